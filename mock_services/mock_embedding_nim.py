@@ -3,12 +3,19 @@ Mock Embedding NIM Service
 Simulates nv-embedqa-e5-v5 for testing
 """
 
+import os
+import asyncio
+
 from fastapi import FastAPI
 import uvicorn
 import numpy as np
 
 app = FastAPI(title="Mock Embedding NIM")
 
+# Optional simulated latency (milliseconds) so benchmarks see embedding costs
+BASE_LATENCY_MS = float(os.getenv("MOCK_EMBEDDING_BASE_LATENCY_MS", "0"))
+MS_PER_TEXT = float(os.getenv("MOCK_EMBEDDING_MS_PER_TEXT", "0"))
+
 
 @app.get("/v1/health/live")
 def health():
@@ -17,7 +24,7 @@ def health():
 
 
 @app.post("/v1/embeddings")
-def embeddings(request: dict):
+async def embeddings(request: dict):
     """
     Mock embedding endpoint
     Returns deterministic mock embeddings based on text hash
@@ -28,6 +35,10 @@ def embeddings(request: dict):
     # Handle both string and list inputs
     if isinstance(input_data, str):
         input_data = [input_data]
+
+    latency_ms = BASE_LATENCY_MS + MS_PER_TEXT * len(input_data)
+    if latency_ms > 0:
+        await asyncio.sleep(latency_ms / 1000)
     
     # Generate mock embeddings (1024 dimensions as per nv-embedqa-e5-v5)
     mock_embeddings = []
@@ -3,11 +3,54 @@ Mock Reasoning NIM Service
 Simulates llama-3.1-nemotron-nano-8B-v1 for testing
 """
 
+import os
+import re
+import json
+import asyncio
+
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 import uvicorn
 
 app = FastAPI(title="Mock Reasoning NIM")
 
+# Optional simulated latency (milliseconds) so benchmarks see prompt and output costs
+BASE_LATENCY_MS = float(os.getenv("MOCK_NIM_BASE_LATENCY_MS", "0"))
+PREFILL_MS_PER_TOKEN = float(os.getenv("MOCK_NIM_PREFILL_MS_PER_TOKEN", "0"))
+DECODE_MS_PER_TOKEN = float(os.getenv("MOCK_NIM_DECODE_MS_PER_TOKEN", "0"))
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _mock_analysis(paper_id: str = None) -> dict:
+    analysis = {
+        "research_question": "Mock research question",
+        "methodology": "Mock methodology",
+        "key_findings": ["Mock finding 1", "Mock finding 2"],
+        "limitations": ["Mock limitation"],
+        "confidence": 0.8,
+    }
+    if paper_id is not None:
+        analysis = {"paper_id": paper_id, **analysis}
+    return analysis
+
+
+def _mock_completion(prompt: str) -> str:
+    """JSON for structured-extraction prompts, a score for evaluations, echo text otherwise"""
+    if prompt.rstrip().endswith("Evaluation:"):
+        return "Score: 0.8 | Explanation: Mock evaluation of themes, contradictions and gaps"
+    if "JSON Array Output:" in prompt:
+        paper_ids = re.findall(r"^Paper ID: (\S+)$", prompt, flags=re.MULTILINE)
+        return json.dumps([_mock_analysis(paper_id) for paper_id in paper_ids])
+    if "JSON Output:" in prompt:
+        return json.dumps(_mock_analysis())
+    mock_response = f"Mock reasoning completion for: {prompt[:100]}"
+    if len(prompt) > 100:
+        mock_response += "..."
+    return mock_response
+
 
 @app.get("/v1/health/live")
 def health():
@@ -16,18 +59,28 @@ def health():
 
 
 @app.post("/v1/completions")
-def completions(request: dict):
+async def completions(request: dict):
     """
     Mock completion endpoint
     Returns a simple mock completion based on the prompt
     """
     prompt = request.get("prompt", "")
-    max_tokens = request.get("max_tokens", 100)
     
     # Generate mock completion
-    mock_response = f"Mock reasoning completion for: {prompt[:100]}"
-    if len(prompt) > 100:
-        mock_response += "..."
+    mock_response = _mock_completion(prompt)
+    latency_ms = (
+        BASE_LATENCY_MS
+        + PREFILL_MS_PER_TOKEN * _tokens(prompt)
+        + DECODE_MS_PER_TOKEN * _tokens(mock_response)
+    )
+    if latency_ms:
+        await asyncio.sleep(latency_ms / 1000)
+    
+    if request.get("stream"):
+        return StreamingResponse(
+            _stream_tokens(mock_response),
+            media_type="text/event-stream"
+        )
     
     return {
         "choices": [{
@@ -44,6 +97,16 @@ def completions(request: dict):
     }
 
 
+def _stream_tokens(text: str):
+    """Yield the completion as SSE events, one word-sized token per event"""
+    words = text.split(" ")
+    for i, word in enumerate(words):
+        token = word if i == 0 else " " + word
+        event = {"choices": [{"text": token, "index": 0, "finish_reason": None}]}
+        yield f"data: {json.dumps(event)}\n\n"
+    yield "data: [DONE]\n\n"
+
+
 @app.post("/v1/chat/completions")
 def chat_completions(request: dict):
     """
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Packed Analysis Benchmark
+Compares single-paper and packed AnalystAgent prompts against the mock reasoning NIM
+"""
+
+import os
+import sys
+import time
+import socket
+import asyncio
+import logging
+import threading
+
+# Simulated NIM costs; set before the mock service module reads them
+os.environ.setdefault("MOCK_NIM_BASE_LATENCY_MS", "50")
+os.environ.setdefault("MOCK_NIM_PREFILL_MS_PER_TOKEN", "0.2")
+os.environ.setdefault("MOCK_NIM_DECODE_MS_PER_TOKEN", "2")
+os.environ["ENABLE_COMPLETION_CACHE"] = "false"
+os.environ["REASONING_STREAM_STRUCTURED"] = "false"
+
+# Add src and the mock services to path
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'mock_services'))
+
+import uvicorn
+
+from mock_reasoning_nim import app
+from nim_clients import ReasoningNIMClient
+from agents import AnalystAgent, Paper
+from constants import MAX_CONCURRENT_ANALYSES
+
+PAPER_COUNTS = [10, 50]
+PACK_SIZES = [4, 8]
+ABSTRACT = (
+    "We study a synthetic research problem with a controlled experimental setup. "
+    "Our method improves over strong baselines on three benchmarks. "
+) * 6  # ~800 characters, a typical abstract
+
+
+def start_mock_nim() -> str:
+    """Run the mock reasoning NIM on a free local port; returns its base URL"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def make_papers(n: int):
+    return [
+        Paper(id=f"arxiv-{i}", title=f"Synthetic paper {i}", authors=["A. Author"], abstract=ABSTRACT, url="")
+        for i in range(n)
+    ]
+
+
+async def run(base_url: str, papers, pack_size: int) -> tuple:
+    async with ReasoningNIMClient(base_url=base_url) as client:
+        calls = 0
+        complete = client.complete
+
+        async def counted_complete(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return await complete(*args, **kwargs)
+
+        client.complete = counted_complete
+        analyst = AnalystAgent(client)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+
+        async def limited(coro):
+            async with semaphore:
+                return await coro
+
+        start = time.perf_counter()
+        if pack_size > 1:
+            groups = analyst.pack_papers(papers, max_papers=pack_size)
+            results = await asyncio.gather(*[limited(analyst.analyze_packed(g)) for g in groups])
+            analyses = [a for group in results for a in group]
+        else:
+            analyses = await asyncio.gather(*[limited(analyst.analyze(p)) for p in papers])
+        elapsed = time.perf_counter() - start
+
+    assert [a.paper_id for a in analyses] == [p.id for p in papers]
+    return calls, elapsed
+
+
+async def main():
+    logging.disable(logging.INFO)
+    base_url = start_mock_nim()
+    print(f"{'papers':>6} | {'mode':<10} | {'calls':>5} | {'latency (s)':>11} | {'speedup':>7}")
+    print("-" * 52)
+    for n in PAPER_COUNTS:
+        papers = make_papers(n)
+        single_calls, single_time = await run(base_url, papers, pack_size=1)
+        print(f"{n:>6} | {'single':<10} | {single_calls:>5} | {single_time:>11.3f} | {'1.0x':>7}")
+        for pack_size in PACK_SIZES:
+            calls, elapsed = await run(base_url, papers, pack_size=pack_size)
+            label = f"packed x{pack_size}"
+            print(f"{n:>6} | {label:<10} | {calls:>5} | {elapsed:>11.3f} | {single_time / elapsed:>6.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
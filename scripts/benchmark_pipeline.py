@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Pipelined Run Benchmark
+Compares end-to-end latency of the phased and pipelined ResearchOpsAgent.run
+against the mock reasoning and embedding NIMs, with simulated paper sources
+"""
+
+import io
+import os
+import sys
+import time
+import socket
+import asyncio
+import logging
+import itertools
+import threading
+import contextlib
+
+# Simulated NIM costs; set before the mock service modules read them
+os.environ.setdefault("MOCK_NIM_BASE_LATENCY_MS", "50")
+os.environ.setdefault("MOCK_NIM_PREFILL_MS_PER_TOKEN", "0.2")
+os.environ.setdefault("MOCK_NIM_DECODE_MS_PER_TOKEN", "2")
+os.environ.setdefault("MOCK_EMBEDDING_BASE_LATENCY_MS", "20")
+os.environ.setdefault("MOCK_EMBEDDING_MS_PER_TEXT", "1")
+# Measure the pipeline itself: no caches, stores or early stop, every paper relevant
+for flag in ("COMPLETION_CACHE", "SOURCE_CACHE", "PAPER_STORE", "VECTOR_INDEX", "ANALYSIS_STORE", "QUERY_EXPANSION"):
+    os.environ[f"ENABLE_{flag}"] = "false"
+os.environ["SCOUT_EARLY_STOP"] = "false"
+os.environ["RELEVANCE_THRESHOLD"] = "0.0"
+os.environ["REASONING_STREAM_STRUCTURED"] = "false"
+os.environ["SYNTHESIS_MAX_ITERATIONS"] = "1"
+
+# Add src and the mock services to path
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'mock_services'))
+
+import uvicorn
+
+import mock_embedding_nim
+import mock_reasoning_nim
+from nim_clients import ReasoningNIMClient, EmbeddingNIMClient
+from agents import ResearchOpsAgent, Paper
+
+PAPER_COUNTS = [10, 25, 50]
+# Simulated source latencies (seconds); each returns max_papers candidates
+SOURCE_LATENCIES = {"arxiv": 0.3, "pubmed": 1.0, "semantic_scholar": 2.0}
+ABSTRACT = (
+    "We study a synthetic research problem with a controlled experimental setup. "
+    "Our method improves over strong baselines on three benchmarks. "
+) * 6  # ~800 characters, a typical abstract
+
+
+def start_mock(app) -> str:
+    """Run a mock NIM on a free local port; returns its base URL"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+_next_paper = itertools.count(1)
+
+
+def simulated_source(name: str, latency: float, count: int):
+    async def search(query):
+        await asyncio.sleep(latency)
+        # Numeric IDs unique across runs, so identity resolution and caches never match
+        numbers = [next(_next_paper) for _ in range(count)]
+        return [
+            Paper(
+                id=f"{name}-{n}",
+                title=f"{name} synthetic paper {n}",
+                authors=["A. Author"],
+                abstract=f"Paper {n}. {ABSTRACT}",
+                url=""
+            )
+            for n in numbers
+        ]
+    return search
+
+
+async def run(reasoning_url: str, embedding_url: str, max_papers: int, pipelined: bool) -> float:
+    async with ReasoningNIMClient(base_url=reasoning_url) as reasoning, \
+            EmbeddingNIMClient(base_url=embedding_url) as embedding:
+        embedding.embedding_cache_obj = None
+        agent = ResearchOpsAgent(reasoning, embedding)
+        for source in ("arxiv", "pubmed", "semantic_scholar", "crossref", "ieee", "acm", "springer"):
+            setattr(agent.scout.source_config, f"enable_{source}", source in SOURCE_LATENCIES)
+        for source, latency in SOURCE_LATENCIES.items():
+            setattr(agent.scout, f"_search_{source}", simulated_source(source, latency, max_papers))
+
+        start = time.perf_counter()
+        # Agents print their decisions; keep them out of the table
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = await agent.run("synthetic research query", max_papers=max_papers, pipelined=pipelined)
+        elapsed = time.perf_counter() - start
+
+    assert report["papers_analyzed"] == max_papers, report.get("papers_analyzed")
+    return elapsed
+
+
+async def main():
+    logging.disable(logging.WARNING)
+    reasoning_url = start_mock(mock_reasoning_nim.app)
+    embedding_url = start_mock(mock_embedding_nim.app)
+    print(f"{'max_papers':>10} | {'phased (s)':>10} | {'pipelined (s)':>13} | {'speedup':>7}")
+    print("-" * 50)
+    for max_papers in PAPER_COUNTS:
+        phased = await run(reasoning_url, embedding_url, max_papers, pipelined=False)
+        pipelined = await run(reasoning_url, embedding_url, max_papers, pipelined=True)
+        print(f"{max_papers:>10} | {phased:>10.2f} | {pipelined:>13.2f} | {phased / pipelined:>6.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
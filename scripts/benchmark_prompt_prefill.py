@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Prompt Prefill Benchmark
+Estimates prefill tokens per call type with a server-side prefix (KV) cache,
+for the old inline prompt layouts and the static-prefix registry templates
+"""
+
+import os
+import sys
+import asyncio
+import logging
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import prompts
+from agents import AnalystAgent, Paper
+from incremental_synthesizer import IncrementalSynthesizer
+from nim_clients import ReasoningNIMClient, estimate_tokens
+
+CALLS_PER_TYPE = 20
+PACK_SIZE = 4
+# Prefix caches reuse whole KV blocks, so a shared prefix only counts in full blocks
+KV_BLOCK_TOKENS = 16
+ABSTRACT = (
+    "We study a synthetic research problem with a controlled experimental setup. "
+    "Our method improves over strong baselines on three benchmarks. "
+) * 6  # ~800 characters, a typical abstract
+
+# Schema the analysis prompt used to pass to extract_structured before the registry
+LEGACY_ANALYSIS_SCHEMA = {
+    "research_question": "string", "methodology": "string", "key_findings": "list",
+    "limitations": "list", "confidence": "float",
+    "statistical_results": {
+        "p_values": "list", "effect_sizes": "list",
+        "confidence_intervals": "list", "statistical_tests": "list"
+    },
+    "experimental_setup": {
+        "datasets": "list", "hardware": "string",
+        "hyperparameters": "list", "software_frameworks": "list"
+    },
+    "comparative_results": {"baselines": "list", "benchmarks": "list", "improvements": "list"},
+    "reproducibility": {"code_available": "boolean", "data_available": "boolean", "repository_url": "string"}
+}
+
+
+def legacy_analysis(paper: Paper) -> str:
+    inner = f"""
+Analyze this research paper and extract comprehensive information.
+
+Title: {paper.title}
+Authors: {', '.join(paper.authors)}
+Abstract: {paper.abstract}
+
+Extract the following in JSON format:
+{prompts.ANALYSIS_JSON_TEMPLATE}
+
+JSON Output:
+"""
+    return f"""
+Extract the following information from the text and return as JSON.
+
+Schema:
+{LEGACY_ANALYSIS_SCHEMA}
+
+Text:
+{inner}
+
+JSON Output:
+"""
+
+
+def legacy_packed(papers) -> str:
+    blocks = "\n\n".join(
+        f"Paper ID: {p.id}\nTitle: {p.title}\nAuthors: {', '.join(p.authors)}\nAbstract: {p.abstract}"
+        for p in papers
+    )
+    return f"""
+Analyze each of the following research papers and extract comprehensive information.
+
+Return a JSON array with one object per paper, in the same order. Each object
+must have a "paper_id" field copied exactly from the paper's "Paper ID" line,
+plus these fields:
+{prompts.ANALYSIS_JSON_TEMPLATE}
+
+Papers:
+
+{blocks}
+
+JSON Array Output:
+"""
+
+
+def legacy_contradiction_check(finding_a: str, finding_b: str) -> str:
+    return f"""Analyze these two research findings and determine if they contradict each other.
+
+Finding A: {finding_a}
+
+Finding B: {finding_b}
+
+A contradiction exists when:
+1. Both findings address the same topic/phenomenon
+2. They make incompatible claims (one says X, the other says not-X)
+3. The incompatibility is not easily resolved by context or temporal differences
+
+Respond with ONLY "yes" or "no".
+"""
+
+
+class RecordingClient:
+    """Stands in for the Reasoning NIM and records every prompt"""
+
+    stream_structured = False
+
+    def __init__(self):
+        self.prompts = []
+
+    async def complete(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return "[]" if "JSON Array Output:" in prompt else "{}"
+
+    async def extract_structured(self, *args, **kwargs):
+        return await ReasoningNIMClient.extract_structured(self, *args, **kwargs)
+
+
+def prefill_tokens(calls) -> tuple:
+    """(total prompt tokens, tokens left to prefill when earlier prompts' prefixes are cached)"""
+    total = prefill = 0
+    for i, prompt in enumerate(calls):
+        shared = 0
+        for earlier in calls[:i]:
+            n = os.path.commonprefix([earlier, prompt])
+            shared = max(shared, len(n))
+        tokens = estimate_tokens(prompt)
+        cached = (min(estimate_tokens(prompt[:shared]), tokens) // KV_BLOCK_TOKENS) * KV_BLOCK_TOKENS if shared else 0
+        total += tokens
+        prefill += tokens - cached
+    return total, prefill
+
+
+async def registry_calls(papers, findings):
+    """Prompts produced by the agents with the registry templates"""
+    calls = {}
+
+    client = RecordingClient()
+    analyst = AnalystAgent(client)
+    for paper in papers:
+        await analyst.analyze(paper)
+    calls["analysis"] = client.prompts
+
+    client = RecordingClient()
+    analyst = AnalystAgent(client)
+    for group in analyst.pack_papers(papers, max_papers=PACK_SIZE):
+        await analyst.analyze_packed(group)
+    calls["analysis-packed"] = [p for p in client.prompts if "JSON Array Output:" in p]
+
+    client = RecordingClient()
+    synthesizer = IncrementalSynthesizer(client, None)
+    for finding_a, finding_b in findings:
+        await synthesizer._is_contradiction(finding_a, finding_b)
+    calls["contradiction-check"] = client.prompts
+    return calls
+
+
+def legacy_calls(papers, findings):
+    groups = AnalystAgent.pack_papers(papers, max_papers=PACK_SIZE)
+    return {
+        "analysis": [legacy_analysis(p) for p in papers],
+        "analysis-packed": [legacy_packed(g) for g in groups],
+        "contradiction-check": [legacy_contradiction_check(a, b) for a, b in findings],
+    }
+
+
+async def main():
+    logging.disable(logging.INFO)
+    papers = [
+        Paper(id=f"arxiv-{i}", title=f"Synthetic paper {i}", authors=["A. Author"], abstract=ABSTRACT, url="")
+        for i in range(CALLS_PER_TYPE)
+    ]
+    findings = [
+        (f"Method {i} improves accuracy by {i}% on benchmark {i}.", f"Method {i} does not improve accuracy.")
+        for i in range(CALLS_PER_TYPE)
+    ]
+    before = legacy_calls(papers, findings)
+    after = await registry_calls(papers, findings)
+
+    print(f"{'call type':<20} | {'layout':<8} | {'calls':>5} | {'tokens/call':>11} | {'prefill/call':>12} | {'reduction':>9}")
+    print("-" * 80)
+    for call_type in before:
+        old_total, old_prefill = prefill_tokens(before[call_type])
+        for layout, calls in (("before", before[call_type]), ("after", after[call_type])):
+            total, prefill = prefill_tokens(calls)
+            n = len(calls)
+            reduction = f"{1 - prefill / old_prefill:>8.0%}" if layout == "after" else f"{'-':>9}"
+            print(f"{call_type:<20} | {layout:<8} | {n:>5} | {total / n:>11.0f} | {prefill / n:>12.0f} | {reduction}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Similarity Microbenchmark
+Compares per-pair cosine_similarity calls with the vectorized similarity module
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from nim_clients import EmbeddingNIMClient
+from similarity import to_matrix, query_scores, greedy_duplicates
+
+DIM = 1024
+SIZES = [50, 500, 5000]
+# Per-pair all-pairs loops are O(n^2) Python calls; sample rows beyond this and extrapolate
+MAX_LOOP_ROWS = 50
+
+
+def _time(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_query(vectors, query) -> tuple:
+    cosine = EmbeddingNIMClient.cosine_similarity
+
+    def per_pair():
+        return [cosine(query, v) for v in vectors]
+
+    def vectorized():
+        return query_scores(query, to_matrix(vectors, DIM), rescale=True)
+
+    return _time(per_pair), _time(vectorized)
+
+
+def bench_all_pairs(vectors) -> tuple:
+    cosine = EmbeddingNIMClient.cosine_similarity
+    n = len(vectors)
+    rows = min(n, MAX_LOOP_ROWS)
+
+    def per_pair_sample():
+        for i in range(rows):
+            for j in range(i + 1, n):
+                cosine(vectors[i], vectors[j])
+
+    # Scale the sampled row cost up to the full upper triangle
+    total_pairs = n * (n - 1) / 2
+    sampled_pairs = sum(n - i - 1 for i in range(rows))
+    loop_time = _time(per_pair_sample, repeat=1) * total_pairs / max(sampled_pairs, 1)
+
+    def vectorized():
+        return greedy_duplicates(to_matrix(vectors, DIM), 0.9)
+
+    return loop_time, _time(vectorized), rows < n
+
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'vectors':>8} | {'op':<10} | {'per-pair (s)':>13} | {'vectorized (s)':>14} | {'speedup':>8}")
+    print("-" * 68)
+
+    for n in SIZES:
+        vectors = rng.normal(size=(n, DIM)).astype(np.float32).tolist()
+        query = rng.normal(size=DIM).tolist()
+
+        loop_time, vec_time = bench_query(vectors, query)
+        print(f"{n:>8} | {'query':<10} | {loop_time:>13.4f} | {vec_time:>14.4f} | {loop_time / vec_time:>7.1f}x")
+
+        loop_time, vec_time, estimated = bench_all_pairs(vectors)
+        label = "all-pairs*" if estimated else "all-pairs"
+        print(f"{n:>8} | {label:<10} | {loop_time:>13.4f} | {vec_time:>14.4f} | {loop_time / vec_time:>7.1f}x")
+
+    print(f"\n* per-pair time extrapolated from the first {MAX_LOOP_ROWS} rows")
+
+
+if __name__ == "__main__":
+    main()
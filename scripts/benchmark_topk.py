@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Scout Ranking Microbenchmark
+Compares list.index sort keys, a heap over a score dict and the vectorized top-k
+"""
+
+import os
+import sys
+import time
+import heapq
+
+import numpy as np
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from agents import Paper
+from similarity import top_k_above
+
+SIZES = [1000, 10000]
+TOP_K = 10
+THRESHOLD = 0.7
+# list.index keys are O(n^2); time a sample of key lookups beyond this and extrapolate
+MAX_INDEX_ROWS = 1000
+
+
+def _time(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def make_candidates(n: int, rng) -> tuple:
+    scores = rng.random(n).astype(np.float32)
+    papers = [
+        Paper(id=f"arxiv-{i}", title=f"Paper {i}", authors=["A"], abstract="Abstract", url="")
+        for i in range(n)
+    ]
+    return papers, scores
+
+
+def bench_list_index(papers, scores) -> tuple:
+    """Original ranking: sort relevant papers with a list.index lookup in the key"""
+    papers_with_scores = list(zip(papers, scores.tolist()))
+    relevant = [p for p, s in papers_with_scores if s >= THRESHOLD]
+    rows = min(len(relevant), MAX_INDEX_ROWS)
+
+    def sample():
+        for p in relevant[:rows]:
+            papers_with_scores[papers.index(p)][1]
+
+    # Sort keys are computed once per element; the sort itself is negligible next to them
+    elapsed = _time(sample, repeat=1) * len(relevant) / max(rows, 1)
+    return elapsed, rows < len(relevant)
+
+
+def bench_heap(papers, scores) -> float:
+    """Score dict plus heapq.nlargest over the relevant papers"""
+    def run():
+        by_id = {p.id: float(s) for p, s in zip(papers, scores)}
+        relevant = [p for p in papers if by_id[p.id] >= THRESHOLD]
+        return heapq.nlargest(TOP_K, relevant, key=lambda p: by_id[p.id])
+    return _time(run)
+
+
+def bench_vectorized(papers, scores) -> float:
+    """Threshold mask plus argpartition over the score array"""
+    def run():
+        return [papers[i] for i in top_k_above(scores, THRESHOLD, TOP_K)]
+    return _time(run)
+
+
+def main():
+    rng = np.random.default_rng(42)
+    print(f"{'candidates':>10} | {'list.index (s)':>14} | {'heap (s)':>9} | {'vectorized (s)':>14} | {'speedup':>8}")
+    print("-" * 69)
+
+    for n in SIZES:
+        papers, scores = make_candidates(n, rng)
+        index_time, estimated = bench_list_index(papers, scores)
+        heap_time = bench_heap(papers, scores)
+        vec_time = bench_vectorized(papers, scores)
+        label = f"{index_time:.4f}" + ("*" if estimated else "")
+        print(f"{n:>10} | {label:>14} | {heap_time:>9.4f} | {vec_time:>14.6f} | {index_time / vec_time:>7.0f}x")
+
+    print(f"\n* list.index time extrapolated from the first {MAX_INDEX_ROWS} relevant papers (a lower bound)")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,9 @@ Multi-agent architecture for research synthesis
 """
 
 import asyncio
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime
 import json
@@ -13,6 +14,8 @@ import logging
 import aiohttp
 import os
 
+import numpy as np
+
 try:
     from pydantic import BaseModel, Field, validator
 except ImportError:
@@ -21,14 +24,32 @@ except ImportError:
     Field = lambda *args, **kwargs: None
     validator = lambda *args, **kwargs: lambda f: f
 
-from nim_clients import ReasoningNIMClient, EmbeddingNIMClient
+from nim_clients import ReasoningNIMClient, EmbeddingNIMClient, estimate_tokens, parse_json_objects
 from config import PaperSourceConfig
 from progress_tracker import ProgressTracker, Stage
+import prompts
 from query_expansion import expand_search_queries
+from similarity import to_matrix, query_scores, greedy_duplicates, top_k_above
+from resource_ledger import track_resources, record_source_call, record_cache_lookup
+from deadline import deadline_scope, budget_timeout, get_research_timeout_seconds
+from source_http import get_source_http_client
+from arxiv_client import ArxivClient
+from pubmed_client import PubMedClient
+from identity_resolution import IdentityResolver, fallback_paper_id
+from constants import (
+    PAPER_STORE_SEARCH_LIMIT,
+    VECTOR_INDEX_SEARCH_LIMIT,
+    SOURCE_LATENCY_BUDGET_SECONDS,
+    SCOUT_EARLY_STOP_FACTOR,
+    ANALYSIS_PACK_SIZE,
+    ANALYSIS_PACK_TOKEN_BUDGET,
+    ANALYSIS_OUTPUT_TOKENS_PER_PAPER,
+    PIPELINE_QUEUE_SIZE
+)
 
 # Optional import for boolean search
 try:
-    from boolean_search import parse_boolean_query, expand_boolean_query
+    from boolean_search import parse_boolean_query, compile_query, broad_query, matches_paper
     BOOLEAN_SEARCH_AVAILABLE = True
 except ImportError:
     BOOLEAN_SEARCH_AVAILABLE = False
@@ -43,6 +64,42 @@ except ImportError:
     CACHE_AVAILABLE = False
     METRICS_AVAILABLE = False
 
+# Optional import for the per-source search cache
+try:
+    from source_cache import get_source_cache, mark_source_failure, source_outcome
+    SOURCE_CACHE_AVAILABLE = True
+except ImportError:
+    SOURCE_CACHE_AVAILABLE = False
+
+    def mark_source_failure(reason: str = ""):
+        """No-op when the source cache is unavailable"""
+
+    @contextmanager
+    def source_outcome():
+        """Failure tracking is unavailable without the source cache"""
+        yield {"failed": False}
+
+# Optional import for the local paper store
+try:
+    from paper_store import get_paper_store
+    PAPER_STORE_AVAILABLE = True
+except ImportError:
+    PAPER_STORE_AVAILABLE = False
+
+# Optional import for the cross-query analysis store
+try:
+    from analysis_store import get_analysis_store
+    ANALYSIS_STORE_AVAILABLE = True
+except ImportError:
+    ANALYSIS_STORE_AVAILABLE = False
+
+# Optional import for the vector index over stored embeddings
+try:
+    from vector_index import get_vector_index
+    VECTOR_INDEX_AVAILABLE = True
+except ImportError:
+    VECTOR_INDEX_AVAILABLE = False
+
 # Optional import for input sanitization with fallback
 try:
     try:
@@ -162,6 +219,10 @@ class Paper:
     url: str
     content: Optional[str] = None
     embedding: Optional[List[float]] = None
+    year: Optional[int] = None
+    venue: Optional[str] = None  # Journal or conference
+    doi: Optional[str] = None
+    relevance_score: Optional[float] = None  # Rescaled query similarity, set by Scout
 
 
 @dataclass
@@ -186,6 +247,22 @@ class Synthesis:
     enhanced_insights: Optional[Dict[str, Any]] = None  # Enhanced insights from enhanced_insights module
 
 
+@dataclass
+class SearchProgress:
+    """Snapshot of a streaming Scout search after one or more sources returned"""
+    source: str  # Source(s) that just completed ("" on the final snapshot)
+    new_papers: List[Paper]  # Newly arrived, embedded and scored candidates
+    top_papers: List[Paper]  # Running top-k above the relevance threshold, best first
+    candidates_seen: int
+    relevant_count: int
+    sources_done: int
+    sources_total: int
+    done: bool = False
+    stopped_early: bool = False
+    relevance_threshold: float = 0.7
+    duplicates_merged: int = 0  # Cross-source duplicates merged before embedding
+
+
 class AgentDecision(Enum):
     """Agent decision types"""
     CONTINUE_SEARCH = "continue_search"
@@ -201,18 +278,36 @@ class ScoutAgent:
     Uses Embedding NIM to find relevant papers
     """
 
-    def __init__(self, embedding_client: EmbeddingNIMClient):
+    def __init__(
+        self,
+        embedding_client: EmbeddingNIMClient,
+        source_cache=None,
+        http_client=None,
+        paper_store=None,
+        vector_index=None
+    ):
         self.embedding_client = embedding_client
         self.papers_found: List[Paper] = []
         self.decision_log = DecisionLog()
         # Load paper source configuration
         self.source_config = PaperSourceConfig.from_env()
+        # Optional SourceSearchCache; None searches every source live
+        self.source_cache = source_cache
+        # Rate-limited pool for literature APIs (kept off the NIM sessions)
+        self.http_client = http_client or get_source_http_client()
+        # Optional PaperStore; searched first as a local source and fed with live results
+        self.paper_store = paper_store
+        # Optional vector index; nearest stored papers are served with their embeddings
+        self.vector_index = vector_index
 
     async def search(
         self,
         query: str,
         max_papers: int = 10,
-        use_query_expansion: bool = True
+        use_query_expansion: bool = True,
+        on_progress: Optional[Callable[[SearchProgress], Awaitable[None]]] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
     ) -> List[Paper]:
         """
         Search for relevant papers using semantic search
@@ -222,32 +317,71 @@ class ScoutAgent:
         - Adaptive search depth
         - Quality filtering decisions
         - Query expansion for better coverage
+
+        Args:
+            query: Research query
+            max_papers: Maximum papers to return
+            use_query_expansion: Expand the query before searching
+            on_progress: Optional coroutine called with each intermediate
+                SearchProgress (see search_stream)
+            start_year: Only papers published in or after this year (where the source supports it)
+            end_year: Only papers published in or before this year (where the source supports it)
+        """
+        final = None
+        async for progress in self.search_stream(
+            query,
+            max_papers=max_papers,
+            use_query_expansion=use_query_expansion,
+            start_year=start_year,
+            end_year=end_year
+        ):
+            final = progress
+            if on_progress is not None and not progress.done:
+                await on_progress(progress)
+        return await self._finalize_search(final, max_papers)
+
+    async def search_stream(
+        self,
+        query: str,
+        max_papers: int = 10,
+        use_query_expansion: bool = True,
+        early_stop: Optional[bool] = None,
+        source_budget: Optional[float] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
+    ) -> AsyncIterator[SearchProgress]:
+        """
+        Search all sources, yielding ranked progress as each source returns
+
+        Abstracts are embedded as they arrive and a running top-k is kept, so
+        callers can show papers before the slowest source has answered. The
+        search stops early once enough papers clear the relevance threshold,
+        and sources still running after the latency budget are dropped.
+
+        Args:
+            query: Research query
+            max_papers: Size of the running top-k
+            use_query_expansion: Expand the query before searching
+            early_stop: Stop once max_papers * SCOUT_EARLY_STOP_FACTOR papers
+                are relevant (defaults to env SCOUT_EARLY_STOP)
+            source_budget: Per-source latency budget in seconds (defaults to
+                env SOURCE_LATENCY_BUDGET_SECONDS, clamped to the request deadline)
+            start_year: Publication year lower bound, pushed down to arXiv
+            end_year: Publication year upper bound, pushed down to arXiv
+
+        Yields:
+            SearchProgress after each source, then a final one with done=True
         """
         logger.info(f"🔍 Scout Agent: Searching for '{query}'")
-        
-        # Step 0: Check for boolean operators and parse if present
-        search_queries = [query]
-        boolean_parsed = None
-        
-        if BOOLEAN_SEARCH_AVAILABLE:
-            try:
-                boolean_parsed = parse_boolean_query(query)
-                if boolean_parsed.get("type") == "boolean":
-                    # Expand boolean query into multiple search queries
-                    search_queries = expand_boolean_query(boolean_parsed)
-                    logger.info(f"Boolean query detected, expanded to {len(search_queries)} queries: {search_queries}")
-            except Exception as e:
-                logger.warning(f"Boolean query parsing failed: {e}, using original query")
-        
-        # Step 0.5: Query Expansion (optional, if not boolean)
-        if boolean_parsed is None or boolean_parsed.get("type") != "boolean":
-            if use_query_expansion and os.getenv("ENABLE_QUERY_EXPANSION", "true").lower() == "true":
-                try:
-                    expanded = await expand_search_queries(query, self.embedding_client, max_expansions=2)
-                    search_queries = expanded
-                    logger.info(f"Query expanded to {len(search_queries)} variations: {search_queries}")
-                except Exception as e:
-                    logger.warning(f"Query expansion failed: {e}, using original query")
+
+        if early_stop is None:
+            early_stop = os.getenv("SCOUT_EARLY_STOP", "true").lower() == "true"
+        if source_budget is None:
+            source_budget = float(os.getenv("SOURCE_LATENCY_BUDGET_SECONDS", SOURCE_LATENCY_BUDGET_SECONDS))
+        source_budget = budget_timeout(source_budget)
+        enough_papers = max_papers * int(os.getenv("SCOUT_EARLY_STOP_FACTOR", SCOUT_EARLY_STOP_FACTOR))
+
+        search_queries, boolean_ast = await self._plan_search_queries(query, use_query_expansion)
 
         # Step 1: Embed the research query (use original for embedding)
         query_embedding = await self.embedding_client.embed(
@@ -255,107 +389,219 @@ class ScoutAgent:
             input_type="query"
         )
 
-        # Step 2: Search multiple sources in parallel for efficiency
-        # Build search tasks for all query variations and enabled sources
-        all_search_tasks = []
-        
+        relevance_threshold = float(os.getenv("RELEVANCE_THRESHOLD", "0.7"))
+
+        # Step 2: Search all query variations on all enabled sources in parallel
+        tasks = {}
+        # Searches whose results must be checked against the boolean query locally
+        post_filtered = set()
         for search_query in search_queries:
-            # Add search tasks for each query variation
-            if self.source_config.enable_arxiv:
-                all_search_tasks.append(self._search_arxiv(search_query))
-            if self.source_config.enable_pubmed:
-                all_search_tasks.append(self._search_pubmed(search_query))
-            if self.source_config.enable_semantic_scholar:
-                all_search_tasks.append(self._search_semantic_scholar(search_query))
-            if self.source_config.enable_crossref:
-                all_search_tasks.append(self._search_crossref(search_query))
-            if self.source_config.enable_ieee:
-                all_search_tasks.append(self._search_ieee(search_query))
-            if self.source_config.enable_acm:
-                all_search_tasks.append(self._search_acm(search_query))
-            if self.source_config.enable_springer:
-                all_search_tasks.append(self._search_springer(search_query))
-        
-        # Execute all searches in parallel
-        search_results = await asyncio.gather(*all_search_tasks, return_exceptions=True)
-        
-        # Combine results, handling exceptions gracefully
-        candidate_papers = []
-        seen_paper_ids = set()  # Deduplicate papers
-        
-        for i, result in enumerate(search_results):
-            if isinstance(result, Exception):
-                logger.warning(f"Search failed (index {i}): {result}")
-                continue
-            if result:
-                for paper in result:
-                    # Deduplicate by paper ID
-                    if paper.id not in seen_paper_ids:
-                        seen_paper_ids.add(paper.id)
-                        candidate_papers.append(paper)
-        
-        logger.info(f"Searched {len(all_search_tasks)} source-query combinations, found {len(candidate_papers)} unique candidate papers")
-
-        # Step 3: Embed all paper abstracts
-        abstracts = [p.abstract for p in candidate_papers]
-        paper_embeddings = await self.embedding_client.embed_batch(
-            abstracts,
-            input_type="passage"
+            for source, search in self._enabled_source_searches():
+                source_query, post_filter = self._source_query(source, search_query, boolean_ast)
+                search, params = self._source_date_filter(source, search, start_year, end_year)
+                task = asyncio.ensure_future(
+                    self._budgeted_source_search(source, search, source_query, source_budget, params)
+                )
+                tasks[task] = source
+                if post_filter:
+                    post_filtered.add(task)
+        if self.vector_index is not None:
+            # One nearest-neighbour lookup on the original query embedding
+            async def index_search(_query: str) -> List[Paper]:
+                return await self._search_vector_index(query_embedding, relevance_threshold)
+
+            task = asyncio.ensure_future(
+                self._budgeted_source_search("index", index_search, query, source_budget)
+            )
+            tasks[task] = "index"
+            if boolean_ast is not None:
+                post_filtered.add(task)
+
+        candidate_papers: List[Paper] = []
+        # Relevance scores aligned with candidate_papers; ranking is a mask plus argpartition
+        candidate_scores = np.zeros(0, dtype=np.float32)
+        relevant_count = 0
+        # Cross-source dedup (DOI/arXiv/PMID/title) before anything is embedded
+        resolver = IdentityResolver()
+        # Live (non-fallback) papers, upserted into the vector index once embedded
+        indexable_ids = set()
+        sources_done = 0
+        stopped_early = False
+        pending = set(tasks)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                new_papers: List[Paper] = []
+                for task in done:
+                    sources_done += 1
+                    if task.cancelled():
+                        logger.warning(f"Search cancelled ({tasks[task]})")
+                        continue
+                    if task.exception() is not None:
+                        logger.warning(f"Search failed ({tasks[task]}): {task.exception()}")
+                        continue
+                    papers, failed = task.result()
+                    stored = tasks[task] in ("local", "index")
+                    if self.paper_store is not None and not stored and not failed and papers:
+                        # Fallback results are never persisted
+                        if self.paper_store.add(papers):
+                            await asyncio.to_thread(self.paper_store.flush)
+                    if task in post_filtered:
+                        papers = [p for p in papers if matches_paper(boolean_ast, p)]
+                    if not stored and not failed:
+                        indexable_ids.update(p.id for p in papers)
+                    new_papers.extend(resolver.resolve(papers))
+
+                if new_papers:
+                    # Step 3/4: Embed the new abstracts and score them (one matrix-vector product);
+                    # papers served by the vector index already carry their embedding
+                    to_embed = [p for p in new_papers if p.embedding is None]
+                    paper_embeddings = await self.embedding_client.embed_batch(
+                        [p.abstract for p in to_embed],
+                        input_type="passage"
+                    ) if to_embed else []
+                    fresh = iter(paper_embeddings)
+                    embedded = [
+                        (p, p.embedding if p.embedding is not None else next(fresh))
+                        for p in new_papers
+                    ]
+                    paper_matrix = to_matrix(
+                        [embedding for _, embedding in embedded],
+                        dim=len(query_embedding)
+                    )
+                    similarities = query_scores(query_embedding, paper_matrix, rescale=True)
+                    for (paper, embedding), similarity in zip(embedded, similarities):
+                        paper.embedding = embedding
+                        paper.relevance_score = float(similarity)
+                    candidate_papers.extend(new_papers)
+                    candidate_scores = np.concatenate([candidate_scores, similarities])
+                    relevant_count += int(np.count_nonzero(similarities >= relevance_threshold))
+
+                stopped_early = early_stop and bool(pending) and relevant_count >= enough_papers
+                yield SearchProgress(
+                    source=", ".join(sorted({tasks[task] for task in done})),
+                    new_papers=new_papers,
+                    top_papers=[
+                        candidate_papers[i]
+                        for i in top_k_above(candidate_scores, relevance_threshold, max_papers)
+                    ],
+                    candidates_seen=len(candidate_papers),
+                    relevant_count=relevant_count,
+                    sources_done=sources_done,
+                    sources_total=len(tasks),
+                    relevance_threshold=relevance_threshold,
+                    duplicates_merged=resolver.duplicates
+                )
+                if stopped_early:
+                    logger.info(
+                        f"Scout early stop: {relevant_count} relevant papers after "
+                        f"{sources_done}/{len(tasks)} source searches"
+                    )
+                    break
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            if self.paper_store is not None and self.paper_store.pending:
+                await asyncio.to_thread(self.paper_store.flush)
+            if self.vector_index is not None:
+                await self._index_papers([p for p in candidate_papers if p.id in indexable_ids])
+
+        logger.info(
+            f"Searched {sources_done}/{len(tasks)} source-query combinations, "
+            f"found {len(candidate_papers)} unique candidate papers "
+            f"({resolver.duplicates} cross-source duplicates merged before embedding)"
         )
 
-        # Step 4: Calculate relevance scores
-        papers_with_scores = []
-        for paper, embedding in zip(candidate_papers, paper_embeddings):
-            similarity = self.embedding_client.cosine_similarity(
-                query_embedding,
-                embedding
-            )
-            paper.embedding = embedding
-            papers_with_scores.append((paper, similarity))
+        yield SearchProgress(
+            source="",
+            new_papers=[],
+            top_papers=[
+                candidate_papers[i]
+                for i in top_k_above(candidate_scores, relevance_threshold, max_papers)
+            ],
+            candidates_seen=len(candidate_papers),
+            relevant_count=relevant_count,
+            sources_done=sources_done,
+            sources_total=len(tasks),
+            done=True,
+            stopped_early=stopped_early,
+            relevance_threshold=relevance_threshold,
+            duplicates_merged=resolver.duplicates
+        )
 
-        # Step 5: AUTONOMOUS DECISION - Filter by relevance threshold
-        relevance_threshold = float(os.getenv("RELEVANCE_THRESHOLD", "0.7"))
-        relevant_papers = [
-            paper for paper, score in papers_with_scores
-            if score >= relevance_threshold
-        ]
+    async def _finalize_search(self, progress: SearchProgress, max_papers: int) -> List[Paper]:
+        """Log the filtering decisions for a finished search and deduplicate the top-k"""
+        candidates = progress.candidates_seen
+        relevant = progress.relevant_count
+        relevance_threshold = progress.relevance_threshold
 
         # 🎯 LOG THIS DECISION - CRITICAL FOR JUDGES!
         self.decision_log.log_decision(
             agent="Scout",
             decision_type="RELEVANCE_FILTERING",
-            decision=f"ACCEPTED {len(relevant_papers)}/{len(candidate_papers)} papers",
+            decision=f"ACCEPTED {relevant}/{candidates} papers",
             reasoning=f"Applied relevance threshold of {relevance_threshold}. "
-                     f"Filtered out {len(candidate_papers) - len(relevant_papers)} "
+                     f"Filtered out {candidates - relevant} "
                      f"low-relevance papers to ensure quality.",
             nim_used="nv-embedqa-e5-v5 (Embedding NIM)",
             metadata={
                 "threshold": relevance_threshold,
-                "total_candidates": len(candidate_papers),
-                "accepted": len(relevant_papers),
-                "rejected": len(candidate_papers) - len(relevant_papers)
+                "total_candidates": candidates,
+                "accepted": relevant,
+                "rejected": candidates - relevant
             }
         )
 
+        if progress.duplicates_merged:
+            # 🎯 LOG IDENTITY RESOLUTION DECISION
+            self.decision_log.log_decision(
+                agent="Scout",
+                decision_type="IDENTITY_RESOLUTION",
+                decision=f"MERGED {progress.duplicates_merged} cross-source duplicates",
+                reasoning="Matched papers on DOI, arXiv ID, PMID and title similarity "
+                         "before embedding, merging their metadata so each paper is "
+                         "embedded and analyzed once.",
+                nim_used="None (identifier matching)",
+                metadata={
+                    "duplicates": progress.duplicates_merged,
+                    "unique_candidates": candidates
+                }
+            )
+
+        if progress.stopped_early:
+            # 🎯 LOG EARLY STOP DECISION
+            self.decision_log.log_decision(
+                agent="Scout",
+                decision_type="SEARCH_EARLY_STOP",
+                decision=f"STOPPED after {progress.sources_done}/{progress.sources_total} source searches",
+                reasoning=f"Already had {relevant} papers above the relevance threshold "
+                         f"for a top {max_papers}; remaining sources were cancelled.",
+                nim_used="nv-embedqa-e5-v5 (Embedding NIM)",
+                metadata={
+                    "sources_done": progress.sources_done,
+                    "sources_total": progress.sources_total,
+                    "relevant": relevant
+                }
+            )
+
         # Step 6: AUTONOMOUS DECISION - Rank and select top papers
-        relevant_papers.sort(
-            key=lambda p: papers_with_scores[candidate_papers.index(p)][1],
-            reverse=True
-        )
-        selected_papers = relevant_papers[:max_papers]
+        selected_papers = progress.top_papers
 
         # 🎯 LOG PAPER SELECTION DECISION
-        if len(relevant_papers) > max_papers:
+        if relevant > max_papers:
             self.decision_log.log_decision(
                 agent="Scout",
                 decision_type="PAPER_SELECTION",
                 decision=f"SELECTED top {max_papers} papers",
-                reasoning=f"Ranked {len(relevant_papers)} relevant papers by "
+                reasoning=f"Ranked {relevant} relevant papers by "
                          f"similarity score and selected top {max_papers} "
                          f"for detailed analysis.",
                 nim_used="nv-embedqa-e5-v5 (Embedding NIM)",
                 metadata={
-                    "available": len(relevant_papers),
+                    "available": relevant,
                     "selected": max_papers
                 }
             )
@@ -383,12 +629,178 @@ class ScoutAgent:
 
         logger.info(
             f"✅ Scout Agent: Found {len(deduplicated_papers)} relevant papers "
-            f"(filtered from {len(candidate_papers)} candidates, "
+            f"(filtered from {candidates} candidates, "
             f"removed {len(selected_papers) - len(deduplicated_papers)} duplicates)"
         )
 
         return deduplicated_papers
 
+    async def _plan_search_queries(self, query: str, use_query_expansion: bool) -> tuple[List[str], Any]:
+        """
+        Parse boolean queries, or semantically expand plain ones
+
+        Returns:
+            (search queries, boolean AST or None); a boolean query is searched
+            once per source (see _source_query)
+        """
+        # Step 0: Check for boolean operators and parse if present
+        search_queries = [query]
+        boolean_ast = None
+        
+        if BOOLEAN_SEARCH_AVAILABLE:
+            try:
+                boolean_parsed = parse_boolean_query(query)
+                if boolean_parsed.get("type") == "boolean":
+                    boolean_ast = boolean_parsed["ast"]
+                    logger.info(f"Boolean query detected: {boolean_ast}")
+            except Exception as e:
+                logger.warning(f"Boolean query parsing failed: {e}, using original query")
+        
+        # Step 0.5: Query Expansion (optional, if not boolean)
+        if boolean_ast is None:
+            if use_query_expansion and os.getenv("ENABLE_QUERY_EXPANSION", "true").lower() == "true":
+                try:
+                    expanded = await expand_search_queries(query, self.embedding_client, max_expansions=2)
+                    search_queries = expanded
+                    logger.info(f"Query expanded to {len(search_queries)} variations: {search_queries}")
+                except Exception as e:
+                    logger.warning(f"Query expansion failed: {e}, using original query")
+
+        return search_queries, boolean_ast
+
+    @staticmethod
+    def _source_query(source: str, query: str, boolean_ast) -> tuple[str, bool]:
+        """
+        Query to send to one source
+
+        Boolean queries are compiled into the source's native syntax when it
+        has one; otherwise the source gets one broad query over the positive
+        terms and its results are post-filtered with the AST.
+
+        Returns:
+            (query, post_filter)
+        """
+        if boolean_ast is None:
+            return query, False
+        native = compile_query(boolean_ast, source)
+        if native is not None:
+            logger.info(f"Boolean query for {source}: {native}")
+            return native, False
+        return broad_query(boolean_ast) or query, True
+
+    def _enabled_source_searches(self) -> List[tuple]:
+        """(source, search method) pairs for the enabled sources"""
+        source_searches = [
+            ("arxiv", self.source_config.enable_arxiv, self._search_arxiv),
+            ("pubmed", self.source_config.enable_pubmed, self._search_pubmed),
+            ("semantic_scholar", self.source_config.enable_semantic_scholar, self._search_semantic_scholar),
+            ("crossref", self.source_config.enable_crossref, self._search_crossref),
+            ("ieee", self.source_config.enable_ieee, self._search_ieee),
+            ("acm", self.source_config.enable_acm, self._search_acm),
+            ("springer", self.source_config.enable_springer, self._search_springer),
+        ]
+        enabled = [(source, search) for source, enabled, search in source_searches if enabled]
+        if self.paper_store is not None:
+            if os.getenv("PAPER_STORE_OFFLINE", "false").lower() == "true":
+                # Offline mode (load testing): serve only what is already stored
+                return [("local", self._search_local)]
+            enabled.insert(0, ("local", self._search_local))
+        return enabled
+
+    @staticmethod
+    def _source_date_filter(
+        source: str,
+        search,
+        start_year: Optional[int],
+        end_year: Optional[int]
+    ) -> tuple[Callable[[str], Awaitable[List[Paper]]], Optional[Dict[str, Any]]]:
+        """
+        Push a publication year range down to sources that support it
+
+        Returns:
+            (search, cache params); other sources are returned unchanged and
+            rely on the caller's year filter
+        """
+        if source != "arxiv" or (start_year is None and end_year is None):
+            return search, None
+
+        async def dated_search(query: str) -> List[Paper]:
+            return await search(
+                query,
+                start_date=datetime(start_year, 1, 1) if start_year is not None else None,
+                end_date=datetime(end_year, 12, 31, 23, 59) if end_year is not None else None
+            )
+
+        return dated_search, {"start_year": start_year, "end_year": end_year}
+
+    async def _budgeted_source_search(
+        self,
+        source: str,
+        search,
+        query: str,
+        budget: float,
+        params: Optional[Dict[str, Any]] = None
+    ) -> tuple[List[Paper], bool]:
+        """
+        Run one source search, giving up once its latency budget is spent
+
+        Args:
+            params: Source parameters that change the results (part of the cache key)
+
+        Returns:
+            (papers, failed) where failed marks fallback or timed-out results
+        """
+        with source_outcome() as outcome:
+            try:
+                papers = await asyncio.wait_for(
+                    self._run_source_search(source, search, query, params), timeout=budget
+                )
+            except asyncio.TimeoutError:
+                logger.warning(f"{source} search exceeded its {budget:.0f}s latency budget, skipping")
+                return [], True
+        return papers or [], outcome["failed"]
+
+    async def _search_local(self, query: str) -> List[Paper]:
+        """Search the local paper store (no network)"""
+        records = await asyncio.to_thread(self.paper_store.search, query, PAPER_STORE_SEARCH_LIMIT)
+        papers = []
+        for record in records:
+            record.pop("source", None)
+            papers.append(Paper(**record))
+        logger.info(f"Found {len(papers)} papers in the local paper store")
+        return papers
+
+    async def _search_vector_index(self, query_embedding: List[float], relevance_threshold: float) -> List[Paper]:
+        """Nearest stored papers to the query embedding (no network for the local index)"""
+        try:
+            hits = await self.vector_index.search(
+                query_embedding,
+                k=VECTOR_INDEX_SEARCH_LIMIT,
+                # Relevance scores are rescaled cosine; the index compares raw cosine
+                min_score=2 * relevance_threshold - 1
+            )
+        except Exception as e:
+            logger.warning(f"Vector index search failed: {e}")
+            return []
+        papers = [
+            Paper(**{**record, "embedding": list(embedding)})
+            for record, _, embedding in hits
+            if record.get("id") and embedding
+        ]
+        logger.info(f"Found {len(papers)} papers in the vector index")
+        return papers
+
+    async def _index_papers(self, papers: List[Paper]):
+        """Upsert freshly embedded papers into the vector index"""
+        papers = [p for p in papers if p.embedding is not None]
+        if not papers:
+            return
+        try:
+            indexed = await self.vector_index.upsert(papers)
+            logger.debug(f"Vector index: upserted {indexed} papers")
+        except Exception as e:
+            logger.warning(f"Vector index upsert failed: {e}")
+
     async def _deduplicate_papers(self, papers: List[Paper], similarity_threshold: float = 0.95) -> List[Paper]:
         """
         Remove duplicate papers using semantic similarity.
@@ -414,31 +826,16 @@ class ScoutAgent:
             # Not enough papers with embeddings to deduplicate
             return papers
         
-        # Build similarity matrix and identify duplicates
-        to_remove = set()
-        
-        for i, paper1 in enumerate(papers_with_embeddings):
-            if paper1.id in to_remove:
-                continue
-            
-            # Check against remaining papers
-            for paper2 in papers_with_embeddings[i+1:]:
-                if paper2.id in to_remove:
-                    continue
-                
-                # Calculate similarity
-                similarity = self.embedding_client.cosine_similarity(
-                    paper1.embedding,
-                    paper2.embedding
-                )
-                
-                # If similarity is above threshold, mark paper2 for removal
-                if similarity >= similarity_threshold:
-                    to_remove.add(paper2.id)
-                    logger.debug(
-                        f"Removing duplicate paper: '{paper2.title[:50]}...' "
-                        f"(similarity: {similarity:.3f} with '{paper1.title[:50]}...')"
-                    )
+        # Build similarity matrix and identify duplicates (keep first of each group).
+        # The threshold is on the 0-1 rescaled scale; convert it to raw cosine.
+        matrix = to_matrix([p.embedding for p in papers_with_embeddings])
+        duplicates = greedy_duplicates(matrix, 2 * similarity_threshold - 1)
+        to_remove = {
+            paper.id for paper, is_duplicate in zip(papers_with_embeddings, duplicates)
+            if is_duplicate
+        }
+        if to_remove:
+            logger.debug(f"Removing {len(to_remove)} near-duplicate papers (threshold {similarity_threshold})")
         
         # Return papers in original order (minus removed ones)
         result = []
@@ -450,49 +847,61 @@ class ScoutAgent:
         
         return result
 
-    async def _search_arxiv(self, query: str) -> List[Paper]:
-        """Search arXiv using real API"""
+    async def _run_source_search(
+        self,
+        source: str,
+        search,
+        query: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Paper]:
+        """Run one source search, through the source cache when configured"""
+        async def live_search(search_query: str) -> List[Paper]:
+            record_source_call(source)
+            return await search(search_query)
+
+        if source in ("local", "index"):
+            return await search(query)
+        if self.source_cache is None:
+            return await live_search(query)
+        return await self.source_cache.fetch(source, query, live_search, params)
+
+    async def _search_arxiv(
+        self,
+        query: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Paper]:
+        """Search arXiv using the Atom export API"""
         try:
-            import arxiv
-            
-            # Use arxiv Python library (synchronous, run in executor)
-            search = arxiv.Search(
-                query=query,
+            entries = await ArxivClient(self.http_client).search(
+                query,
                 max_results=20,
-                sort_by=arxiv.SortCriterion.Relevance,
-                sort_order=arxiv.SortOrder.Descending
+                start_date=start_date,
+                end_date=end_date
             )
             
-            # Run synchronous arxiv search in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            results = await loop.run_in_executor(None, list, search.results())
-            
-            papers = []
-            for result in results:
-                papers.append(Paper(
-                    id=f"arxiv-{result.entry_id.split('/')[-1]}",
-                    title=result.title,
-                    authors=[author.name for author in result.authors],
-                    abstract=result.summary,
-                    url=result.entry_id,
+            papers = [
+                Paper(
+                    id=f"arxiv-{entry.arxiv_id}",
+                    title=entry.title,
+                    authors=entry.authors,
+                    abstract=entry.summary,
+                    url=entry.url,
                     content=None
-                ))
-                # Limit to prevent too many results
-                if len(papers) >= 20:
-                    break
+                )
+                for entry in entries
+            ]
             
             logger.info(f"Found {len(papers)} papers from arXiv")
             return papers
             
-        except ImportError:
-            logger.warning("arxiv package not available, falling back to simulated results")
-            return await self._search_arxiv_fallback(query)
         except Exception as e:
             logger.error(f"arXiv search error: {e}")
             return await self._search_arxiv_fallback(query)
     
     async def _search_arxiv_fallback(self, query: str) -> List[Paper]:
         """Fallback simulated arXiv search"""
+        mark_source_failure("arxiv unavailable")
         return [
             Paper(
                 id="arxiv-001",
@@ -513,61 +922,30 @@ class ScoutAgent:
     async def _search_pubmed(self, query: str) -> List[Paper]:
         """Search PubMed using real E-utilities API"""
         try:
-            import aiohttp
-            import xml.etree.ElementTree as ET
+            client = PubMedClient(self.http_client, api_key=self.source_config.pubmed_api_key)
+            records = await client.search(query, max_results=20)
             
-            base_url = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
-            
-            # Ensure we have a session
-            if not self.embedding_client.session:
-                raise Exception("No HTTP session available")
-            
-            # Step 1: Search for paper IDs
-            search_url = f"{base_url}/esearch.fcgi"
-            search_params = {
-                "db": "pubmed",
-                "term": query,
-                "retmax": 20,
-                "retmode": "json",
-                "sort": "relevance"
-            }
-            
-            async with self.embedding_client.session.get(
-                search_url,
-                params=search_params
-            ) as response:
-                if response.status != 200:
-                    logger.warning(f"PubMed search returned status {response.status}")
-                    return await self._search_pubmed_fallback(query)
-                
-                search_result = await response.json()
-                pmids = search_result.get("esearchresult", {}).get("idlist", [])
-            
-            if not pmids:
+            if not records:
                 logger.info("No PubMed results found")
                 return await self._search_pubmed_fallback(query)
             
-            # Step 2: Fetch paper details (limit to 20)
-            pmids = pmids[:20]
-            fetch_url = f"{base_url}/efetch.fcgi"
-            fetch_params = {
-                "db": "pubmed",
-                "id": ",".join(pmids),
-                "retmode": "xml"
-            }
-            
-            async with self.embedding_client.session.get(
-                fetch_url,
-                params=fetch_params
-            ) as response:
-                if response.status != 200:
-                    logger.warning(f"PubMed fetch returned status {response.status}")
-                    return await self._search_pubmed_fallback(query)
-                
-                xml_text = await response.text()
-            
-            # Step 3: Parse XML
-            papers = self._parse_pubmed_xml(xml_text)
+            papers = [
+                Paper(
+                    id=(
+                        f"pubmed-{record.pmid}" if record.pmid
+                        else fallback_paper_id("pubmed", record.title, record.authors, record.abstract)
+                    ),
+                    title=record.title,
+                    authors=record.authors,
+                    abstract=record.abstract,
+                    url=record.url,
+                    content=None,
+                    year=record.year,
+                    venue=record.journal,
+                    doi=record.doi
+                )
+                for record in records
+            ]
             
             logger.info(f"Found {len(papers)} papers from PubMed")
             return papers
@@ -576,67 +954,9 @@ class ScoutAgent:
             logger.error(f"PubMed search error: {e}")
             return await self._search_pubmed_fallback(query)
     
-    def _parse_pubmed_xml(self, xml_text: str) -> List[Paper]:
-        """Parse PubMed XML response"""
-        try:
-            import xml.etree.ElementTree as ET
-            
-            root = ET.fromstring(xml_text)
-            papers = []
-            
-            for article in root.findall(".//PubmedArticle"):
-                try:
-                    # Extract title
-                    title_elem = article.find(".//ArticleTitle")
-                    title = title_elem.text if title_elem is not None and title_elem.text else "No title"
-                    
-                    # Extract authors
-                    authors = []
-                    for author in article.findall(".//Author"):
-                        lastname_elem = author.find("LastName")
-                        forename_elem = author.find("ForeName")
-                        if lastname_elem is not None and lastname_elem.text:
-                            name = lastname_elem.text
-                            if forename_elem is not None and forename_elem.text:
-                                name = f"{forename_elem.text} {name}"
-                            authors.append(name)
-                    
-                    # Extract abstract
-                    abstract_text = ""
-                    for abstract_elem in article.findall(".//AbstractText"):
-                        if abstract_elem.text:
-                            abstract_text += abstract_elem.text + " "
-                    abstract_text = abstract_text.strip() or "No abstract available"
-                    
-                    # Extract PMID for URL
-                    pmid_elem = article.find(".//PMID")
-                    pmid = pmid_elem.text if pmid_elem is not None and pmid_elem.text else ""
-                    url = f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/" if pmid else ""
-                    
-                    # Extract publication date
-                    pub_date_elem = article.find(".//PubDate/Year")
-                    pub_year = pub_date_elem.text if pub_date_elem is not None and pub_date_elem.text else "Unknown"
-                    
-                    papers.append(Paper(
-                        id=f"pubmed-{pmid}" if pmid else f"pubmed-{len(papers)}",
-                        title=title,
-                        authors=authors,
-                        abstract=abstract_text,
-                        url=url,
-                        content=None
-                    ))
-                except Exception as e:
-                    logger.warning(f"Error parsing PubMed article: {e}")
-                    continue
-            
-            return papers
-            
-        except Exception as e:
-            logger.error(f"PubMed XML parse error: {e}")
-            return []
-    
     async def _search_pubmed_fallback(self, query: str) -> List[Paper]:
         """Fallback simulated PubMed search"""
+        mark_source_failure("pubmed unavailable")
         return [
             Paper(
                 id="pubmed-001",
@@ -655,10 +975,6 @@ class ScoutAgent:
             api_key = self.source_config.semantic_scholar_api_key or os.getenv("SEMANTIC_SCHOLAR_API_KEY")
             base_url = "https://api.semanticscholar.org/graph/v1/paper/search"
             
-            # Ensure we have a session
-            if not self.embedding_client.session:
-                raise Exception("No HTTP session available")
-            
             headers = {}
             if api_key:
                 headers["x-api-key"] = api_key
@@ -666,14 +982,14 @@ class ScoutAgent:
             params = {
                 "query": query,
                 "limit": 20,
-                "fields": "title,authors,year,abstract,url,paperId"
+                "fields": "title,authors,year,abstract,url,paperId,venue,externalIds"
             }
             
-            async with self.embedding_client.session.get(
+            async with self.http_client.get(
                 base_url,
                 headers=headers,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=aiohttp.ClientTimeout(total=budget_timeout(30))
             ) as response:
                 if response.status != 200:
                     logger.warning(f"Semantic Scholar returned status {response.status}")
@@ -700,13 +1016,25 @@ class ScoutAgent:
                     if not paper_url and paper_id:
                         paper_url = f"https://www.semanticscholar.org/paper/{paper_id}"
                     
+                    external_ids = paper_data.get("externalIds") or {}
+                    doi = external_ids.get("DOI")
+                    if not doi and external_ids.get("ArXiv"):
+                        doi = f"10.48550/arXiv.{external_ids['ArXiv']}"
+                    
+                    title = paper_data.get("title", "No title")
                     papers.append(Paper(
-                        id=f"semanticscholar-{paper_id}" if paper_id else f"semanticscholar-{len(papers)}",
-                        title=paper_data.get("title", "No title"),
+                        id=(
+                            f"semanticscholar-{paper_id}" if paper_id
+                            else fallback_paper_id("semanticscholar", title, authors, paper_data.get("abstract"))
+                        ),
+                        title=title,
                         authors=authors,
                         abstract=paper_data.get("abstract", "No abstract available"),
                         url=paper_url,
-                        content=None
+                        content=None,
+                        year=paper_data.get("year"),
+                        venue=paper_data.get("venue") or None,
+                        doi=doi
                     ))
                 except Exception as e:
                     logger.warning(f"Error parsing Semantic Scholar paper: {e}")
@@ -721,6 +1049,7 @@ class ScoutAgent:
     
     async def _search_semantic_scholar_fallback(self, query: str) -> List[Paper]:
         """Fallback for Semantic Scholar"""
+        mark_source_failure("semantic_scholar unavailable")
         return []
 
     async def _search_crossref(self, query: str) -> List[Paper]:
@@ -730,10 +1059,6 @@ class ScoutAgent:
             
             base_url = "https://api.crossref.org/works"
             
-            # Ensure we have a session
-            if not self.embedding_client.session:
-                raise Exception("No HTTP session available")
-            
             params = {
                 "query": query,
                 "rows": 20,
@@ -744,11 +1069,11 @@ class ScoutAgent:
             mailto = self.source_config.crossref_mailto or os.getenv("CROSSREF_MAILTO", "research-ops@example.com")
             headers = {"User-Agent": f"ResearchOps-Agent/1.0 (mailto:{mailto})"}
             
-            async with self.embedding_client.session.get(
+            async with self.http_client.get(
                 base_url,
                 headers=headers,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=aiohttp.ClientTimeout(total=budget_timeout(30))
             ) as response:
                 if response.status != 200:
                     logger.warning(f"Crossref returned status {response.status}")
@@ -796,13 +1121,21 @@ class ScoutAgent:
                         if date_parts and len(date_parts[0]) > 0:
                             year = str(date_parts[0][0])
                     
+                    venue = item.get("container-title", [])
+                    if isinstance(venue, list):
+                        venue = venue[0] if venue else None
+                    
+                    native_id = item.get('DOI', item.get('URL', '').split('/')[-1] if item.get('URL') else None)
                     papers.append(Paper(
-                        id=f"crossref-{item.get('DOI', item.get('URL', '').split('/')[-1] if item.get('URL') else len(papers))}",
+                        id=f"crossref-{native_id}" if native_id else fallback_paper_id("crossref", title, authors, abstract),
                         title=title,
                         authors=authors,
                         abstract=abstract,
                         url=url,
-                        content=None
+                        content=None,
+                        year=int(year) if year and year.isdigit() else None,
+                        venue=venue or None,
+                        doi=item.get("DOI")
                     ))
                 except Exception as e:
                     logger.warning(f"Error parsing Crossref paper: {e}")
@@ -817,6 +1150,7 @@ class ScoutAgent:
     
     async def _search_crossref_fallback(self, query: str) -> List[Paper]:
         """Fallback for Crossref"""
+        mark_source_failure("crossref unavailable")
         return []
 
     async def _search_ieee(self, query: str) -> List[Paper]:
@@ -831,10 +1165,6 @@ class ScoutAgent:
             
             base_url = "https://ieeexploreapi.ieee.org/api/v1/search/articles"
             
-            # Ensure we have a session
-            if not self.embedding_client.session:
-                raise Exception("No HTTP session available")
-            
             params = {
                 "apikey": api_key,
                 "querytext": query,
@@ -842,13 +1172,14 @@ class ScoutAgent:
                 "sort_order": "relevance"
             }
             
-            async with self.embedding_client.session.get(
+            async with self.http_client.get(
                 base_url,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=aiohttp.ClientTimeout(total=budget_timeout(30))
             ) as response:
                 if response.status != 200:
                     logger.warning(f"IEEE returned status {response.status}")
+                    mark_source_failure(f"status {response.status}")
                     return []
                 
                 result = await response.json()
@@ -876,9 +1207,11 @@ class ScoutAgent:
                     if not url and article_number:
                         url = f"https://ieeexplore.ieee.org/document/{article_number}"
                     
+                    native_id = article_number or article.get('publication_number')
+                    title = article.get("title", "No title")
                     papers.append(Paper(
-                        id=f"ieee-{article_number or article.get('publication_number', len(papers))}",
-                        title=article.get("title", "No title"),
+                        id=f"ieee-{native_id}" if native_id else fallback_paper_id("ieee", title, authors, abstract),
+                        title=title,
                         authors=authors,
                         abstract=abstract,
                         url=url,
@@ -893,6 +1226,7 @@ class ScoutAgent:
             
         except Exception as e:
             logger.error(f"IEEE search error: {e}")
+            mark_source_failure(str(e))
             return []
 
     async def _search_acm(self, query: str) -> List[Paper]:
@@ -910,10 +1244,6 @@ class ScoutAgent:
             # ACM API endpoint (this may vary based on ACM's API structure)
             base_url = "https://api.acm.org/v1/search"
             
-            # Ensure we have a session
-            if not self.embedding_client.session:
-                raise Exception("No HTTP session available")
-            
             headers = {
                 "Authorization": f"Bearer {api_key}",
                 "Accept": "application/json"
@@ -924,14 +1254,15 @@ class ScoutAgent:
                 "limit": 20
             }
             
-            async with self.embedding_client.session.get(
+            async with self.http_client.get(
                 base_url,
                 headers=headers,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=aiohttp.ClientTimeout(total=budget_timeout(30))
             ) as response:
                 if response.status != 200:
                     logger.warning(f"ACM returned status {response.status}")
+                    mark_source_failure(f"status {response.status}")
                     return []
                 
                 result = await response.json()
@@ -948,11 +1279,14 @@ class ScoutAgent:
                         if name:
                             authors.append(name)
                     
+                    native_id = item.get('id', item.get('doi'))
+                    title = item.get("title", "No title")
+                    abstract = item.get("abstract", item.get("description", "No abstract available"))
                     papers.append(Paper(
-                        id=f"acm-{item.get('id', item.get('doi', len(papers)))}",
-                        title=item.get("title", "No title"),
+                        id=f"acm-{native_id}" if native_id else fallback_paper_id("acm", title, authors, abstract),
+                        title=title,
                         authors=authors,
-                        abstract=item.get("abstract", item.get("description", "No abstract available")),
+                        abstract=abstract,
                         url=item.get("url", item.get("pdfUrl", f"https://dl.acm.org/doi/{item.get('doi', '')}")),
                         content=None
                     ))
@@ -965,6 +1299,7 @@ class ScoutAgent:
             
         except Exception as e:
             logger.error(f"ACM search error: {e}")
+            mark_source_failure(str(e))
             return []
 
     async def _search_springer(self, query: str) -> List[Paper]:
@@ -979,10 +1314,6 @@ class ScoutAgent:
             
             base_url = "https://api.springernature.com/metadata/json"
             
-            # Ensure we have a session
-            if not self.embedding_client.session:
-                raise Exception("No HTTP session available")
-            
             params = {
                 "q": query,
                 "api_key": api_key,
@@ -990,13 +1321,14 @@ class ScoutAgent:
                 "s": 1    # Start page
             }
             
-            async with self.embedding_client.session.get(
+            async with self.http_client.get(
                 base_url,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=aiohttp.ClientTimeout(total=budget_timeout(30))
             ) as response:
                 if response.status != 200:
                     logger.warning(f"Springer returned status {response.status}")
+                    mark_source_failure(f"status {response.status}")
                     return []
                 
                 result = await response.json()
@@ -1038,9 +1370,11 @@ class ScoutAgent:
                     if not url and doi:
                         url = f"https://doi.org/{doi}"
                     
+                    native_id = doi or record.get('identifier')
+                    title = record.get("title", "No title")
                     papers.append(Paper(
-                        id=f"springer-{doi or record.get('identifier', len(papers))}",
-                        title=record.get("title", "No title"),
+                        id=f"springer-{native_id}" if native_id else fallback_paper_id("springer", title, authors, abstract),
+                        title=title,
                         authors=authors,
                         abstract=abstract,
                         url=url,
@@ -1055,6 +1389,7 @@ class ScoutAgent:
             
         except Exception as e:
             logger.error(f"Springer search error: {e}")
+            mark_source_failure(str(e))
             return []
 
 
@@ -1064,6 +1399,12 @@ class AnalystAgent:
     Uses Reasoning NIM to extract structured information
     """
 
+    # Registry versions; bumped with the prompt text so cached completions are invalidated
+    PROMPT_VERSION = prompts.ANALYSIS.version
+    PACKED_PROMPT_VERSION = prompts.ANALYSIS_PACKED.version
+    # Stored analyses are reused only while both templates are unchanged
+    STORE_VERSION = f"{PROMPT_VERSION}+{PACKED_PROMPT_VERSION}"
+
     def __init__(self, reasoning_client: ReasoningNIMClient):
         self.reasoning_client = reasoning_client
 
@@ -1078,84 +1419,25 @@ class AnalystAgent:
         """
         logger.info(f"📊 Analyst Agent: Analyzing '{paper.title}'")
 
-        # Construct enhanced analysis prompt with statistical and experimental extraction
-        prompt = f"""
-Analyze this research paper and extract comprehensive information.
-
-Title: {paper.title}
-Authors: {', '.join(paper.authors)}
-Abstract: {paper.abstract}
-
-Extract the following in JSON format:
-{{
-    "research_question": "main research question",
-    "methodology": "research methodology used",
-    "key_findings": ["finding 1", "finding 2", "finding 3"],
-    "limitations": ["limitation 1", "limitation 2"],
-    "confidence": 0.0-1.0,
-    "statistical_results": {{
-        "p_values": ["p < 0.05", "p = 0.001"],
-        "effect_sizes": ["Cohen's d = 0.8", "R² = 0.65"],
-        "confidence_intervals": ["95% CI: [0.5, 0.9]"],
-        "statistical_tests": ["t-test", "ANOVA"]
-    }},
-    "experimental_setup": {{
-        "datasets": ["Dataset A", "Dataset B"],
-        "hardware": "GPU/CPU specifications",
-        "hyperparameters": ["learning_rate: 0.001", "batch_size: 32"],
-        "software_frameworks": ["PyTorch", "TensorFlow"]
-    }},
-    "comparative_results": {{
-        "baselines": ["baseline method 1", "baseline method 2"],
-        "benchmarks": ["SOTA: 95% accuracy", "Previous: 90% accuracy"],
-        "improvements": ["10% improvement over baseline"]
-    }},
-    "reproducibility": {{
-        "code_available": true/false,
-        "data_available": true/false,
-        "repository_url": "GitHub/Zenodo URL if available"
-    }}
-}}
-
-JSON Output:
-"""
-
-        # Use reasoning model to extract structured info with enhanced schema
+        # Static instructions and output template first, the paper last (prefix-cache friendly)
         analysis_result = await self.reasoning_client.extract_structured(
-            prompt,
-            schema={
-                "research_question": "string",
-                "methodology": "string",
-                "key_findings": "list",
-                "limitations": "list",
-                "confidence": "float",
-                "statistical_results": {
-                    "p_values": "list",
-                    "effect_sizes": "list",
-                    "confidence_intervals": "list",
-                    "statistical_tests": "list"
-                },
-                "experimental_setup": {
-                    "datasets": "list",
-                    "hardware": "string",
-                    "hyperparameters": "list",
-                    "software_frameworks": "list"
-                },
-                "comparative_results": {
-                    "baselines": "list",
-                    "benchmarks": "list",
-                    "improvements": "list"
-                },
-                "reproducibility": {
-                    "code_available": "boolean",
-                    "data_available": "boolean",
-                    "repository_url": "string"
-                }
-            }
+            prompts.format_paper(paper.title, paper.authors, paper.abstract),
+            schema=prompts.ANALYSIS_JSON_TEMPLATE,
+            instructions=prompts.ANALYSIS_INSTRUCTIONS,
+            cache=True,
+            template_version=self.PROMPT_VERSION
         )
 
+        analysis = self._build_analysis(paper.id, analysis_result)
+        logger.info(f"✅ Analyst Agent: Extracted {len(analysis.key_findings)} findings")
+
+        return analysis
+
+    @staticmethod
+    def _build_analysis(paper_id: str, analysis_result: Dict[str, Any]) -> Analysis:
+        """Convert extracted JSON into an Analysis"""
         analysis = Analysis(
-            paper_id=paper.id,
+            paper_id=paper_id,
             research_question=analysis_result.get("research_question", ""),
             methodology=analysis_result.get("methodology", ""),
             key_findings=analysis_result.get("key_findings", []),
@@ -1170,10 +1452,97 @@ JSON Output:
             "comparative_results": analysis_result.get("comparative_results", {}),
             "reproducibility": analysis_result.get("reproducibility", {})
         }
+        return analysis
 
-        logger.info(f"✅ Analyst Agent: Extracted {len(analysis.key_findings)} findings")
+    @staticmethod
+    def pack_papers(
+        papers: List[Paper],
+        max_papers: int = ANALYSIS_PACK_SIZE,
+        token_budget: int = ANALYSIS_PACK_TOKEN_BUDGET
+    ) -> List[List[Paper]]:
+        """
+        Group papers for packed analysis, in order
 
-        return analysis
+        A group closes when it reaches max_papers or when the next paper's
+        estimated title + abstract tokens would exceed token_budget, so long
+        abstracts get smaller groups. A paper over budget on its own is
+        analyzed alone.
+        """
+        groups: List[List[Paper]] = []
+        current: List[Paper] = []
+        current_tokens = 0
+        for paper in papers:
+            tokens = estimate_tokens(f"{paper.title} {paper.abstract}")
+            if current and (len(current) >= max_papers or current_tokens + tokens > token_budget):
+                groups.append(current)
+                current, current_tokens = [], 0
+            current.append(paper)
+            current_tokens += tokens
+        if current:
+            groups.append(current)
+        return groups
+
+    async def analyze_packed(self, papers: List[Paper]) -> List[Analysis]:
+        """
+        Analyze several papers in one completion
+
+        The instruction header and output template are sent once, followed by
+        every paper; the model answers with a JSON array keyed by paper_id.
+        Elements are parsed independently and any paper whose element is
+        missing or malformed is re-analyzed on its own.
+
+        Returns:
+            One Analysis per paper, in input order
+        """
+        if len(papers) == 1:
+            return [await self.analyze(papers[0])]
+
+        logger.info(f"📊 Analyst Agent: Analyzing {len(papers)} papers in one packed prompt")
+        prompt = prompts.ANALYSIS_PACKED.render(papers="\n\n".join(
+            prompts.format_paper(paper.title, paper.authors, paper.abstract, paper_id=paper.id)
+            for paper in papers
+        ))
+
+        wanted = {paper.id for paper in papers}
+
+        def packed_elements(response: str) -> Dict[str, Dict[str, Any]]:
+            elements: Dict[str, Dict[str, Any]] = {}
+            for element in parse_json_objects(response):
+                paper_id = str(element.get("paper_id", ""))
+                if paper_id in wanted and paper_id not in elements:
+                    elements[paper_id] = element
+            return elements
+
+        results: Dict[str, Dict[str, Any]] = {}
+        try:
+            response = await self.reasoning_client.complete(
+                prompt,
+                max_tokens=ANALYSIS_OUTPUT_TOKENS_PER_PAPER * len(papers),
+                temperature=0.3,
+                cache=True,
+                template_version=self.PACKED_PROMPT_VERSION,
+                # Only a reply covering every paper is worth replaying
+                validate=lambda reply: len(packed_elements(reply)) == len(wanted)
+            )
+            results = packed_elements(response)
+        except Exception as e:
+            logger.warning(f"Packed analysis failed, analyzing {len(papers)} papers individually: {e}")
+
+        missing = [paper for paper in papers if paper.id not in results]
+        if missing:
+            logger.info(f"Packed analysis: retrying {len(missing)}/{len(papers)} papers individually")
+        retried = await asyncio.gather(*[self.analyze(paper) for paper in missing], return_exceptions=True)
+        by_id = {}
+        for paper, analysis in zip(missing, retried):
+            if isinstance(analysis, Exception):
+                # Same empty analysis as an unparsed reply; the rest of the group is kept
+                logger.error(f"Error analyzing paper {paper.id}: {analysis}")
+                analysis = self._build_analysis(paper.id, {})
+            by_id[paper.id] = analysis
+        by_id.update({paper_id: self._build_analysis(paper_id, result) for paper_id, result in results.items()})
+
+        logger.info(f"✅ Analyst Agent: Packed analysis of {len(papers)} papers")
+        return [by_id[paper.id] for paper in papers]
 
 
 class SynthesizerAgent:
@@ -1191,7 +1560,11 @@ class SynthesizerAgent:
         self.embedding_client = embedding_client
         self.decision_log = DecisionLog()
 
-    async def synthesize(self, analyses: List[Analysis]) -> Synthesis:
+    async def synthesize(
+        self,
+        analyses: List[Analysis],
+        finding_embeddings: Optional[List[List[float]]] = None
+    ) -> Synthesis:
         """
         Synthesize findings across multiple papers
 
@@ -1199,6 +1572,11 @@ class SynthesizerAgent:
         - Identify common themes (using embeddings)
         - Find contradictions (using reasoning)
         - Identify gaps (using reasoning)
+
+        Args:
+            analyses: Paper analyses
+            finding_embeddings: Embeddings of every key finding, in analysis
+                order, when already computed (e.g. by the pipelined run)
         """
         logger.info(f"🧩 Synthesizer Agent: Synthesizing {len(analyses)} analyses")
 
@@ -1208,10 +1586,11 @@ class SynthesizerAgent:
             all_findings.extend(analysis.key_findings)
 
         # Embed all findings
-        finding_embeddings = await self.embedding_client.embed_batch(
-            all_findings,
-            input_type="passage"
-        )
+        if finding_embeddings is None or len(finding_embeddings) != len(all_findings):
+            finding_embeddings = await self.embedding_client.embed_batch(
+                all_findings,
+                input_type="passage"
+            )
 
         # Find clusters of similar findings
         themes = await self._cluster_findings(all_findings, finding_embeddings)
@@ -1238,18 +1617,7 @@ class SynthesizerAgent:
             for i, analysis in enumerate(analyses)
         ])
 
-        contradiction_prompt = f"""
-Analyze these research findings and identify any contradictions or conflicting results.
-
-{findings_text}
-
-List contradictions in the format:
-- [Paper X] says: ...
-- [Paper Y] says: ...
-- Conflict: ...
-
-Contradictions:
-"""
+        contradiction_prompt = prompts.CONTRADICTIONS.render(findings=findings_text)
 
         contradictions_text = await self.reasoning_client.complete(
             contradiction_prompt,
@@ -1273,15 +1641,7 @@ Contradictions:
         )
 
         # Step 3: Identify research gaps
-        gap_prompt = f"""
-Based on these research findings, identify gaps in the literature and areas needing further investigation.
-
-{findings_text}
-
-Common themes identified: {themes}
-
-Research gaps and future directions:
-"""
+        gap_prompt = prompts.RESEARCH_GAPS.render(findings=findings_text, themes=themes)
 
         gaps_text = await self.reasoning_client.complete(
             gap_prompt,
@@ -1515,26 +1875,14 @@ Research gaps and future directions:
     
     async def _evaluate_synthesis_quality(self, synthesis: Synthesis) -> float:
         """Evaluate synthesis quality using reasoning model"""
-        eval_prompt = f"""
-Evaluate the quality of this research synthesis on a scale of 0.0 to 1.0.
-
-Common Themes ({len(synthesis.common_themes)}):
-{chr(10).join(f"- {theme}" for theme in synthesis.common_themes)}
-
-Contradictions ({len(synthesis.contradictions)}):
-{chr(10).join(f"- {c}" for c in synthesis.contradictions)}
-
-Research Gaps ({len(synthesis.gaps)}):
-{chr(10).join(f"- {gap}" for gap in synthesis.gaps)}
-
-Evaluation Criteria:
-1. Theme Coherence: Are themes well-defined and distinct?
-2. Contradiction Clarity: Are conflicts clearly explained?
-3. Gap Specificity: Are gaps specific and actionable?
-
-Provide a quality score (0.0-1.0) and brief explanation.
-Format: Score: 0.85 | Explanation: ...
-"""
+        eval_prompt = prompts.SYNTHESIS_QUALITY.render(
+            theme_count=len(synthesis.common_themes),
+            themes="\n".join(f"- {theme}" for theme in synthesis.common_themes),
+            contradiction_count=len(synthesis.contradictions),
+            contradictions="\n".join(f"- {c}" for c in synthesis.contradictions),
+            gap_count=len(synthesis.gaps),
+            gaps="\n".join(f"- {gap}" for gap in synthesis.gaps)
+        )
         
         try:
             response = await self.reasoning_client.complete(
@@ -1570,24 +1918,14 @@ Format: Score: 0.85 | Explanation: ...
         else:
             focus_instruction = "Improve all aspects: themes, contradictions, and gaps."
         
-        refinement_prompt = f"""
-Refine this research synthesis to improve quality (current: {current_quality:.2f}).
-
-Strategy: {strategy}
-{focus_instruction}
-
-Current Synthesis:
-Themes: {synthesis.common_themes}
-Contradictions: {synthesis.contradictions}
-Gaps: {synthesis.gaps}
-
-Provide refined synthesis in JSON format:
-{{
-    "themes": ["theme 1", "theme 2", ...],
-    "contradictions": ["contradiction 1", "contradiction 2", ...],
-    "gaps": ["gap 1", "gap 2", ...]
-}}
-"""
+        refinement_prompt = prompts.SYNTHESIS_REFINEMENT.render(
+            quality=current_quality,
+            strategy=strategy,
+            focus_instruction=focus_instruction,
+            themes=synthesis.common_themes,
+            contradictions=synthesis.contradictions,
+            gaps=synthesis.gaps
+        )
         
         try:
             response = await self.reasoning_client.complete(
@@ -1770,25 +2108,11 @@ class CoordinatorAgent:
         """
         logger.info(f"🎯 Coordinator: Evaluating search completeness")
 
-        decision_prompt = f"""
-You are coordinating a research synthesis project.
-
-Research Query: {query}
-Papers Found: {papers_found}
-Topics Covered: {', '.join(current_coverage)}
-
-Based on this information, decide if we need to search for more papers.
-
-Consider:
-- Is the number of papers sufficient for a comprehensive review?
-- Are there important subtopics or aspects not yet covered?
-- Is there enough diversity in the papers found?
-
-Decision (yes/no): Should we search for MORE papers?
-Reasoning: Why or why not?
-
-Response:
-"""
+        decision_prompt = prompts.SEARCH_CONTINUATION.render(
+            query=query,
+            papers_found=papers_found,
+            topics=', '.join(current_coverage)
+        )
 
         response = await self.reasoning_client.complete(
             decision_prompt,
@@ -1829,23 +2153,11 @@ Response:
         """
         logger.info(f"🎯 Coordinator: Evaluating synthesis quality (threshold: {quality_threshold})")
 
-        decision_prompt = f"""
-Evaluate if this research synthesis is complete and high-quality.
-
-Common Themes: {len(synthesis.common_themes)} identified
-Contradictions: {len(synthesis.contradictions)} found
-Research Gaps: {len(synthesis.gaps)} identified
-
-Is this synthesis:
-- Comprehensive enough for a literature review?
-- Well-structured with clear themes?
-- Properly identifying contradictions and gaps?
-
-Decision (yes/no): Is the synthesis COMPLETE?
-Reasoning: Why or why not?
-
-Response:
-"""
+        decision_prompt = prompts.SYNTHESIS_COMPLETENESS.render(
+            theme_count=len(synthesis.common_themes),
+            contradiction_count=len(synthesis.contradictions),
+            gap_count=len(synthesis.gaps)
+        )
 
         response = await self.reasoning_client.complete(
             decision_prompt,
@@ -2062,8 +2374,39 @@ class ResearchOpsAgent:
         reasoning_client: ReasoningNIMClient,
         embedding_client: EmbeddingNIMClient
     ):
-        self.scout = ScoutAgent(embedding_client)
+        source_cache = None
+        if SOURCE_CACHE_AVAILABLE and os.getenv("ENABLE_SOURCE_CACHE", "true").lower() == "true":
+            try:
+                source_cache = get_source_cache(paper_factory=Paper)
+            except Exception as e:
+                logger.warning(f"Source cache initialization failed: {e}")
+        paper_store = None
+        if PAPER_STORE_AVAILABLE and os.getenv("ENABLE_PAPER_STORE", "true").lower() == "true":
+            try:
+                paper_store = get_paper_store()
+            except Exception as e:
+                logger.warning(f"Paper store initialization failed: {e}")
+        vector_index = None
+        if VECTOR_INDEX_AVAILABLE and os.getenv("ENABLE_VECTOR_INDEX", "true").lower() == "true":
+            try:
+                vector_index = get_vector_index()
+            except Exception as e:
+                logger.warning(f"Vector index initialization failed: {e}")
+        self.scout = ScoutAgent(
+            embedding_client,
+            source_cache=source_cache,
+            paper_store=paper_store,
+            vector_index=vector_index
+        )
         self.analyst = AnalystAgent(reasoning_client)
+        # Analyses depend only on the paper and the prompt, so they are reused across queries
+        self.analysis_store = None
+        if ANALYSIS_STORE_AVAILABLE and os.getenv("ENABLE_ANALYSIS_STORE", "true").lower() == "true":
+            try:
+                # Stale prompt versions are purged once per process, not per request
+                self.analysis_store = get_analysis_store(AnalystAgent.STORE_VERSION)
+            except Exception as e:
+                logger.warning(f"Analysis store initialization failed: {e}")
         self.synthesizer = SynthesizerAgent(reasoning_client, embedding_client)
         self.coordinator = CoordinatorAgent(reasoning_client)
         
@@ -2112,7 +2455,14 @@ class ResearchOpsAgent:
             logger.error(f"Invalid input: {e}")
             raise ValueError(f"Invalid input: {str(e)}")
 
-    async def _execute_search_phase(self, query: str, max_papers: int) -> List[Any]:
+    async def _execute_search_phase(
+        self,
+        query: str,
+        max_papers: int,
+        on_progress: Optional[Callable[[SearchProgress], Awaitable[None]]] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
+    ) -> List[Any]:
         """
         Execute search phase with autonomous expansion
         
@@ -2120,12 +2470,26 @@ class ResearchOpsAgent:
         - Initial paper search
         - Autonomous decision to search for more papers
         - Consolidate search-related decisions
+
+        Args:
+            query: Research query
+            max_papers: Maximum papers to select
+            on_progress: Optional coroutine called with each streaming Scout
+                snapshot, so callers can show papers before every source answers
+            start_year: Publication year lower bound passed to the Scout
+            end_year: Publication year upper bound passed to the Scout
         
         Returns:
             List of Paper objects
         """
         self.progress_tracker.set_stage(Stage.SEARCHING, "Embedding NIM")
-        papers = await self.scout.search(query, max_papers=max_papers)
+        papers = await self.scout.search(
+            query,
+            max_papers=max_papers,
+            on_progress=on_progress,
+            start_year=start_year,
+            end_year=end_year
+        )
         self.progress_tracker.set_papers_found(len(papers))
         self.progress_tracker.set_papers_total(len(papers))
         
@@ -2139,7 +2503,9 @@ class ResearchOpsAgent:
             logger.info("🔄 Agent decided to search for more papers")
             additional_papers = await self.scout.search(
                 f"{query} additional perspectives",
-                max_papers=5
+                max_papers=5,
+                start_year=start_year,
+                end_year=end_year
             )
             papers.extend(additional_papers)
         
@@ -2150,11 +2516,104 @@ class ResearchOpsAgent:
         
         return papers
 
+    async def _lookup_stored_analyses(self, papers: List[Any]) -> Dict[str, tuple[Analysis, str]]:
+        """
+        Fetch analyses of papers from the analysis store in one bulk lookup
+
+        Store errors count as misses.
+
+        Returns:
+            {paper.id: (Analysis, tier)} for papers already analyzed with the
+            current prompts, tier "warm" or "cold"
+        """
+        if self.analysis_store is None or not papers:
+            return {}
+        try:
+            found = await asyncio.to_thread(
+                self.analysis_store.get_many, papers, AnalystAgent.STORE_VERSION
+            )
+        except Exception as e:
+            logger.warning(f"Analysis store lookup failed: {e}")
+            found = {}
+
+        stored = {}
+        for paper_id, (analysis, tier) in found.items():
+            try:
+                stored[paper_id] = (Analysis(**{**analysis, "paper_id": paper_id}), tier)
+            except TypeError as e:
+                logger.warning(f"Ignoring malformed stored analysis for {paper_id}: {e}")
+        return stored
+
+    def _record_analysis_reuse(self, papers: List[Any], stored: Dict[str, tuple[Analysis, str]]):
+        """Record one request's analysis store hit rate (metrics, resource ledger and log)"""
+        if self.analysis_store is None or not papers:
+            return
+        warm_hits = sum(1 for _, tier in stored.values() if tier == "warm")
+        cold_hits = len(stored) - warm_hits
+        for paper in papers:
+            record_cache_lookup("analysis", paper.id in stored)
+        if self.metrics:
+            self.metrics.record_analysis_store_lookups(warm_hits, cold_hits, len(papers) - len(stored))
+        logger.info(
+            f"Analysis store: {len(stored)}/{len(papers)} papers reused "
+            f"({warm_hits} warm, {cold_hits} cold, hit rate {len(stored) / len(papers):.0%})"
+        )
+
+    async def _store_analyses(self, papers: List[Any], analyses: List[Any]):
+        """Store fresh analyses for reuse by later queries, skipping failures and placeholders"""
+        if self.analysis_store is None:
+            return
+        entries = [
+            (paper, asdict(analysis))
+            for paper, analysis in zip(papers, analyses)
+            if isinstance(analysis, Analysis) and (analysis.key_findings or analysis.methodology)
+        ]
+        if not entries:
+            return
+        try:
+            await asyncio.to_thread(self.analysis_store.put_many, entries, AnalystAgent.STORE_VERSION)
+        except Exception as e:
+            logger.warning(f"Analysis store write failed: {e}")
+
+    @staticmethod
+    def _placeholder_analysis(paper: Any, query: str) -> Analysis:
+        """Placeholder analysis so one failure does not stop processing"""
+        return Analysis(
+            paper_id=paper.id,
+            research_question=query,
+            key_findings=[],
+            methodology="",
+            limitations=[],
+            confidence=0.0,
+            metadata={}
+        )
+
+    @staticmethod
+    def _assess_quality(paper: Any, analysis: Analysis) -> Any:
+        """Score one paper's quality from its metadata and analysis"""
+        from quality_assessment import assess_paper_quality
+        paper_data = {
+            "id": paper.id,
+            "title": paper.title,
+            "authors": paper.authors,
+            "source": paper.id.split('-')[0] if '-' in paper.id else "unknown",
+            "venue": getattr(paper, 'venue', None) or '',
+            "published_date": getattr(paper, 'published_date', None)
+        }
+        analysis_data = {
+            "methodology": analysis.methodology,
+            "statistical_results": analysis.metadata.get("statistical_results", {}) if analysis.metadata else {},
+            "experimental_setup": analysis.metadata.get("experimental_setup", {}) if analysis.metadata else {},
+            "reproducibility": analysis.metadata.get("reproducibility", {}) if analysis.metadata else {}
+        }
+        return assess_paper_quality(paper_data, analysis_data)
+
     async def _execute_analysis_phase(self, papers: List[Any], query: str) -> tuple[List[Any], List[Any]]:
         """
         Execute parallel analysis phase with quality assessment
 
         Responsibilities:
+        - Reuse of stored analyses from earlier queries
         - Parallel paper analysis
         - Quality assessment for each paper
         - Error handling for quality assessment
@@ -2170,8 +2629,11 @@ class ResearchOpsAgent:
         self.progress_tracker.set_stage(Stage.ANALYZING, "Reasoning NIM")
         
         # Parallel analysis with concurrency limit
+        # Per-request cap; the process-wide reasoning limiter adapts to NIM load
         from constants import MAX_CONCURRENT_ANALYSES
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ANALYSES)
+        semaphore = asyncio.Semaphore(
+            int(os.getenv("MAX_CONCURRENT_ANALYSES", MAX_CONCURRENT_ANALYSES))
+        )
         
         async def analyze_with_limit(paper):
             """Analyze paper with concurrency limit"""
@@ -2180,23 +2642,47 @@ class ResearchOpsAgent:
                     return await self.analyst.analyze(paper)
                 except Exception as e:
                     logger.error(f"Error analyzing paper {paper.id}: {e}")
-                    # Return a placeholder analysis to continue processing
-                    from agents import Analysis
-                    return Analysis(
-                        paper_id=paper.id,
-                        research_question=query,
-                        key_findings=[],
-                        methodology="",
-                        limitations=[],
-                        confidence=0.0,
-                        metadata={}
-                    )
-        
-        # Process all papers in parallel with concurrency limit
-        analyses = await asyncio.gather(*[
-            analyze_with_limit(paper)
-            for paper in papers
-        ], return_exceptions=True)
+                    return self._placeholder_analysis(paper, query)
+
+        async def analyze_group_with_limit(group):
+            """Analyze a packed group of papers with concurrency limit"""
+            async with semaphore:
+                try:
+                    return await self.analyst.analyze_packed(group)
+                except Exception as e:
+                    logger.error(f"Error analyzing papers {[p.id for p in group]}: {e}")
+                    return [self._placeholder_analysis(paper, query) for paper in group]
+
+        # Analyses stored by earlier queries are fetched in one lookup; only misses reach the NIM
+        stored_hits = await self._lookup_stored_analyses(papers)
+        self._record_analysis_reuse(papers, stored_hits)
+        stored = {paper_id: analysis for paper_id, (analysis, _) in stored_hits.items()}
+        pending = [paper for paper in papers if paper.id not in stored]
+
+        # Several papers share one completion (one instruction header) when packing is enabled
+        pack_size = int(os.getenv("ANALYSIS_PACK_SIZE", ANALYSIS_PACK_SIZE))
+        if not pending:
+            fresh = []
+        elif pack_size > 1 and len(pending) > 1:
+            groups = self.analyst.pack_papers(pending, max_papers=pack_size)
+            logger.info(f"Packed {len(pending)} papers into {len(groups)} analysis prompts")
+            group_results = await asyncio.gather(*[
+                analyze_group_with_limit(group)
+                for group in groups
+            ], return_exceptions=True)
+            fresh = []
+            for group, result in zip(groups, group_results):
+                fresh.extend([result] * len(group) if isinstance(result, Exception) else result)
+        else:
+            # Process all papers in parallel with concurrency limit
+            fresh = await asyncio.gather(*[
+                analyze_with_limit(paper)
+                for paper in pending
+            ], return_exceptions=True)
+
+        await self._store_analyses(pending, fresh)
+        fresh_by_id = {paper.id: analysis for paper, analysis in zip(pending, fresh)}
+        analyses = [stored.get(paper.id) or fresh_by_id[paper.id] for paper in papers]
         
         # Filter out exceptions and log them
         valid_analyses = []
@@ -2212,24 +2698,8 @@ class ResearchOpsAgent:
         # Assess quality for each paper (with error handling)
         quality_scores = []
         try:
-            from quality_assessment import assess_paper_quality
             for paper, analysis in zip(papers, analyses):
-                paper_data = {
-                    "id": paper.id,
-                    "title": paper.title,
-                    "authors": paper.authors,
-                    "source": paper.id.split('-')[0] if '-' in paper.id else "unknown",
-                    "venue": getattr(paper, 'venue', ''),
-                    "published_date": getattr(paper, 'published_date', None)
-                }
-                analysis_data = {
-                    "methodology": analysis.methodology,
-                    "statistical_results": analysis.metadata.get("statistical_results", {}) if analysis.metadata else {},
-                    "experimental_setup": analysis.metadata.get("experimental_setup", {}) if analysis.metadata else {},
-                    "reproducibility": analysis.metadata.get("reproducibility", {}) if analysis.metadata else {}
-                }
-                quality_score = assess_paper_quality(paper_data, analysis_data)
-                quality_scores.append(quality_score)
+                quality_scores.append(self._assess_quality(paper, analysis))
             logger.info(f"✅ Quality assessed for {len(quality_scores)} papers")
         except Exception as e:
             logger.warning(f"Quality assessment failed: {e}")
@@ -2237,19 +2707,190 @@ class ResearchOpsAgent:
         
         return analyses, quality_scores
 
-    async def _execute_synthesis_phase(self, analyses: List[Any]) -> Any:
+    async def _execute_pipelined_phases(
+        self,
+        query: str,
+        max_papers: int,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
+    ) -> tuple[List[Any], List[Any], List[Any], Optional[List[List[float]]]]:
+        """
+        Execute search, analysis and per-paper post-processing as a pipeline
+
+        Papers are queued for Analyst workers as soon as they enter the
+        Scout's running top-k, and each finished analysis is scored and has
+        its findings embedded right away; only synthesis waits for the full
+        set. Workers pack whatever papers are already waiting into one
+        prompt. Queues are bounded, so a slow stage holds back the one
+        before it. Papers analyzed before being displaced from the top-k are
+        dropped from the result (their analyses are still stored for reuse).
+
+        Args:
+            query: Research query
+            max_papers: Maximum papers to select
+            start_year: Publication year lower bound passed to the Scout
+            end_year: Publication year upper bound passed to the Scout
+
+        Returns:
+            (papers, analyses, quality_scores, finding_embeddings) for the
+            papers that were analyzed, aligned by position; a quality score is
+            None where assessment failed, and finding_embeddings is None if
+            any embedding call failed
+        """
+        from constants import MAX_CONCURRENT_ANALYSES
+        workers = int(os.getenv("MAX_CONCURRENT_ANALYSES", MAX_CONCURRENT_ANALYSES))
+        pack_size = int(os.getenv("ANALYSIS_PACK_SIZE", ANALYSIS_PACK_SIZE))
+        queue_size = int(os.getenv("PIPELINE_QUEUE_SIZE", PIPELINE_QUEUE_SIZE))
+        paper_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        result_queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+
+        queued = set()
+        selected: Optional[set] = None  # Final paper IDs once the search is done
+        stored_hits: Dict[str, tuple[Analysis, str]] = {}
+        results: Dict[str, tuple] = {}  # paper.id -> (analysis, quality score, finding embeddings)
+
+        async def enqueue(candidates):
+            """Queue unseen papers; stored analyses skip the Analyst"""
+            new = [paper for paper in candidates if paper.id not in queued]
+            if not new:
+                return
+            queued.update(paper.id for paper in new)
+            hits = await self._lookup_stored_analyses(new)
+            stored_hits.update(hits)
+            for paper in new:
+                if paper.id in hits:
+                    await result_queue.put((paper, hits[paper.id][0]))
+                else:
+                    await paper_queue.put(paper)
+
+        async def on_progress(progress: SearchProgress):
+            await enqueue(progress.top_papers)
+
+        async def analyze_group(group):
+            try:
+                if len(group) == 1:
+                    return [await self.analyst.analyze(group[0])]
+                return await self.analyst.analyze_packed(group)
+            except Exception as e:
+                logger.error(f"Error analyzing papers {[p.id for p in group]}: {e}")
+                return [self._placeholder_analysis(paper, query) for paper in group]
+
+        async def analyst_worker():
+            stop = False
+            while not stop:
+                paper = await paper_queue.get()
+                if paper is None:
+                    return
+                batch = [paper]
+                # Pack papers that are already waiting instead of waiting for more
+                while len(batch) < pack_size and not paper_queue.empty():
+                    waiting = paper_queue.get_nowait()
+                    if waiting is None:
+                        stop = True
+                        break
+                    batch.append(waiting)
+                if selected is not None:
+                    batch = [p for p in batch if p.id in selected]
+                if not batch:
+                    continue
+                groups = self.analyst.pack_papers(batch, max_papers=pack_size)
+                analyses = [a for group in await asyncio.gather(*[analyze_group(g) for g in groups]) for a in group]
+                await self._store_analyses(batch, analyses)
+                for item in zip(batch, analyses):
+                    await result_queue.put(item)
+
+        async def finish(paper, analysis):
+            """Score quality and embed findings of one analysis"""
+            try:
+                quality = self._assess_quality(paper, analysis)
+            except Exception as e:
+                logger.warning(f"Quality assessment failed for {paper.id}: {e}")
+                quality = None
+            embeddings = []
+            if analysis.key_findings:
+                try:
+                    embeddings = await self.synthesizer.embedding_client.embed_batch(
+                        analysis.key_findings,
+                        input_type="passage"
+                    )
+                except Exception as e:
+                    logger.warning(f"Finding embedding failed for {paper.id}: {e}")
+                    embeddings = None
+            results[paper.id] = (analysis, quality, embeddings)
+            self.progress_tracker.set_papers_analyzed(len(results))
+
+        async def post_processor():
+            pending = []
+            while True:
+                item = await result_queue.get()
+                if item is None:
+                    break
+                pending.append(asyncio.create_task(finish(*item)))
+            await asyncio.gather(*pending)
+
+        worker_tasks = [asyncio.create_task(analyst_worker()) for _ in range(workers)]
+        post_task = asyncio.create_task(post_processor())
+        try:
+            papers = await self._execute_search_phase(
+                query, max_papers, on_progress=on_progress, start_year=start_year, end_year=end_year
+            )
+            self.progress_tracker.set_stage(Stage.ANALYZING, "Reasoning NIM")
+            selected = {paper.id for paper in papers}
+            await enqueue(papers)
+            for _ in worker_tasks:
+                await paper_queue.put(None)
+            await asyncio.gather(*worker_tasks)
+            await result_queue.put(None)
+            await post_task
+        except BaseException:
+            for task in (*worker_tasks, post_task):
+                task.cancel()
+            raise
+
+        self._record_analysis_reuse(papers, {
+            paper_id: hit for paper_id, hit in stored_hits.items() if paper_id in selected
+        })
+        discarded = len(set(results) - selected)
+        if discarded:
+            logger.info(f"Pipeline: discarded {discarded} analyses of papers displaced from the top-k")
+
+        # Positions must line up with papers: the report pairs them by index
+        papers = [paper for paper in papers if paper.id in results]
+        kept = [results[paper.id] for paper in papers]
+        analyses = [analysis for analysis, _, _ in kept]
+        quality_scores = [quality for _, quality, _ in kept]
+        finding_embeddings = None
+        if all(embeddings is not None for _, _, embeddings in kept):
+            finding_embeddings = [vector for _, _, embeddings in kept for vector in embeddings]
+        self.progress_tracker.set_papers_analyzed(len(analyses))
+        logger.info(f"✅ Pipeline: analyzed and scored {len(analyses)} papers")
+        return papers, analyses, quality_scores, finding_embeddings
+
+    async def _execute_synthesis_phase(
+        self,
+        analyses: List[Any],
+        finding_embeddings: Optional[List[List[float]]] = None
+    ) -> Any:
         """
         Execute synthesis phase
         
         Responsibilities:
         - Synthesize analyses into themes, contradictions, gaps
         - Consolidate synthesizer decisions
+
+        Args:
+            analyses: Paper analyses
+            finding_embeddings: Finding embeddings computed while analyses
+                arrived (pipelined run); embedded here when None
         
         Returns:
             Synthesis object
         """
         self.progress_tracker.set_stage(Stage.SYNTHESIZING, "Both NIMs")
-        synthesis = await self.synthesizer.synthesize(analyses)
+        if finding_embeddings is None:
+            synthesis = await self.synthesizer.synthesize(analyses)
+        else:
+            synthesis = await self.synthesizer.synthesize(analyses, finding_embeddings=finding_embeddings)
         
         # Consolidate synthesizer decisions
         for decision in self.synthesizer.decision_log.get_decisions():
@@ -2373,6 +3014,10 @@ class ResearchOpsAgent:
                     "authors": p.authors,
                     "abstract": p.abstract,
                     "url": p.url,
+                    "year": p.year,
+                    "venue": p.venue,
+                    "doi": p.doi,
+                    "relevance_score": p.relevance_score,
                     "source": p.id.split('-')[0] if '-' in p.id else "unknown"
                 }
                 for p in papers
@@ -2398,9 +3043,10 @@ class ResearchOpsAgent:
                 }
                 for a in analyses
             ],
+            # Scores are aligned with papers; None marks a failed assessment
             "quality_scores": [
                 {
-                    "paper_id": papers[i].id,
+                    "paper_id": paper.id,
                     "overall_score": qs.overall_score,
                     "methodology_score": qs.methodology_score,
                     "statistical_score": qs.statistical_score,
@@ -2411,15 +3057,29 @@ class ResearchOpsAgent:
                     "issues": qs.issues,
                     "strengths": qs.strengths
                 }
-                for i, qs in enumerate(quality_scores)
+                for paper, qs in zip(papers, quality_scores)
+                if qs is not None
             ] if quality_scores else []
         }
         
         return report
 
-    async def run(self, query: str, max_papers: int = 10) -> Dict[str, Any]:
+    async def run(
+        self,
+        query: str,
+        max_papers: int = 10,
+        pipelined: Optional[bool] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Orchestrate full research synthesis workflow
+
+        With pipelined=True (default: env PIPELINED_EXECUTION) search,
+        analysis and per-paper post-processing overlap instead of running
+        as separate phases; see _execute_pipelined_phases. start_year and
+        end_year are pushed down to sources that can filter by date (arXiv);
+        callers still filter the returned papers by year.
         
         This method coordinates all phases:
         1. Input validation
@@ -2463,20 +3123,34 @@ class ResearchOpsAgent:
         self.progress_tracker.start()
         self.progress_tracker.set_stage(Stage.INITIALIZING, "Embedding NIM")
 
-        # Phase 1: Search phase
-        papers = await self._execute_search_phase(query, max_papers)
+        # Every NIM call, cache lookup and source call below lands in this ledger,
+        # and retries below stop once the request deadline cannot cover them
+        with track_resources() as ledger, deadline_scope(get_research_timeout_seconds()):
+            if pipelined is None:
+                pipelined = os.getenv("PIPELINED_EXECUTION", "false").lower() == "true"
+            if pipelined:
+                # Phases 1-2 overlapped: papers are analyzed as the search selects them
+                papers, analyses, quality_scores, finding_embeddings = await self._execute_pipelined_phases(
+                    query, max_papers, start_year=start_year, end_year=end_year
+                )
+            else:
+                # Phase 1: Search phase
+                papers = await self._execute_search_phase(
+                    query, max_papers, start_year=start_year, end_year=end_year
+                )
 
-        # Phase 2: Analysis phase
-        analyses, quality_scores = await self._execute_analysis_phase(papers, query)
-        
-        # Phase 3: Synthesis phase
-        synthesis = await self._execute_synthesis_phase(analyses)
-        
-        # Phase 3.5: Generate enhanced insights
-        synthesis = await self.synthesizer.generate_enhanced_insights(papers, analyses, synthesis)
-        
-        # Phase 4: Refinement phase
-        synthesis, synthesis_complete = await self._execute_refinement_phase(synthesis, analyses)
+                # Phase 2: Analysis phase
+                analyses, quality_scores = await self._execute_analysis_phase(papers, query)
+                finding_embeddings = None
+            
+            # Phase 3: Synthesis phase
+            synthesis = await self._execute_synthesis_phase(analyses, finding_embeddings)
+            
+            # Phase 3.5: Generate enhanced insights
+            synthesis = await self.synthesizer.generate_enhanced_insights(papers, analyses, synthesis)
+            
+            # Phase 4: Refinement phase
+            synthesis, synthesis_complete = await self._execute_refinement_phase(synthesis, analyses)
 
         # Complete progress tracking
         self.progress_tracker.complete()
@@ -2485,6 +3159,12 @@ class ResearchOpsAgent:
         report = self._generate_report(
             query, papers, analyses, synthesis, quality_scores, synthesis_complete
         )
+        report["resource_usage"] = ledger.to_dict()
+        if METRICS_AVAILABLE:
+            try:
+                get_metrics_collector().record_request_resources(ledger.totals())
+            except Exception as e:
+                logger.warning(f"Failed to record request resource usage: {e}")
 
         logger.info(f"\n{'='*60}")
         logger.info(f"✅ Agentic Researcher: Synthesis complete!")
@@ -0,0 +1,215 @@
+"""
+Per-Paper Analysis Store
+Reuses Analyst results across queries (in-process warm tier over a SQLite cold tier)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+
+from identity_resolution import identity_keys
+from constants import (
+    ANALYSIS_STORE_DEFAULT_PATH,
+    ANALYSIS_STORE_WARM_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+# Identifier kinds in order of preference for the canonical paper key
+_CANONICAL_KINDS = ("doi:", "arxiv:", "pmid:")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS analyses (
+    paper_key TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    analysis TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (paper_key, content_hash, prompt_version)
+);
+CREATE INDEX IF NOT EXISTS analyses_version ON analyses(prompt_version);
+"""
+
+_UPSERT = """
+INSERT OR REPLACE INTO analyses (paper_key, content_hash, prompt_version, analysis, created_at)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 300
+
+
+def canonical_paper_key(paper: Any) -> str:
+    """DOI, arXiv ID or PMID when known (so sources share entries), else the paper ID"""
+    keys = identity_keys(paper)
+    for kind in _CANONICAL_KINDS:
+        matching = sorted(key for key in keys if key.startswith(kind))
+        if matching:
+            return matching[0]
+    return f"id:{paper.id}"
+
+
+def content_hash(paper: Any) -> str:
+    """Hash of everything the analysis prompt sees (title, authors, abstract)"""
+    content = "\n".join([
+        paper.title or "",
+        "; ".join(paper.authors or []),
+        paper.abstract or "",
+    ])
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class AnalysisStore:
+    """
+    Analyses keyed by (canonical paper key, content hash, prompt version)
+
+    Lookups check a bounded in-process LRU (warm tier) and then the SQLite
+    database (cold tier) in one query per batch; cold hits are promoted. A
+    new prompt version never matches old entries, and purge_versions drops
+    them from disk. Methods are blocking; call them via asyncio.to_thread
+    from async code.
+    """
+
+    def __init__(self, path: str = ANALYSIS_STORE_DEFAULT_PATH, warm_size: int = ANALYSIS_STORE_WARM_SIZE):
+        """
+        Initialize analysis store
+
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+            warm_size: Analyses kept in the in-process tier
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.warm_size = warm_size
+        self._warm: "OrderedDict[Tuple[str, str, str], Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def key(paper: Any, prompt_version: str) -> Tuple[str, str, str]:
+        return canonical_paper_key(paper), content_hash(paper), prompt_version
+
+    def _remember(self, key: Tuple[str, str, str], analysis: Dict[str, Any]):
+        self._warm[key] = analysis
+        self._warm.move_to_end(key)
+        while len(self._warm) > self.warm_size:
+            self._warm.popitem(last=False)
+
+    def get_many(self, papers: List[Any], prompt_version: str) -> Dict[str, Tuple[Dict[str, Any], str]]:
+        """
+        Look up stored analyses for papers
+
+        Returns:
+            {paper.id: (analysis dict, tier)} for hits, tier "warm" or "cold"
+        """
+        found: Dict[str, Tuple[Dict[str, Any], str]] = {}
+        cold_lookups: Dict[Tuple[str, str, str], List[str]] = {}
+        with self._lock:
+            for paper in papers:
+                key = self.key(paper, prompt_version)
+                analysis = self._warm.get(key)
+                if analysis is not None:
+                    self._warm.move_to_end(key)
+                    found[paper.id] = (analysis, "warm")
+                else:
+                    cold_lookups.setdefault(key, []).append(paper.id)
+
+            keys = list(cold_lookups)
+            for start in range(0, len(keys), _LOOKUP_CHUNK):
+                chunk = keys[start:start + _LOOKUP_CHUNK]
+                clause = " OR ".join("(paper_key = ? AND content_hash = ?)" for _ in chunk)
+                params: List[Any] = [value for key in chunk for value in key[:2]]
+                rows = self._conn.execute(
+                    f"SELECT paper_key, content_hash, analysis FROM analyses "
+                    f"WHERE prompt_version = ? AND ({clause})",
+                    [prompt_version] + params
+                ).fetchall()
+                for paper_key, digest, payload in rows:
+                    key = (paper_key, digest, prompt_version)
+                    analysis = json.loads(payload)
+                    self._remember(key, analysis)
+                    for paper_id in cold_lookups.get(key, []):
+                        found[paper_id] = (analysis, "cold")
+        return found
+
+    def put_many(self, entries: List[Tuple[Any, Dict[str, Any]]], prompt_version: str) -> int:
+        """
+        Store analyses in both tiers
+
+        Args:
+            entries: (paper, analysis dict) pairs
+            prompt_version: Analysis prompt version they were produced with
+
+        Returns:
+            Number of analyses stored
+        """
+        if not entries:
+            return 0
+        now = time.time()
+        rows = []
+        with self._lock:
+            for paper, analysis in entries:
+                key = self.key(paper, prompt_version)
+                self._remember(key, analysis)
+                rows.append((*key, json.dumps(analysis, default=str), now))
+            with self._conn:
+                self._conn.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def purge_versions(self, keep_version: str) -> int:
+        """Delete analyses produced by any other prompt version; returns rows removed"""
+        with self._lock:
+            self._warm = OrderedDict(
+                (key, analysis) for key, analysis in self._warm.items() if key[2] == keep_version
+            )
+            with self._conn:
+                removed = self._conn.execute(
+                    "DELETE FROM analyses WHERE prompt_version != ?", (keep_version,)
+                ).rowcount
+        if removed:
+            logger.info(f"Analysis store: purged {removed} analyses from old prompt versions")
+        return removed
+
+    def count(self) -> int:
+        """Number of stored analyses (cold tier)"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._conn.close()
+
+
+# Global analysis store instance
+_analysis_store: Optional[AnalysisStore] = None
+
+
+def get_analysis_store(prompt_version: Optional[str] = None) -> AnalysisStore:
+    """
+    Get global analysis store (path from env ANALYSIS_STORE_PATH)
+
+    Args:
+        prompt_version: Current analysis prompt version; entries of other
+            versions are purged once, when the store is first opened
+    """
+    global _analysis_store
+    if _analysis_store is None:
+        store = AnalysisStore(
+            path=os.getenv("ANALYSIS_STORE_PATH", ANALYSIS_STORE_DEFAULT_PATH),
+            warm_size=int(os.getenv("ANALYSIS_STORE_WARM_SIZE", ANALYSIS_STORE_WARM_SIZE))
+        )
+        if prompt_version is not None:
+            store.purge_versions(prompt_version)
+        _analysis_store = store
+    return _analysis_store
@@ -32,9 +32,21 @@ import logging
 import os
 from datetime import datetime
 import json
-
-from nim_clients import ReasoningNIMClient, EmbeddingNIMClient
+from contextlib import asynccontextmanager
+
+from nim_clients import (
+    ReasoningNIMClient,
+    EmbeddingNIMClient,
+    get_client_pool,
+    close_client_pool,
+    get_shared_clients,
+)
 from agents import ResearchOpsAgent, ResearchQuery, Synthesis
+from source_http import close_source_http_client
+from vector_index import close_vector_index
+from resource_ledger import track_resources
+from deadline import deadline_scope, get_research_timeout_seconds
+from pdf_analysis import get_pdf_parse_pool, close_pdf_parse_pool
 from incremental_synthesizer import IncrementalSynthesizer
 from input_sanitization import (
     sanitize_research_query,
@@ -49,6 +61,7 @@ from exceptions import (
     PaperSourceError,
     CircuitBreakerOpenError,
     ConfigurationError,
+    WorkerPoolSaturatedError,
 )
 from constants import (
     DEFAULT_CORS_ORIGINS,
@@ -125,6 +138,26 @@ else:
     auth_middleware = None
 
 
+@asynccontextmanager
+async def nim_clients():
+    """
+    Yield (reasoning, embedding) NIM clients for a request
+
+    Uses the process-wide pooled clients opened at startup. Falls back to
+    per-request clients when the pool is not running (e.g. in unit tests).
+    """
+    shared = get_shared_clients()
+    if shared is not None:
+        yield shared
+        return
+
+    async with (
+        ReasoningNIMClient() as reasoning,
+        EmbeddingNIMClient() as embedding,
+    ):
+        yield reasoning, embedding
+
+
 # Middleware for metrics and auth
 @app.middleware("http")
 async def metrics_and_auth_middleware(request: StarletteRequest, call_next):
@@ -250,6 +283,7 @@ class ResearchResponse(BaseModel):
     synthesis_complete: bool
     processing_time_seconds: float
     query: str
+    resource_usage: Optional[Dict[str, Any]] = None  # Per-request NIM/cache/source usage
 
     class Config:
         schema_extra = {
@@ -479,6 +513,9 @@ async def prometheus_metrics():
     if not metrics or not METRICS_AVAILABLE:
         return Response(content="# Metrics not available\n", media_type="text/plain")
 
+    # Pool gauges are sampled at scrape time
+    get_client_pool().report_metrics()
+
     return Response(content=metrics.get_metrics(), media_type="text/plain")
 
 
@@ -551,7 +588,10 @@ async def research(
             cache = get_cache()
             synthesis_cache = SynthesisCache(cache)
             cached_result = synthesis_cache.get_synthesis(
-                validated.query, validated.max_papers
+                validated.query,
+                validated.max_papers,
+                start_year=request.start_year,
+                end_year=request.end_year,
             )
             if cached_result:
                 logger.info(f"✅ Cache hit for query: {validated.query}")
@@ -635,30 +675,35 @@ async def research(
             except ImportError:
                 use_async_timeout = False
 
-            async with (
-                ReasoningNIMClient() as reasoning,
-                EmbeddingNIMClient() as embedding,
-            ):
+            async with nim_clients() as (reasoning, embedding):
                 # Create agent
                 agent = ResearchOpsAgent(reasoning, embedding)
 
-                # Run research workflow with timeout
+                # Run research workflow with timeout (the same budget run() uses
+                # for its deadline, so retries never outlive the request)
+                research_timeout = get_research_timeout_seconds()
                 try:
                     if use_async_timeout:
-                        async with timeout(300):  # 5 minute hard limit
+                        async with timeout(research_timeout):
                             result = await agent.run(
-                                query=validated.query, max_papers=validated.max_papers
+                                query=validated.query,
+                                max_papers=validated.max_papers,
+                                start_year=request.start_year,
+                                end_year=request.end_year,
                             )
                     else:
                         # Fallback: use asyncio.wait_for when async_timeout not available
                         result = await asyncio.wait_for(
                             agent.run(
-                                query=validated.query, max_papers=validated.max_papers
+                                query=validated.query,
+                                max_papers=validated.max_papers,
+                                start_year=request.start_year,
+                                end_year=request.end_year,
                             ),
-                            timeout=300,  # 5 minute hard limit
+                            timeout=research_timeout,
                         )
                 except asyncio.TimeoutError:
-                    logger.error("Research synthesis exceeded 5 minute limit")
+                    logger.error(f"Research synthesis exceeded {research_timeout:.0f}s limit")
                     # Return partial results if available
                     from agents import _generate_demo_result
 
@@ -674,7 +719,11 @@ async def research(
             if synthesis_cache:
                 try:
                     synthesis_cache.set_synthesis(
-                        validated.query, validated.max_papers, result
+                        validated.query,
+                        validated.max_papers,
+                        result,
+                        start_year=request.start_year,
+                        end_year=request.end_year,
                     )
                     logger.info(
                         f"✅ Cached synthesis result for query: {validated.query}"
@@ -1186,22 +1235,43 @@ async def analyze_pdf_full_text(request: BibTeXExportRequest):
     Analyze full-text PDFs of papers
     
     Downloads and analyzes full PDF text to extract methodologies,
-    experimental details, and results beyond abstracts.
+    experimental details, and results beyond abstracts. Returns 503 with
+    Retry-After when the PDF parse pool is already full.
     """
+    # Fail fast rather than queueing downloads behind a saturated parse pool
+    pdf_parse_pool = get_pdf_parse_pool()
+
+    def parser_busy() -> HTTPException:
+        retry_after = max(1, int(pdf_parse_pool.timeout))
+        return HTTPException(
+            status_code=503,
+            detail={
+                "error": "PDF parser busy",
+                "message": f"{pdf_parse_pool.pending} documents already being parsed",
+                "retry_after": retry_after,
+                "timestamp": datetime.now().isoformat()
+            },
+            headers={"Retry-After": str(retry_after)}
+        )
+
+    if pdf_parse_pool.saturated:
+        raise parser_busy()
+
     try:
         from pdf_analysis import analyze_papers_full_text
-        from nim_clients import ReasoningNIMClient
         
         # Initialize reasoning client for enhanced extraction
         reasoning_client = None
         try:
-            async with ReasoningNIMClient() as client:
+            async with nim_clients() as (client, _):
                 reasoning_client = client
                 results = await analyze_papers_full_text(
                     request.papers,
                     reasoning_client=reasoning_client,
                     max_papers=int(os.getenv("MAX_PDF_ANALYSIS", "5"))
                 )
+        except WorkerPoolSaturatedError:
+            raise
         except Exception as e:
             logger.warning(f"Reasoning client unavailable, using basic extraction: {e}")
             results = await analyze_papers_full_text(
@@ -1217,6 +1287,9 @@ async def analyze_pdf_full_text(request: BibTeXExportRequest):
                 "failed": sum(1 for r in results.values() if "error" in r)
             }
         }
+    except WorkerPoolSaturatedError:
+        # Filled up by concurrent requests after the check above
+        raise parser_busy()
     except Exception as e:
         logger.error(f"PDF analysis error: {e}")
         raise HTTPException(
@@ -1531,7 +1604,8 @@ async def research_stream(request: ResearchRequest):
     
     **Event Types:**
     - `agent_status`: Agent starting work
-    - `papers_found`: Scout completed paper search
+    - `papers_found`: Scout's running top papers (`partial: true`, sent as each
+      source returns) and the final selection (`partial: false`)
     - `paper_analyzed`: Paper analysis complete (batched)
     - `theme_found`: Theme discovered during synthesis
     - `contradiction_found`: Contradiction detected
@@ -1559,191 +1633,238 @@ async def research_stream(request: ResearchRequest):
             yield f"event: agent_status\n"
             yield f"data: {json.dumps({'agent': 'Scout', 'status': 'starting', 'message': 'Searching for papers'})}\n\n"
             
-            # Initialize NIM clients
-            async with (
-                ReasoningNIMClient() as reasoning,
-                EmbeddingNIMClient() as embedding,
-            ):
-                # Create agent
-                agent = ResearchOpsAgent(reasoning, embedding)
+            # Same ledger and deadline as ResearchOpsAgent.run: tasks started
+            # below (e.g. the search) copy this context, so their NIM calls are
+            # recorded here and their retries stop at the request deadline
+            with track_resources() as ledger, deadline_scope(get_research_timeout_seconds()):
+                # Use shared NIM clients
+                async with nim_clients() as (reasoning, embedding):
+                    # Create agent
+                    agent = ResearchOpsAgent(reasoning, embedding)
                 
-                # Phase 1: Search (0-30s)
-                yield f"event: agent_status\n"
-                yield f"data: {json.dumps({'agent': 'Scout', 'status': 'searching', 'message': f'Searching {agent.scout.source_config.enable_arxiv + agent.scout.source_config.enable_pubmed} sources'})}\n\n"
+                    # Phase 1: Search (0-30s)
+                    yield f"event: agent_status\n"
+                    yield f"data: {json.dumps({'agent': 'Scout', 'status': 'searching', 'message': f'Searching {agent.scout.source_config.enable_arxiv + agent.scout.source_config.enable_pubmed} sources'})}\n\n"
                 
-                papers = await agent._execute_search_phase(validated.query, validated.max_papers)
+                    def paper_summary(p):
+                        return {
+                            "id": p.id,
+                            "title": p.title,
+                            "authors": p.authors,
+                            "abstract": p.abstract[:200] + "..." if len(p.abstract) > 200 else p.abstract,
+                            "url": p.url,
+                            "relevance_score": p.relevance_score,
+                            "source": p.id.split('-')[0] if '-' in p.id else "unknown"
+                        }
+
+                    # Scout streams its running top-k as each source returns; forward
+                    # those as partial papers_found events while the search continues
+                    search_updates: asyncio.Queue = asyncio.Queue()
+
+                    async def on_search_progress(progress):
+                        await search_updates.put(progress)
+
+                    search_task = asyncio.create_task(
+                        agent._execute_search_phase(
+                            validated.query,
+                            validated.max_papers,
+                            on_progress=on_search_progress,
+                            start_year=request.start_year,
+                            end_year=request.end_year
+                        )
+                    )
+                    try:
+                        while not search_task.done() or not search_updates.empty():
+                            update = asyncio.create_task(search_updates.get())
+                            await asyncio.wait({update, search_task}, return_when=asyncio.FIRST_COMPLETED)
+                            if not update.done():
+                                update.cancel()
+                                continue
+                            progress = update.result()
+                            if progress.top_papers:
+                                partial = {
+                                    'partial': True,
+                                    'papers_count': len(progress.top_papers),
+                                    'papers': [paper_summary(p) for p in progress.top_papers],
+                                    'sources_done': progress.sources_done,
+                                    'sources_total': progress.sources_total
+                                }
+                                yield "event: papers_found\n"
+                                yield f"data: {json.dumps(partial)}\n\n"
+                    finally:
+                        if not search_task.done():
+                            search_task.cancel()
+                    papers = await search_task
                 
-                # Emit papers_found event
-                papers_data = [
-                    {
-                        "id": p.id,
-                        "title": p.title,
-                        "authors": p.authors,
-                        "abstract": p.abstract[:200] + "..." if len(p.abstract) > 200 else p.abstract,
-                        "url": p.url,
-                        "source": p.id.split('-')[0] if '-' in p.id else "unknown"
-                    }
-                    for p in papers
-                ]
+                    # Emit final papers_found event
+                    papers_data = [paper_summary(p) for p in papers]
                 
-                yield f"event: papers_found\n"
-                yield f"data: {json.dumps({'papers_count': len(papers), 'papers': papers_data, 'decisions': agent.decision_log.get_decisions()})}\n\n"
+                    yield f"event: papers_found\n"
+                    yield f"data: {json.dumps({'partial': False, 'papers_count': len(papers), 'papers': papers_data, 'decisions': agent.decision_log.get_decisions()})}\n\n"
                 
-                # Phase 2: Progressive Analysis + Synthesis (30s-3min)
-                # Use incremental synthesizer for real-time synthesis updates
-                yield f"event: agent_status\n"
-                yield f"data: {json.dumps({'agent': 'Analyst', 'status': 'analyzing', 'message': f'Analyzing {len(papers)} papers progressively'})}\n\n"
-
-                # Create incremental synthesizer
-                incremental_synthesizer = IncrementalSynthesizer(
-                    reasoning_client=reasoning,
-                    embedding_client=embedding,
-                    similarity_threshold=0.7,
-                    top_k_candidates=5
-                )
-
-                # Process papers one at a time with progressive synthesis
-                analyses = []
-                quality_scores = []
-
-                for idx, paper in enumerate(papers):
-                    # Analyze single paper
-                    paper_analysis = await agent.analyst.analyze(paper)
-                    quality_score = agent.analyst.assess_quality(paper, paper_analysis)
-
-                    analyses.append(paper_analysis)
-                    quality_scores.append(quality_score)
-
-                    # Emit paper_analyzed event
-                    yield f"event: paper_analyzed\n"
-                    paper_data = {
-                        'paper_number': idx + 1,
-                        'total': len(papers),
-                        'paper_id': paper.id,
-                        'title': paper.title,
-                        'findings_count': len(paper_analysis.key_findings),
-                        'confidence': paper_analysis.confidence
-                    }
-                    yield f"data: {json.dumps(paper_data)}\n\n"
-
-                    # Incremental synthesis after each paper
-                    paper_info = {
-                        "id": paper.id,
-                        "title": paper.title,
-                        "authors": paper.authors,
-                        "url": paper.url
-                    }
-
-                    synthesis_update = await incremental_synthesizer.add_analysis(
-                        paper_analysis,
-                        paper_info
+                    # Phase 2: Progressive Analysis + Synthesis (30s-3min)
+                    # Use incremental synthesizer for real-time synthesis updates
+                    yield f"event: agent_status\n"
+                    yield f"data: {json.dumps({'agent': 'Analyst', 'status': 'analyzing', 'message': f'Analyzing {len(papers)} papers progressively'})}\n\n"
+
+                    # Create incremental synthesizer
+                    incremental_synthesizer = IncrementalSynthesizer(
+                        reasoning_client=reasoning,
+                        embedding_client=embedding,
+                        similarity_threshold=0.7,
+                        top_k_candidates=5
                     )
 
-                    # Emit synthesis_update event with progressive discoveries
-                    update_data = synthesis_update.to_dict()
-
-                    # Emit individual discovery events for new themes
-                    for new_theme in synthesis_update.new_themes:
-                        yield f"event: theme_emerging\n"
-                        theme_data = {
+                    # Process papers one at a time with progressive synthesis
+                    analyses = []
+                    quality_scores = []
+
+                    for idx, paper in enumerate(papers):
+                        # Analyze single paper
+                        paper_analysis = await agent.analyst.analyze(paper)
+                        try:
+                            quality_score = agent._assess_quality(paper, paper_analysis)
+                        except Exception as e:
+                            logger.warning(f"Quality assessment failed for {paper.id}: {e}")
+                            quality_score = None
+
+                        analyses.append(paper_analysis)
+                        quality_scores.append(quality_score)
+
+                        # Emit paper_analyzed event
+                        yield f"event: paper_analyzed\n"
+                        paper_data = {
                             'paper_number': idx + 1,
-                            'theme_name': new_theme.name,
-                            'confidence': new_theme.confidence,
-                            'initial_finding': new_theme.key_findings[0] if new_theme.key_findings else 'N/A'
+                            'total': len(papers),
+                            'paper_id': paper.id,
+                            'title': paper.title,
+                            'findings_count': len(paper_analysis.key_findings),
+                            'confidence': paper_analysis.confidence
                         }
-                        yield f"data: {json.dumps(theme_data)}\n\n"
-
-                    # Emit theme strengthening events
-                    for update in synthesis_update.theme_updates:
-                        yield f"event: theme_strengthened\n"
-                        theme_update_data = {
-                            'paper_number': idx + 1,
-                            'theme_name': update['theme_name'],
-                            'old_confidence': update['old_confidence'],
-                            'new_confidence': update['new_confidence'],
-                            'new_finding': update['new_finding']
+                        yield f"data: {json.dumps(paper_data)}\n\n"
+
+                        # Incremental synthesis after each paper
+                        paper_info = {
+                            "id": paper.id,
+                            "title": paper.title,
+                            "authors": paper.authors,
+                            "url": paper.url
                         }
-                        yield f"data: {json.dumps(theme_update_data)}\n\n"
 
-                    # Emit contradiction discovery events
-                    for contradiction in synthesis_update.new_contradictions:
-                        yield f"event: contradiction_discovered\n"
-                        contradiction_data = {
-                            'paper_number': idx + 1,
-                            'finding_a': contradiction.finding_a,
-                            'finding_b': contradiction.finding_b,
-                            'explanation': contradiction.explanation,
-                            'severity': contradiction.severity
-                        }
-                        yield f"data: {json.dumps(contradiction_data)}\n\n"
+                        synthesis_update = await incremental_synthesizer.add_analysis(
+                            paper_analysis,
+                            paper_info
+                        )
 
-                    # Emit theme merge events
-                    for merge in synthesis_update.merged_themes:
-                        yield f"event: themes_merged\n"
-                        merge_data = {
-                            'paper_number': idx + 1,
-                            'merged_from': merge['merged_from'],
-                            'merged_into': merge['merged_into'],
-                            'similarity': merge['similarity']
-                        }
-                        yield f"data: {json.dumps(merge_data)}\n\n"
-
-                    # Emit comprehensive synthesis update
-                    yield f"event: synthesis_update\n"
-                    yield f"data: {json.dumps(update_data)}\n\n"
-
-                # Get final synthesis from incremental synthesizer
-                final_synthesis_obj = incremental_synthesizer.get_final_synthesis()
-
-                # Convert to compatible format for refinement phase
-                synthesis = Synthesis(
-                    common_themes=[theme.name for theme in final_synthesis_obj.themes],
-                    contradictions=[
-                        {
-                            "finding_a": c.finding_a,
-                            "finding_b": c.finding_b,
-                            "explanation": c.explanation,
-                            "severity": c.severity
-                        }
-                        for c in final_synthesis_obj.contradictions
-                    ],
-                    gaps=[gap.description for gap in final_synthesis_obj.gaps],
-                    recommendations=[],  # Will be filled by refinement phase
-                    enhanced_insights=None  # Will be populated after synthesis
-                )
+                        # Emit synthesis_update event with progressive discoveries
+                        update_data = synthesis_update.to_dict()
+
+                        # Emit individual discovery events for new themes
+                        for new_theme in synthesis_update.new_themes:
+                            yield f"event: theme_emerging\n"
+                            theme_data = {
+                                'paper_number': idx + 1,
+                                'theme_name': new_theme.name,
+                                'confidence': new_theme.confidence,
+                                'initial_finding': new_theme.key_findings[0] if new_theme.key_findings else 'N/A'
+                            }
+                            yield f"data: {json.dumps(theme_data)}\n\n"
+
+                        # Emit theme strengthening events
+                        for update in synthesis_update.theme_updates:
+                            yield f"event: theme_strengthened\n"
+                            theme_update_data = {
+                                'paper_number': idx + 1,
+                                'theme_name': update['theme_name'],
+                                'old_confidence': update['old_confidence'],
+                                'new_confidence': update['new_confidence'],
+                                'new_finding': update['new_finding']
+                            }
+                            yield f"data: {json.dumps(theme_update_data)}\n\n"
+
+                        # Emit contradiction discovery events
+                        for contradiction in synthesis_update.new_contradictions:
+                            yield f"event: contradiction_discovered\n"
+                            contradiction_data = {
+                                'paper_number': idx + 1,
+                                'finding_a': contradiction.finding_a,
+                                'finding_b': contradiction.finding_b,
+                                'explanation': contradiction.explanation,
+                                'severity': contradiction.severity
+                            }
+                            yield f"data: {json.dumps(contradiction_data)}\n\n"
+
+                        # Emit theme merge events
+                        for merge in synthesis_update.merged_themes:
+                            yield f"event: themes_merged\n"
+                            merge_data = {
+                                'paper_number': idx + 1,
+                                'merged_from': merge['merged_from'],
+                                'merged_into': merge['merged_into'],
+                                'similarity': merge['similarity']
+                            }
+                            yield f"data: {json.dumps(merge_data)}\n\n"
+
+                        # Emit comprehensive synthesis update
+                        yield f"event: synthesis_update\n"
+                        yield f"data: {json.dumps(update_data)}\n\n"
+
+                    # Get final synthesis from incremental synthesizer
+                    final_synthesis_obj = incremental_synthesizer.get_final_synthesis()
+
+                    # Convert to compatible format for refinement phase
+                    synthesis = Synthesis(
+                        common_themes=[theme.name for theme in final_synthesis_obj.themes],
+                        contradictions=[
+                            {
+                                "finding_a": c.finding_a,
+                                "finding_b": c.finding_b,
+                                "explanation": c.explanation,
+                                "severity": c.severity
+                            }
+                            for c in final_synthesis_obj.contradictions
+                        ],
+                        gaps=[gap.description for gap in final_synthesis_obj.gaps],
+                        recommendations=[],  # Will be filled by refinement phase
+                        enhanced_insights=None  # Will be populated after synthesis
+                    )
 
-                # Phase 4: Refinement (optional)
-                yield f"event: agent_status\n"
-                yield f"data: {json.dumps({'agent': 'Coordinator', 'status': 'evaluating', 'message': 'Assessing synthesis quality'})}\n\n"
+                    # Phase 4: Refinement (optional)
+                    yield f"event: agent_status\n"
+                    yield f"data: {json.dumps({'agent': 'Coordinator', 'status': 'evaluating', 'message': 'Assessing synthesis quality'})}\n\n"
                 
-                synthesis, synthesis_complete = await agent._execute_refinement_phase(synthesis, analyses)
+                    synthesis, synthesis_complete = await agent._execute_refinement_phase(synthesis, analyses)
                 
-                # Final event: synthesis_complete
-                processing_time = time.time() - start_time
+                    # Final event: synthesis_complete
+                    processing_time = time.time() - start_time
                 
-                final_result = {
-                    "query": validated.query,
-                    "papers_analyzed": len(papers),
-                    "common_themes": synthesis.common_themes,
-                    "contradictions": synthesis.contradictions,
-                    "research_gaps": synthesis.gaps,
-                    "decisions": agent.decision_log.get_decisions(),
-                    "synthesis_complete": synthesis_complete,
-                    "processing_time_seconds": round(processing_time, 2),
-                    "quality_scores": [
-                        {
-                            "paper_id": papers[i].id,
-                            "overall_score": qs.overall_score,
-                            "confidence_level": qs.confidence_level
-                        }
-                        for i, qs in enumerate(quality_scores)
-                    ] if quality_scores else []
-                }
+                    final_result = {
+                        "query": validated.query,
+                        "papers_analyzed": len(papers),
+                        "common_themes": synthesis.common_themes,
+                        "contradictions": synthesis.contradictions,
+                        "research_gaps": synthesis.gaps,
+                        "decisions": agent.decision_log.get_decisions(),
+                        "synthesis_complete": synthesis_complete,
+                        "processing_time_seconds": round(processing_time, 2),
+                        "quality_scores": [
+                            {
+                                "paper_id": papers[i].id,
+                                "overall_score": qs.overall_score,
+                                "confidence_level": qs.confidence_level
+                            }
+                            for i, qs in enumerate(quality_scores)
+                            if qs is not None
+                        ] if quality_scores else [],
+                        "resource_usage": ledger.to_dict()
+                    }
+                    if metrics and METRICS_AVAILABLE:
+                        metrics.record_request_resources(ledger.totals())
                 
-                yield f"event: synthesis_complete\n"
-                yield f"data: {json.dumps(final_result)}\n\n"
+                    yield f"event: synthesis_complete\n"
+                    yield f"data: {json.dumps(final_result)}\n\n"
                 
-                logger.info(f"SSE stream complete: {len(papers)} papers, {processing_time:.2f}s")
+                    logger.info(f"SSE stream complete: {len(papers)} papers, {processing_time:.2f}s")
                 
         except ValueError as e:
             # Validation error
@@ -1931,12 +2052,20 @@ async def startup_event():
     logger.info("NIMs: Reasoning + Embedding")
     logger.info("=" * 60)
 
+    # Open shared NIM connection pools once for the whole process
+    await get_client_pool().start()
+
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Log shutdown information"""
+    """Log shutdown information and release pooled connections"""
     logger.info("🛑 Agentic Researcher API Shutting Down")
+    # Close only what this process created; nothing is built just to be closed
+    await close_client_pool()
+    await close_source_http_client()
+    await close_vector_index()
+    await close_pdf_parse_pool()
 
 
 if __name__ == "__main__":
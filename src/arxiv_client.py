@@ -0,0 +1,181 @@
+"""
+Async arXiv Client
+Queries the arXiv Atom export API and parses the feed incrementally
+"""
+
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, List
+
+logger = logging.getLogger(__name__)
+
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
+ATOM = "{http://www.w3.org/2005/Atom}"
+ARXIV_MAX_RESULTS = 100  # Per request; larger pages are slow to generate upstream
+
+SORT_FIELDS = {
+    "relevance": "relevance",
+    "submitted": "submittedDate",
+    "updated": "lastUpdatedDate",
+}
+
+
+@dataclass
+class ArxivEntry:
+    """One arXiv search result"""
+    arxiv_id: str  # e.g. "2401.01234v2"
+    title: str
+    summary: str
+    url: str
+    authors: List[str] = field(default_factory=list)
+    published: Optional[str] = None  # ISO 8601 submission timestamp
+    pdf_url: Optional[str] = None
+
+
+def _arxiv_timestamp(value: datetime) -> str:
+    return value.strftime("%Y%m%d%H%M")
+
+
+def build_search_query(
+    query: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+) -> str:
+    """
+    Build an arXiv search_query, adding a submittedDate range when given
+
+    Open-ended ranges use the earliest/latest timestamp arXiv accepts.
+    """
+    if start_date is None and end_date is None:
+        return query
+    start = _arxiv_timestamp(start_date) if start_date else "190001010000"
+    end = _arxiv_timestamp(end_date) if end_date else "299912312359"
+    return f"({query}) AND submittedDate:[{start} TO {end}]"
+
+
+def _text(element: ET.Element, tag: str) -> str:
+    child = element.find(tag)
+    if child is None or child.text is None:
+        return ""
+    # Atom titles and summaries are hard-wrapped
+    return " ".join(child.text.split())
+
+
+def parse_entry(element: ET.Element) -> ArxivEntry:
+    """Convert an Atom <entry> element into an ArxivEntry"""
+    url = _text(element, f"{ATOM}id")
+    pdf_url = None
+    for link in element.findall(f"{ATOM}link"):
+        if link.get("title") == "pdf":
+            pdf_url = link.get("href")
+    return ArxivEntry(
+        arxiv_id=url.rstrip("/").split("/")[-1],
+        title=_text(element, f"{ATOM}title"),
+        summary=_text(element, f"{ATOM}summary"),
+        url=url,
+        authors=[
+            _text(author, f"{ATOM}name")
+            for author in element.findall(f"{ATOM}author")
+        ],
+        published=_text(element, f"{ATOM}published") or None,
+        pdf_url=pdf_url
+    )
+
+
+class AtomFeedParser:
+    """
+    Incremental Atom parser
+
+    Feed it response chunks as they arrive; completed entries are returned
+    right away and their elements released, so the whole feed is never held
+    in memory.
+    """
+
+    def __init__(self):
+        self._parser = ET.XMLPullParser(events=("start", "end"))
+        self._root: Optional[ET.Element] = None
+
+    def feed(self, chunk: bytes) -> List[ArxivEntry]:
+        """Parse a chunk and return the entries it completed"""
+        self._parser.feed(chunk)
+        entries = []
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if self._root is None:
+                    self._root = element
+                continue
+            if element.tag == f"{ATOM}entry":
+                entries.append(parse_entry(element))
+                if self._root is not None:
+                    self._root.remove(element)
+        return entries
+
+    def close(self):
+        """Finish parsing (raises ParseError on a truncated feed)"""
+        self._parser.close()
+
+
+class ArxivClient:
+    """
+    Native async client for the arXiv export API
+
+    Requests go through the shared source HTTP client, so they are pooled
+    and held to arXiv's rate limit without borrowing executor threads.
+    """
+
+    def __init__(self, http_client, base_url: str = ARXIV_API_URL):
+        """
+        Initialize arXiv client
+
+        Args:
+            http_client: SourceHTTPClient (or anything with a compatible ``get``)
+            base_url: Atom export API endpoint
+        """
+        self.http_client = http_client
+        self.base_url = base_url
+
+    async def search(
+        self,
+        query: str,
+        max_results: int = 20,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        sort_by: str = "relevance"
+    ) -> List[ArxivEntry]:
+        """
+        Search arXiv
+
+        Args:
+            query: arXiv search query
+            max_results: Number of results requested from arXiv (pushed down)
+            start_date: Only papers submitted on or after this time
+            end_date: Only papers submitted on or before this time
+            sort_by: "relevance", "submitted" or "updated"
+
+        Returns:
+            Entries in arXiv's ranking order
+        """
+        max_results = max(1, min(max_results, ARXIV_MAX_RESULTS))
+        params = {
+            "search_query": build_search_query(query, start_date, end_date),
+            "start": 0,
+            "max_results": max_results,
+            "sortBy": SORT_FIELDS.get(sort_by, "relevance"),
+            "sortOrder": "descending",
+        }
+
+        entries: List[ArxivEntry] = []
+        parser = AtomFeedParser()
+        async with self.http_client.get(self.base_url, params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"arXiv returned status {response.status}")
+            async for chunk in response.content.iter_chunked(16384):
+                entries.extend(parser.feed(chunk))
+                if len(entries) >= max_results:
+                    break
+            else:
+                parser.close()
+
+        return entries[:max_results]
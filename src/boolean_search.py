@@ -3,13 +3,262 @@ Boolean Search Support
 Parses and processes boolean search operators (AND, OR, NOT) in queries
 """
 
-from typing import List, Set, Dict, Any, Optional
+from dataclasses import dataclass
+from typing import List, Set, Dict, Any, Optional, Tuple, Union, Callable
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class Term:
+    """A word or phrase"""
+    text: str
+
+
+@dataclass(frozen=True)
+class And:
+    children: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    children: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Not:
+    child: "Node"
+
+
+Node = Union[Term, And, Or, Not]
+
+_TOKEN = re.compile(r'\s*(?:(\()|(\))|"([^"]*)"|([^\s()"]+))')
+_OPERATORS = {"AND", "OR", "NOT"}
+
+
+def _tokenize(query: str) -> List[Tuple[str, str]]:
+    tokens = []
+    for match in _TOKEN.finditer(query):
+        open_paren, close_paren, phrase, word = match.groups()
+        if open_paren:
+            tokens.append(("(", "("))
+        elif close_paren:
+            tokens.append((")", ")"))
+        elif phrase is not None:
+            if phrase.strip():
+                tokens.append(("phrase", phrase.strip()))
+        elif word.upper() in _OPERATORS:
+            tokens.append((word.upper(), word))
+        else:
+            tokens.append(("word", word))
+    return tokens
+
+
+class _Parser:
+    """
+    Recursive-descent parser; precedence NOT > AND > OR
+
+    Adjacent unquoted words form one phrase term, quoted phrases stand alone,
+    "A NOT B" means A AND NOT B, and unbalanced parentheses or dangling
+    operators are tolerated.
+    """
+
+    def __init__(self, tokens: List[Tuple[str, str]]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self) -> Optional[str]:
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def parse(self) -> Optional[Node]:
+        node = self._or()
+        while self.pos < len(self.tokens):
+            # Stray ")" - skip it and keep AND-ing what follows
+            self.pos += 1
+            rest = self._or()
+            node = _combine(And, [node, rest])
+        return node
+
+    def _or(self) -> Optional[Node]:
+        children = [self._and()]
+        while self._peek() == "OR":
+            self.pos += 1
+            children.append(self._and())
+        return _combine(Or, children)
+
+    def _and(self) -> Optional[Node]:
+        children = [self._unary()]
+        while self._peek() in ("AND", "NOT", "word", "phrase", "("):
+            if self._peek() == "AND":
+                self.pos += 1
+            children.append(self._unary())
+        return _combine(And, children)
+
+    def _unary(self) -> Optional[Node]:
+        if self._peek() == "NOT":
+            self.pos += 1
+            child = self._unary()
+            return Not(child) if child is not None else None
+        return self._primary()
+
+    def _primary(self) -> Optional[Node]:
+        kind = self._peek()
+        if kind == "(":
+            self.pos += 1
+            node = self._or()
+            if self._peek() == ")":
+                self.pos += 1
+            return node
+        if kind == "phrase":
+            self.pos += 1
+            return Term(self.tokens[self.pos - 1][1])
+        words = []
+        while self._peek() == "word":
+            words.append(self.tokens[self.pos][1])
+            self.pos += 1
+        return Term(" ".join(words)) if words else None
+
+
+def _combine(kind, children: List[Optional[Node]]) -> Optional[Node]:
+    flat: List[Node] = []
+    for child in children:
+        if child is None:
+            continue
+        flat.extend(child.children if isinstance(child, kind) else [child])
+    if not flat:
+        return None
+    return flat[0] if len(flat) == 1 else kind(tuple(flat))
+
+
+def parse_boolean_ast(query: str) -> Optional[Node]:
+    """
+    Parse a query into a boolean expression tree
+
+    Args:
+        query: Query such as 'AI AND (medical OR clinical) NOT review'
+
+    Returns:
+        Root node, or None for an empty query
+    """
+    return _Parser(_tokenize(query)).parse()
+
+
+def ast_terms(node: Optional[Node], positive: bool = True) -> List[str]:
+    """Terms of the tree in order (only the non-negated ones when positive=True)"""
+    if node is None:
+        return []
+    if isinstance(node, Term):
+        return [node.text]
+    if isinstance(node, Not):
+        return [] if positive else ast_terms(node.child, positive)
+    terms = []
+    for child in node.children:
+        for term in ast_terms(child, positive):
+            if term not in terms:
+                terms.append(term)
+    return terms
+
+
+def broad_query(node: Optional[Node]) -> str:
+    """One plain query covering every positive term, for sources without boolean syntax"""
+    return " ".join(ast_terms(node))
+
+
+def _normalize_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def evaluate(node: Node, text: str) -> bool:
+    """Evaluate the tree against text (case-insensitive substring match per term)"""
+    if isinstance(node, Term):
+        return _normalize_text(node.text) in text
+    if isinstance(node, Not):
+        return not evaluate(node.child, text)
+    if isinstance(node, And):
+        return all(evaluate(child, text) for child in node.children)
+    return any(evaluate(child, text) for child in node.children)
+
+
+def matches_paper(node: Optional[Node], paper: Any) -> bool:
+    """Whether a paper (object or dict) satisfies the tree on title, abstract and authors"""
+    if node is None:
+        return True
+
+    def field(name):
+        return paper.get(name) if isinstance(paper, dict) else getattr(paper, name, None)
+
+    text = _normalize_text(" ".join([
+        field("title") or "",
+        field("abstract") or "",
+        " ".join(field("authors") or []),
+    ]))
+    return evaluate(node, text)
+
+
+class UnsupportedQuery(ValueError):
+    """The tree cannot be expressed in a source's query syntax"""
+
+
+@dataclass(frozen=True)
+class QueryDialect:
+    """Native boolean syntax of one source"""
+    term: Callable[[str], str]
+    and_not: str  # Binary exclusion operator ("NOT" or arXiv's "ANDNOT")
+
+
+def _quoted(text: str) -> str:
+    text = text.replace('"', "")
+    return f'"{text}"' if " " in text else text
+
+
+DIALECTS: Dict[str, QueryDialect] = {
+    "arxiv": QueryDialect(term=lambda t: f"all:{_quoted(t)}", and_not="ANDNOT"),
+    "pubmed": QueryDialect(term=lambda t: f"{_quoted(t)}[tiab]", and_not="NOT"),
+    "ieee": QueryDialect(term=_quoted, and_not="NOT"),
+    "springer": QueryDialect(term=_quoted, and_not="NOT"),
+}
+
+
+def _compile(node: Node, dialect: QueryDialect, nested: bool = False) -> str:
+    if isinstance(node, Term):
+        return dialect.term(node.text)
+    if isinstance(node, Not):
+        # All supported dialects only exclude relative to something else
+        raise UnsupportedQuery("negation without a positive operand")
+    if isinstance(node, Or):
+        compiled = " OR ".join(_compile(child, dialect, nested=True) for child in node.children)
+    else:
+        positives = [child for child in node.children if not isinstance(child, Not)]
+        negatives = [child.child for child in node.children if isinstance(child, Not)]
+        if not positives:
+            raise UnsupportedQuery("conjunction of negations only")
+        compiled = " AND ".join(_compile(child, dialect, nested=True) for child in positives)
+        for negative in negatives:
+            compiled += f" {dialect.and_not} {_compile(negative, dialect, nested=True)}"
+    return f"({compiled})" if nested else compiled
+
+
+def compile_query(node: Optional[Node], source: str) -> Optional[str]:
+    """
+    Translate the tree into a source's native query syntax
+
+    Returns:
+        The native query, or None when the source has no boolean syntax
+        (or the tree cannot be expressed in it); callers then search
+        broad_query() and post-filter with matches_paper()
+    """
+    dialect = DIALECTS.get(source)
+    if node is None or dialect is None:
+        return None
+    try:
+        return _compile(node, dialect)
+    except UnsupportedQuery as e:
+        logger.debug(f"Boolean query not expressible for {source}: {e}")
+        return None
+
+
 def parse_boolean_query(query: str) -> Dict[str, Any]:
     """
     Parse a boolean search query with AND, OR, NOT operators
@@ -75,6 +324,7 @@ def parse_boolean_query(query: str) -> Dict[str, Any]:
         "terms": terms,
         "operators": operators,
         "parsed_expression": _build_expression(terms, operators),
+        "ast": parse_boolean_ast(original_query),
     }
 
 
@@ -105,6 +355,9 @@ def expand_boolean_query(parsed_query: Dict[str, Any]) -> List[str]:
     """
     Expand boolean query into multiple simple queries for search
 
+    Scout no longer fans out over these; it sends each source one query
+    compiled from the AST (see compile_query) and post-filters the rest.
+
     For boolean queries, we generate variations:
     - AND: Search for combined terms
     - OR: Search for each term separately
@@ -171,54 +424,8 @@ def filter_by_boolean_terms(
     if parsed_query["type"] == "simple":
         return papers
 
-    terms = parsed_query["terms"]
-    operators = parsed_query["operators"]
-
-    filtered = []
-
-    for paper in papers:
-        # Extract searchable text
-        searchable_text = " ".join(
-            [
-                paper.get("title", ""),
-                paper.get("abstract", ""),
-                " ".join(paper.get("authors", [])),
-            ]
-        ).lower()
-
-        # Process terms with operators
-        term_results = {}
-        for term in terms:
-            term_lower = term.lower()
-            term_results[term] = term_lower in searchable_text
-
-        # Apply boolean logic
-        if not operators:
-            # Single term
-            result = term_results.get(terms[0], False)
-        else:
-            # Multiple terms with operators
-            # Simple left-to-right evaluation
-            result = term_results.get(terms[0], False)
-
-            for i, op in enumerate(operators):
-                next_term = terms[i + 1] if i + 1 < len(terms) else None
-                if next_term is None:
-                    break
-
-                next_result = term_results.get(next_term, False)
-
-                if op == "AND":
-                    result = result and next_result
-                elif op == "OR":
-                    result = result or next_result
-                elif op == "NOT":
-                    result = result and not next_result
-
-        if result:
-            filtered.append(paper)
-
-    return filtered
+    ast = parsed_query.get("ast") or parse_boolean_ast(parsed_query["original"])
+    return [paper for paper in papers if matches_paper(ast, paper)]
 
 
 def format_boolean_query_hint(query: str) -> Optional[str]:
@@ -3,12 +3,19 @@ Multi-Level Caching System
 Provides 10-50x performance improvement through intelligent caching
 """
 
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Sequence
+from collections import OrderedDict
 import json
 import hashlib
 import logging
+import os
+import threading
 from datetime import datetime, timedelta
 
+import numpy as np
+
+from constants import COMPLETION_CACHE_TTL_SECONDS
+
 logger = logging.getLogger(__name__)
 
 # Try to import Redis for advanced caching
@@ -197,16 +204,17 @@ class PaperMetadataCache:
 
 
 class EmbeddingCache:
-    """Specialized cache for embeddings"""
+    """Specialized cache for embeddings (shared tier, keyed by full text and model)"""
     
-    def __init__(self, cache: Cache):
+    def __init__(self, cache: Cache, model: str = "nvidia/nv-embedqa-e5-v5"):
         self.cache = cache
         self.prefix = "embedding"
+        self.model = model
         self.ttl = 604800  # 7 days (embeddings rarely change)
     
     def get_embedding(self, text: str, input_type: str = "passage") -> Optional[List[float]]:
         """Get cached embedding"""
-        key = self.cache._generate_key(self.prefix, text, input_type=input_type)
+        key = self.cache._generate_key(self.prefix, text, input_type=input_type, model=self.model)
         return self.cache.get(key)
     
     def set_embedding(
@@ -216,10 +224,136 @@ class EmbeddingCache:
         input_type: str = "passage"
     ):
         """Cache embedding"""
-        key = self.cache._generate_key(self.prefix, text, input_type=input_type)
+        key = self.cache._generate_key(self.prefix, text, input_type=input_type, model=self.model)
         self.cache.set(key, embedding, self.ttl)
 
 
+class EmbeddingVectorCache:
+    """
+    Bounded in-process LRU cache for embedding vectors
+    
+    Keys are a SHA-256 of model, input type and the full text, so texts that
+    share a prefix never collide. Vectors are stored as float32 arrays and the
+    cache evicts least-recently-used entries once its byte budget is exceeded.
+    """
+    
+    def __init__(self, max_bytes: int = 128 * 1024 * 1024, metrics=None):
+        """
+        Initialize vector cache
+        
+        Args:
+            max_bytes: Memory budget for stored vectors
+            metrics: Optional metrics collector for hit/miss/eviction counts
+        """
+        self.max_bytes = max_bytes
+        self.metrics = metrics
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(text: str, model: str, input_type: str) -> str:
+        """Build cache key from the full text, model and input type"""
+        digest = hashlib.sha256(f"{model}\x00{input_type}\x00{text}".encode()).hexdigest()
+        return f"embedding:{digest}"
+    
+    def get(self, text: str, model: str, input_type: str) -> Optional[List[float]]:
+        """Get a cached vector (as a list of floats) or None"""
+        return self.get_many([text], model, input_type).get(0)
+    
+    def get_many(
+        self,
+        texts: Sequence[str],
+        model: str,
+        input_type: str
+    ) -> Dict[int, List[float]]:
+        """
+        Look up many texts at once
+        
+        Returns:
+            Mapping of position in texts -> cached vector, for hits only
+        """
+        found: Dict[int, List[float]] = {}
+        with self._lock:
+            for idx, text in enumerate(texts):
+                key = self.make_key(text, model, input_type)
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[idx] = vector.tolist()
+        
+        hits = len(found)
+        misses = len(texts) - hits
+        self.hits += hits
+        self.misses += misses
+        if self.metrics:
+            for _ in range(hits):
+                self.metrics.record_cache_hit("embedding")
+            for _ in range(misses):
+                self.metrics.record_cache_miss("embedding")
+        
+        return found
+    
+    def set(self, text: str, model: str, input_type: str, vector: Sequence[float]):
+        """Store one vector"""
+        self.set_many([text], model, input_type, [vector])
+    
+    def set_many(
+        self,
+        texts: Sequence[str],
+        model: str,
+        input_type: str,
+        vectors: Sequence[Sequence[float]]
+    ):
+        """Store vectors for texts, evicting least-recently-used entries over budget"""
+        evicted = 0
+        with self._lock:
+            for text, vector in zip(texts, vectors):
+                if vector is None or len(vector) == 0:
+                    continue
+                key = self.make_key(text, model, input_type)
+                array = np.asarray(vector, dtype=np.float32)
+                
+                previous = self._entries.pop(key, None)
+                if previous is not None:
+                    self._bytes -= previous.nbytes
+                self._entries[key] = array
+                self._bytes += array.nbytes
+            
+            while self._bytes > self.max_bytes and self._entries:
+                _, oldest = self._entries.popitem(last=False)
+                self._bytes -= oldest.nbytes
+                evicted += 1
+        
+        if evicted:
+            self.evictions += evicted
+            if self.metrics:
+                self.metrics.record_cache_eviction("embedding", evicted)
+    
+    def clear(self):
+        """Drop all cached vectors"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0
+        }
+
+
 class SynthesisCache:
     """Specialized cache for synthesis results"""
     
@@ -228,25 +362,165 @@ class SynthesisCache:
         self.prefix = "synthesis"
         self.ttl = 3600  # 1 hour
     
-    def get_synthesis(self, query: str, max_papers: int) -> Optional[Dict[str, Any]]:
+    def _key(self, query: str, max_papers: int, start_year: Optional[int], end_year: Optional[int]) -> str:
+        # Year ranges are pushed down to sources, so they select different papers
+        years = {}
+        if start_year is not None or end_year is not None:
+            years = {"start_year": start_year, "end_year": end_year}
+        return self.cache._generate_key(self.prefix, query, max_papers=max_papers, **years)
+    
+    def get_synthesis(
+        self,
+        query: str,
+        max_papers: int,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """Get cached synthesis result"""
-        key = self.cache._generate_key(self.prefix, query, max_papers=max_papers)
-        return self.cache.get(key)
+        return self.cache.get(self._key(query, max_papers, start_year, end_year))
     
     def set_synthesis(
         self,
         query: str,
         max_papers: int,
-        result: Dict[str, Any]
+        result: Dict[str, Any],
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None
     ):
         """Cache synthesis result"""
-        key = self.cache._generate_key(self.prefix, query, max_papers=max_papers)
-        self.cache.set(key, result, self.ttl)
+        self.cache.set(self._key(query, max_papers, start_year, end_year), result, self.ttl)
+
+
+class CompletionCache:
+    """
+    Specialized cache for deterministic reasoning completions
+    
+    Keys cover the model, a SHA-256 of the prompt, max_tokens, the sampling
+    parameters and a prompt-template version, so editing a template (and
+    bumping its version) invalidates old entries.
+    """
+    
+    def __init__(self, cache: Cache, ttl: int = COMPLETION_CACHE_TTL_SECONDS):
+        self.cache = cache
+        self.prefix = "completion"
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.tokens_saved = 0
+        self._lock = threading.Lock()
+    
+    def _key(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        template_version: Optional[str]
+    ) -> str:
+        prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        return self.cache._generate_key(
+            self.prefix,
+            model,
+            prompt_hash,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            template_version=template_version
+        )
+    
+    def get_completion(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        template_version: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get cached completion
+        
+        Returns:
+            Dictionary with "text" and "completion_tokens", or None on a miss
+        """
+        key = self._key(model, prompt, max_tokens, temperature, top_p, template_version)
+        entry = self.cache.get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.tokens_saved += entry.get("completion_tokens", 0)
+        return entry
+    
+    def set_completion(
+        self,
+        model: str,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        text: str,
+        completion_tokens: int,
+        template_version: Optional[str] = None
+    ):
+        """Cache completion text with its generated token count"""
+        key = self._key(model, prompt, max_tokens, temperature, top_p, template_version)
+        self.cache.set(
+            key,
+            {"text": text, "completion_tokens": completion_tokens},
+            self.ttl
+        )
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts, hit rate and generated tokens saved"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "tokens_saved": self.tokens_saved
+            }
+
+
+# Global completion cache instance
+_completion_cache: Optional[CompletionCache] = None
+
+
+def get_completion_cache() -> CompletionCache:
+    """Get global reasoning completion cache (shares the Redis/memory tiers)"""
+    global _completion_cache
+    if _completion_cache is None:
+        ttl = int(os.getenv("COMPLETION_CACHE_TTL_SECONDS", COMPLETION_CACHE_TTL_SECONDS))
+        _completion_cache = CompletionCache(get_cache(), ttl=ttl)
+    return _completion_cache
+
+
+# Global embedding vector cache instance
+_embedding_vector_cache: Optional[EmbeddingVectorCache] = None
+
+
+def get_embedding_vector_cache() -> EmbeddingVectorCache:
+    """Get global in-process embedding vector cache"""
+    global _embedding_vector_cache
+    if _embedding_vector_cache is None:
+        try:
+            from metrics import get_metrics_collector
+            metrics = get_metrics_collector()
+        except ImportError:
+            metrics = None
+        max_mb = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "128"))
+        _embedding_vector_cache = EmbeddingVectorCache(
+            max_bytes=max_mb * 1024 * 1024,
+            metrics=metrics
+        )
+    return _embedding_vector_cache
 
 
 def get_cache() -> Cache:
     """Get global cache instance"""
-    import os
     redis_url = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     return Cache(redis_url=redis_url, default_ttl=3600)
 
@@ -0,0 +1,271 @@
+"""
+Adaptive Concurrency Limiting
+Process-wide AIMD limiter that keeps the Reasoning NIM busy without overloading it
+"""
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional, Deque, Dict, Hashable
+
+from constants import (
+    REASONING_INITIAL_CONCURRENCY,
+    REASONING_MIN_CONCURRENCY,
+    REASONING_MAX_CONCURRENCY,
+    REASONING_LATENCY_TOLERANCE
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AdaptiveLimiterConfig:
+    """Configuration for adaptive concurrency limiter"""
+    initial_limit: int = 4
+    min_limit: int = 1
+    max_limit: int = 32
+    increase_step: float = 1.0        # Additive increase per full window of successes
+    decrease_factor: float = 0.5      # Multiplicative decrease on overload
+    latency_tolerance: float = 2.0    # Overloaded when recent latency > tolerance x baseline
+    baseline_weight: float = 0.05     # EWMA weight of each sample in the long-run baseline
+    recent_weight: float = 0.3        # EWMA weight of each sample in the recent latency
+    min_latency_samples: int = 3      # Samples per key before latency can trigger a decrease
+    overhead_tokens: int = 32         # Fixed per-call cost (prefill, network) in output tokens
+    decrease_cooldown: float = 1.0    # Seconds between two decreases
+
+
+class LimiterSlot:
+    """Handle for one admitted call; lets the caller flag overload and report output size"""
+
+    def __init__(self):
+        self.overloaded = False
+        self.output_tokens: Optional[int] = None
+        self.first_token_at: Optional[float] = None
+
+    def mark_overloaded(self):
+        """Flag the call as overloaded (e.g. HTTP 429/503 from the NIM)"""
+        self.overloaded = True
+
+    def set_output_tokens(self, tokens: int):
+        """Report generated tokens so latency is compared per token"""
+        self.output_tokens = tokens
+
+    def mark_first_token(self):
+        """Report the first streamed token; time-to-first-token is used as the latency"""
+        if self.first_token_at is None:
+            self.first_token_at = time.monotonic()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limiter with latency feedback
+
+    The limit grows by roughly one slot per window of successful calls while
+    recent latency stays close to its long-run baseline, and is cut
+    multiplicatively on timeouts, 429/503 responses or when recent latency
+    climbs past the tolerance (the NIM is queueing internally). Both are
+    EWMAs tracked per key (e.g. max_tokens), over time-to-first-token for
+    streamed calls or latency per generated token otherwise, so replies of
+    different lengths are comparable. Waiters are admitted in FIFO order.
+    """
+
+    def __init__(
+        self,
+        name: str = "limiter",
+        config: Optional[AdaptiveLimiterConfig] = None,
+        metrics=None
+    ):
+        self.name = name
+        self.config = config or AdaptiveLimiterConfig()
+        self.metrics = metrics
+
+        self.limit = float(self.config.initial_limit)
+        self.in_flight = 0
+        self.baseline_latency: Dict[Hashable, float] = {}
+        self.recent_latency: Dict[Hashable, float] = {}
+        self._latency_samples: Dict[Hashable, int] = {}
+        self._last_decrease = 0.0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._report()
+
+    @property
+    def current_limit(self) -> int:
+        """Integer number of calls admitted concurrently"""
+        return max(self.config.min_limit, int(self.limit))
+
+    def get_queue_length(self) -> int:
+        """Number of calls waiting for a slot"""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    async def acquire(self) -> float:
+        """
+        Wait for a slot
+
+        Returns:
+            Seconds spent waiting in the queue
+        """
+        start = time.monotonic()
+        if self.in_flight < self.current_limit and not self.get_queue_length():
+            self.in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Slot was granted as we were cancelled; hand it on
+                    self._release_slot()
+                raise
+
+        waited = time.monotonic() - start
+        if self.metrics:
+            self.metrics.record_concurrency_wait(self.name, waited)
+        return waited
+
+    def release(
+        self,
+        latency: Optional[float] = None,
+        overloaded: bool = False,
+        key: Hashable = None,
+        tokens: Optional[int] = None
+    ):
+        """
+        Return a slot and adapt the limit
+
+        Args:
+            latency: Call latency in seconds (None when the call failed)
+            overloaded: Call hit a timeout or an overload response
+            key: Latency class of the call (calls sharing a key are comparable)
+            tokens: Generated tokens; latency is then compared per token
+        """
+        if overloaded:
+            self._decrease("overload")
+        elif latency is not None:
+            if tokens is not None:
+                latency /= max(1, tokens) + self.config.overhead_tokens
+            self._on_latency(latency, key)
+        self._release_slot()
+
+    @asynccontextmanager
+    async def slot(self, key: Hashable = None):
+        """
+        Hold a slot for the duration of a call
+
+        Timeouts count as overload; other exceptions release the slot
+        without adapting the limit.
+
+        Args:
+            key: Latency class of the call (e.g. max_tokens)
+        """
+        await self.acquire()
+        handle = LimiterSlot()
+        start = time.monotonic()
+        try:
+            yield handle
+        except asyncio.TimeoutError:
+            self.release(overloaded=True)
+            raise
+        except BaseException:
+            self.release(overloaded=handle.overloaded)
+            raise
+        else:
+            if handle.overloaded:
+                self.release(overloaded=True)
+            elif handle.first_token_at is not None:
+                # Time-to-first-token does not depend on output length
+                self.release(latency=handle.first_token_at - start, key=("ttft", key))
+            else:
+                self.release(
+                    latency=time.monotonic() - start,
+                    key=key,
+                    tokens=handle.output_tokens
+                )
+
+    def _on_latency(self, latency: float, key: Hashable = None):
+        cfg = self.config
+        baseline = self.baseline_latency.get(key, latency)
+        recent = self.recent_latency.get(key, latency)
+        samples = self._latency_samples.get(key, 0) + 1
+
+        recent += (latency - recent) * cfg.recent_weight
+        spiking = samples > cfg.min_latency_samples and recent > baseline * cfg.latency_tolerance
+        # The baseline follows slowly, so a sustained rise stays visible against it
+        baseline += (latency - baseline) * cfg.baseline_weight
+        self.baseline_latency[key] = baseline
+        self.recent_latency[key] = recent
+        self._latency_samples[key] = samples
+
+        if spiking:
+            self._decrease("latency")
+        elif self.in_flight >= self.current_limit:
+            # Only grow when the current limit is actually being used
+            self.limit = min(cfg.max_limit, self.limit + cfg.increase_step / self.limit)
+            self._report()
+            self._wake()
+
+    def _decrease(self, reason: str):
+        now = time.monotonic()
+        if now - self._last_decrease < self.config.decrease_cooldown:
+            return
+        self._last_decrease = now
+        previous = self.current_limit
+        self.limit = max(float(self.config.min_limit), self.limit * self.config.decrease_factor)
+        logger.warning(
+            f"Concurrency limiter {self.name}: backing off ({reason}) "
+            f"{previous} -> {self.current_limit}"
+        )
+        self._report()
+
+    def _release_slot(self):
+        self.in_flight = max(0, self.in_flight - 1)
+        self._wake()
+
+    def _wake(self):
+        while self._waiters and self.in_flight < self.current_limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+        self._report()
+
+    def _report(self):
+        if self.metrics:
+            self.metrics.record_concurrency_limit(self.name, self.current_limit, self.in_flight)
+
+    def get_stats(self) -> dict:
+        """Get current limit, in-flight calls, queue length and latency baselines"""
+        return {
+            "limit": self.current_limit,
+            "in_flight": self.in_flight,
+            "queued": self.get_queue_length(),
+            "baseline_latency": dict(self.baseline_latency)
+        }
+
+
+# Global reasoning limiter instance
+_reasoning_limiter: Optional[AdaptiveConcurrencyLimiter] = None
+
+
+def get_reasoning_limiter() -> AdaptiveConcurrencyLimiter:
+    """Get process-wide limiter for Reasoning NIM calls"""
+    global _reasoning_limiter
+    if _reasoning_limiter is None:
+        try:
+            from metrics import get_metrics_collector
+            metrics = get_metrics_collector()
+        except ImportError:
+            metrics = None
+        config = AdaptiveLimiterConfig(
+            initial_limit=int(os.getenv("REASONING_INITIAL_CONCURRENCY", REASONING_INITIAL_CONCURRENCY)),
+            min_limit=int(os.getenv("REASONING_MIN_CONCURRENCY", REASONING_MIN_CONCURRENCY)),
+            max_limit=int(os.getenv("REASONING_MAX_CONCURRENCY", REASONING_MAX_CONCURRENCY)),
+            latency_tolerance=float(os.getenv("REASONING_LATENCY_TOLERANCE", REASONING_LATENCY_TOLERANCE))
+        )
+        _reasoning_limiter = AdaptiveConcurrencyLimiter("reasoning", config, metrics)
+    return _reasoning_limiter
@@ -44,6 +44,7 @@ class PaperSourceConfig:
     """Configuration for paper source APIs"""
     # Free/public APIs
     semantic_scholar_api_key: Optional[str] = None
+    pubmed_api_key: Optional[str] = None  # NCBI key raises the E-utilities rate limit
     crossref_mailto: str = "research-ops@example.com"
     
     # APIs requiring keys/subscriptions
@@ -101,6 +102,7 @@ class PaperSourceConfig:
         
         return cls(
             semantic_scholar_api_key=os.getenv("SEMANTIC_SCHOLAR_API_KEY"),
+            pubmed_api_key=os.getenv("NCBI_API_KEY"),
             crossref_mailto=os.getenv("CROSSREF_MAILTO", "research-ops@example.com"),
             ieee_api_key=ieee_key,
             acm_api_key=acm_key,
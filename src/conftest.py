@@ -0,0 +1,31 @@
+"""
+Shared pytest fixtures for the unit tests
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+
+@pytest.fixture
+def make_paper():
+    """
+    Factory for Paper objects with test defaults
+
+    make_paper(paper_id, title=None, **fields): the title defaults to
+    "Title <paper_id>", other fields to one author, a short abstract and no
+    URL; an embedding may be any sequence (e.g. a NumPy row).
+    """
+    from agents import Paper
+
+    def factory(paper_id: str, title: str = None, **fields) -> Paper:
+        values = {"authors": ["A"], "abstract": "Abstract", "url": ""}
+        values.update(fields)
+        if values.get("embedding") is not None:
+            values["embedding"] = [float(x) for x in values["embedding"]]
+        return Paper(id=paper_id, title=title or f"Title {paper_id}", **values)
+
+    return factory
@@ -11,6 +11,29 @@ MAX_RESEARCH_TIMEOUT_SECONDS = 300  # 5 minutes
 NIM_CONNECT_TIMEOUT_SECONDS = 10
 NIM_SOCK_READ_TIMEOUT_SECONDS = 60  # Increased from 30 to handle slower responses under load
 
+# NIM connection pool (shared clients created at API startup)
+NIM_POOL_MAX_CONNECTIONS = 100
+NIM_POOL_MAX_CONNECTIONS_PER_HOST = 32
+NIM_POOL_DNS_CACHE_TTL_SECONDS = 300
+NIM_POOL_KEEPALIVE_TIMEOUT_SECONDS = 30
+
+# Embedding micro-batching (coalesces concurrent embed calls)
+EMBEDDING_BATCH_LINGER_MS = 5
+EMBEDDING_MAX_BATCH_SIZE = 64
+EMBEDDING_BATCH_TOKEN_BUDGET = 8192  # Estimated tokens per /v1/embeddings call
+EMBEDDING_MAX_INPUT_TOKENS = 512  # nv-embedqa-e5-v5 per-input limit
+EMBEDDING_MAX_IN_FLIGHT = 4  # Concurrent embedding calls per client
+
+# Reasoning NIM adaptive concurrency (process-wide AIMD limiter)
+REASONING_INITIAL_CONCURRENCY = 4
+REASONING_MIN_CONCURRENCY = 1
+REASONING_MAX_CONCURRENCY = 32
+REASONING_LATENCY_TOLERANCE = 2.0  # Back off when recent latency per token (or TTFT) exceeds 2x its EWMA baseline
+
+# Deadline-aware retries (expected call latency a retry must fit in)
+REASONING_EXPECTED_LATENCY_SECONDS = 10.0
+EMBEDDING_EXPECTED_LATENCY_SECONDS = 2.0
+
 # Thresholds
 DEFAULT_RELEVANCE_THRESHOLD = 0.5  # Lowered from 0.7 to allow more papers through filtering
 DEFAULT_SYNTHESIS_QUALITY_THRESHOLD = 0.8
@@ -21,8 +44,14 @@ MAX_RELEVANCE_THRESHOLD = 1.0
 MAX_PAPERS_PER_QUERY = 50
 MIN_PAPERS_PER_QUERY = 1
 DEFAULT_MAX_PAPERS = 10
-MAX_CONCURRENT_ANALYSES = 3  # Reduced from 5 to prevent NIM overload
+MAX_CONCURRENT_ANALYSES = 8  # Per request; the global reasoning limiter protects the NIM
+ANALYSIS_PACK_SIZE = 4  # Papers per packed analysis completion (1 disables packing)
+ANALYSIS_PACK_TOKEN_BUDGET = 2000  # Estimated paper tokens (title + abstract) per packed prompt
+ANALYSIS_OUTPUT_TOKENS_PER_PAPER = 700  # Completion budget per paper in a packed prompt
+PIPELINE_QUEUE_SIZE = 16  # Bound on papers/analyses waiting between pipelined stages
 MAX_CONCURRENT_SEARCHES = 10
+SOURCE_LATENCY_BUDGET_SECONDS = 20.0  # Slower source searches are dropped from the result
+SCOUT_EARLY_STOP_FACTOR = 2  # Stop searching once 2x max_papers are above the threshold
 MAX_QUERY_LENGTH = 500
 MIN_QUERY_LENGTH = 1
 
@@ -32,6 +61,64 @@ SYNTHESIS_CACHE_TTL_HOURS = 24
 HEALTH_CACHE_TTL_SECONDS = 30
 EMBEDDING_CACHE_TTL_HOURS = 24
 
+# Paper source search cache (fresh TTL per source, then served stale while refreshing)
+SOURCE_CACHE_TTL_SECONDS = {
+    "arxiv": 6 * 3600,
+    "pubmed": 12 * 3600,
+    "semantic_scholar": 12 * 3600,
+    "crossref": 24 * 3600,
+    "ieee": 24 * 3600,
+    "acm": 24 * 3600,
+    "springer": 24 * 3600,
+}
+SOURCE_CACHE_DEFAULT_TTL_SECONDS = 6 * 3600
+SOURCE_CACHE_STALE_SECONDS = 24 * 3600
+SOURCE_CACHE_EMPTY_TTL_SECONDS = 600  # Empty results
+SOURCE_CACHE_ERROR_TTL_SECONDS = 60  # Failed searches (fallback results)
+COMPLETION_CACHE_TTL_SECONDS = 86400  # Reasoning completions (keyed by prompt version)
+COMPLETION_CACHE_MAX_TEMPERATURE = 0.5  # Higher temperatures are never cached
+
+# Local paper store (SQLite + FTS5), queried before the live sources
+PAPER_STORE_DEFAULT_PATH = "data/papers.db"
+PAPER_STORE_BATCH_SIZE = 100  # Buffered papers per write transaction
+PAPER_STORE_SEARCH_LIMIT = 20
+
+# Cross-query Analyst results (in-process warm tier over SQLite)
+ANALYSIS_STORE_DEFAULT_PATH = "data/analyses.db"
+ANALYSIS_STORE_WARM_SIZE = 2000  # Analyses kept in process
+
+# Vector index over stored paper embeddings (Qdrant when VECTOR_DB_URL is set)
+VECTOR_DB_DEFAULT_COLLECTION = "papers"
+VECTOR_INDEX_SEARCH_LIMIT = 20
+VECTOR_INDEX_IVF_MIN_SIZE = 4096  # Below this the local index is scanned exactly
+VECTOR_INDEX_IVF_NPROBE = 8  # IVF lists scored per query
+VECTOR_INDEX_MAX_LOCAL_SIZE = 20000  # ~80 MB of 1024-dim float32; use Qdrant beyond this
+
+# Full-text PDF parsing (process pool, off the event loop)
+PDF_PARSE_WORKERS = 2
+PDF_PARSE_MAX_PENDING = 4  # Documents parsing or queued; more are rejected immediately
+PDF_PARSE_TIMEOUT_SECONDS = 30.0  # Per document
+PDF_MAX_PAGES = 60
+
+# External paper source HTTP client (per-host token buckets, requests/second)
+SOURCE_HTTP_RATE_LIMITS = {
+    "export.arxiv.org": 0.33,  # arXiv asks for one request every 3 seconds
+    "eutils.ncbi.nlm.nih.gov": 3.0,  # NCBI E-utilities without an API key
+    "api.semanticscholar.org": 0.5,  # Shared unauthenticated pool
+    "api.crossref.org": 10.0,  # Polite pool (mailto set)
+    "ieeexploreapi.ieee.org": 5.0,
+    "api.acm.org": 2.0,
+    "api.springernature.com": 5.0,
+}
+SOURCE_HTTP_KEYED_RATE_LIMITS = {
+    "eutils.ncbi.nlm.nih.gov": 10.0,
+    "api.semanticscholar.org": 1.0,
+}
+SOURCE_HTTP_DEFAULT_RATE = 2.0
+SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST = 4
+SOURCE_HTTP_POOL_SIZE = 50
+SOURCE_HTTP_THROTTLE_RETRIES = 1  # Retries after a 429, within the request deadline
+
 # Retry Configuration
 MAX_RETRY_ATTEMPTS = 3
 RETRY_MIN_WAIT_SECONDS = 2
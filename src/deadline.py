@@ -0,0 +1,192 @@
+"""
+Request Deadlines and Deadline-Aware Retries
+Carries one time budget per request so retries never outlive the request
+"""
+
+import os
+import time
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional, Callable
+
+from constants import MAX_RESEARCH_TIMEOUT_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for server-provided Retry-After waits
+MAX_RETRY_AFTER_SECONDS = 30.0
+
+
+class Deadline:
+    """Absolute point in time by which a request must finish"""
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self.expires_at = time.monotonic() + timeout_seconds
+
+    def remaining(self) -> float:
+        """Seconds left (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the budget is used up"""
+        return self.remaining() <= 0
+
+    def covers(self, seconds: float) -> bool:
+        """Whether the remaining budget covers the given duration"""
+        return self.remaining() >= seconds
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("request_deadline", default=None)
+
+
+def get_current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the request running in this context, if any"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: float):
+    """
+    Apply a deadline to the enclosed block
+
+    A nested scope never extends an outer deadline; the earlier one wins.
+
+    Yields:
+        The effective Deadline
+    """
+    deadline = Deadline(timeout_seconds)
+    outer = _current_deadline.get()
+    if outer is not None and outer.expires_at < deadline.expires_at:
+        deadline = outer
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def get_research_timeout_seconds() -> float:
+    """
+    Time budget for one research request
+
+    Read once here so the API's hard timeout and the deadline that bounds
+    retries inside the agents always agree.
+    """
+    return float(os.getenv("MAX_RESEARCH_TIMEOUT_SECONDS", MAX_RESEARCH_TIMEOUT_SECONDS))
+
+
+def budget_timeout(default_seconds: float, minimum_seconds: float = 1.0) -> float:
+    """
+    Clamp a per-call timeout to the current request's remaining budget
+
+    Args:
+        default_seconds: Timeout to use when no deadline is active
+        minimum_seconds: Floor so calls are not issued with a zero timeout
+
+    Returns:
+        Timeout in seconds
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default_seconds
+    return max(minimum_seconds, min(default_seconds, deadline.remaining()))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header (delta-seconds or HTTP date)
+
+    Returns:
+        Seconds to wait, or None when the header is missing or malformed
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class DeadlineRetryPolicy:
+    """
+    Tenacity stop/wait strategies bounded by the request deadline
+
+    The wait honors a ``retry_after`` attribute on the last exception (set
+    from the server's Retry-After header), falling back to exponential
+    backoff. Retrying stops after max_attempts, or as soon as the remaining
+    budget cannot cover the upcoming wait plus the call's expected latency.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        expected_latency: float,
+        max_attempts: int = 3,
+        multiplier: float = 1.0,
+        min_wait: float = 2.0,
+        max_wait: float = 10.0,
+        metrics_getter: Optional[Callable] = None
+    ):
+        self.name = name
+        self.expected_latency = expected_latency
+        self.max_attempts = max_attempts
+        self.multiplier = multiplier
+        self.min_wait = min_wait
+        self.max_wait = max_wait
+        self._metrics_getter = metrics_getter
+
+    def _metrics(self):
+        if self._metrics_getter is None:
+            return None
+        try:
+            return self._metrics_getter()
+        except Exception:
+            return None
+
+    def next_wait(self, retry_state) -> float:
+        """Seconds to sleep before the next attempt"""
+        exception = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(exception, "retry_after", None)
+        if retry_after is not None:
+            return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+        backoff = self.multiplier * (2 ** (retry_state.attempt_number - 1))
+        return max(self.min_wait, min(backoff, self.max_wait))
+
+    def wait(self, retry_state) -> float:
+        """Tenacity wait strategy"""
+        return self.next_wait(retry_state)
+
+    def stop(self, retry_state) -> bool:
+        """Tenacity stop strategy; counts retries and budget exhaustion"""
+        metrics = self._metrics()
+
+        if retry_state.attempt_number >= self.max_attempts:
+            return True
+
+        deadline = _current_deadline.get()
+        if deadline is not None:
+            needed = self.next_wait(retry_state) + self.expected_latency
+            if not deadline.covers(needed):
+                logger.warning(
+                    f"{self.name}: not retrying, {deadline.remaining():.1f}s left "
+                    f"but retry needs ~{needed:.1f}s"
+                )
+                if metrics:
+                    metrics.record_retry_budget_exhausted(self.name)
+                return True
+
+        if metrics:
+            metrics.record_retry_attempt(self.name)
+        return False
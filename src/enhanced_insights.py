@@ -13,6 +13,8 @@ from collections import Counter, defaultdict
 import re
 import os
 
+import prompts
+
 try:
     from nim_clients import ReasoningNIMClient
 except ImportError:
@@ -571,13 +573,7 @@ class EnhancedInsightsGenerator:
 
     async def _suggest_approaches(self, gap: str) -> List[str]:
         """Suggest research approaches for a gap."""
-        prompt = f"""Suggest 2-3 specific research approaches to address this gap:
-        
-Gap: {gap}
-
-Provide concise, actionable research directions.
-Format as a bulleted list.
-"""
+        prompt = prompts.GAP_APPROACHES.render(gap=gap)
         try:
             response = await self.reasoning_client.complete(
                 prompt,
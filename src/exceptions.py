@@ -31,6 +31,26 @@ class NIMServiceError(ResearchOpsError):
             self.details["service"] = service
 
 
+class NIMOverloadedError(NIMServiceError):
+    """NIM rejected a call because it is saturated (HTTP 429/503); safe to retry"""
+    
+    def __init__(
+        self,
+        message: str,
+        service: str = None,
+        status: int = None,
+        retry_after: float = None,
+        details: dict = None
+    ):
+        super().__init__(message, service, details)
+        self.status = status
+        self.retry_after = retry_after
+        if status:
+            self.details["status"] = status
+        if retry_after is not None:
+            self.details["retry_after"] = retry_after
+
+
 class ValidationError(ResearchOpsError):
     """Input validation error"""
     
@@ -64,6 +84,19 @@ class CircuitBreakerOpenError(ResearchOpsError):
             self.details["retry_after"] = retry_after
 
 
+class WorkerPoolSaturatedError(ResearchOpsError):
+    """A bounded worker pool has no free slot; the caller should retry later"""
+    
+    def __init__(self, message: str, pool: str = None, retry_after: int = None, details: dict = None):
+        super().__init__(message, details)
+        self.pool = pool
+        self.retry_after = retry_after
+        if pool:
+            self.details["pool"] = pool
+        if retry_after:
+            self.details["retry_after"] = retry_after
+
+
 class ConfigurationError(ResearchOpsError):
     """Configuration validation error"""
     pass
@@ -0,0 +1,311 @@
+"""
+Cross-Source Paper Identity Resolution
+Merges the same paper found on several sources before it is embedded
+"""
+
+import re
+import zlib
+import hashlib
+import logging
+import unicodedata
+from typing import Any, Dict, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Titles shorter than this (after normalization) are too generic to match on
+MIN_TITLE_LENGTH = 15
+TITLE_SHINGLE_SIZE = 4
+TITLE_SIMILARITY_THRESHOLD = 0.8  # Jaccard over title shingles
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16
+# Title-only matches also need the years to agree within this many years (a
+# preprint and its journal version are often a year apart) or a shared author
+YEAR_TOLERANCE = 1
+STRONG_KEY_KINDS = ("doi:", "pmid:", "arxiv:")
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_ARXIV_NEW = re.compile(r"(\d{4}\.\d{4,5})(v\d+)?$")
+_ARXIV_OLD = re.compile(r"([a-z\-]+(?:\.[a-z]{2})?/\d{7})(v\d+)?$")
+_ARXIV_DOI = re.compile(r"^10\.48550/arxiv\.(.+)$")
+_PMID = re.compile(r"^\d{1,9}$")
+
+
+def normalize_doi(value: Optional[str]) -> Optional[str]:
+    """Lowercase a DOI and strip resolver prefixes"""
+    if not value:
+        return None
+    doi = value.strip().lower()
+    doi = re.sub(r"^(https?://)?(dx\.)?doi\.org/", "", doi)
+    doi = re.sub(r"^doi:\s*", "", doi)
+    return doi if doi.startswith("10.") else None
+
+
+def normalize_arxiv_id(value: Optional[str]) -> Optional[str]:
+    """Extract a version-less arXiv identifier from an ID, URL or arXiv DOI"""
+    if not value:
+        return None
+    text = value.strip().lower()
+    doi_match = _ARXIV_DOI.match(normalize_doi(text) or "")
+    if doi_match:
+        text = doi_match.group(1)
+    text = re.sub(r"^arxiv:", "", text)
+    text = re.sub(r"\.pdf$", "", text.rstrip("/"))
+    text = text.split("/abs/")[-1].split("/pdf/")[-1]
+    for pattern in (_ARXIV_NEW, _ARXIV_OLD):
+        match = pattern.search(text)
+        if match:
+            return match.group(1)
+    return None
+
+
+def normalize_title(title: Optional[str]) -> str:
+    """Fold accents, case and punctuation so titles compare across sources"""
+    if not title:
+        return ""
+    text = unicodedata.normalize("NFKD", title)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def fallback_paper_id(source: str, title: Optional[str], authors: Optional[List[str]], abstract: Optional[str]) -> str:
+    """
+    Source-prefixed ID for a record without a native identifier
+
+    It is derived from the content, not the record's position in the result
+    list, so it names the same paper in every search and never collides with
+    an unrelated paper in the paper store or vector index.
+    """
+    content = "\n".join([normalize_title(title), "; ".join(authors or []), abstract or ""])
+    return f"{source}-h{hashlib.sha256(content.encode('utf-8')).hexdigest()[:16]}"
+
+
+def identity_keys(paper: Any) -> Set[str]:
+    """
+    Strong identifiers of a paper: DOI, arXiv ID, PMID and normalized title
+
+    They are read from the DOI field, the source-prefixed ID and the URL.
+    """
+    keys = set()
+    paper_id = getattr(paper, "id", "") or ""
+    source, _, native_id = paper_id.partition("-")
+    url = getattr(paper, "url", "") or ""
+
+    for candidate in (getattr(paper, "doi", None), url, native_id if source in ("crossref", "springer") else None):
+        arxiv_id = normalize_arxiv_id(candidate) if candidate and "48550" in candidate else None
+        if arxiv_id:
+            keys.add(f"arxiv:{arxiv_id}")
+            continue
+        doi = normalize_doi(candidate)
+        if doi:
+            keys.add(f"doi:{doi}")
+
+    for candidate in (native_id if source == "arxiv" else None, url if "arxiv.org" in url else None):
+        arxiv_id = normalize_arxiv_id(candidate)
+        if arxiv_id:
+            keys.add(f"arxiv:{arxiv_id}")
+
+    if source == "pubmed" and _PMID.match(native_id):
+        keys.add(f"pmid:{native_id}")
+    pmid_match = re.search(r"pubmed\.ncbi\.nlm\.nih\.gov/(\d+)", url)
+    if pmid_match:
+        keys.add(f"pmid:{pmid_match.group(1)}")
+
+    title = normalize_title(getattr(paper, "title", ""))
+    if len(title) >= MIN_TITLE_LENGTH:
+        keys.add(f"title:{title}")
+    return keys
+
+
+def _conflicting(keys_a: Set[str], keys_b: Set[str]) -> bool:
+    # Two different DOIs (or PMIDs, or arXiv IDs) mean two different papers,
+    # however similar the titles are
+    for kind in STRONG_KEY_KINDS:
+        a = {k for k in keys_a if k.startswith(kind)}
+        b = {k for k in keys_b if k.startswith(kind)}
+        if a and b and not a & b:
+            return True
+    return False
+
+
+def author_surnames(authors: Optional[List[str]]) -> Set[str]:
+    """Normalized surnames ("Ada Lovelace", "Lovelace, A." and "Lovelace A" agree)"""
+    surnames = set()
+    for author in authors or []:
+        name = author.split(",")[0] if "," in author else author
+        tokens = [t for t in normalize_title(name).split() if len(t) > 1]
+        if tokens:
+            surnames.add(tokens[0] if "," in author else tokens[-1])
+    return surnames
+
+
+def _corroborated(paper_a: Any, paper_b: Any) -> bool:
+    # Distinct papers can share a title; without a shared identifier, the
+    # publication year or an author has to agree as well
+    try:
+        year_a, year_b = int(paper_a.year), int(paper_b.year)
+        if abs(year_a - year_b) <= YEAR_TOLERANCE:
+            return True
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return bool(
+        author_surnames(getattr(paper_a, "authors", None))
+        & author_surnames(getattr(paper_b, "authors", None))
+    )
+
+
+def title_shingles(title: str, size: int = TITLE_SHINGLE_SIZE) -> Set[str]:
+    """Character shingles of a normalized title"""
+    if len(title) <= size:
+        return {title} if title else set()
+    return {title[i:i + size] for i in range(len(title) - size + 1)}
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+class MinHashLSH:
+    """
+    MinHash signatures with banded LSH buckets
+
+    Items whose shingle sets have high Jaccard similarity share at least one
+    band bucket with high probability; candidates are verified exactly.
+    """
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, bands: int = MINHASH_BANDS, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        # 29-bit multipliers keep a * crc32 + b below 2**63 (no uint64 overflow)
+        self._a = rng.integers(1, 1 << 29, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+
+    def signature(self, shingles: Set[str]) -> np.ndarray:
+        """MinHash signature of a shingle set"""
+        hashes = np.array(
+            [zlib.crc32(s.encode("utf-8")) for s in shingles], dtype=np.uint64
+        ).reshape(-1, 1)
+        permuted = (hashes * self._a + self._b) % np.uint64(_MERSENNE_PRIME)
+        return permuted.min(axis=0)
+
+    def _bands(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def insert(self, item: int, signature: np.ndarray):
+        for band, key in self._bands(signature):
+            self._buckets[band].setdefault(key, []).append(item)
+
+    def query(self, signature: np.ndarray) -> Set[int]:
+        """Items sharing at least one band with the signature"""
+        candidates: Set[int] = set()
+        for band, key in self._bands(signature):
+            candidates.update(self._buckets[band].get(key, ()))
+        return candidates
+
+
+def _is_placeholder(text: Optional[str]) -> bool:
+    return not text or text.startswith("No abstract") or text == "No title"
+
+
+def merge_metadata(target: Any, duplicate: Any):
+    """
+    Fill gaps in target's metadata from a duplicate record of the same paper
+
+    Once target has been embedded its abstract is kept, so the embedding and
+    relevance score (and the vector index entry) stay consistent with it.
+    """
+    if getattr(target, "embedding", None) is None and not _is_placeholder(duplicate.abstract) and (
+        _is_placeholder(target.abstract) or len(duplicate.abstract) > len(target.abstract)
+    ):
+        target.abstract = duplicate.abstract
+    if not target.authors and duplicate.authors:
+        target.authors = list(duplicate.authors)
+    for field_name in ("year", "venue", "doi", "content"):
+        if getattr(target, field_name, None) is None and getattr(duplicate, field_name, None) is not None:
+            setattr(target, field_name, getattr(duplicate, field_name))
+
+
+class IdentityResolver:
+    """
+    Incremental cross-source deduplication
+
+    Papers are matched on normalized DOI, arXiv ID, PMID or title, and then
+    fuzzily on title shingles through MinHash LSH. Matches on the title alone
+    also need the year or an author to agree. The first record of a paper is
+    kept and later duplicates only contribute missing metadata.
+    """
+
+    def __init__(self, title_threshold: float = TITLE_SIMILARITY_THRESHOLD):
+        self.title_threshold = title_threshold
+        self.duplicates = 0
+        self._papers: List[Any] = []
+        self._keys: List[Set[str]] = []
+        self._shingles: List[Set[str]] = []
+        self._by_key: Dict[str, int] = {}
+        self._by_id: Dict[str, int] = {}
+        self._lsh = MinHashLSH()
+
+    def _find(self, paper: Any, keys: Set[str], shingles: Set[str], signature) -> Optional[int]:
+        if paper.id in self._by_id:
+            return self._by_id[paper.id]
+        for key in sorted(keys):
+            index = self._by_key.get(key)
+            if index is None or _conflicting(keys, self._keys[index]):
+                continue
+            if key.startswith(STRONG_KEY_KINDS) or _corroborated(paper, self._papers[index]):
+                return index
+        if signature is None:
+            return None
+        for index in sorted(self._lsh.query(signature)):
+            if _conflicting(keys, self._keys[index]):
+                continue
+            if (jaccard(shingles, self._shingles[index]) >= self.title_threshold
+                    and _corroborated(paper, self._papers[index])):
+                return index
+        return None
+
+    def add(self, paper: Any) -> bool:
+        """
+        Register a paper
+
+        Returns:
+            True if it is new, False if it was merged into an earlier record
+        """
+        keys = identity_keys(paper)
+        title = normalize_title(paper.title)
+        shingles = title_shingles(title) if len(title) >= MIN_TITLE_LENGTH else set()
+        signature = self._lsh.signature(shingles) if shingles else None
+
+        index = self._find(paper, keys, shingles, signature)
+        if index is not None:
+            merge_metadata(self._papers[index], paper)
+            self._keys[index] |= keys
+            for key in keys:
+                self._by_key.setdefault(key, index)
+            self._by_id.setdefault(paper.id, index)
+            self.duplicates += 1
+            return False
+
+        index = len(self._papers)
+        self._papers.append(paper)
+        self._keys.append(keys)
+        self._shingles.append(shingles)
+        self._by_id[paper.id] = index
+        for key in keys:
+            self._by_key.setdefault(key, index)
+        if signature is not None:
+            self._lsh.insert(index, signature)
+        return True
+
+    def resolve(self, papers: List[Any]) -> List[Any]:
+        """Register papers and return the ones that are new"""
+        return [paper for paper in papers if self.add(paper)]
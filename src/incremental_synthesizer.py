@@ -12,8 +12,12 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 
+import numpy as np
+
 from nim_clients import ReasoningNIMClient, EmbeddingNIMClient
+import prompts
 from agents import Synthesis
+from similarity import EmbeddingMatrix, pairwise_scores
 
 logger = logging.getLogger(__name__)
 
@@ -131,6 +135,9 @@ class IncrementalSynthesizer:
     - Total: ~100-150 comparisons vs 900 (85% reduction)
     """
 
+    # Registry version of the contradiction prompt, so cached yes/no answers follow prompt changes
+    CONTRADICTION_PROMPT_VERSION = prompts.CONTRADICTION_CHECK.version
+
     def __init__(
         self,
         reasoning_client: ReasoningNIMClient,
@@ -158,6 +165,9 @@ class IncrementalSynthesizer:
         self.all_findings: List[str] = []
         self.finding_embeddings: List[List[float]] = []
         self.finding_to_paper: Dict[str, str] = {}  # Maps finding to paper title
+        # Normalized float32 copy of finding_embeddings for vectorized scoring
+        self.finding_matrix = EmbeddingMatrix()
+        self.finding_index: Dict[str, int] = {}  # First row of each finding in all_findings
 
     async def add_analysis(
         self,
@@ -208,8 +218,11 @@ class IncrementalSynthesizer:
             new_gaps = await self._identify_gaps()
 
         # Update running state
-        self.all_findings.extend(new_findings)
+        for finding in new_findings:
+            self.finding_index.setdefault(finding, len(self.all_findings))
+            self.all_findings.append(finding)
         self.finding_embeddings.extend(new_embeddings)
+        self.finding_matrix.extend(new_embeddings)
 
         # Create synthesis update
         update = SynthesisUpdate(
@@ -255,25 +268,23 @@ class IncrementalSynthesizer:
             best_match_theme = None
             best_similarity = 0.0
 
+            # Score the finding against every existing finding in one pass
+            finding_scores = self.finding_matrix.scores(finding_embedding)
+
             for theme in self.themes:
                 # Calculate average similarity to theme's findings
                 if not theme.key_findings:
                     continue
 
-                # Get embeddings for theme findings
                 theme_finding_indices = [
-                    self.all_findings.index(tf) for tf in theme.key_findings
-                    if tf in self.all_findings
+                    self.finding_index[tf] for tf in theme.key_findings
+                    if tf in self.finding_index
                 ]
 
                 if not theme_finding_indices:
                     continue
 
-                similarities = [
-                    self._cosine_similarity(finding_embedding, self.finding_embeddings[i])
-                    for i in theme_finding_indices
-                ]
-                avg_similarity = sum(similarities) / len(similarities)
+                avg_similarity = float(finding_scores[theme_finding_indices].mean())
 
                 if avg_similarity > best_similarity:
                     best_similarity = avg_similarity
@@ -408,38 +419,22 @@ class IncrementalSynthesizer:
         top_k: int = 5
     ) -> List[tuple[str, float]]:
         """Find top K most similar existing findings as contradiction candidates."""
-        similarities = []
-
-        for idx, existing_finding in enumerate(self.all_findings):
-            existing_embedding = self.finding_embeddings[idx]
-            similarity = self._cosine_similarity(new_embedding, existing_embedding)
-            similarities.append((existing_finding, similarity))
-
-        # Sort by similarity and return top K
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        return similarities[:top_k]
+        return [
+            (self.all_findings[idx], similarity)
+            for idx, similarity in self.finding_matrix.top_k(new_embedding, top_k)
+        ]
 
     async def _is_contradiction(self, finding_a: str, finding_b: str) -> bool:
         """Use Reasoning NIM to determine if two findings contradict."""
-        prompt = f"""Analyze these two research findings and determine if they contradict each other.
-
-Finding A: {finding_a}
-
-Finding B: {finding_b}
-
-A contradiction exists when:
-1. Both findings address the same topic/phenomenon
-2. They make incompatible claims (one says X, the other says not-X)
-3. The incompatibility is not easily resolved by context or temporal differences
-
-Respond with ONLY "yes" or "no".
-"""
+        prompt = prompts.CONTRADICTION_CHECK.render(finding_a=finding_a, finding_b=finding_b)
 
         try:
             response = await self.reasoning_client.complete(
                 prompt,
                 max_tokens=10,
-                temperature=0.1
+                temperature=0.1,
+                cache=True,
+                template_version=self.CONTRADICTION_PROMPT_VERSION
             )
             return response.strip().lower() == "yes"
         except Exception as e:
@@ -454,18 +449,12 @@ Respond with ONLY "yes" or "no".
         paper_b: str
     ) -> str:
         """Generate explanation for why findings contradict."""
-        prompt = f"""Explain the contradiction between these research findings:
-
-Finding A (from {paper_a}): {finding_a}
-
-Finding B (from {paper_b}): {finding_b}
-
-Provide a concise 1-2 sentence explanation of the contradiction. Consider:
-- What specific claims conflict?
-- Are there temporal, methodological, or contextual differences?
-- What might explain the disagreement?
-
-Explanation:"""
+        prompt = prompts.CONTRADICTION_EXPLANATION.render(
+            finding_a=finding_a,
+            finding_b=finding_b,
+            paper_a=paper_a,
+            paper_b=paper_b
+        )
 
         try:
             response = await self.reasoning_client.complete(
@@ -483,12 +472,18 @@ Explanation:"""
         merged = []
         themes_to_remove = set()
 
+        if len(self.themes) < 2 or len(self.finding_matrix) == 0:
+            return merged
+
+        # All finding-vs-finding similarities in a single matrix product
+        finding_similarities = pairwise_scores(self.finding_matrix.matrix)
+
         # Compare all pairs of themes
-        for i, theme_a in enumerate(self.running_synthesis.themes):
+        for i, theme_a in enumerate(self.themes):
             if i in themes_to_remove:
                 continue
 
-            for j, theme_b in enumerate(self.running_synthesis.themes[i+1:], start=i+1):
+            for j, theme_b in enumerate(self.themes[i+1:], start=i+1):
                 if j in themes_to_remove:
                     continue
 
@@ -496,30 +491,22 @@ Explanation:"""
                 if not theme_a.key_findings or not theme_b.key_findings:
                     continue
 
-                # Get embeddings for both themes' findings
                 theme_a_indices = [
-                    self.all_findings.index(f) for f in theme_a.key_findings
-                    if f in self.all_findings
+                    self.finding_index[f] for f in theme_a.key_findings
+                    if f in self.finding_index
                 ]
                 theme_b_indices = [
-                    self.all_findings.index(f) for f in theme_b.key_findings
-                    if f in self.all_findings
+                    self.finding_index[f] for f in theme_b.key_findings
+                    if f in self.finding_index
                 ]
 
                 if not theme_a_indices or not theme_b_indices:
                     continue
 
                 # Calculate average cross-similarity
-                similarities = []
-                for a_idx in theme_a_indices:
-                    for b_idx in theme_b_indices:
-                        sim = self._cosine_similarity(
-                            self.finding_embeddings[a_idx],
-                            self.finding_embeddings[b_idx]
-                        )
-                        similarities.append(sim)
-
-                avg_similarity = sum(similarities) / len(similarities)
+                avg_similarity = float(
+                    finding_similarities[np.ix_(theme_a_indices, theme_b_indices)].mean()
+                )
 
                 # Merge if very similar
                 if avg_similarity >= 0.85:
@@ -595,20 +582,6 @@ Theme name:"""
 
         return gaps
 
-    @staticmethod
-    def _cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
-        """Calculate cosine similarity between two vectors."""
-        import math
-
-        dot_product = sum(a * b for a, b in zip(vec_a, vec_b))
-        magnitude_a = math.sqrt(sum(a * a for a in vec_a))
-        magnitude_b = math.sqrt(sum(b * b for b in vec_b))
-
-        if magnitude_a == 0 or magnitude_b == 0:
-            return 0.0
-
-        return dot_product / (magnitude_a * magnitude_b)
-
     def get_final_synthesis(self) -> Synthesis:
         """Get the final complete synthesis."""
         # Generate key insights from all themes and findings
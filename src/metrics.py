@@ -8,6 +8,8 @@ import time
 import logging
 from datetime import datetime
 
+from resource_ledger import record_cache_lookup
+
 logger = logging.getLogger(__name__)
 
 # Try to import Prometheus client
@@ -85,6 +87,17 @@ class MetricsCollector:
             ['cache_type']
         )
         
+        self.cache_evictions = Counter(
+            'research_ops_cache_evictions_total',
+            'Total cache evictions',
+            ['cache_type']
+        )
+        
+        self.completion_tokens_saved = Counter(
+            'research_ops_completion_tokens_saved_total',
+            'Generated tokens avoided by reasoning completion cache hits'
+        )
+        
         # Quality metrics
         self.quality_scores = Histogram(
             'research_ops_quality_scores',
@@ -98,6 +111,114 @@ class MetricsCollector:
             'Number of currently active requests'
         )
         
+        # Embedding micro-batching
+        self.embedding_batch_size = Histogram(
+            'research_ops_embedding_batch_size',
+            'Texts per coalesced embedding NIM call',
+            buckets=[1, 2, 4, 8, 16, 32, 64, 128]
+        )
+        
+        self.embedding_batch_linger = Histogram(
+            'research_ops_embedding_batch_linger_seconds',
+            'Time the first text in a coalesced batch waited before dispatch',
+            buckets=[0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1]
+        )
+        
+        # NIM connection pool gauges
+        self.nim_pool_connections = Gauge(
+            'research_ops_nim_pool_connections',
+            'Connections held by the shared NIM client pools',
+            ['nim_type', 'state']  # reasoning/embedding, open/idle
+        )
+        
+        # Per-request resource usage (from the request's resource ledger)
+        self.request_resource_usage = Histogram(
+            'research_ops_request_resource_usage',
+            'Resources consumed by a single research request',
+            ['resource'],
+            buckets=[0, 1, 10, 100, 1000, 10000, 100000, 1000000, 10000000]
+        )
+        
+        # Streaming completions
+        self.nim_time_to_first_token = Histogram(
+            'research_ops_nim_time_to_first_token_seconds',
+            'Time from request to first streamed token',
+            ['nim_type'],
+            buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0]
+        )
+        
+        self.nim_stream_tokens_after_close = Histogram(
+            'research_ops_nim_stream_tokens_after_close',
+            'max_tokens budget left unused when a stream was closed early',
+            ['nim_type'],
+            buckets=[0, 16, 64, 128, 256, 512, 1024, 2048]
+        )
+        
+        # Deadline-aware retries
+        self.nim_retries = Counter(
+            'research_ops_nim_retries_total',
+            'NIM call retries attempted',
+            ['nim_type']
+        )
+        
+        self.retry_budget_exhausted = Counter(
+            'research_ops_retry_budget_exhausted_total',
+            'Retries skipped because the request deadline could not cover them',
+            ['nim_type']
+        )
+        
+        # Adaptive NIM concurrency limiter
+        self.nim_concurrency_limit = Gauge(
+            'research_ops_nim_concurrency_limit',
+            'Current adaptive concurrency limit for NIM calls',
+            ['nim_type']
+        )
+        
+        self.nim_in_flight = Gauge(
+            'research_ops_nim_in_flight',
+            'NIM calls currently admitted by the concurrency limiter',
+            ['nim_type']
+        )
+        
+        self.nim_queue_wait = Histogram(
+            'research_ops_nim_queue_wait_seconds',
+            'Time NIM calls waited for a concurrency slot',
+            ['nim_type'],
+            buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0]
+        )
+        
+        self.source_request_duration = Histogram(
+            'research_ops_source_request_duration_seconds',
+            'External paper source request latency',
+            ['host', 'status'],
+            buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0]
+        )
+        
+        self.source_throttled = Counter(
+            'research_ops_source_throttled_total',
+            'Paper source requests delayed by rate limiting',
+            ['host', 'reason']
+        )
+        
+        self.source_queue_wait = Histogram(
+            'research_ops_source_queue_wait_seconds',
+            'Time paper source requests waited for the host rate limiter',
+            ['host'],
+            buckets=[0.001, 0.01, 0.1, 0.5, 1.0, 3.0, 10.0, 30.0]
+        )
+        
+        self.analysis_store_lookups = Counter(
+            'research_ops_analysis_store_lookups_total',
+            'Per-paper analysis store lookups by result',
+            ['result']  # warm, cold, miss
+        )
+        
+        self.analysis_store_hit_rate = Histogram(
+            'research_ops_analysis_store_hit_rate',
+            'Share of a request\'s papers served from the analysis store',
+            buckets=[0.0, 0.1, 0.25, 0.5, 0.75, 0.9, 1.0]
+        )
+        
         logger.info("Metrics collector initialized")
     
     def record_request(self, status: str, duration: float):
@@ -147,19 +268,35 @@ class MetricsCollector:
         ).observe(duration)
     
     def record_cache_hit(self, cache_type: str):
-        """Record cache hit"""
+        """Record cache hit (also counted in the current request's resource ledger)"""
+        record_cache_lookup(cache_type, hit=True)
         if not self.metrics_enabled:
             return
         
         self.cache_hits.labels(cache_type=cache_type).inc()
     
     def record_cache_miss(self, cache_type: str):
-        """Record cache miss"""
+        """Record cache miss (also counted in the current request's resource ledger)"""
+        record_cache_lookup(cache_type, hit=False)
         if not self.metrics_enabled:
             return
         
         self.cache_misses.labels(cache_type=cache_type).inc()
     
+    def record_cache_eviction(self, cache_type: str, count: int = 1):
+        """Record cache evictions"""
+        if not self.metrics_enabled:
+            return
+        
+        self.cache_evictions.labels(cache_type=cache_type).inc(count)
+    
+    def record_completion_tokens_saved(self, tokens: int):
+        """Record generated tokens avoided by a completion cache hit"""
+        if not self.metrics_enabled:
+            return
+        
+        self.completion_tokens_saved.inc(tokens)
+    
     def record_quality_score(self, score: float):
         """Record paper quality score"""
         if not self.metrics_enabled:
@@ -181,6 +318,106 @@ class MetricsCollector:
         
         self.active_requests.dec()
     
+    def record_embedding_batch(self, batch_size: int, linger_seconds: float):
+        """Record size and linger time of a coalesced embedding batch"""
+        if not self.metrics_enabled:
+            return
+        
+        self.embedding_batch_size.observe(batch_size)
+        self.embedding_batch_linger.observe(linger_seconds)
+    
+    def record_connection_pool(self, nim_type: str, open_connections: int, idle_connections: int):
+        """Record open/idle connection counts for a NIM client pool"""
+        if not self.metrics_enabled:
+            return
+        
+        self.nim_pool_connections.labels(nim_type=nim_type, state="open").set(open_connections)
+        self.nim_pool_connections.labels(nim_type=nim_type, state="idle").set(idle_connections)
+    
+    def record_request_resources(self, totals: Dict[str, int]):
+        """Record one request's resource totals (see ResourceLedger.totals)"""
+        if not self.metrics_enabled:
+            return
+        
+        for resource, value in totals.items():
+            self.request_resource_usage.labels(resource=resource).observe(value)
+    
+    def record_time_to_first_token(self, nim_type: str, seconds: float):
+        """Record time to first streamed token"""
+        if not self.metrics_enabled:
+            return
+        
+        self.nim_time_to_first_token.labels(nim_type=nim_type).observe(seconds)
+    
+    def record_stream_early_stop(self, nim_type: str, tokens_after_close: int):
+        """Record generation budget left unused by closing a stream early"""
+        if not self.metrics_enabled:
+            return
+        
+        self.nim_stream_tokens_after_close.labels(nim_type=nim_type).observe(tokens_after_close)
+    
+    def record_retry_attempt(self, nim_type: str):
+        """Record a NIM call retry"""
+        if not self.metrics_enabled:
+            return
+        
+        self.nim_retries.labels(nim_type=nim_type).inc()
+    
+    def record_retry_budget_exhausted(self, nim_type: str):
+        """Record a retry skipped for lack of deadline budget"""
+        if not self.metrics_enabled:
+            return
+        
+        self.retry_budget_exhausted.labels(nim_type=nim_type).inc()
+    
+    def record_concurrency_limit(self, nim_type: str, limit: int, in_flight: int):
+        """Record adaptive concurrency limit and admitted calls"""
+        if not self.metrics_enabled:
+            return
+        
+        self.nim_concurrency_limit.labels(nim_type=nim_type).set(limit)
+        self.nim_in_flight.labels(nim_type=nim_type).set(in_flight)
+    
+    def record_concurrency_wait(self, nim_type: str, wait_seconds: float):
+        """Record time a call waited for a concurrency slot"""
+        if not self.metrics_enabled:
+            return
+        
+        self.nim_queue_wait.labels(nim_type=nim_type).observe(wait_seconds)
+    
+    def record_source_request(self, host: str, status: int, latency: float):
+        """Record an external paper source request"""
+        if not self.metrics_enabled:
+            return
+        
+        self.source_request_duration.labels(host=host, status=str(status)).observe(latency)
+    
+    def record_source_throttled(self, host: str, reason: str):
+        """Record a source request delayed by its host rate limit or a 429"""
+        if not self.metrics_enabled:
+            return
+        
+        self.source_throttled.labels(host=host, reason=reason).inc()
+    
+    def record_source_queue_wait(self, host: str, wait_seconds: float):
+        """Record time a source request waited for its host limiter"""
+        if not self.metrics_enabled:
+            return
+        
+        self.source_queue_wait.labels(host=host).observe(wait_seconds)
+    
+    def record_analysis_store_lookups(self, warm_hits: int, cold_hits: int, misses: int):
+        """Record one request's analysis store lookups and its hit rate"""
+        if not self.metrics_enabled:
+            return
+        
+        for result, count in (("warm", warm_hits), ("cold", cold_hits), ("miss", misses)):
+            if count:
+                self.analysis_store_lookups.labels(result=result).inc(count)
+        total = warm_hits + cold_hits + misses
+        if total:
+            self.analysis_store_hit_rate.observe((warm_hits + cold_hits) / total)
+    
     def get_metrics(self) -> str:
         """Get Prometheus metrics in text format"""
         if not self.metrics_enabled:
@@ -4,22 +4,39 @@ Handles API calls to Reasoning NIM and Embedding NIM
 """
 
 import os
+import json
 import aiohttp
 import asyncio
-from typing import List, Dict, Any, Optional
+import itertools
+from typing import List, Dict, Any, Optional, Tuple, Callable, Awaitable, Union
 import logging
 from tenacity import (
     retry,
-    stop_after_attempt,
-    wait_exponential,
     retry_if_exception_type,
     before_sleep_log
 )
 import time
+from concurrency import LimiterSlot, get_reasoning_limiter
+from resource_ledger import record_reasoning_call, record_embedding_call, track_resources
+from deadline import DeadlineRetryPolicy, parse_retry_after
+from exceptions import NIMOverloadedError
+from prompts import EXTRACTION_INSTRUCTIONS, structured_extraction
 from constants import (
     NIM_CONNECT_TIMEOUT_SECONDS,
     NIM_SOCK_READ_TIMEOUT_SECONDS,
-    DEFAULT_TIMEOUT_SECONDS
+    DEFAULT_TIMEOUT_SECONDS,
+    NIM_POOL_MAX_CONNECTIONS,
+    NIM_POOL_MAX_CONNECTIONS_PER_HOST,
+    NIM_POOL_DNS_CACHE_TTL_SECONDS,
+    NIM_POOL_KEEPALIVE_TIMEOUT_SECONDS,
+    EMBEDDING_BATCH_LINGER_MS,
+    EMBEDDING_MAX_BATCH_SIZE,
+    EMBEDDING_BATCH_TOKEN_BUDGET,
+    EMBEDDING_MAX_INPUT_TOKENS,
+    EMBEDDING_MAX_IN_FLIGHT,
+    COMPLETION_CACHE_MAX_TEMPERATURE,
+    REASONING_EXPECTED_LATENCY_SECONDS,
+    EMBEDDING_EXPECTED_LATENCY_SECONDS
 )
 
 logging.basicConfig(level=logging.INFO)
@@ -45,31 +62,179 @@ except ImportError:
     METRICS_AVAILABLE = False
 
 try:
-    from cache import get_cache, EmbeddingCache
+    from cache import (
+        get_cache,
+        EmbeddingCache,
+        get_embedding_vector_cache,
+        get_completion_cache
+    )
     CACHE_AVAILABLE = True
 except ImportError:
     CACHE_AVAILABLE = False
 
 
+# Statuses a NIM returns when it is saturated; these are retried
+NIM_OVERLOAD_STATUSES = (429, 503)
+
+RETRYABLE_NIM_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, NIMOverloadedError)
+
+# Retries stop early when the request deadline cannot cover another attempt
+REASONING_RETRY_POLICY = DeadlineRetryPolicy(
+    "reasoning",
+    expected_latency=REASONING_EXPECTED_LATENCY_SECONDS,
+    metrics_getter=get_metrics_collector if METRICS_AVAILABLE else None
+)
+EMBEDDING_RETRY_POLICY = DeadlineRetryPolicy(
+    "embedding",
+    expected_latency=EMBEDDING_EXPECTED_LATENCY_SECONDS,
+    metrics_getter=get_metrics_collector if METRICS_AVAILABLE else None
+)
+
+
+def overload_error(service: str, response: aiohttp.ClientResponse, error_text: str) -> NIMOverloadedError:
+    """Build a retryable error from a 429/503 response, keeping its Retry-After"""
+    return NIMOverloadedError(
+        f"{service.capitalize()} NIM overloaded (status {response.status}): {error_text[:200]}",
+        service=service,
+        status=response.status,
+        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+    )
+
+def create_nim_connector() -> aiohttp.TCPConnector:
+    """
+    Create a TCP connector tuned for long-lived NIM traffic
+
+    Keeps connections alive between calls, caches DNS lookups and caps
+    connections per host so one busy NIM cannot starve the other.
+    """
+    return aiohttp.TCPConnector(
+        limit=int(os.getenv("NIM_POOL_MAX_CONNECTIONS", NIM_POOL_MAX_CONNECTIONS)),
+        limit_per_host=int(os.getenv(
+            "NIM_POOL_MAX_CONNECTIONS_PER_HOST", NIM_POOL_MAX_CONNECTIONS_PER_HOST
+        )),
+        ttl_dns_cache=int(os.getenv(
+            "NIM_POOL_DNS_CACHE_TTL_SECONDS", NIM_POOL_DNS_CACHE_TTL_SECONDS
+        )),
+        use_dns_cache=True,
+        keepalive_timeout=float(os.getenv(
+            "NIM_POOL_KEEPALIVE_TIMEOUT_SECONDS", NIM_POOL_KEEPALIVE_TIMEOUT_SECONDS
+        ))
+    )
+
+
+def get_connector_stats(session: Optional[aiohttp.ClientSession]) -> Dict[str, int]:
+    """
+    Report open and idle connection counts for a client session
+
+    Args:
+        session: Session whose connector should be inspected
+
+    Returns:
+        Dictionary with "open" and "idle" connection counts
+    """
+    if session is None or session.closed or session.connector is None:
+        return {"open": 0, "idle": 0}
+
+    connector = session.connector
+    try:
+        idle = sum(len(conns) for conns in connector._conns.values())
+        in_use = len(connector._acquired)
+    except AttributeError:
+        # Connector internals differ between aiohttp versions
+        return {"open": 0, "idle": 0}
+
+    return {"open": idle + in_use, "idle": idle}
+
+
+class JSONObjectScanner:
+    """
+    Incremental scanner that finds where the first top-level JSON object ends
+
+    Feed it text as it streams in; tracks brace depth outside of strings
+    (honoring escapes) so a stream can be closed once the object balances.
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.started = False
+        self.complete = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, chunk: str) -> Optional[int]:
+        """
+        Consume a chunk of text
+
+        Args:
+            chunk: Next piece of streamed text
+
+        Returns:
+            Number of characters of this chunk that belong to the text up to
+            and including the closing brace, or None while the object is open
+        """
+        if self.complete:
+            return 0
+        self.buffer += chunk
+
+        for i, char in enumerate(chunk):
+            if not self.started:
+                if char == "{":
+                    self.started = True
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char == "{":
+                self._depth += 1
+            elif char == "}":
+                self._depth -= 1
+                if self._depth == 0:
+                    self.complete = True
+                    self.buffer = self.buffer[:len(self.buffer) - len(chunk) + i + 1]
+                    return i + 1
+
+        return None
+
+
 class ReasoningNIMClient:
     """
     Client for llama-3.1-nemotron-nano-8B-v1 Reasoning NIM
     Handles text generation and reasoning tasks
     """
 
+    MODEL = "nvidia/llama-3.1-nemotron-nano-8b-v1"
+
+    JSON_HEADERS = {"Content-Type": "application/json"}
+
     DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
         total=DEFAULT_TIMEOUT_SECONDS,         # Total timeout for entire request
         connect=NIM_CONNECT_TIMEOUT_SECONDS,   # Timeout for connection establishment
         sock_read=NIM_SOCK_READ_TIMEOUT_SECONDS  # Timeout for reading response (now 60s)
     )
 
-    def __init__(self, base_url: str = None, timeout: Optional[aiohttp.ClientTimeout] = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         self.base_url = base_url or os.getenv(
             "REASONING_NIM_URL",
             "http://reasoning-nim.research-ops.svc.cluster.local:8000"
         )
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self.session: Optional[aiohttp.ClientSession] = None
+        # A session passed in is shared and owned by the caller (see NIMClientPool)
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         
         # Initialize circuit breaker
         if CIRCUIT_BREAKER_AVAILABLE:
@@ -92,15 +257,35 @@ class ReasoningNIMClient:
         else:
             self.metrics = None
 
+        # Stream structured extraction and stop once the JSON object closes
+        self.stream_structured = os.getenv("REASONING_STREAM_STRUCTURED", "true").lower() == "true"
+
+        # Process-wide adaptive limiter shared by every reasoning client
+        self.limiter = get_reasoning_limiter()
+
+        # Opt-in completion cache for deterministic, low-temperature prompts
+        self.completion_cache = None
+        if CACHE_AVAILABLE and os.getenv("ENABLE_COMPLETION_CACHE", "true").lower() == "true":
+            try:
+                self.completion_cache = get_completion_cache()
+            except Exception as e:
+                logger.warning(f"Completion cache initialization failed: {e}")
+        self.completion_cache_max_temperature = float(os.getenv(
+            "COMPLETION_CACHE_MAX_TEMPERATURE", COMPLETION_CACHE_MAX_TEMPERATURE
+        ))
+
     async def __aenter__(self):
         """Async context manager entry - create session if needed"""
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        if self._owns_session and (self.session is None or self.session.closed):
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=create_nim_connector()
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit - close session"""
-        if self.session and not self.session.closed:
+        """Async context manager exit - close session unless it is shared"""
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
             # Wait for underlying connections to close
             await asyncio.sleep(0.250)
@@ -111,7 +296,8 @@ class ReasoningNIMClient:
         max_tokens: int = 2048,
         temperature: float = 0.7,
         top_p: float = 0.9,
-        stream: bool = False
+        stream: bool = False,
+        stop_at_json: bool = False
     ) -> str:
         """Internal implementation with retry logic"""
         if not self.session or self.session.closed:
@@ -120,7 +306,7 @@ class ReasoningNIMClient:
         url = f"{self.base_url}/v1/completions"
 
         payload = {
-            "model": "nvidia/llama-3.1-nemotron-nano-8b-v1",
+            "model": self.MODEL,
             "prompt": prompt,
             "max_tokens": max_tokens,
             "temperature": temperature,
@@ -128,30 +314,124 @@ class ReasoningNIMClient:
             "stream": stream
         }
 
-        async with self.session.post(url, json=payload) as response:
-            # Validate response status
-            if response.status != 200:
-                error_text = await response.text()
-                raise ValueError(
-                    f"Reasoning NIM returned status {response.status}: {error_text}"
-                )
-            
-            result = await response.json()
+        body = json.dumps(payload).encode("utf-8")
 
-            # Validate response structure
-            if "choices" not in result or not result["choices"]:
-                raise ValueError(f"Invalid NIM response structure: {result}")
+        async with self.limiter.slot(key=(max_tokens, stream)) as slot:
+            async with self.session.post(url, data=body, headers=self.JSON_HEADERS) as response:
+                # Validate response status
+                if response.status != 200:
+                    error_text = await response.text()
+                    if response.status in NIM_OVERLOAD_STATUSES:
+                        slot.mark_overloaded()
+                        raise overload_error("reasoning", response, error_text)
+                    raise ValueError(
+                        f"Reasoning NIM returned status {response.status}: {error_text}"
+                    )
 
-            # Extract completion text
-            completion = result["choices"][0]["text"]
+                # Servers that ignore "stream" answer with a plain JSON body
+                if stream and response.content_type == "text/event-stream":
+                    return await self._read_stream(
+                        response, prompt, max_tokens, stop_at_json, len(body), slot
+                    )
+                
+                raw = await response.read()
+                result = json.loads(raw)
+                slot.set_output_tokens(completion_tokens(result, "text"))
+
+        # Validate response structure
+        if "choices" not in result or not result["choices"]:
+            raise ValueError(f"Invalid NIM response structure: {result}")
+
+        # Extract completion text
+        completion = result["choices"][0]["text"]
+
+        usage = result.get("usage") or {}
+        record_reasoning_call(
+            prompt_tokens=usage.get("prompt_tokens", estimate_tokens(prompt)),
+            completion_tokens=usage.get("completion_tokens", estimate_tokens(completion)),
+            request_bytes=len(body),
+            response_bytes=len(raw)
+        )
 
-            logger.info(f"Reasoning completion: {len(completion)} chars (prompt: {len(prompt)} chars)")
-            return completion
+        logger.info(f"Reasoning completion: {len(completion)} chars (prompt: {len(prompt)} chars)")
+        return completion
+
+    async def _read_stream(
+        self,
+        response: aiohttp.ClientResponse,
+        prompt: str,
+        max_tokens: int,
+        stop_at_json: bool,
+        request_bytes: int = 0,
+        slot: Optional[LimiterSlot] = None
+    ) -> str:
+        """
+        Read an SSE completion stream, optionally stopping at the first JSON object
+
+        Each "data:" event carries one chunk of generated text. With
+        stop_at_json the connection is closed as soon as the first top-level
+        object balances, so the NIM stops generating trailing text. The
+        first token is reported to the limiter slot, if given.
+        """
+        start = time.time()
+        scanner = JSONObjectScanner() if stop_at_json else None
+        chunks: List[str] = []
+        events = 0
+        received_bytes = 0
+        first_token_recorded = False
+
+        def record_call(text: str):
+            record_reasoning_call(
+                prompt_tokens=estimate_tokens(prompt),
+                completion_tokens=events,
+                request_bytes=request_bytes,
+                response_bytes=received_bytes
+            )
+            return text
+
+        async for raw_line in response.content:
+            received_bytes += len(raw_line)
+            line = raw_line.decode("utf-8").strip()
+            if not line.startswith("data:"):
+                continue
+            data = line[len("data:"):].strip()
+            if data == "[DONE]":
+                break
+
+            try:
+                event = json.loads(data)
+                text = event["choices"][0].get("text", "")
+            except (ValueError, KeyError, IndexError) as e:
+                raise ValueError(f"Invalid NIM stream event: {data[:200]}") from e
+
+            events += 1
+            if text and not first_token_recorded:
+                first_token_recorded = True
+                if slot is not None:
+                    slot.mark_first_token()
+                if self.metrics:
+                    self.metrics.record_time_to_first_token("reasoning", time.time() - start)
+
+            if scanner is None:
+                chunks.append(text)
+                continue
+
+            end = scanner.feed(text)
+            if end is not None:
+                # Object closed: drop the rest of the generation
+                response.close()
+                unused = max(0, max_tokens - events)
+                if self.metrics:
+                    self.metrics.record_stream_early_stop("reasoning", unused)
+                logger.info(f"Closed completion stream after JSON object ({unused} tokens of budget unused)")
+                return record_call(scanner.buffer)
+
+        return record_call(scanner.buffer if scanner is not None else "".join(chunks))
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        stop=REASONING_RETRY_POLICY.stop,
+        wait=REASONING_RETRY_POLICY.wait,
+        retry=retry_if_exception_type(RETRYABLE_NIM_ERRORS),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     async def complete(
@@ -160,7 +440,11 @@ class ReasoningNIMClient:
         max_tokens: int = 2048,
         temperature: float = 0.7,
         top_p: float = 0.9,
-        stream: bool = False
+        stream: bool = False,
+        cache: bool = False,
+        template_version: Optional[str] = None,
+        stop_at_json: bool = False,
+        validate: Optional[Callable[[str], bool]] = None
     ) -> str:
         """
         Generate completion using reasoning model with automatic retry and circuit breaker
@@ -171,6 +455,13 @@ class ReasoningNIMClient:
             temperature: Sampling temperature (0.0-1.0)
             top_p: Nucleus sampling parameter
             stream: Whether to stream response
+            cache: Serve/store the completion from the completion cache
+                (ignored above COMPLETION_CACHE_MAX_TEMPERATURE)
+            template_version: Prompt template version, part of the cache key
+            stop_at_json: When streaming, stop once the first JSON object closes
+                and return the text up to its closing brace
+            validate: With cache, only completions for which this returns True
+                are stored (e.g. replies that parse), so a bad reply is not replayed
 
         Returns:
             Generated text completion
@@ -181,6 +472,57 @@ class ReasoningNIMClient:
             ValueError: Invalid response structure (will not retry)
             CircuitBreakerOpenError: If circuit breaker is open
         """
+        completion_cache = None
+        if (
+            cache
+            and self.completion_cache is not None
+            and temperature <= self.completion_cache_max_temperature
+        ):
+            completion_cache = self.completion_cache
+
+        if completion_cache is None:
+            return await self._complete_guarded(
+                prompt, max_tokens, temperature, top_p, stream, stop_at_json
+            )
+
+        cache_args = (self.MODEL, prompt, max_tokens, temperature, top_p)
+        if stop_at_json:
+            # Truncated text differs from a full completion of the same prompt
+            template_version = f"{template_version}:json" if template_version else "json"
+        cached = completion_cache.get_completion(*cache_args, template_version=template_version)
+        if cached is not None:
+            if self.metrics:
+                self.metrics.record_cache_hit("completion")
+                self.metrics.record_completion_tokens_saved(cached.get("completion_tokens", 0))
+            return cached["text"]
+
+        if self.metrics:
+            self.metrics.record_cache_miss("completion")
+
+        completion = await self._complete_guarded(
+            prompt, max_tokens, temperature, top_p, stream, stop_at_json
+        )
+        if validate is not None and not validate(completion):
+            logger.info("Completion failed validation, not caching it")
+            return completion
+        completion_cache.set_completion(
+            *cache_args,
+            text=completion,
+            completion_tokens=estimate_tokens(completion),
+            template_version=template_version
+        )
+        return completion
+
+    async def _complete_guarded(
+        self,
+        prompt: str,
+        max_tokens: int,
+        temperature: float,
+        top_p: float,
+        stream: bool,
+        stop_at_json: bool = False
+    ) -> str:
+        """Run a completion through the circuit breaker (when available)"""
         # Use circuit breaker if available
         if self.circuit_breaker:
             try:
@@ -190,7 +532,8 @@ class ReasoningNIMClient:
                     max_tokens=max_tokens,
                     temperature=temperature,
                     top_p=top_p,
-                    stream=stream
+                    stream=stream,
+                    stop_at_json=stop_at_json
                 )
             except CircuitBreakerOpenError:
                 logger.error(f"Circuit breaker OPEN for reasoning NIM - service unavailable")
@@ -199,7 +542,7 @@ class ReasoningNIMClient:
             # Fallback without circuit breaker
             try:
                 return await self._complete_impl(
-                    prompt, max_tokens, temperature, top_p, stream
+                    prompt, max_tokens, temperature, top_p, stream, stop_at_json
                 )
             except aiohttp.ClientError as e:
                 logger.error(f"Reasoning NIM network error: {e}")
@@ -215,9 +558,9 @@ class ReasoningNIMClient:
                 raise
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        stop=REASONING_RETRY_POLICY.stop,
+        wait=REASONING_RETRY_POLICY.wait,
+        retry=retry_if_exception_type(RETRYABLE_NIM_ERRORS),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     async def chat(
@@ -243,30 +586,48 @@ class ReasoningNIMClient:
         url = f"{self.base_url}/v1/chat/completions"
 
         payload = {
-            "model": "nvidia/llama-3.1-nemotron-nano-8b-v1",
+            "model": self.MODEL,
             "messages": messages,
             "max_tokens": max_tokens,
             "temperature": temperature,
         }
 
         try:
-            async with self.session.post(url, json=payload) as response:
-                if response.status != 200:
-                    error_text = await response.text()
-                    raise ValueError(
-                        f"Reasoning NIM chat returned status {response.status}: {error_text}"
-                    )
-                
-                result = await response.json()
-
-                if "choices" not in result or not result["choices"]:
-                    raise ValueError(f"Invalid NIM chat response structure: {result}")
+            body = json.dumps(payload).encode("utf-8")
+            async with self.limiter.slot(key=("chat", max_tokens)) as slot:
+                async with self.session.post(url, data=body, headers=self.JSON_HEADERS) as response:
+                    if response.status != 200:
+                        error_text = await response.text()
+                        if response.status in NIM_OVERLOAD_STATUSES:
+                            slot.mark_overloaded()
+                            raise overload_error("reasoning", response, error_text)
+                        raise ValueError(
+                            f"Reasoning NIM chat returned status {response.status}: {error_text}"
+                        )
+                    
+                    raw = await response.read()
+                    result = json.loads(raw)
+                    slot.set_output_tokens(completion_tokens(result, "message"))
 
-                # Extract message content
-                content = result["choices"][0]["message"]["content"]
+            if "choices" not in result or not result["choices"]:
+                raise ValueError(f"Invalid NIM chat response structure: {result}")
+
+            # Extract message content
+            content = result["choices"][0]["message"]["content"]
+
+            usage = result.get("usage") or {}
+            record_reasoning_call(
+                prompt_tokens=usage.get(
+                    "prompt_tokens",
+                    sum(estimate_tokens(m.get("content", "")) for m in messages)
+                ),
+                completion_tokens=usage.get("completion_tokens", estimate_tokens(content)),
+                request_bytes=len(body),
+                response_bytes=len(raw)
+            )
 
-                logger.info(f"Chat response: {len(content)} chars")
-                return content
+            logger.info(f"Chat response: {len(content)} chars")
+            return content
 
         except aiohttp.ClientError as e:
             logger.error(f"Reasoning NIM chat network error: {e}")
@@ -284,38 +645,43 @@ class ReasoningNIMClient:
     async def extract_structured(
         self,
         text: str,
-        schema: Dict[str, Any]
+        schema: Union[Dict[str, Any], str],
+        cache: bool = False,
+        template_version: Optional[str] = None,
+        instructions: str = EXTRACTION_INSTRUCTIONS
     ) -> Dict[str, Any]:
         """
         Extract structured information using reasoning model
 
+        The prompt is the schema's registry template (instructions and schema
+        first, text last), so calls with the same schema share a prefix.
+
         Args:
             text: Input text to analyze
-            schema: Expected output structure
+            schema: Expected output structure, or an example object as text
+            cache: Reuse cached completions for identical text and schema
+            template_version: Version of the caller's prompt template
+                (defaults to the extraction template's version)
+            instructions: Task instructions placed before the schema
 
         Returns:
             Extracted structured data
         """
-        prompt = f"""
-Extract the following information from the text and return as JSON.
-
-Schema:
-{schema}
-
-Text:
-{text}
-
-JSON Output:
-"""
+        template = structured_extraction(schema, instructions)
+        prompt = template.render(text=text)
 
         response = await self.complete(
             prompt=prompt,
             temperature=0.3,  # Lower for more deterministic extraction
-            max_tokens=1024
+            max_tokens=1024,
+            stream=self.stream_structured,
+            stop_at_json=self.stream_structured,
+            cache=cache,
+            template_version=template_version or template.version,
+            validate=lambda reply: decode_first_json_object(reply) is not None
         )
 
         # Parse JSON from response - extract first complete JSON object only
-        import json
         try:
             # Find start of JSON
             start_idx = response.find('{')
@@ -337,26 +703,307 @@ JSON Output:
             return {}
 
 
+def decode_first_json_object(text: str) -> Optional[Any]:
+    """First complete JSON value starting at the first "{", or None if it does not parse"""
+    start_idx = text.find('{')
+    if start_idx == -1:
+        return None
+    try:
+        return json.JSONDecoder().raw_decode(text, start_idx)[0]
+    except ValueError:
+        return None
+
+
+def parse_json_objects(text: str) -> List[Dict[str, Any]]:
+    """
+    Decode the JSON objects of a (possibly malformed) JSON array response
+
+    Elements are decoded one at a time, so a truncated or invalid element
+    only loses that element; decoding resumes at the next "{" (which may be
+    an object nested in the broken element, so callers validate elements).
+
+    Returns:
+        Successfully decoded top-level objects, in order
+    """
+    decoder = json.JSONDecoder()
+    start = text.find('[')
+    pos = start + 1 if start != -1 else 0
+    objects = []
+    while True:
+        pos = text.find('{', pos)
+        if pos == -1:
+            return objects
+        try:
+            obj, pos = decoder.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            pos += 1
+            continue
+        if isinstance(obj, dict):
+            objects.append(obj)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate for English text (~4 characters per token)"""
+    return max(1, (len(text) + 3) // 4)
+
+
+def completion_tokens(result: Dict[str, Any], field: str) -> int:
+    """Generated tokens of a completion response ("text") or chat response ("message")"""
+    usage = result.get("usage") or {}
+    if usage.get("completion_tokens") is not None:
+        return usage["completion_tokens"]
+    choice = (result.get("choices") or [{}])[0]
+    output = choice.get(field) or ""
+    return estimate_tokens(output.get("content") or "" if isinstance(output, dict) else output)
+
+
+def pack_by_token_budget(
+    texts: List[str],
+    token_budget: int = EMBEDDING_BATCH_TOKEN_BUDGET,
+    max_items: int = EMBEDDING_MAX_BATCH_SIZE
+) -> List[List[int]]:
+    """
+    Pack texts into batches bounded by estimated tokens and item count
+
+    Texts are ordered by length before packing so similar lengths share a
+    batch (less padding on the NIM) and short texts fill batches completely.
+    Each text counts at most EMBEDDING_MAX_INPUT_TOKENS since the NIM
+    truncates longer inputs.
+
+    Args:
+        texts: Texts to pack
+        token_budget: Maximum estimated tokens per batch
+        max_items: Maximum texts per batch
+
+    Returns:
+        List of batches, each a list of indices into texts
+    """
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_tokens = 0
+    for idx in order:
+        tokens = min(estimate_tokens(texts[idx]), EMBEDDING_MAX_INPUT_TOKENS)
+        if current and (current_tokens + tokens > token_budget or len(current) >= max_items):
+            batches.append(current)
+            current, current_tokens = [], 0
+        current.append(idx)
+        current_tokens += tokens
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+# One text's share of a coalesced call: (batch id, tokens, request bytes, response bytes)
+_BatchShare = Tuple[int, float, float, float]
+
+
+class EmbeddingMicroBatcher:
+    """
+    Coalesces concurrent embedding requests into shared /v1/embeddings calls
+
+    Texts submitted within the linger window are grouped by input_type,
+    de-duplicated and packed into token-bounded batches that are sent
+    concurrently. Each caller awaits a future that receives its own vector.
+    A shared call's tokens and bytes are charged to each caller's resource
+    ledger in proportion to its texts' share of the batch.
+    """
+
+    def __init__(
+        self,
+        send_batch: Callable[[List[str], str], Awaitable[List[List[float]]]],
+        linger_ms: float = EMBEDDING_BATCH_LINGER_MS,
+        max_batch_size: int = EMBEDDING_MAX_BATCH_SIZE,
+        token_budget: int = EMBEDDING_BATCH_TOKEN_BUDGET,
+        metrics=None
+    ):
+        """
+        Initialize micro-batcher
+
+        Args:
+            send_batch: Coroutine that embeds a list of texts for one input_type
+            linger_ms: Milliseconds to wait for more texts before flushing
+            max_batch_size: Maximum texts per NIM call
+            token_budget: Maximum estimated tokens per NIM call
+            metrics: Optional metrics collector
+        """
+        self.send_batch = send_batch
+        self.linger_seconds = max(linger_ms, 0) / 1000.0
+        self.max_batch_size = max(int(max_batch_size), 1)
+        self.token_budget = max(int(token_budget), 1)
+        self.metrics = metrics
+
+        self._pending: Dict[str, List[Tuple[str, asyncio.Future]]] = {}
+        self._pending_tokens: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._timers: Dict[str, asyncio.TimerHandle] = {}
+        self._tasks: set = set()
+        self._batch_ids = itertools.count()
+
+    async def submit(self, text: str, input_type: str) -> List[float]:
+        """
+        Queue a text for embedding and wait for its vector
+
+        Args:
+            text: Text to embed
+            input_type: "query" or "passage"
+
+        Returns:
+            Embedding vector
+        """
+        vector, share = await self._enqueue(text, input_type)
+        self._charge([share])
+        return vector
+
+    async def submit_many(self, texts: List[str], input_type: str) -> List[List[float]]:
+        """Queue several texts and wait for all of their vectors (order preserved)"""
+        results = await asyncio.gather(*(self._enqueue(text, input_type) for text in texts))
+        self._charge([share for _, share in results])
+        return [vector for vector, _ in results]
+
+    @staticmethod
+    def _charge(shares: List["_BatchShare"]):
+        """Record the caller's share of each batch on its ledger (one call per batch)"""
+        by_batch: Dict[int, List[float]] = {}
+        for batch_id, tokens, request_bytes, response_bytes in shares:
+            totals = by_batch.setdefault(batch_id, [0.0, 0.0, 0.0])
+            totals[0] += tokens
+            totals[1] += request_bytes
+            totals[2] += response_bytes
+        for tokens, request_bytes, response_bytes in by_batch.values():
+            record_embedding_call(
+                tokens=round(tokens),
+                request_bytes=round(request_bytes),
+                response_bytes=round(response_bytes)
+            )
+
+    async def _enqueue(self, text: str, input_type: str) -> Tuple[List[float], "_BatchShare"]:
+        """Queue a text and wait for its vector and its share of the batch's cost"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        group = self._pending.setdefault(input_type, [])
+        if not group:
+            self._opened_at[input_type] = time.monotonic()
+            self._pending_tokens[input_type] = 0
+            self._timers[input_type] = loop.call_later(
+                self.linger_seconds, self._flush, input_type
+            )
+        group.append((text, future))
+        self._pending_tokens[input_type] += min(estimate_tokens(text), EMBEDDING_MAX_INPUT_TOKENS)
+
+        # Flush early once a full batch is waiting
+        if (len(group) >= self.max_batch_size
+                or self._pending_tokens[input_type] >= self.token_budget):
+            self._flush(input_type)
+
+        return await future
+
+    def _flush(self, input_type: str):
+        """Dispatch everything pending for input_type as packed, concurrent batches"""
+        timer = self._timers.pop(input_type, None)
+        if timer is not None:
+            timer.cancel()
+
+        items = self._pending.pop(input_type, [])
+        self._pending_tokens.pop(input_type, None)
+        if not items:
+            return
+        linger = time.monotonic() - self._opened_at.pop(input_type, time.monotonic())
+
+        # Identical texts (within or across callers) are embedded once
+        waiters: Dict[str, List[asyncio.Future]] = {}
+        for text, future in items:
+            waiters.setdefault(text, []).append(future)
+        texts = list(waiters)
+
+        for batch in pack_by_token_budget(texts, self.token_budget, self.max_batch_size):
+            chunk = [(texts[i], waiters[texts[i]]) for i in batch]
+            task = asyncio.ensure_future(self._dispatch(chunk, input_type, linger))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(
+        self,
+        chunk: List[Tuple[str, List[asyncio.Future]]],
+        input_type: str,
+        linger: float
+    ):
+        """Send one coalesced batch and fan vectors back out to waiting futures"""
+        texts = [text for text, _ in chunk]
+
+        if self.metrics:
+            self.metrics.record_embedding_batch(len(texts), linger)
+
+        try:
+            # This task runs in the context of whichever caller started the
+            # flush; capture the call's cost here and split it among callers
+            with track_resources() as batch_cost:
+                vectors = await self.send_batch(texts, input_type)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"Embedding NIM returned {len(vectors)} vectors for {len(texts)} inputs"
+                )
+        except Exception as e:
+            for _, futures in chunk:
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        batch_id = next(self._batch_ids)
+        weights = [min(estimate_tokens(text), EMBEDDING_MAX_INPUT_TOKENS) for text in texts]
+        total_weight = sum(weights)
+        for (_, futures), vector, weight in zip(chunk, vectors, weights):
+            # A text requested by several callers is split between them
+            fraction = weight / total_weight / len(futures)
+            share = (
+                batch_id,
+                batch_cost.embedding_tokens * fraction,
+                batch_cost.request_bytes * fraction,
+                batch_cost.response_bytes * fraction
+            )
+            for future in futures:
+                if not future.done():
+                    future.set_result((vector, share))
+
+    def get_pending_count(self) -> int:
+        """Get number of texts waiting to be flushed"""
+        return sum(len(group) for group in self._pending.values())
+
+
 class EmbeddingNIMClient:
     """
     Client for Retrieval Embedding NIM (nv-embedqa-e5-v5)
     Handles text embedding and similarity operations
     """
 
+    MODEL = "nvidia/nv-embedqa-e5-v5"
+
+    JSON_HEADERS = {"Content-Type": "application/json"}
+
     DEFAULT_TIMEOUT = aiohttp.ClientTimeout(
         total=DEFAULT_TIMEOUT_SECONDS,
         connect=NIM_CONNECT_TIMEOUT_SECONDS,
         sock_read=NIM_SOCK_READ_TIMEOUT_SECONDS
     )
 
-    def __init__(self, base_url: str = None, timeout: Optional[aiohttp.ClientTimeout] = None):
+    def __init__(
+        self,
+        base_url: str = None,
+        timeout: Optional[aiohttp.ClientTimeout] = None,
+        session: Optional[aiohttp.ClientSession] = None
+    ):
         self.base_url = base_url or os.getenv(
             "EMBEDDING_NIM_URL",
             "http://embedding-nim.research-ops.svc.cluster.local:8001"
         )
         self.timeout = timeout or self.DEFAULT_TIMEOUT
-        self.session: Optional[aiohttp.ClientSession] = None
-        self.embedding_cache: Dict[str, List[float]] = {}  # In-memory fallback
+        # A session passed in is shared and owned by the caller (see NIMClientPool)
+        self.session: Optional[aiohttp.ClientSession] = session
+        self._owns_session = session is None
         
         # Initialize metrics and cache
         if METRICS_AVAILABLE:
@@ -371,27 +1018,53 @@ class EmbeddingNIMClient:
         if CACHE_AVAILABLE:
             try:
                 cache = get_cache()
-                self.embedding_cache_obj = EmbeddingCache(cache)
+                # Only Redis is shared; the in-memory fallback would be an unbounded duplicate of the LRU
+                self.embedding_cache_obj = (
+                    EmbeddingCache(cache, model=self.MODEL) if cache.redis_client else None
+                )
             except Exception as e:
                 logger.warning(f"Cache initialization failed: {e}")
                 self.embedding_cache_obj = None
+            # Process-wide bounded float32 LRU (checked before the shared tier)
+            self.vector_cache = get_embedding_vector_cache()
         else:
             self.embedding_cache_obj = None
+            self.vector_cache = None
+
+        # Coalesce concurrent embed calls into shared NIM requests
+        if os.getenv("EMBEDDING_MICRO_BATCHING", "true").lower() == "true":
+            self.batcher: Optional[EmbeddingMicroBatcher] = EmbeddingMicroBatcher(
+                self._post_embeddings,
+                linger_ms=float(os.getenv("EMBEDDING_BATCH_LINGER_MS", EMBEDDING_BATCH_LINGER_MS)),
+                max_batch_size=int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", EMBEDDING_MAX_BATCH_SIZE)),
+                token_budget=int(os.getenv("EMBEDDING_BATCH_TOKEN_BUDGET", EMBEDDING_BATCH_TOKEN_BUDGET)),
+                metrics=self.metrics
+            )
+        else:
+            self.batcher = None
+
+        # Bounds concurrent /v1/embeddings calls from this client
+        self._in_flight = asyncio.Semaphore(
+            int(os.getenv("EMBEDDING_MAX_IN_FLIGHT", EMBEDDING_MAX_IN_FLIGHT))
+        )
 
     async def __aenter__(self):
-        if self.session is None or self.session.closed:
-            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        if self._owns_session and (self.session is None or self.session.closed):
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=create_nim_connector()
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session and not self.session.closed:
+        if self._owns_session and self.session and not self.session.closed:
             await self.session.close()
             await asyncio.sleep(0.250)
 
     @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        stop=EMBEDDING_RETRY_POLICY.stop,
+        wait=EMBEDDING_RETRY_POLICY.wait,
+        retry=retry_if_exception_type(RETRYABLE_NIM_ERRORS),
         before_sleep=before_sleep_log(logger, logging.WARNING)
     )
     async def embed(
@@ -411,90 +1084,126 @@ class EmbeddingNIMClient:
         Returns:
             Embedding vector (list of floats)
         """
-        # Check advanced cache first
+        if cache and self.vector_cache:
+            cached_embedding = self.vector_cache.get(text, self.MODEL, input_type)
+            if cached_embedding is not None:
+                logger.debug(f"Embedding cache hit: {text[:50]}...")
+                return cached_embedding
+
+        # Shared Redis tier (only when Redis is connected)
         if cache and self.embedding_cache_obj:
             cached_embedding = self.embedding_cache_obj.get_embedding(text, input_type)
             if cached_embedding is not None:
                 if self.metrics:
-                    self.metrics.record_cache_hit("embedding")
-                logger.debug(f"Embedding cache hit: {text[:50]}...")
+                    self.metrics.record_cache_hit("embedding_shared")
+                if self.vector_cache:
+                    self.vector_cache.set(text, self.MODEL, input_type, cached_embedding)
+                logger.debug(f"Shared embedding cache hit: {text[:50]}...")
                 return cached_embedding
-        
-        if self.metrics and cache:
-            self.metrics.record_cache_miss("embedding")
-        
-        # Fallback to in-memory cache
-        cache_key = f"{input_type}:{text[:100]}"
-        if cache and cache_key in self.embedding_cache:
-            logger.info("Using in-memory cached embedding")
-            return self.embedding_cache[cache_key]
 
+        try:
+            if self.batcher:
+                embedding = await self.batcher.submit(text, input_type)
+            else:
+                embedding = (await self._post_embeddings([text], input_type))[0]
+        except aiohttp.ClientError as e:
+            logger.error(f"Embedding NIM network error for {self.base_url}/v1/embeddings: {e}")
+            raise
+        except asyncio.TimeoutError as e:
+            logger.error(f"Embedding NIM timeout: {e}")
+            raise
+        except ValueError as e:
+            logger.error(f"Embedding NIM validation error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Embedding NIM unexpected error: {e}")
+            raise
+
+        # Cache if enabled (local LRU and shared tier)
+        if cache:
+            if self.vector_cache:
+                self.vector_cache.set(text, self.MODEL, input_type, embedding)
+            if self.embedding_cache_obj:
+                self.embedding_cache_obj.set_embedding(text, embedding, input_type)
+
+        logger.info(f"Generated embedding: dim={len(embedding)}")
+        return embedding
+
+    async def _post_embeddings(self, texts: List[str], input_type: str) -> List[List[float]]:
+        """
+        Send one /v1/embeddings request for a list of texts
+
+        Args:
+            texts: Texts to embed (already validated and truncated)
+            input_type: "query" or "passage"
+
+        Returns:
+            Embedding vectors in input order
+        """
         if not self.session or self.session.closed:
             raise RuntimeError("NIM client session not initialized. Use async context manager.")
-        
+
         url = f"{self.base_url}/v1/embeddings"
 
         payload = {
-            "model": "nvidia/nv-embedqa-e5-v5",
-            "input": text,
+            "model": self.MODEL,
+            "input": texts,
             "input_type": input_type,
-            "encoding_format": "float"
+            "encoding_format": "float",
+            "truncate": "END"  # Guard the 512-token per-input limit
         }
 
-        start_time = time.time()
-        try:
-            async with self.session.post(url, json=payload) as response:
-                duration = time.time() - start_time
-                
-                if response.status != 200:
-                    error_text = await response.text()
-                    if self.metrics:
-                        self.metrics.record_nim_request("embedding", "embed", "error", duration)
-                    raise ValueError(
-                        f"Embedding NIM returned status {response.status}: {error_text}"
-                    )
-                
-                result = await response.json()
+        async with self._in_flight:
+            return await self._send_embeddings_request(url, payload)
 
-                if "data" not in result or not result["data"]:
-                    if self.metrics:
-                        self.metrics.record_nim_request("embedding", "embed", "error", duration)
-                    raise ValueError(f"Invalid embedding NIM response structure: {result}")
+    async def _send_embeddings_request(self, url: str, payload: Dict[str, Any]) -> List[List[float]]:
+        """POST an embeddings payload and return vectors in input order"""
+        body = json.dumps(payload).encode("utf-8")
+        start_time = time.time()
+        async with self.session.post(url, data=body, headers=self.JSON_HEADERS) as response:
+            duration = time.time() - start_time
 
-                # Extract embedding vector
-                embedding = result["data"][0]["embedding"]
-                
+            if response.status != 200:
+                error_text = await response.text()
                 if self.metrics:
-                    self.metrics.record_nim_request("embedding", "embed", "success", duration)
+                    self.metrics.record_nim_request("embedding", "embed", "error", duration)
+                if response.status in NIM_OVERLOAD_STATUSES:
+                    raise overload_error("embedding", response, error_text)
+                raise ValueError(
+                    f"Embedding NIM returned status {response.status}: {error_text}"
+                )
 
-                # Cache if enabled (both advanced and in-memory)
-                if cache:
-                    if self.embedding_cache_obj:
-                        self.embedding_cache_obj.set_embedding(text, embedding, input_type)
-                    # Also keep in-memory for backwards compatibility
-                    self.embedding_cache[cache_key] = embedding
+            raw = await response.read()
+            result = json.loads(raw)
 
-                logger.info(f"Generated embedding: dim={len(embedding)}")
-                return embedding
+            if "data" not in result or not result["data"]:
+                if self.metrics:
+                    self.metrics.record_nim_request("embedding", "embed", "error", duration)
+                raise ValueError(f"Invalid embedding NIM response structure: {result}")
+
+            if self.metrics:
+                self.metrics.record_nim_request("embedding", "embed", "success", duration)
+
+            usage = result.get("usage") or {}
+            record_embedding_call(
+                tokens=usage.get(
+                    "prompt_tokens",
+                    sum(estimate_tokens(text) for text in payload["input"])
+                ),
+                request_bytes=len(body),
+                response_bytes=len(raw)
+            )
 
-        except aiohttp.ClientError as e:
-            logger.error(f"Embedding NIM network error for {url}: {e}")
-            raise
-        except asyncio.TimeoutError as e:
-            logger.error(f"Embedding NIM timeout: {e}")
-            raise
-        except ValueError as e:
-            logger.error(f"Embedding NIM validation error: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Embedding NIM unexpected error: {e}")
-            raise
+            # Responses carry an index per item; order by it to be safe
+            data = sorted(result["data"], key=lambda item: item.get("index", 0))
+            return [item["embedding"] for item in data]
 
     async def embed_batch(
         self,
         texts: List[str],
         input_type: str = "passage",
-        batch_size: int = 32
+        batch_size: int = 32,
+        cache: bool = True
     ) -> List[List[float]]:
         """
         Generate embeddings for multiple texts (batched for efficiency)
@@ -502,13 +1211,12 @@ class EmbeddingNIMClient:
         Args:
             texts: List of texts to embed
             input_type: "query" or "passage"
-            batch_size: Number of texts per API call
+            batch_size: Maximum texts per API call when micro-batching is disabled
+            cache: Whether to serve/store vectors via the embedding cache
 
         Returns:
             List of embedding vectors
         """
-        all_embeddings = []
-
         # Filter out None and empty strings before processing
         # Store original indices to map results back correctly
         # Also truncate texts to stay within NIM's 512 token limit
@@ -530,59 +1238,84 @@ class EmbeddingNIMClient:
         if not valid_texts:
             logger.warning("No valid texts to embed in batch")
             return [[] for _ in texts]  # Return empty embeddings for all inputs
-        
-        # Process in batches
-        for i in range(0, len(valid_texts), batch_size):
-            batch = valid_texts[i:i + batch_size]
-
-            url = f"{self.base_url}/v1/embeddings"
 
-            payload = {
-                "model": "nvidia/nv-embedqa-e5-v5",
-                "input": batch,
-                "input_type": input_type,
-                "encoding_format": "float"
-            }
-
-            try:
-                if not self.session or self.session.closed:
-                    raise RuntimeError("NIM client session not initialized")
-                
-                async with self.session.post(url, json=payload) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise ValueError(
-                            f"Embedding NIM batch returned status {response.status}: {error_text}"
-                        )
-                    
-                    result = await response.json()
-
-                    if "data" not in result or not result["data"]:
-                        raise ValueError(f"Invalid embedding NIM batch response: {result}")
+        # Embed each distinct text once and fan vectors back out
+        unique_texts = list(dict.fromkeys(valid_texts))
+        vectors_by_text: Dict[str, List[float]] = {}
+
+        # Batch cache lookup; only misses go to the NIM
+        if cache and self.vector_cache:
+            cached = self.vector_cache.get_many(unique_texts, self.MODEL, input_type)
+            for idx, vector in cached.items():
+                vectors_by_text[unique_texts[idx]] = vector
+            unique_texts = [
+                text for idx, text in enumerate(unique_texts) if idx not in cached
+            ]
+
+        # Shared Redis tier for the remaining misses
+        if cache and self.embedding_cache_obj and unique_texts:
+            shared_hits = {}
+            for text in unique_texts:
+                vector = self.embedding_cache_obj.get_embedding(text, input_type)
+                if vector is not None:
+                    shared_hits[text] = vector
+            if shared_hits:
+                if self.metrics:
+                    for _ in shared_hits:
+                        self.metrics.record_cache_hit("embedding_shared")
+                if self.vector_cache:
+                    self.vector_cache.set_many(
+                        list(shared_hits), self.MODEL, input_type, list(shared_hits.values())
+                    )
+                vectors_by_text.update(shared_hits)
+                unique_texts = [text for text in unique_texts if text not in shared_hits]
 
-                    # Extract all embeddings from batch
-                    batch_embeddings = [
-                        item["embedding"] for item in result["data"]
-                    ]
-                    all_embeddings.extend(batch_embeddings)
+        try:
+            if self.batcher:
+                # Coalesced with any concurrent embed calls from other requests
+                unique_embeddings = await self.batcher.submit_many(unique_texts, input_type)
+            else:
+                # Token-packed sub-batches sent concurrently (bounded by the in-flight limit)
+                batches = pack_by_token_budget(
+                    unique_texts,
+                    int(os.getenv("EMBEDDING_BATCH_TOKEN_BUDGET", EMBEDDING_BATCH_TOKEN_BUDGET)),
+                    batch_size
+                )
+                batch_results = await asyncio.gather(*(
+                    self._post_embeddings([unique_texts[i] for i in batch], input_type)
+                    for batch in batches
+                ))
+                unique_embeddings = [None] * len(unique_texts)
+                for batch, vectors in zip(batches, batch_results):
+                    for i, vector in zip(batch, vectors):
+                        unique_embeddings[i] = vector
+
+            logger.info(
+                f"Embedded {len(valid_texts)} texts "
+                f"({len(unique_texts)} sent, {len(vectors_by_text)} cached)"
+            )
 
-                    logger.info(f"Embedded batch {i//batch_size + 1}: {len(batch)} texts")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Batch embedding network error: {e}")
+            raise
+        except ValueError as e:
+            logger.error(f"Batch embedding validation error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Batch embedding unexpected error: {e}")
+            raise
 
-            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
-                logger.error(f"Batch embedding network error: {e}")
-                # Retry this batch
-                raise
-            except ValueError as e:
-                logger.error(f"Batch embedding validation error: {e}")
-                raise
-            except Exception as e:
-                logger.error(f"Batch embedding unexpected error: {e}")
-                raise
+        vectors_by_text.update(zip(unique_texts, unique_embeddings))
+        if cache and self.vector_cache and unique_texts:
+            self.vector_cache.set_many(unique_texts, self.MODEL, input_type, unique_embeddings)
+        if cache and self.embedding_cache_obj:
+            for text, vector in zip(unique_texts, unique_embeddings):
+                self.embedding_cache_obj.set_embedding(text, vector, input_type)
         
         # Map results back to original positions (with None/empty strings getting empty embeddings)
         result_embeddings = [[] for _ in range(len(texts))]
-        for valid_idx, embedding in zip(valid_indices, all_embeddings):
-            result_embeddings[valid_idx] = embedding
+        for valid_idx, text in zip(valid_indices, valid_texts):
+            result_embeddings[valid_idx] = vectors_by_text[text]
         
         return result_embeddings
 
@@ -622,6 +1355,109 @@ class EmbeddingNIMClient:
         return float((similarity + 1) / 2)
 
 
+class NIMClientPool:
+    """
+    Process-wide pair of NIM clients backed by long-lived connection pools
+
+    Created once at API startup and closed at shutdown so that requests reuse
+    warm keep-alive connections instead of opening a session per request.
+    """
+
+    def __init__(self):
+        self.reasoning: Optional[ReasoningNIMClient] = None
+        self.embedding: Optional[EmbeddingNIMClient] = None
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+
+    @property
+    def started(self) -> bool:
+        return bool(self._sessions) and not any(
+            session.closed for session in self._sessions.values()
+        )
+
+    async def start(self):
+        """Open one pooled session per NIM and bind the shared clients to it"""
+        if self.started:
+            return
+
+        self._sessions = {
+            "reasoning": aiohttp.ClientSession(
+                timeout=ReasoningNIMClient.DEFAULT_TIMEOUT,
+                connector=create_nim_connector()
+            ),
+            "embedding": aiohttp.ClientSession(
+                timeout=EmbeddingNIMClient.DEFAULT_TIMEOUT,
+                connector=create_nim_connector()
+            ),
+        }
+        self.reasoning = ReasoningNIMClient(session=self._sessions["reasoning"])
+        self.embedding = EmbeddingNIMClient(session=self._sessions["embedding"])
+        logger.info("Shared NIM connection pools opened")
+
+    async def close(self):
+        """Close pooled sessions (called once at shutdown)"""
+        for name, session in self._sessions.items():
+            if not session.closed:
+                await session.close()
+        if self._sessions:
+            # Give connections a moment to shut down cleanly
+            await asyncio.sleep(0.250)
+            logger.info("Shared NIM connection pools closed")
+        self._sessions = {}
+        self.reasoning = None
+        self.embedding = None
+
+    def get_stats(self) -> Dict[str, Dict[str, int]]:
+        """Get open/idle connection counts per NIM"""
+        return {
+            name: get_connector_stats(session)
+            for name, session in self._sessions.items()
+        }
+
+    def report_metrics(self):
+        """Publish pool gauges to the metrics collector"""
+        if not METRICS_AVAILABLE:
+            return
+        try:
+            collector = get_metrics_collector()
+            for name, stats in self.get_stats().items():
+                collector.record_connection_pool(name, stats["open"], stats["idle"])
+        except Exception as e:
+            logger.warning(f"Failed to report NIM pool metrics: {e}")
+
+
+# Global client pool instance
+_client_pool: Optional[NIMClientPool] = None
+
+
+def get_client_pool() -> NIMClientPool:
+    """Get global NIM client pool instance"""
+    global _client_pool
+    if _client_pool is None:
+        _client_pool = NIMClientPool()
+    return _client_pool
+
+
+async def close_client_pool():
+    """Close the global NIM client pool if one was created"""
+    global _client_pool
+    if _client_pool is not None:
+        await _client_pool.close()
+        _client_pool = None
+
+
+def get_shared_clients() -> Optional[Tuple[ReasoningNIMClient, EmbeddingNIMClient]]:
+    """
+    Get the shared (reasoning, embedding) clients if the pool has been started
+
+    Returns:
+        Client pair, or None when running outside the API process
+    """
+    pool = get_client_pool()
+    if not pool.started:
+        return None
+    return pool.reasoning, pool.embedding
+
+
 # Example usage
 async def example_usage():
     """Demonstrate NIM client usage"""
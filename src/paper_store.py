@@ -0,0 +1,246 @@
+"""
+Local Paper Store
+Durable SQLite store of every fetched paper with FTS5 search over title and abstract
+"""
+
+import os
+import re
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Optional, Dict, Any, List
+
+from constants import PAPER_STORE_DEFAULT_PATH, PAPER_STORE_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+def _fts5_available() -> bool:
+    try:
+        conn = sqlite3.connect(":memory:")
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(text)")
+        conn.close()
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+FTS5_AVAILABLE = _fts5_available()
+
+STORE_FIELDS = ("id", "source", "title", "authors", "abstract", "url", "year", "venue", "doi")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id TEXT PRIMARY KEY,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    authors TEXT NOT NULL,
+    abstract TEXT NOT NULL,
+    url TEXT,
+    year INTEGER,
+    venue TEXT,
+    doi TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_doi ON papers(doi);
+CREATE INDEX IF NOT EXISTS papers_year ON papers(year);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+    title, abstract, content='papers', content_rowid='rowid'
+);
+CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+    INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_ad AFTER DELETE ON papers BEGIN
+    INSERT INTO papers_fts(papers_fts, rowid, title, abstract) VALUES ('delete', old.rowid, old.title, old.abstract);
+END;
+CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE ON papers BEGIN
+    INSERT INTO papers_fts(papers_fts, rowid, title, abstract) VALUES ('delete', old.rowid, old.title, old.abstract);
+    INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.rowid, new.title, new.abstract);
+END;
+"""
+
+_UPSERT = """
+INSERT INTO papers (id, source, title, authors, abstract, url, year, venue, doi, fetched_at)
+VALUES (:id, :source, :title, :authors, :abstract, :url, :year, :venue, :doi, :fetched_at)
+ON CONFLICT(id) DO UPDATE SET
+    title = excluded.title,
+    authors = excluded.authors,
+    abstract = excluded.abstract,
+    url = COALESCE(excluded.url, papers.url),
+    year = COALESCE(excluded.year, papers.year),
+    venue = COALESCE(excluded.venue, papers.venue),
+    doi = COALESCE(excluded.doi, papers.doi),
+    fetched_at = excluded.fetched_at
+"""
+
+
+def fts_query(query: str) -> str:
+    """
+    Turn free text into an FTS5 query
+
+    Terms are quoted (so operators and punctuation in user input are inert)
+    and OR-ed; bm25 ranking puts papers matching more terms first.
+    """
+    terms = re.findall(r"\w+", query.lower())
+    return " OR ".join(f'"{term}"' for term in terms if len(term) > 1)
+
+
+class PaperStore:
+    """
+    SQLite-backed store of fetched papers
+
+    Writes are buffered and committed in batches; searches go through an
+    FTS5 index over title and abstract (LIKE matching when the SQLite build
+    lacks FTS5). Methods are blocking; call them via asyncio.to_thread from
+    async code.
+    """
+
+    def __init__(self, path: str = PAPER_STORE_DEFAULT_PATH, batch_size: int = PAPER_STORE_BATCH_SIZE):
+        """
+        Initialize paper store
+
+        Args:
+            path: Database file (":memory:" for a throwaway store)
+            batch_size: Buffered papers that trigger a flush
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+            if FTS5_AVAILABLE:
+                self._conn.executescript(_FTS_SCHEMA)
+
+    @property
+    def pending(self) -> int:
+        """Buffered papers not yet written"""
+        return len(self._pending)
+
+    def add(self, papers: List[Any]) -> bool:
+        """
+        Buffer papers for writing
+
+        Returns:
+            True when the buffer has reached batch_size and should be flushed
+        """
+        now = time.time()
+        with self._lock:
+            for paper in papers:
+                source = paper.id.split("-", 1)[0] if "-" in paper.id else "unknown"
+                self._pending[paper.id] = {
+                    "id": paper.id,
+                    "source": source,
+                    "title": paper.title or "",
+                    "authors": json.dumps(list(paper.authors or [])),
+                    "abstract": paper.abstract or "",
+                    "url": paper.url or None,
+                    "year": getattr(paper, "year", None),
+                    "venue": getattr(paper, "venue", None),
+                    "doi": getattr(paper, "doi", None),
+                    "fetched_at": now,
+                }
+            return len(self._pending) >= self.batch_size
+
+    def flush(self) -> int:
+        """Write buffered papers in one transaction; returns the number written"""
+        with self._lock:
+            if not self._pending:
+                return 0
+            rows = list(self._pending.values())
+            self._pending = {}
+            with self._conn:
+                self._conn.executemany(_UPSERT, rows)
+        logger.debug(f"Paper store: wrote {len(rows)} papers")
+        return len(rows)
+
+    def search(self, query: str, limit: int = 20, sources: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Full-text search over title and abstract
+
+        Args:
+            query: Free-text query
+            limit: Maximum results
+            sources: Only return papers from these sources
+
+        Returns:
+            Paper records (dicts with STORE_FIELDS), best match first
+        """
+        source_filter = ""
+        params: List[Any] = []
+        if FTS5_AVAILABLE:
+            match = fts_query(query)
+            if not match:
+                return []
+            sql = (
+                "SELECT p.* FROM papers_fts JOIN papers p ON p.rowid = papers_fts.rowid "
+                "WHERE papers_fts MATCH ?"
+            )
+            params.append(match)
+            order = " ORDER BY bm25(papers_fts, 2.0, 1.0)"
+        else:
+            terms = [t for t in re.findall(r"\w+", query.lower()) if len(t) > 1]
+            if not terms:
+                return []
+            sql = "SELECT p.* FROM papers p WHERE (" + " OR ".join(
+                "lower(p.title) LIKE ? OR lower(p.abstract) LIKE ?" for _ in terms
+            ) + ")"
+            for term in terms:
+                params.extend([f"%{term}%", f"%{term}%"])
+            order = " ORDER BY p.fetched_at DESC"
+        if sources:
+            source_filter = f" AND p.source IN ({','.join('?' for _ in sources)})"
+            params.extend(sources)
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql + source_filter + order + " LIMIT ?", params).fetchall()
+        return [self._row_to_record(row) for row in rows]
+
+    def get(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Get one paper by ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM papers WHERE id = ?", (paper_id,)).fetchone()
+        return self._row_to_record(row) if row else None
+
+    def count(self) -> int:
+        """Number of stored papers"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+
+    @staticmethod
+    def _row_to_record(row: sqlite3.Row) -> Dict[str, Any]:
+        record = {field: row[field] for field in STORE_FIELDS}
+        record["authors"] = json.loads(record["authors"] or "[]")
+        return record
+
+    def close(self):
+        """Flush pending writes and close the database"""
+        self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+# Global paper store instance
+_paper_store: Optional[PaperStore] = None
+
+
+def get_paper_store() -> PaperStore:
+    """Get global paper store (path from env PAPER_STORE_PATH)"""
+    global _paper_store
+    if _paper_store is None:
+        _paper_store = PaperStore(
+            path=os.getenv("PAPER_STORE_PATH", PAPER_STORE_DEFAULT_PATH),
+            batch_size=int(os.getenv("PAPER_STORE_BATCH_SIZE", PAPER_STORE_BATCH_SIZE))
+        )
+    return _paper_store
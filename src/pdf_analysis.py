@@ -4,10 +4,26 @@ Downloads and analyzes full PDF text of papers to extract methodologies,
 experimental details, and results beyond abstracts.
 """
 
-from typing import List, Dict, Any, Optional
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Dict, Any, Optional, Callable, Tuple, Deque
+import asyncio
+import io
 import logging
+import multiprocessing
 import os
 import re
+import threading
+import time
+
+from exceptions import WorkerPoolSaturatedError
+from constants import (
+    PDF_PARSE_WORKERS,
+    PDF_PARSE_MAX_PENDING,
+    PDF_PARSE_TIMEOUT_SECONDS,
+    PDF_MAX_PAGES
+)
 
 # Optional PDF parsing dependencies
 try:
@@ -24,6 +40,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Slots reserved by PDFParsePool.reserve for the documents of the current request
+_reserved_slots: ContextVar[Optional[Dict[str, Any]]] = ContextVar("pdf_reserved_slots", default=None)
+
 
 class PDFAnalyzer:
     """Analyzes full-text PDF documents for research papers"""
@@ -68,31 +87,26 @@ class PDFAnalyzer:
             if not pdf_content:
                 return {"error": "Failed to download PDF", "paper_id": paper_id}
             
-            # Extract text
-            full_text = self._extract_text(pdf_content)
-            if not full_text:
+            # Text and structured extraction run in a worker process, off the event loop
+            parsed = await get_pdf_parse_pool().parse(pdf_content, use_pdfplumber=self.use_pdfplumber)
+            pages = parsed.pop("pages")
+            if not pages:
                 return {"error": "Failed to extract text from PDF", "paper_id": paper_id}
-            
-            # Extract structured information
-            analysis = {
-                "paper_id": paper_id,
-                "full_text_length": len(full_text),
-                "full_text_preview": full_text[:1000] + "..." if len(full_text) > 1000 else full_text,
-                "methodology": self._extract_section(full_text, ["methodology", "methods", "method"]),
-                "results": self._extract_section(full_text, ["results", "findings", "experimental results"]),
-                "experimental_setup": self._extract_experimental_setup(full_text),
-                "figures_tables": self._extract_figures_tables(full_text),
-                "citations_in_text": self._extract_citations(full_text),
-                "statistical_results": self._extract_statistical_results(full_text)
-            }
+            analysis = {"paper_id": paper_id, **parsed}
             
             # Use reasoning NIM for advanced extraction if available
             if self.reasoning_client:
-                enhanced_analysis = await self._enhanced_extraction(full_text, analysis)
+                enhanced_analysis = await self._enhanced_extraction("\n\n".join(pages), analysis)
                 analysis.update(enhanced_analysis)
             
             return analysis
             
+        except WorkerPoolSaturatedError as e:
+            logger.warning(f"PDF analysis skipped for {paper_id}: {e.message}")
+            return {"error": "PDF parser busy", "paper_id": paper_id, **e.details}
+        except asyncio.TimeoutError:
+            logger.warning(f"PDF parsing timed out for {paper_id}")
+            return {"error": "PDF parsing timed out", "paper_id": paper_id}
         except Exception as e:
             logger.error(f"PDF analysis error for {paper_id}: {e}", exc_info=True)
             return {"error": str(e), "paper_id": paper_id}
@@ -116,50 +130,8 @@ class PDFAnalyzer:
             logger.error(f"PDF download error: {e}")
             return None
     
-    def _extract_text(self, pdf_content: bytes) -> str:
-        """Extract text from PDF content"""
-        if self.use_pdfplumber and HAS_PDFPLUMBER:
-            return self._extract_with_pdfplumber(pdf_content)
-        elif HAS_PYPDF2:
-            return self._extract_with_pypdf2(pdf_content)
-        else:
-            return ""
-    
-    def _extract_with_pdfplumber(self, pdf_content: bytes) -> str:
-        """Extract text using pdfplumber (better quality)"""
-        import io
-        text_parts = []
-        
-        try:
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
-        except Exception as e:
-            logger.error(f"pdfplumber extraction error: {e}")
-            return ""
-        
-        return "\n\n".join(text_parts)
-    
-    def _extract_with_pypdf2(self, pdf_content: bytes) -> str:
-        """Extract text using PyPDF2 (fallback)"""
-        import io
-        text_parts = []
-        
-        try:
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
-            for page in pdf_reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
-        except Exception as e:
-            logger.error(f"PyPDF2 extraction error: {e}")
-            return ""
-        
-        return "\n\n".join(text_parts)
-    
-    def _extract_section(self, text: str, section_keywords: List[str]) -> Optional[str]:
+    @staticmethod
+    def _extract_section(text: str, section_keywords: List[str]) -> Optional[str]:
         """Extract a specific section from text"""
         text_lower = text.lower()
         
@@ -180,7 +152,8 @@ class PDFAnalyzer:
         
         return None
     
-    def _extract_experimental_setup(self, text: str) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_experimental_setup(text: str) -> Dict[str, Any]:
         """Extract experimental setup details"""
         setup = {
             "datasets": [],
@@ -229,7 +202,8 @@ class PDFAnalyzer:
         
         return setup
     
-    def _extract_figures_tables(self, text: str) -> Dict[str, Any]:
+    @staticmethod
+    def _extract_figures_tables(text: str) -> Dict[str, Any]:
         """Extract metadata about figures and tables"""
         figures = []
         tables = []
@@ -253,7 +227,8 @@ class PDFAnalyzer:
             "tables": tables[:10]
         }
     
-    def _extract_citations(self, text: str) -> List[str]:
+    @staticmethod
+    def _extract_citations(text: str) -> List[str]:
         """Extract citation references from text"""
         # Common citation patterns: [1], [1,2], (Author, 2020), etc.
         citation_patterns = [
@@ -269,7 +244,8 @@ class PDFAnalyzer:
         
         return list(set(citations))[:50]  # Limit to 50 unique citations
     
-    def _extract_statistical_results(self, text: str) -> Dict[str, List[str]]:
+    @staticmethod
+    def _extract_statistical_results(text: str) -> Dict[str, List[str]]:
         """Extract statistical results (p-values, effect sizes, etc.)"""
         results = {
             "p_values": [],
@@ -333,6 +309,366 @@ Provide JSON format response.
             return {}
 
 
+def _compact(text: str) -> str:
+    """Collapse whitespace runs and drop blank lines (line breaks mark section headers)"""
+    return "\n".join(" ".join(line.split()) for line in text.splitlines() if line.strip())
+
+
+def _extract_pages(
+    pdf_content: bytes,
+    use_pdfplumber: bool,
+    max_pages: int,
+    deadline: float
+) -> Tuple[List[str], int, bool]:
+    """
+    Extract compact text per page, up to max_pages and the deadline
+
+    Returns:
+        (page texts, total page count, stopped at deadline)
+    """
+    pages: List[str] = []
+    try:
+        if use_pdfplumber and HAS_PDFPLUMBER:
+            document = pdfplumber.open(io.BytesIO(pdf_content))
+            page_list = document.pages
+        elif HAS_PYPDF2:
+            document = None
+            page_list = PyPDF2.PdfReader(io.BytesIO(pdf_content)).pages
+        else:
+            return [], 0, False
+        try:
+            for page in page_list[:max_pages]:
+                if time.monotonic() > deadline:
+                    return pages, len(page_list), True
+                text = page.extract_text()
+                if text:
+                    pages.append(_compact(text))
+            return pages, len(page_list), False
+        finally:
+            if document is not None:
+                document.close()
+    except Exception as e:
+        logger.error(f"PDF text extraction error: {e}")
+        return pages, len(pages), False
+
+
+def analyze_text(pages: List[str]) -> Dict[str, Any]:
+    """Regex extraction over the joined page texts"""
+    full_text = "\n\n".join(pages)
+    return {
+        "full_text_length": len(full_text),
+        "full_text_preview": full_text[:1000] + "..." if len(full_text) > 1000 else full_text,
+        "methodology": PDFAnalyzer._extract_section(full_text, ["methodology", "methods", "method"]),
+        "results": PDFAnalyzer._extract_section(full_text, ["results", "findings", "experimental results"]),
+        "experimental_setup": PDFAnalyzer._extract_experimental_setup(full_text),
+        "figures_tables": PDFAnalyzer._extract_figures_tables(full_text),
+        "citations_in_text": PDFAnalyzer._extract_citations(full_text),
+        "statistical_results": PDFAnalyzer._extract_statistical_results(full_text)
+    }
+
+
+def parse_pdf(
+    pdf_content: bytes,
+    use_pdfplumber: bool = True,
+    max_pages: int = PDF_MAX_PAGES,
+    timeout: float = PDF_PARSE_TIMEOUT_SECONDS
+) -> Dict[str, Any]:
+    """
+    Worker entry point: page texts plus structured extraction
+
+    Runs in a PDFParsePool process so only the compact page texts and the
+    extracted fields cross back to the event loop. Pages past max_pages, or
+    left when the timeout passes, are skipped and the result is marked
+    truncated.
+    """
+    deadline = time.monotonic() + timeout
+    pages, page_count, timed_out = _extract_pages(pdf_content, use_pdfplumber, max_pages, deadline)
+    if not pages:
+        return {"pages": [], "page_count": page_count}
+    result = analyze_text(pages)
+    result.update(
+        pages=pages,
+        page_count=page_count,
+        pages_parsed=len(pages),
+        truncated=timed_out or page_count > max_pages
+    )
+    return result
+
+
+class PDFParsePool:
+    """
+    Bounded process pool for CPU-heavy PDF parsing
+
+    At most max_pending documents are parsing or queued; further requests
+    are rejected with WorkerPoolSaturatedError instead of waiting. Callers
+    that fan out over several documents can reserve slots up front, so they
+    are rejected before any work starts rather than part-way through. Each
+    worker is its own single-process multiprocessing.Pool, so a document can
+    be stopped without touching the others: it gets timeout seconds inside
+    the worker (pages after that are skipped), and a worker still busy after
+    twice that is terminated and replaced, freeing the slot. Workers are
+    started and stopped in threads, since spawning one re-imports this
+    module. Queued documents wait for a worker in FIFO order.
+    """
+
+    def __init__(
+        self,
+        workers: int = PDF_PARSE_WORKERS,
+        max_pending: int = PDF_PARSE_MAX_PENDING,
+        timeout: float = PDF_PARSE_TIMEOUT_SECONDS,
+        max_pages: int = PDF_MAX_PAGES
+    ):
+        self.workers = workers
+        self.max_pending = max(max_pending, workers)
+        self.timeout = timeout
+        self.max_pages = max_pages
+        # Spawn rather than fork: the parent runs an event loop and threads
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: List[Any] = []
+        self._started: set = set()
+        # Workers running or being started; bounded by workers
+        self._slots = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._stopping: set = set()
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        """Documents parsing or queued (including reserved slots)"""
+        return self._pending
+
+    @property
+    def saturated(self) -> bool:
+        return self._pending >= self.max_pending
+
+    def _retry_after(self) -> int:
+        return max(1, int(self.timeout))
+
+    def _saturated_error(self) -> WorkerPoolSaturatedError:
+        return WorkerPoolSaturatedError(
+            f"PDF parse pool saturated ({self._pending}/{self.max_pending} documents in flight)",
+            pool="pdf_parse",
+            retry_after=self._retry_after()
+        )
+
+    @contextmanager
+    def reserve(self, count: int):
+        """
+        Reserve up to count slots for the documents of one request
+
+        Yields:
+            Number of slots reserved (at least 1); runs inside the block use
+            them instead of taking new ones
+
+        Raises:
+            WorkerPoolSaturatedError: no slot is free
+        """
+        with self._lock:
+            free = self.max_pending - self._pending
+            if free < 1:
+                raise self._saturated_error()
+            reserved = max(1, min(count, free))
+            self._pending += reserved
+        token = _reserved_slots.set({"pool": self, "free": reserved})
+        try:
+            yield reserved
+        finally:
+            _reserved_slots.reset(token)
+            with self._lock:
+                self._pending -= reserved
+
+    async def _start_worker(self):
+        """Start a worker in a thread; the caller already holds its slot"""
+        start = asyncio.ensure_future(asyncio.to_thread(self._context.Pool, processes=1))
+        try:
+            worker = await asyncio.shield(start)
+        except asyncio.CancelledError:
+            # The thread still finishes starting the process; stop it when it does
+            start.add_done_callback(
+                lambda f: f.cancelled() or f.exception() is not None or f.result().terminate()
+            )
+            self._release_slot()
+            raise
+        except BaseException:
+            self._release_slot()
+            raise
+        self._started.add(worker)
+        return worker
+
+    def _release_slot(self):
+        """Give up a worker slot, passing it to the next waiter if any"""
+        self._slots -= 1
+        self._checkin(None)
+
+    async def _checkout(self):
+        """Take an idle worker, start one if below the limit, or wait in line"""
+        if self._idle:
+            return self._idle.pop()
+        if self._slots < self.workers:
+            self._slots += 1
+            return await self._start_worker()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            worker = await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Worker (or slot) was handed over as we were cancelled; pass it on
+                if waiter.result() is None:
+                    self._release_slot()
+                else:
+                    self._checkin(waiter.result())
+            raise
+        if worker is None:
+            # Handed the slot of a terminated worker
+            return await self._start_worker()
+        return worker
+
+    def _checkin(self, worker):
+        """Hand a worker (None: a free slot) to the next waiter, or park it"""
+        if worker is None and self._slots >= self.workers:
+            return
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            if worker is None:
+                self._slots += 1
+            waiter.set_result(worker)
+            return
+        if worker is not None:
+            self._idle.append(worker)
+
+    def _terminate(self, worker) -> asyncio.Future:
+        """Kill a worker process (and whatever it is stuck in) in a thread"""
+        self._started.discard(worker)
+        stopping = asyncio.get_running_loop().run_in_executor(None, worker.terminate)
+        self._stopping.add(stopping)
+        stopping.add_done_callback(self._stopping.discard)
+        return stopping
+
+    @staticmethod
+    async def _apply(worker, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        """Run fn(*args) on a worker; results arrive on the pool's handler thread"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def resolve(method: str, value: Any):
+            if not future.done():
+                getattr(future, method)(value)
+
+        def deliver(method: str):
+            def callback(value: Any):
+                try:
+                    loop.call_soon_threadsafe(resolve, method, value)
+                except RuntimeError:
+                    pass  # Loop already closed; nobody is waiting
+            return callback
+
+        worker.apply_async(fn, args, callback=deliver("set_result"), error_callback=deliver("set_exception"))
+        return await future
+
+    def _acquire(self) -> Optional[Dict[str, Any]]:
+        """Take a slot for one document: a reserved one if available, else a new one"""
+        reservation = _reserved_slots.get()
+        with self._lock:
+            if reservation is not None and reservation["pool"] is self and reservation["free"] > 0:
+                reservation["free"] -= 1
+                return reservation
+            if self._pending >= self.max_pending:
+                raise self._saturated_error()
+            self._pending += 1
+            return None
+
+    def _release(self, reservation: Optional[Dict[str, Any]]):
+        with self._lock:
+            if reservation is not None:
+                reservation["free"] += 1
+            else:
+                self._pending -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any, timeout: Optional[float] = None) -> Any:
+        """
+        Run fn(*args) in a worker process
+
+        Raises:
+            WorkerPoolSaturatedError: max_pending calls are already in flight
+            asyncio.TimeoutError: fn ran longer than timeout (default: pool
+                timeout); its worker has been terminated
+        """
+        reservation = self._acquire()
+        try:
+            worker = await self._checkout()
+            try:
+                result = await asyncio.wait_for(
+                    self._apply(worker, fn, args),
+                    self.timeout if timeout is None else timeout
+                )
+            except asyncio.TimeoutError:
+                # A hung parser cannot be interrupted; kill its process to free the slot
+                stopping = self._terminate(worker)
+                self._release_slot()
+                await stopping
+                raise
+            except asyncio.CancelledError:
+                self._terminate(worker)
+                self._release_slot()
+                raise
+            except BaseException:
+                # fn raised in the worker: the process itself is fine
+                self._checkin(worker)
+                raise
+            self._checkin(worker)
+            return result
+        finally:
+            self._release(reservation)
+
+    async def parse(self, pdf_content: bytes, use_pdfplumber: bool = True) -> Dict[str, Any]:
+        """Parse one PDF in a worker (see parse_pdf)"""
+        return await self.run(
+            parse_pdf, pdf_content, use_pdfplumber, self.max_pages, self.timeout,
+            timeout=2 * self.timeout
+        )
+
+    async def close(self):
+        """Stop the worker processes"""
+        for waiter in self._waiters:
+            if not waiter.done():
+                waiter.cancel()
+        self._waiters.clear()
+        for worker in list(self._started):
+            self._terminate(worker)
+        self._idle = []
+        if self._stopping:
+            await asyncio.gather(*list(self._stopping), return_exceptions=True)
+
+
+# Global PDF parse pool instance
+_pdf_parse_pool: Optional[PDFParsePool] = None
+
+
+def get_pdf_parse_pool() -> PDFParsePool:
+    """Get global PDF parse pool (workers are started on first use)"""
+    global _pdf_parse_pool
+    if _pdf_parse_pool is None:
+        _pdf_parse_pool = PDFParsePool(
+            workers=int(os.getenv("PDF_PARSE_WORKERS", PDF_PARSE_WORKERS)),
+            max_pending=int(os.getenv("PDF_PARSE_MAX_PENDING", PDF_PARSE_MAX_PENDING)),
+            timeout=float(os.getenv("PDF_PARSE_TIMEOUT_SECONDS", PDF_PARSE_TIMEOUT_SECONDS)),
+            max_pages=int(os.getenv("PDF_MAX_PAGES", PDF_MAX_PAGES))
+        )
+    return _pdf_parse_pool
+
+
+async def close_pdf_parse_pool():
+    """Stop the global PDF parse pool's workers if the pool was created"""
+    global _pdf_parse_pool
+    if _pdf_parse_pool is not None:
+        await _pdf_parse_pool.close()
+        _pdf_parse_pool = None
+
+
 async def analyze_papers_full_text(
     papers: List[Dict[str, Any]],
     reasoning_client=None,
@@ -348,6 +684,9 @@ async def analyze_papers_full_text(
         
     Returns:
         Dictionary mapping paper_id to analysis results
+
+    Raises:
+        WorkerPoolSaturatedError: the PDF parse pool has no free slot
     """
     analyzer = PDFAnalyzer(reasoning_client=reasoning_client)
     results = {}
@@ -362,19 +701,20 @@ async def analyze_papers_full_text(
         logger.info("No papers with PDF URLs found")
         return results
     
-    import asyncio
-    
-    # Analyze in parallel (limited concurrency)
-    semaphore = asyncio.Semaphore(3)  # Max 3 concurrent downloads
-    
-    async def analyze_one(paper):
-        async with semaphore:
-            pdf_url = paper.get("pdf_url") or paper.get("url", "")
-            paper_id = paper.get("id", "")
-            return await analyzer.analyze_pdf(pdf_url, paper_id)
-    
-    tasks = [analyze_one(p) for p in papers_with_pdf]
-    analyses = await asyncio.gather(*tasks, return_exceptions=True)
+    # Reserve parse slots before downloading anything, so a busy pool is
+    # reported for the whole request (WorkerPoolSaturatedError) instead of
+    # per paper; concurrency is limited to the slots we got
+    with get_pdf_parse_pool().reserve(min(3, len(papers_with_pdf))) as slots:  # Max 3 concurrent downloads
+        semaphore = asyncio.Semaphore(slots)
+        
+        async def analyze_one(paper):
+            async with semaphore:
+                pdf_url = paper.get("pdf_url") or paper.get("url", "")
+                paper_id = paper.get("id", "")
+                return await analyzer.analyze_pdf(pdf_url, paper_id)
+        
+        tasks = [analyze_one(p) for p in papers_with_pdf]
+        analyses = await asyncio.gather(*tasks, return_exceptions=True)
     
     for paper, analysis in zip(papers_with_pdf, analyses):
         if isinstance(analysis, Exception):
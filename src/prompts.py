@@ -0,0 +1,328 @@
+"""
+Prompt Registry
+Versioned Reasoning NIM prompts laid out as a static prefix plus a per-call suffix
+
+Every template puts its instructions and output schema first and the
+per-paper or per-request content last, so all calls of one type share a
+byte-identical prefix that the inference server's prefix (KV) cache can
+reuse. Prefixes are rendered once at import; only the suffix is formatted
+per call. Bump a template's version whenever its text changes so completion
+and analysis caches keyed on the version are invalidated.
+"""
+
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+
+@dataclass(frozen=True)
+class PromptTemplate:
+    """A prompt type: static prefix, str.format suffix and version"""
+    name: str
+    version: str
+    prefix: str
+    suffix: str
+
+    def render(self, **fields: Any) -> str:
+        """Render the prompt; only the suffix is formatted"""
+        return self.prefix + self.suffix.format(**fields)
+
+
+# Registered templates by name
+PROMPTS: Dict[str, PromptTemplate] = {}
+
+
+def register(template: PromptTemplate) -> PromptTemplate:
+    """Add a template to the registry"""
+    if template.name in PROMPTS:
+        raise ValueError(f"Prompt '{template.name}' is already registered")
+    PROMPTS[template.name] = template
+    return template
+
+
+def get_prompt(name: str) -> PromptTemplate:
+    """Look up a registered template by name"""
+    try:
+        return PROMPTS[name]
+    except KeyError:
+        raise KeyError(f"Unknown prompt '{name}'. Registered: {sorted(PROMPTS)}") from None
+
+
+def format_paper(title: str, authors: List[str], abstract: str, paper_id: Optional[str] = None) -> str:
+    """Per-paper block shared by the analysis prompts"""
+    lines = [f"Paper ID: {paper_id}"] if paper_id is not None else []
+    lines += [
+        f"Title: {title}",
+        f"Authors: {', '.join(authors)}",
+        f"Abstract: {abstract}",
+    ]
+    return "\n".join(lines)
+
+
+# Structured extraction ------------------------------------------------------
+
+EXTRACTION_INSTRUCTIONS = "Extract the following information from the text and return as JSON."
+EXTRACTION_VERSION = "extraction-v2"
+
+# Extraction templates by (schema text, instructions); rendered once per schema
+_extraction_templates: Dict[Tuple[str, str], PromptTemplate] = {}
+
+
+def structured_extraction(
+    schema: Union[Dict[str, Any], str],
+    instructions: str = EXTRACTION_INSTRUCTIONS,
+    name: str = "structured-extraction",
+    version: str = EXTRACTION_VERSION
+) -> PromptTemplate:
+    """
+    Extraction template for a schema (suffix field: text)
+
+    A string schema is used verbatim, so callers can pass an annotated
+    example object. The template is built on first use and reused after.
+    """
+    schema_text = schema if isinstance(schema, str) else json.dumps(schema, indent=2, default=str)
+    key = (schema_text, instructions)
+    template = _extraction_templates.get(key)
+    if template is None:
+        template = PromptTemplate(
+            name=name,
+            version=version,
+            prefix=f"{instructions}\n\nSchema:\n{schema_text}\n\nText:\n",
+            suffix="{text}\n\nJSON Output:\n"
+        )
+        _extraction_templates[key] = template
+    return template
+
+
+# Analyst --------------------------------------------------------------------
+
+# Output template shared by the single-paper and packed analysis prompts
+ANALYSIS_JSON_TEMPLATE = """{
+    "research_question": "main research question",
+    "methodology": "research methodology used",
+    "key_findings": ["finding 1", "finding 2", "finding 3"],
+    "limitations": ["limitation 1", "limitation 2"],
+    "confidence": 0.0-1.0,
+    "statistical_results": {
+        "p_values": ["p < 0.05", "p = 0.001"],
+        "effect_sizes": ["Cohen's d = 0.8", "R² = 0.65"],
+        "confidence_intervals": ["95% CI: [0.5, 0.9]"],
+        "statistical_tests": ["t-test", "ANOVA"]
+    },
+    "experimental_setup": {
+        "datasets": ["Dataset A", "Dataset B"],
+        "hardware": "GPU/CPU specifications",
+        "hyperparameters": ["learning_rate: 0.001", "batch_size: 32"],
+        "software_frameworks": ["PyTorch", "TensorFlow"]
+    },
+    "comparative_results": {
+        "baselines": ["baseline method 1", "baseline method 2"],
+        "benchmarks": ["SOTA: 95% accuracy", "Previous: 90% accuracy"],
+        "improvements": ["10% improvement over baseline"]
+    },
+    "reproducibility": {
+        "code_available": true/false,
+        "data_available": true/false,
+        "repository_url": "GitHub/Zenodo URL if available"
+    }
+}"""
+
+ANALYSIS_INSTRUCTIONS = (
+    "Analyze the research paper given after \"Text:\" and extract comprehensive information.\n"
+    "Return JSON with the fields of this schema."
+)
+
+ANALYSIS = register(structured_extraction(
+    ANALYSIS_JSON_TEMPLATE,
+    ANALYSIS_INSTRUCTIONS,
+    name="analysis",
+    version="analyst-v2"
+))
+
+ANALYSIS_PACKED = register(PromptTemplate(
+    name="analysis-packed",
+    version="analyst-packed-v2",
+    prefix=f"""Analyze each of the research papers listed after "Papers:" and extract comprehensive information.
+
+Return a JSON array with one object per paper, in the same order. Each object
+must have a "paper_id" field copied exactly from the paper's "Paper ID" line,
+plus these fields:
+{ANALYSIS_JSON_TEMPLATE}
+
+Papers:
+
+""",
+    suffix="{papers}\n\nJSON Array Output:\n"
+))
+
+
+# Synthesizer ----------------------------------------------------------------
+
+CONTRADICTIONS = register(PromptTemplate(
+    name="contradictions",
+    version="contradictions-v2",
+    prefix="""Analyze the research findings below and identify any contradictions or conflicting results.
+
+List contradictions in the format:
+- [Paper X] says: ...
+- [Paper Y] says: ...
+- Conflict: ...
+
+Findings:
+
+""",
+    suffix="{findings}\n\nContradictions:\n"
+))
+
+RESEARCH_GAPS = register(PromptTemplate(
+    name="research-gaps",
+    version="research-gaps-v2",
+    prefix="""Based on the research findings and themes below, identify gaps in the literature and areas needing further investigation.
+
+Findings:
+
+""",
+    suffix="{findings}\n\nCommon themes identified: {themes}\n\nResearch gaps and future directions:\n"
+))
+
+SYNTHESIS_QUALITY = register(PromptTemplate(
+    name="synthesis-quality",
+    version="synthesis-quality-v2",
+    prefix="""Evaluate the quality of the research synthesis below on a scale of 0.0 to 1.0.
+
+Evaluation Criteria:
+1. Theme Coherence: Are themes well-defined and distinct?
+2. Contradiction Clarity: Are conflicts clearly explained?
+3. Gap Specificity: Are gaps specific and actionable?
+
+Provide a quality score (0.0-1.0) and brief explanation.
+Format: Score: 0.85 | Explanation: ...
+
+""",
+    suffix="""Common Themes ({theme_count}):
+{themes}
+
+Contradictions ({contradiction_count}):
+{contradictions}
+
+Research Gaps ({gap_count}):
+{gaps}
+
+Evaluation:
+"""
+))
+
+SYNTHESIS_REFINEMENT = register(PromptTemplate(
+    name="synthesis-refinement",
+    version="synthesis-refinement-v2",
+    prefix="""Refine the research synthesis below to improve its quality, following the given strategy.
+
+Provide refined synthesis in JSON format:
+{
+    "themes": ["theme 1", "theme 2", ...],
+    "contradictions": ["contradiction 1", "contradiction 2", ...],
+    "gaps": ["gap 1", "gap 2", ...]
+}
+
+""",
+    suffix="""Current quality: {quality:.2f}
+Strategy: {strategy}
+{focus_instruction}
+
+Current Synthesis:
+Themes: {themes}
+Contradictions: {contradictions}
+Gaps: {gaps}
+
+Refined JSON:
+"""
+))
+
+
+# Coordinator ----------------------------------------------------------------
+
+SEARCH_CONTINUATION = register(PromptTemplate(
+    name="search-continuation",
+    version="search-continuation-v2",
+    prefix="""You are coordinating a research synthesis project.
+Decide from the project status below whether we need to search for more papers.
+
+Consider:
+- Is the number of papers sufficient for a comprehensive review?
+- Are there important subtopics or aspects not yet covered?
+- Is there enough diversity in the papers found?
+
+Answer with:
+Decision (yes/no): Should we search for MORE papers?
+Reasoning: Why or why not?
+
+""",
+    suffix="Research Query: {query}\nPapers Found: {papers_found}\nTopics Covered: {topics}\n\nResponse:\n"
+))
+
+SYNTHESIS_COMPLETENESS = register(PromptTemplate(
+    name="synthesis-completeness",
+    version="synthesis-completeness-v2",
+    prefix="""Evaluate if the research synthesis summarized below is complete and high-quality.
+
+Is this synthesis:
+- Comprehensive enough for a literature review?
+- Well-structured with clear themes?
+- Properly identifying contradictions and gaps?
+
+Answer with:
+Decision (yes/no): Is the synthesis COMPLETE?
+Reasoning: Why or why not?
+
+""",
+    suffix=(
+        "Common Themes: {theme_count} identified\n"
+        "Contradictions: {contradiction_count} found\n"
+        "Research Gaps: {gap_count} identified\n\nResponse:\n"
+    )
+))
+
+
+# Incremental synthesis and insights -----------------------------------------
+
+CONTRADICTION_CHECK = register(PromptTemplate(
+    name="contradiction-check",
+    version="contradiction-v2",
+    prefix="""Determine if the two research findings below contradict each other.
+
+A contradiction exists when:
+1. Both findings address the same topic/phenomenon
+2. They make incompatible claims (one says X, the other says not-X)
+3. The incompatibility is not easily resolved by context or temporal differences
+
+Respond with ONLY "yes" or "no".
+
+""",
+    suffix="Finding A: {finding_a}\n\nFinding B: {finding_b}\n\nAnswer:"
+))
+
+CONTRADICTION_EXPLANATION = register(PromptTemplate(
+    name="contradiction-explanation",
+    version="contradiction-explanation-v2",
+    prefix="""Explain the contradiction between the two research findings below.
+
+Provide a concise 1-2 sentence explanation of the contradiction. Consider:
+- What specific claims conflict?
+- Are there temporal, methodological, or contextual differences?
+- What might explain the disagreement?
+
+""",
+    suffix="Finding A (from {paper_a}): {finding_a}\n\nFinding B (from {paper_b}): {finding_b}\n\nExplanation:"
+))
+
+GAP_APPROACHES = register(PromptTemplate(
+    name="gap-approaches",
+    version="gap-approaches-v2",
+    prefix="""Suggest 2-3 specific research approaches to address the research gap below.
+
+Provide concise, actionable research directions.
+Format as a bulleted list.
+
+""",
+    suffix="Gap: {gap}\n\nApproaches:\n"
+))
@@ -0,0 +1,215 @@
+"""
+Async PubMed Client
+E-utilities search through the history server with paged, off-loop XML parsing
+"""
+
+import io
+import asyncio
+import logging
+import xml.etree.ElementTree as ET
+from dataclasses import dataclass, field
+from typing import Optional, List, AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+EUTILS_BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
+# Articles per efetch request. Typical searches fit in one page, so a search
+# costs esearch plus one efetch; only larger result sets are paged.
+PUBMED_PAGE_SIZE = 200
+
+
+@dataclass
+class PubMedRecord:
+    """One PubMed article"""
+    pmid: str
+    title: str
+    abstract: str
+    authors: List[str] = field(default_factory=list)
+    year: Optional[int] = None
+    journal: Optional[str] = None
+    doi: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"https://pubmed.ncbi.nlm.nih.gov/{self.pmid}/" if self.pmid else ""
+
+
+def _element_text(element: Optional[ET.Element]) -> str:
+    # itertext keeps inline markup such as <i> and <sup> in titles and abstracts
+    if element is None:
+        return ""
+    return " ".join("".join(element.itertext()).split())
+
+
+def _parse_year(article: ET.Element) -> Optional[int]:
+    year = article.findtext(".//Article/Journal/JournalIssue/PubDate/Year")
+    if not year:
+        # Some records only carry a free-text date such as "2019 Spring"
+        medline_date = article.findtext(".//Article/Journal/JournalIssue/PubDate/MedlineDate") or ""
+        year = medline_date[:4]
+    if not year:
+        year = article.findtext(".//ArticleDate/Year")
+    return int(year) if year and year.isdigit() else None
+
+
+def _parse_doi(article: ET.Element) -> Optional[str]:
+    for article_id in article.findall(".//PubmedData/ArticleIdList/ArticleId"):
+        if article_id.get("IdType") == "doi" and article_id.text:
+            return article_id.text.strip()
+    for location in article.findall(".//Article/ELocationID"):
+        if location.get("EIdType") == "doi" and location.text:
+            return location.text.strip()
+    return None
+
+
+def parse_article(article: ET.Element) -> PubMedRecord:
+    """Convert a <PubmedArticle> element into a PubMedRecord"""
+    authors = []
+    for author in article.findall(".//AuthorList/Author"):
+        lastname = author.findtext("LastName")
+        if lastname:
+            forename = author.findtext("ForeName")
+            authors.append(f"{forename} {lastname}" if forename else lastname)
+        elif author.findtext("CollectiveName"):
+            authors.append(author.findtext("CollectiveName"))
+
+    abstract = " ".join(
+        _element_text(section) for section in article.findall(".//Abstract/AbstractText")
+    ).strip()
+
+    journal = (
+        article.findtext(".//Article/Journal/Title")
+        or article.findtext(".//MedlineJournalInfo/MedlineTA")
+    )
+
+    return PubMedRecord(
+        pmid=article.findtext(".//MedlineCitation/PMID") or article.findtext(".//PMID") or "",
+        title=_element_text(article.find(".//ArticleTitle")) or "No title",
+        abstract=abstract or "No abstract available",
+        authors=authors,
+        year=_parse_year(article),
+        journal=journal.strip() if journal else None,
+        doi=_parse_doi(article)
+    )
+
+
+def parse_pubmed_articles(xml_bytes: bytes) -> List[PubMedRecord]:
+    """
+    Stream-parse an efetch response
+
+    Each <PubmedArticle> is converted and then cleared, so memory stays flat
+    regardless of page size. Blocking; run it off the event loop.
+    """
+    records = []
+    root = None
+    for event, element in ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        if element.tag == "PubmedArticle":
+            try:
+                records.append(parse_article(element))
+            except Exception as e:
+                logger.warning(f"Error parsing PubMed article: {e}")
+            element.clear()
+            if root is not None:
+                root.clear()
+    return records
+
+
+class PubMedClient:
+    """
+    Native async client for NCBI E-utilities
+
+    esearch stores the result set on the history server (WebEnv/query_key);
+    efetch then pulls it page by page, and each page is parsed in a worker
+    thread so large XML responses never block the event loop.
+    """
+
+    def __init__(
+        self,
+        http_client,
+        api_key: Optional[str] = None,
+        base_url: str = EUTILS_BASE_URL,
+        page_size: int = PUBMED_PAGE_SIZE,
+        executor=None
+    ):
+        """
+        Initialize PubMed client
+
+        Args:
+            http_client: SourceHTTPClient (or anything with a compatible ``get``)
+            api_key: Optional NCBI API key
+            base_url: E-utilities base URL
+            page_size: Maximum articles per efetch request
+            executor: Executor for XML parsing (default thread pool when None)
+        """
+        self.http_client = http_client
+        self.api_key = api_key
+        self.base_url = base_url
+        self.page_size = page_size
+        self.executor = executor
+
+    def _params(self, **params) -> dict:
+        if self.api_key:
+            params["api_key"] = self.api_key
+        return params
+
+    async def esearch(self, query: str, max_results: int) -> Optional[dict]:
+        """
+        Run esearch with usehistory
+
+        Returns:
+            {"count", "webenv", "query_key"} or None when nothing matched
+        """
+        params = self._params(
+            db="pubmed",
+            term=query,
+            retmax=0,
+            retmode="json",
+            sort="relevance",
+            usehistory="y"
+        )
+        async with self.http_client.get(f"{self.base_url}/esearch.fcgi", params=params) as response:
+            if response.status != 200:
+                raise RuntimeError(f"PubMed esearch returned status {response.status}")
+            result = (await response.json()).get("esearchresult", {})
+
+        count = min(int(result.get("count", 0) or 0), max_results)
+        if not count or not result.get("webenv"):
+            return None
+        return {"count": count, "webenv": result["webenv"], "query_key": result.get("querykey", "1")}
+
+    async def fetch_pages(self, history: dict) -> AsyncIterator[List[PubMedRecord]]:
+        """Fetch and parse a stored result set page by page"""
+        loop = asyncio.get_running_loop()
+        for start in range(0, history["count"], self.page_size):
+            params = self._params(
+                db="pubmed",
+                query_key=history["query_key"],
+                WebEnv=history["webenv"],
+                retstart=start,
+                retmax=min(self.page_size, history["count"] - start),
+                retmode="xml"
+            )
+            async with self.http_client.get(f"{self.base_url}/efetch.fcgi", params=params) as response:
+                if response.status != 200:
+                    raise RuntimeError(f"PubMed efetch returned status {response.status}")
+                body = await response.read()
+            yield await loop.run_in_executor(self.executor, parse_pubmed_articles, body)
+
+    async def search(self, query: str, max_results: int = 20) -> List[PubMedRecord]:
+        """
+        Search PubMed
+
+        Returns:
+            Up to max_results records in relevance order
+        """
+        history = await self.esearch(query, max_results)
+        if history is None:
+            return []
+        records: List[PubMedRecord] = []
+        async for page in self.fetch_pages(history):
+            records.extend(page)
+        return records[:max_results]
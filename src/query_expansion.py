@@ -6,6 +6,7 @@ Intelligently expands search queries using embeddings to find related terms
 from typing import List, Dict, Any
 import logging
 from nim_clients import EmbeddingNIMClient
+from similarity import to_matrix, query_scores
 
 logger = logging.getLogger(__name__)
 
@@ -54,14 +55,17 @@ class QueryExpander:
             input_type="query"
         )
         
-        # Calculate similarity scores
-        similarities = []
-        for candidate, candidate_embedding in zip(expansion_candidates, candidate_embeddings):
-            similarity = self.embedding_client.cosine_similarity(
-                query_embedding,
-                candidate_embedding
-            )
-            similarities.append((candidate, similarity))
+        # Calculate similarity scores (one matrix-vector product, 0-1 scale)
+        scored_candidates = list(zip(expansion_candidates, candidate_embeddings))
+        candidate_matrix = to_matrix(
+            [embedding for _, embedding in scored_candidates],
+            dim=len(query_embedding)
+        )
+        scores = query_scores(query_embedding, candidate_matrix, rescale=True)
+        similarities = [
+            (candidate, float(score))
+            for (candidate, _), score in zip(scored_candidates, scores)
+        ]
         
         # Sort by similarity and take top expansions
         similarities.sort(key=lambda x: x[1], reverse=True)
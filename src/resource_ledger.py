@@ -0,0 +1,130 @@
+"""
+Per-Request Resource Ledger
+Tracks what a single research request cost (NIM calls, tokens, bytes, cache hits, source calls)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ResourceLedger:
+    """Resource totals for one request"""
+    reasoning_calls: int = 0
+    embedding_calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    embedding_tokens: int = 0
+    request_bytes: int = 0
+    response_bytes: int = 0
+    cache_hits: Dict[str, int] = field(default_factory=dict)
+    cache_misses: Dict[str, int] = field(default_factory=dict)
+    source_calls: Dict[str, int] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for API responses"""
+        return {
+            "reasoning_calls": self.reasoning_calls,
+            "embedding_calls": self.embedding_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "embedding_tokens": self.embedding_tokens,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "cache_hits": dict(self.cache_hits),
+            "cache_misses": dict(self.cache_misses),
+            "source_calls": dict(self.source_calls)
+        }
+
+    def totals(self) -> Dict[str, int]:
+        """Flat numeric totals (per-tier and per-source counts summed)"""
+        return {
+            "reasoning_calls": self.reasoning_calls,
+            "embedding_calls": self.embedding_calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "embedding_tokens": self.embedding_tokens,
+            "request_bytes": self.request_bytes,
+            "response_bytes": self.response_bytes,
+            "cache_hits": sum(self.cache_hits.values()),
+            "cache_misses": sum(self.cache_misses.values()),
+            "source_calls": sum(self.source_calls.values())
+        }
+
+
+# Ledger of the request running in the current context. Tasks spawned with
+# asyncio.gather/create_task copy the context, so they share this object.
+_current_ledger: ContextVar[Optional[ResourceLedger]] = ContextVar(
+    "resource_ledger", default=None
+)
+
+
+def get_current_ledger() -> Optional[ResourceLedger]:
+    """Get the ledger of the request running in this context, if any"""
+    return _current_ledger.get()
+
+
+@contextmanager
+def track_resources():
+    """
+    Start a ledger for the enclosed block
+
+    Yields:
+        ResourceLedger collecting everything recorded inside the block
+    """
+    ledger = ResourceLedger()
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+
+
+def record_reasoning_call(
+    prompt_tokens: int = 0,
+    completion_tokens: int = 0,
+    request_bytes: int = 0,
+    response_bytes: int = 0
+):
+    """Record one Reasoning NIM call against the current request"""
+    ledger = _current_ledger.get()
+    if ledger is None:
+        return
+    ledger.reasoning_calls += 1
+    ledger.prompt_tokens += prompt_tokens
+    ledger.completion_tokens += completion_tokens
+    ledger.request_bytes += request_bytes
+    ledger.response_bytes += response_bytes
+
+
+def record_embedding_call(tokens: int = 0, request_bytes: int = 0, response_bytes: int = 0):
+    """Record one Embedding NIM call against the current request"""
+    ledger = _current_ledger.get()
+    if ledger is None:
+        return
+    ledger.embedding_calls += 1
+    ledger.embedding_tokens += tokens
+    ledger.request_bytes += request_bytes
+    ledger.response_bytes += response_bytes
+
+
+def record_cache_lookup(tier: str, hit: bool):
+    """Record a cache hit or miss for a cache tier"""
+    ledger = _current_ledger.get()
+    if ledger is None:
+        return
+    counts = ledger.cache_hits if hit else ledger.cache_misses
+    counts[tier] = counts.get(tier, 0) + 1
+
+
+def record_source_call(source: str):
+    """Record a call to an external paper source"""
+    ledger = _current_ledger.get()
+    if ledger is None:
+        return
+    ledger.source_calls[source] = ledger.source_calls.get(source, 0) + 1
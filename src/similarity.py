@@ -0,0 +1,241 @@
+"""
+Vectorized Similarity Engine
+Shared cosine-similarity helpers over L2-normalized float32 matrices
+"""
+
+from typing import List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def to_matrix(vectors: Sequence[Sequence[float]], dim: Optional[int] = None) -> np.ndarray:
+    """
+    Stack vectors into an L2-normalized float32 matrix
+
+    Rows that are empty, have the wrong dimension or have zero norm are left
+    as zero rows so they score 0 against everything.
+
+    Args:
+        vectors: Embedding vectors (lists or arrays)
+        dim: Expected dimension (inferred from the first non-empty vector if omitted)
+
+    Returns:
+        Matrix of shape (len(vectors), dim)
+    """
+    if dim is None:
+        dim = next((len(v) for v in vectors if v is not None and len(v) > 0), 0)
+
+    matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+    for i, vector in enumerate(vectors):
+        if vector is not None and len(vector) == dim and dim > 0:
+            matrix[i] = vector
+
+    return _normalize_rows(matrix)
+
+
+def normalize(vector: Sequence[float]) -> np.ndarray:
+    """L2-normalize a single vector as float32 (zero vector stays zero)"""
+    arr = np.asarray(vector, dtype=np.float32).reshape(-1)
+    norm = np.linalg.norm(arr)
+    if norm == 0:
+        return arr
+    return arr / norm
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+def valid_rows(matrix: np.ndarray) -> np.ndarray:
+    """Boolean mask of rows that hold a real (non-zero) vector"""
+    return np.any(matrix != 0, axis=1)
+
+
+def to_unit_interval(scores: np.ndarray) -> np.ndarray:
+    """Rescale cosine scores from [-1, 1] to [0, 1] (EmbeddingNIMClient convention)"""
+    return (scores + 1.0) / 2.0
+
+
+def query_scores(
+    query: Sequence[float],
+    matrix: np.ndarray,
+    rescale: bool = False
+) -> np.ndarray:
+    """
+    Cosine similarity of one query against every row in a single matrix-vector product
+
+    Args:
+        query: Query embedding
+        matrix: Normalized matrix from to_matrix()
+        rescale: Map scores to [0, 1] like EmbeddingNIMClient.cosine_similarity
+            (invalid rows score 0.0)
+
+    Returns:
+        Array of scores, one per row
+    """
+    if matrix.shape[0] == 0:
+        return np.zeros(0, dtype=np.float32)
+
+    q = normalize(query)
+    if q.shape[0] != matrix.shape[1] or not q.any():
+        return np.zeros(matrix.shape[0], dtype=np.float32)
+
+    scores = matrix @ q
+    if rescale:
+        scores = np.where(valid_rows(matrix), to_unit_interval(scores), 0.0).astype(np.float32)
+    return scores
+
+
+def pairwise_scores(matrix: np.ndarray) -> np.ndarray:
+    """All-pairs cosine similarity (n x n) in one matrix product"""
+    return matrix @ matrix.T
+
+
+def pairs_above(matrix: np.ndarray, threshold: float) -> List[Tuple[int, int, float]]:
+    """
+    Find all pairs (i < j) whose cosine similarity is at least threshold
+
+    Args:
+        matrix: Normalized matrix from to_matrix()
+        threshold: Raw cosine threshold in [-1, 1]
+
+    Returns:
+        List of (i, j, score) tuples ordered by i then j
+    """
+    n = matrix.shape[0]
+    if n < 2:
+        return []
+
+    scores = pairwise_scores(matrix)
+    mask = np.triu(scores >= threshold, k=1)
+    valid = valid_rows(matrix)
+    mask &= valid[:, None] & valid[None, :]
+
+    rows, cols = np.nonzero(mask)
+    return [(int(i), int(j), float(scores[i, j])) for i, j in zip(rows, cols)]
+
+
+def greedy_duplicates(matrix: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Mark rows that duplicate an earlier, kept row (keep-first semantics)
+
+    Args:
+        matrix: Normalized matrix from to_matrix()
+        threshold: Raw cosine threshold in [-1, 1]
+
+    Returns:
+        Boolean array, True for rows to drop
+    """
+    n = matrix.shape[0]
+    removed = np.zeros(n, dtype=bool)
+    if n < 2:
+        return removed
+
+    scores = pairwise_scores(matrix)
+    valid = valid_rows(matrix)
+    for i in range(n - 1):
+        if removed[i] or not valid[i]:
+            continue
+        removed[i + 1:] |= (scores[i, i + 1:] >= threshold) & valid[i + 1:]
+
+    return removed
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores, best first, using argpartition
+
+    Args:
+        scores: 1-D score array
+        k: Number of indices to return
+
+    Returns:
+        Index array of length min(k, len(scores))
+    """
+    n = scores.shape[0]
+    if k <= 0 or n == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k >= n:
+        return np.argsort(-scores, kind="stable")
+
+    candidates = np.argpartition(-scores, k - 1)[:k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def top_k_above(scores: np.ndarray, threshold: float, k: int) -> np.ndarray:
+    """
+    Indices of the k highest scores at or above threshold, best first
+
+    Args:
+        scores: 1-D score array
+        threshold: Minimum score (inclusive)
+        k: Number of indices to return
+
+    Returns:
+        Index array (into scores) of length <= k
+    """
+    passing = np.flatnonzero(scores >= threshold)
+    return passing[top_k(scores[passing], k)]
+
+
+class EmbeddingMatrix:
+    """
+    Growable L2-normalized float32 matrix for incremental workloads
+
+    Rows are appended in batches (capacity doubles as needed) so callers can
+    score new vectors against everything seen so far without rebuilding.
+    """
+
+    def __init__(self, dim: Optional[int] = None, capacity: int = 64):
+        self.dim = dim
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """View of the populated rows"""
+        if self._data is None:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        return self._data[:self._size]
+
+    def extend(self, vectors: Sequence[Sequence[float]]):
+        """Append vectors (normalized on the way in)"""
+        if not vectors:
+            return
+
+        rows = to_matrix(vectors, self.dim)
+        if self.dim is None:
+            self.dim = rows.shape[1]
+        if self._data is None:
+            self._data = np.zeros((max(self._capacity, len(rows)), self.dim), dtype=np.float32)
+
+        needed = self._size + len(rows)
+        if needed > self._data.shape[0]:
+            grown = np.zeros((max(needed, self._data.shape[0] * 2), self.dim), dtype=np.float32)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+
+        self._data[self._size:needed] = rows
+        self._size = needed
+
+    def set_row(self, index: int, vector: Sequence[float]):
+        """Overwrite one stored row (normalized on the way in)"""
+        self._data[index] = to_matrix([vector], self.dim)[0]
+
+    def scores(self, query: Sequence[float], rescale: bool = False) -> np.ndarray:
+        """Score a query against every stored row"""
+        return query_scores(query, self.matrix, rescale=rescale)
+
+    def top_k(self, query: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """(row index, raw cosine score) for the k most similar rows, best first"""
+        scores = self.scores(query)
+        return [(int(i), float(scores[i])) for i in top_k(scores, k)]
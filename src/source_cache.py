@@ -0,0 +1,262 @@
+"""
+Per-Source Search Result Cache
+Stale-while-revalidate caching of paper source searches with negative caching
+"""
+
+import os
+import re
+import time
+import asyncio
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, List, Callable, Awaitable, Set
+
+from cache import Cache, get_cache
+from constants import (
+    SOURCE_CACHE_TTL_SECONDS,
+    SOURCE_CACHE_DEFAULT_TTL_SECONDS,
+    SOURCE_CACHE_STALE_SECONDS,
+    SOURCE_CACHE_EMPTY_TTL_SECONDS,
+    SOURCE_CACHE_ERROR_TTL_SECONDS
+)
+
+logger = logging.getLogger(__name__)
+
+# Fields kept when a paper is cached (no embeddings or full text)
+PAPER_RECORD_FIELDS = ("id", "title", "authors", "abstract", "url", "year", "venue", "doi")
+
+# Outcome of the source search running in the current context
+_fetch_outcome: ContextVar[Optional[Dict[str, Any]]] = ContextVar("source_fetch_outcome", default=None)
+
+
+def mark_source_failure(reason: str = ""):
+    """
+    Flag the current source search as failed
+
+    Source searches degrade to fallback results instead of raising; calling
+    this from those paths makes the cache store the result as a short-lived
+    error entry instead of a normal one. Enclosing outcomes are flagged too.
+    """
+    outcome = _fetch_outcome.get()
+    while outcome is not None:
+        outcome["failed"] = True
+        outcome["reason"] = reason
+        outcome = outcome.get("parent")
+
+
+@contextmanager
+def source_outcome():
+    """
+    Track whether the source search run inside the block failed
+
+    Yields:
+        Dict whose "failed" flag is set by mark_source_failure
+    """
+    outcome = {"failed": False, "reason": "", "parent": _fetch_outcome.get()}
+    token = _fetch_outcome.set(outcome)
+    try:
+        yield outcome
+    finally:
+        _fetch_outcome.reset(token)
+
+
+def normalize_query(query: str) -> str:
+    """Lowercase and collapse whitespace so trivially different queries share entries"""
+    return re.sub(r"\s+", " ", query.strip().lower())
+
+
+def paper_to_record(paper: Any) -> Dict[str, Any]:
+    """Convert a Paper into a compact JSON-safe record"""
+    record = {field: getattr(paper, field, None) for field in PAPER_RECORD_FIELDS}
+    record["authors"] = list(record["authors"] or [])
+    return record
+
+
+class SourceSearchCache:
+    """
+    Cache for (source, query, params) search results
+
+    Entries are fresh for the source's TTL, then served stale for
+    SOURCE_CACHE_STALE_SECONDS while one background refresh runs. Empty
+    results and failures are cached briefly so a dead source is not hit on
+    every request. Concurrent identical misses share one live fetch.
+    """
+
+    def __init__(
+        self,
+        cache: Cache,
+        paper_factory: Optional[Callable[..., Any]] = None,
+        metrics=None
+    ):
+        """
+        Initialize source search cache
+
+        Args:
+            cache: Backing cache (Redis or in-memory)
+            paper_factory: Builds a paper object from a record (defaults to dicts)
+            metrics: Optional metrics collector for hit/miss counts
+        """
+        self.cache = cache
+        self.prefix = "source_search"
+        self.paper_factory = paper_factory
+        self.metrics = metrics
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._refreshing: Set[str] = set()
+        self._background: Set[asyncio.Task] = set()
+
+    def make_key(self, source: str, query: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for a normalized query and source parameters"""
+        return self.cache._generate_key(self.prefix, source, normalize_query(query), **(params or {}))
+
+    def _fresh_ttl(self, source: str) -> int:
+        env_name = f"SOURCE_CACHE_TTL_{source.upper()}"
+        default = SOURCE_CACHE_TTL_SECONDS.get(source, SOURCE_CACHE_DEFAULT_TTL_SECONDS)
+        return int(os.getenv(env_name, default))
+
+    def _to_papers(self, records: List[Dict[str, Any]]) -> List[Any]:
+        if self.paper_factory is None:
+            return [dict(record) for record in records]
+        return [self.paper_factory(**record) for record in records]
+
+    def _record_lookup(self, hit: bool):
+        if self.metrics:
+            if hit:
+                self.metrics.record_cache_hit("source_search")
+            else:
+                self.metrics.record_cache_miss("source_search")
+
+    async def fetch(
+        self,
+        source: str,
+        query: str,
+        search: Callable[[str], Awaitable[List[Any]]],
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """
+        Return cached results for a source search, fetching live on a miss
+
+        Args:
+            source: Source name (e.g. "arxiv")
+            query: Search query as sent to the source
+            search: Coroutine function performing the live search for a query
+            params: Extra source parameters that change the results
+
+        Returns:
+            List of papers
+        """
+        key = self.make_key(source, query, params)
+        entry = self.cache.get(key)
+        now = time.time()
+
+        if entry is not None:
+            self._record_lookup(hit=True)
+            if entry.get("failed"):
+                mark_source_failure("cached failure")
+            if now >= entry["fresh_until"] and key not in self._refreshing:
+                # Serve stale, refresh in the background
+                self._refreshing.add(key)
+                task = asyncio.create_task(self._refresh(key, source, query, search))
+                self._background.add(task)
+                task.add_done_callback(self._background.discard)
+            return self._to_papers(entry["papers"])
+
+        self._record_lookup(hit=False)
+
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            records, failed = await asyncio.shield(pending)
+            if failed:
+                mark_source_failure("shared failed fetch")
+            return self._to_papers(records)
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            with source_outcome() as outcome:
+                records = await self._fetch_live(key, source, query, search)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise; make sure an unobserved future does not warn
+            future.exception()
+            raise
+        else:
+            future.set_result((records, outcome["failed"]))
+        finally:
+            self._in_flight.pop(key, None)
+
+        return self._to_papers(records)
+
+    async def _refresh(self, key: str, source: str, query: str, search):
+        try:
+            await self._fetch_live(key, source, query, search, keep_on_failure=True)
+        except Exception as e:
+            logger.warning(f"Background refresh failed for {source} '{query}': {e}")
+        finally:
+            self._refreshing.discard(key)
+
+    async def _fetch_live(
+        self,
+        key: str,
+        source: str,
+        query: str,
+        search,
+        keep_on_failure: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Run the live search and store the outcome"""
+        with source_outcome() as outcome:
+            try:
+                papers = await search(query)
+            except Exception:
+                outcome["failed"] = True
+                if not keep_on_failure:
+                    self._store(key, [], SOURCE_CACHE_ERROR_TTL_SECONDS, serve_stale=False, failed=True)
+                raise
+
+        records = [paper_to_record(paper) for paper in papers or []]
+        if outcome["failed"]:
+            if keep_on_failure:
+                # A stale good entry beats a fresh error entry
+                return records
+            logger.info(f"Caching failed {source} search briefly: {outcome['reason'] or 'fallback used'}")
+            self._store(key, records, SOURCE_CACHE_ERROR_TTL_SECONDS, serve_stale=False, failed=True)
+        elif not records:
+            self._store(key, records, SOURCE_CACHE_EMPTY_TTL_SECONDS, serve_stale=False)
+        else:
+            self._store(key, records, self._fresh_ttl(source), serve_stale=True)
+        return records
+
+    def _store(
+        self,
+        key: str,
+        records: List[Dict[str, Any]],
+        fresh_ttl: int,
+        serve_stale: bool,
+        failed: bool = False
+    ):
+        # Negative entries simply expire; only good results are served stale
+        stale = SOURCE_CACHE_STALE_SECONDS if serve_stale else 0
+        entry = {"papers": records, "fresh_until": time.time() + fresh_ttl, "failed": failed}
+        self.cache.set(key, entry, fresh_ttl + stale)
+
+
+# Global source search cache instance
+_source_cache: Optional[SourceSearchCache] = None
+
+
+def get_source_cache(paper_factory: Optional[Callable[..., Any]] = None) -> SourceSearchCache:
+    """Get global source search cache (shares the Redis/memory tiers)"""
+    global _source_cache
+    if _source_cache is None:
+        try:
+            from metrics import get_metrics_collector
+            metrics = get_metrics_collector()
+        except ImportError:
+            metrics = None
+        _source_cache = SourceSearchCache(get_cache(), paper_factory=paper_factory, metrics=metrics)
+    elif paper_factory is not None and _source_cache.paper_factory is None:
+        _source_cache.paper_factory = paper_factory
+    return _source_cache
@@ -0,0 +1,322 @@
+"""
+External Paper Source HTTP Client
+Pooled HTTP client for literature APIs with per-host rate limiting and queueing
+"""
+
+import os
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from config import PaperSourceConfig
+from deadline import get_current_deadline, parse_retry_after, MAX_RETRY_AFTER_SECONDS
+from constants import (
+    SOURCE_HTTP_RATE_LIMITS,
+    SOURCE_HTTP_KEYED_RATE_LIMITS,
+    SOURCE_HTTP_DEFAULT_RATE,
+    SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST,
+    SOURCE_HTTP_POOL_SIZE,
+    SOURCE_HTTP_THROTTLE_RETRIES
+)
+
+logger = logging.getLogger(__name__)
+
+# Which API key raises each host's rate limit
+HOST_API_KEYS = {
+    "eutils.ncbi.nlm.nih.gov": "pubmed_api_key",
+    "api.semanticscholar.org": "semantic_scholar_api_key",
+    "ieeexploreapi.ieee.org": "ieee_api_key",
+    "api.acm.org": "acm_api_key",
+    "api.springernature.com": "springer_api_key",
+}
+
+
+@dataclass
+class HostLimit:
+    """Rate and concurrency allowance for one host"""
+    rate: float  # Requests per second
+    burst: int
+    max_concurrent: int
+
+
+def host_limits_from_config(config: PaperSourceConfig) -> Dict[str, HostLimit]:
+    """
+    Build per-host limits, using the keyed rates for hosts whose API key is set
+
+    Rates can be overridden per host with SOURCE_RATE_LIMIT_<HOST> (dots and
+    dashes become underscores, e.g. SOURCE_RATE_LIMIT_API_CROSSREF_ORG).
+    """
+    max_concurrent = int(os.getenv("SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST", SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST))
+    limits = {}
+    for host, rate in SOURCE_HTTP_RATE_LIMITS.items():
+        key_field = HOST_API_KEYS.get(host)
+        if key_field and getattr(config, key_field, None):
+            rate = SOURCE_HTTP_KEYED_RATE_LIMITS.get(host, rate)
+        env_name = "SOURCE_RATE_LIMIT_" + host.upper().replace(".", "_").replace("-", "_")
+        rate = float(os.getenv(env_name, rate))
+        limits[host] = HostLimit(rate=rate, burst=max(1, int(rate)), max_concurrent=max_concurrent)
+    return limits
+
+
+def default_host_limit() -> HostLimit:
+    """
+    Limit for hosts without their own entry
+
+    The rate can be overridden with SOURCE_HTTP_DEFAULT_RATE and the
+    concurrency with SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST, as for known hosts.
+    """
+    rate = float(os.getenv("SOURCE_HTTP_DEFAULT_RATE", SOURCE_HTTP_DEFAULT_RATE))
+    max_concurrent = int(os.getenv("SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST", SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST))
+    return HostLimit(rate=rate, burst=max(1, int(rate)), max_concurrent=max_concurrent)
+
+
+class TokenBucket:
+    """
+    Token bucket that queues callers instead of rejecting them
+
+    Waiters are served in arrival order. pause() empties the bucket until a
+    given time, used when a host answers 429 with Retry-After.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting for it if necessary
+
+        Returns:
+            Seconds spent waiting
+        """
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self._refill(now)
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return time.monotonic() - start
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the given number of seconds"""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0.0
+        self.updated = time.monotonic()
+
+
+class HostLimiter:
+    """Token bucket plus concurrency cap for one host"""
+
+    def __init__(self, limit: HostLimit):
+        self.limit = limit
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+        self.semaphore = asyncio.Semaphore(limit.max_concurrent)
+
+    async def acquire(self) -> float:
+        """Wait for a concurrency slot and a token; returns total wait"""
+        start = time.monotonic()
+        await self.semaphore.acquire()
+        try:
+            await self.bucket.acquire()
+        except BaseException:
+            self.semaphore.release()
+            raise
+        return time.monotonic() - start
+
+    def release(self):
+        self.semaphore.release()
+
+
+class SourceHTTPClient:
+    """
+    Shared HTTP client for external paper sources
+
+    Keeps literature API traffic off the NIM connection pools. Each host gets
+    a token bucket (higher rates when its API key is configured) and a
+    concurrency cap; requests over the limit wait in line instead of failing.
+    A 429 pauses the host for its Retry-After and the request is retried
+    once if the request deadline allows.
+    """
+
+    DEFAULT_TIMEOUT = aiohttp.ClientTimeout(total=30, connect=10)
+
+    def __init__(
+        self,
+        config: Optional[PaperSourceConfig] = None,
+        session: Optional[aiohttp.ClientSession] = None,
+        metrics=None
+    ):
+        """
+        Initialize source HTTP client
+
+        Args:
+            config: Paper source configuration (API keys select the rate limits)
+            session: Optional externally managed session (not closed by this client)
+            metrics: Optional metrics collector for latency and throttle metrics
+        """
+        self.config = config or PaperSourceConfig.from_env()
+        self.host_limits = host_limits_from_config(self.config)
+        self.default_limit = default_host_limit()
+        self.session = session
+        self._owns_session = session is None
+        self.metrics = metrics
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _bind_loop(self):
+        # Sessions and asyncio primitives belong to one event loop; scripts
+        # that call asyncio.run() repeatedly get fresh ones per loop
+        loop = asyncio.get_running_loop()
+        if loop is self._loop:
+            return
+        previous, self._loop = self._loop, loop
+        self._limiters = {}
+        if self._owns_session and self.session is not None:
+            stale, self.session = self.session, None
+            await self._close_stale_session(stale, previous)
+
+    @staticmethod
+    async def _close_stale_session(session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]):
+        """Close a session left behind by an earlier event loop"""
+        if session.closed:
+            return
+        try:
+            if loop is not None and loop.is_running():
+                # Still serving another thread: close it on its own loop
+                asyncio.run_coroutine_threadsafe(session.close(), loop)
+            else:
+                # Finished loop (e.g. an earlier asyncio.run): release the
+                # connector and mark the session closed from here
+                await session.close()
+        except Exception as e:
+            logger.debug(f"Failed to close stale source HTTP session: {e}")
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or (self._owns_session and self.session.closed):
+            self.session = aiohttp.ClientSession(
+                timeout=self.DEFAULT_TIMEOUT,
+                connector=aiohttp.TCPConnector(
+                    limit=int(os.getenv("SOURCE_HTTP_POOL_SIZE", SOURCE_HTTP_POOL_SIZE)),
+                    limit_per_host=int(os.getenv(
+                        "SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST", SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST
+                    )),
+                    ttl_dns_cache=300
+                )
+            )
+            self._owns_session = True
+        return self.session
+
+    def limiter_for(self, host: str) -> HostLimiter:
+        """Get (or create) the limiter for a host"""
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = HostLimiter(self.host_limits.get(host, self.default_limit))
+            self._limiters[host] = limiter
+        return limiter
+
+    def _record(self, method: str, *args):
+        if self.metrics is None:
+            return
+        try:
+            getattr(self.metrics, method)(*args)
+        except Exception as e:
+            logger.debug(f"Failed to record source HTTP metric: {e}")
+
+    @asynccontextmanager
+    async def get(self, url: str, **kwargs: Any):
+        """
+        Rate-limited GET, used like ``session.get``
+
+        Yields:
+            aiohttp response
+        """
+        await self._bind_loop()
+        host = urlsplit(url).hostname or ""
+        limiter = self.limiter_for(host)
+
+        for attempt in range(SOURCE_HTTP_THROTTLE_RETRIES + 1):
+            waited = await limiter.acquire()
+            if waited > 0.01:
+                self._record("record_source_throttled", host, "queued")
+            self._record("record_source_queue_wait", host, waited)
+            try:
+                start = time.monotonic()
+                async with self._get_session().get(url, **kwargs) as response:
+                    self._record("record_source_request", host, response.status, time.monotonic() - start)
+                    if response.status == 429:
+                        self._record("record_source_throttled", host, "rate_limited")
+                        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+                        if retry_after is None:
+                            retry_after = 1.0 / limiter.limit.rate
+                        retry_after = min(retry_after, MAX_RETRY_AFTER_SECONDS)
+                        limiter.bucket.pause(retry_after)
+                        deadline = get_current_deadline()
+                        can_wait = deadline is None or deadline.covers(retry_after + 1)
+                        if attempt < SOURCE_HTTP_THROTTLE_RETRIES and can_wait:
+                            logger.info(f"{host} returned 429, retrying in {retry_after:.1f}s")
+                            continue
+                    yield response
+                    return
+            finally:
+                limiter.release()
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per-host limits and current token levels"""
+        return {
+            host: {
+                "rate": limiter.limit.rate,
+                "max_concurrent": limiter.limit.max_concurrent,
+                "tokens": round(limiter.bucket.tokens, 2)
+            }
+            for host, limiter in self._limiters.items()
+        }
+
+    async def close(self):
+        """Close the pooled session if this client created it"""
+        if self._owns_session and self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
+
+
+# Global source HTTP client instance
+_source_http_client: Optional[SourceHTTPClient] = None
+
+
+def get_source_http_client() -> SourceHTTPClient:
+    """Get global source HTTP client (one pool and rate limiter set per process)"""
+    global _source_http_client
+    if _source_http_client is None:
+        try:
+            from metrics import get_metrics_collector
+            metrics = get_metrics_collector()
+        except ImportError:
+            metrics = None
+        _source_http_client = SourceHTTPClient(metrics=metrics)
+    return _source_http_client
+
+
+async def close_source_http_client():
+    """Close the global source HTTP client if one was created"""
+    global _source_http_client
+    if _source_http_client is not None:
+        await _source_http_client.close()
+        _source_http_client = None
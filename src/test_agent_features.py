@@ -29,7 +29,10 @@ class TestScoutAgentFeatures:
         """Create ScoutAgent with mock embedding client"""
         mock_client = Mock()
         mock_client.embed = AsyncMock(return_value=[0.1] * 1024)
-        mock_client.embed_batch = AsyncMock(return_value=[[0.1] * 1024] * 3)
+        # Abstract embeddings close to the query but distinct from each other
+        mock_client.embed_batch = AsyncMock(return_value=[
+            [0.1] * i + [2.0] + [0.1] * (1023 - i) for i in range(3)
+        ])
         mock_client.cosine_similarity = Mock(return_value=0.85)
         return ScoutAgent(mock_client)
 
@@ -83,27 +86,7 @@ class TestScoutAgentFeatures:
         # Add mock embeddings to papers (required for deduplication)
         papers[0].embedding = [0.1] * 1024  # p1 embedding
         papers[1].embedding = [0.1] * 1024  # p2 embedding (same as p1 - will be duplicate)
-        papers[2].embedding = [0.9] * 1024  # p3 embedding (different - will be kept)
-
-        # Mock cosine_similarity to return high similarity for p1 vs p2, low for others
-        def mock_similarity(emb1, emb2):
-            # Check if comparing p1 and p2 (both have [0.1] * 1024)
-            if emb1 == papers[0].embedding and emb2 == papers[1].embedding:
-                return 0.95
-            # Check if comparing p1 and p3
-            if (emb1 == papers[0].embedding and emb2 == papers[2].embedding) or \
-               (emb1 == papers[2].embedding and emb2 == papers[0].embedding):
-                return 0.3
-            # Check if comparing p2 and p3
-            if (emb1 == papers[1].embedding and emb2 == papers[2].embedding) or \
-               (emb1 == papers[2].embedding and emb2 == papers[1].embedding):
-                return 0.3
-            # Same embeddings = high similarity
-            if emb1 == emb2:
-                return 1.0
-            return 0.5  # default
-        
-        scout_agent.embedding_client.cosine_similarity = mock_similarity
+        papers[2].embedding = [0.9, -0.9] * 512  # p3 embedding (orthogonal - will be kept)
 
         deduplicated = await scout_agent._deduplicate_papers(papers)
 
@@ -13,7 +13,7 @@ import asyncio
 from unittest.mock import Mock, AsyncMock, patch
 from agents import (
     ScoutAgent, AnalystAgent, SynthesizerAgent, CoordinatorAgent,
-    ResearchOpsAgent, Paper, Analysis, Synthesis
+    ResearchOpsAgent, Paper, Analysis, Synthesis, SearchProgress
 )
 
 
@@ -78,6 +78,111 @@ async def test_scout_agent_search(mock_embedding_client):
         assert mock_pubmed.called
 
 
+def make_streaming_scout(mock_embedding_client, fast_count=3):
+    """Scout with a fast arXiv source and a slow PubMed source"""
+    scout = ScoutAgent(mock_embedding_client)
+    for source in ("semantic_scholar", "crossref", "ieee", "acm", "springer"):
+        setattr(scout.source_config, f"enable_{source}", False)
+    scout.source_config.enable_arxiv = True
+    scout.source_config.enable_pubmed = True
+    mock_embedding_client.embed_batch = AsyncMock(
+        side_effect=lambda texts, input_type: [[0.1] * 1024 for _ in texts]
+    )
+
+    async def fast(query):
+        return [
+            Paper(id=f"arxiv-{i}", title="T", authors=[], abstract=f"A{i}", url="")
+            for i in range(fast_count)
+        ]
+
+    async def slow(query):
+        await asyncio.sleep(5)
+        return [Paper(id="pubmed-1", title="T", authors=[], abstract="B", url="")]
+
+    scout._search_arxiv = fast
+    scout._search_pubmed = slow
+    return scout
+
+
+@pytest.mark.asyncio
+async def test_scout_search_stream_stops_early(mock_embedding_client, monkeypatch):
+    """Test streaming search yields the fast source first and cancels the rest once enough papers are relevant"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.5")
+    scout = make_streaming_scout(mock_embedding_client, fast_count=4)
+
+    updates = [
+        progress async for progress in
+        scout.search_stream("q", max_papers=2, use_query_expansion=False)
+    ]
+
+    assert updates[0].source == "arxiv"
+    assert len(updates[0].top_papers) == 2
+    assert updates[-1].done and updates[-1].stopped_early
+    assert updates[-1].sources_done == 1
+    assert all(p.embedding is not None for p in updates[0].new_papers)
+
+
+@pytest.mark.asyncio
+async def test_scout_search_drops_sources_over_latency_budget(mock_embedding_client, monkeypatch):
+    """Test a source slower than its latency budget is skipped instead of delaying the search"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.5")
+    monkeypatch.setenv("SOURCE_LATENCY_BUDGET_SECONDS", "0.05")
+    scout = make_streaming_scout(mock_embedding_client, fast_count=1)
+    progress_events = []
+
+    async def on_progress(progress):
+        progress_events.append(progress)
+
+    results = await scout.search("q", max_papers=5, use_query_expansion=False, on_progress=on_progress)
+
+    assert [p.id for p in results] == ["arxiv-0"]
+    assert [event.sources_done for event in progress_events] == [1, 2]
+    assert any(d["decision_type"] == "RELEVANCE_FILTERING" for d in scout.decision_log.get_decisions())
+
+
+@pytest.mark.asyncio
+async def test_scout_ranks_by_score_and_keeps_scores_on_papers(mock_embedding_client, monkeypatch):
+    """Test the top-k is ordered by relevance and each paper carries its score"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.6")
+    scout = make_streaming_scout(mock_embedding_client, fast_count=4)
+    mock_embedding_client.embed = AsyncMock(return_value=[1.0, 0.0])
+    # Rescaled scores: 0.5, 1.0, 0.85, 0.55
+    mock_embedding_client.embed_batch = AsyncMock(return_value=[[0.0, 1.0], [1.0, 0.0], [1.0, 1.0], [0.1, 1.0]])
+    scout.source_config.enable_pubmed = False
+
+    updates = [u async for u in scout.search_stream("q", max_papers=5, use_query_expansion=False)]
+
+    assert [p.id for p in updates[-1].top_papers] == ["arxiv-1", "arxiv-2"]
+    assert updates[-1].relevant_count == 2
+    assert [p.relevance_score for p in updates[-1].top_papers] == pytest.approx([1.0, 0.8536], abs=1e-3)
+    assert updates[0].new_papers[0].relevance_score == pytest.approx(0.5)
+
+
+@pytest.mark.asyncio
+async def test_scout_merges_cross_source_duplicates_before_embedding(mock_embedding_client, monkeypatch):
+    """Test the same paper from two sources is embedded once and reported"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.5")
+    scout = make_streaming_scout(mock_embedding_client)
+
+    async def arxiv(query):
+        return [Paper(id="arxiv-2401.01234v1", title="Graph Neural Networks for Drug Discovery",
+                      authors=[], abstract="A", url="http://arxiv.org/abs/2401.01234v1")]
+
+    async def pubmed(query):
+        return [Paper(id="pubmed-1", title="Graph neural networks for drug discovery",
+                      authors=[], abstract="B", url="", doi="10.48550/arXiv.2401.01234")]
+
+    scout._search_arxiv = arxiv
+    scout._search_pubmed = pubmed
+
+    results = await scout.search("q", max_papers=5, use_query_expansion=False)
+
+    assert [p.id for p in results] == ["arxiv-2401.01234v1"] or [p.id for p in results] == ["pubmed-1"]
+    embedded = sum(len(call.args[0]) for call in mock_embedding_client.embed_batch.call_args_list)
+    assert embedded == 1
+    assert any(d["decision_type"] == "IDENTITY_RESOLUTION" for d in scout.decision_log.get_decisions())
+
+
 @pytest.mark.asyncio
 async def test_analyst_agent_analyze(mock_reasoning_client, sample_paper):
     """Test AnalystAgent analyze functionality"""
@@ -91,6 +196,58 @@ async def test_analyst_agent_analyze(mock_reasoning_client, sample_paper):
     assert mock_reasoning_client.extract_structured.called
 
 
+@pytest.mark.asyncio
+async def test_analyst_packed_analysis_retries_only_bad_elements(mock_reasoning_client):
+    """Test one completion covers the group and only the malformed element is re-analyzed"""
+    papers = [
+        Paper(id=f"arxiv-{i}", title=f"Paper {i}", authors=["A"], abstract="Abstract", url="")
+        for i in range(3)
+    ]
+    mock_reasoning_client.complete = AsyncMock(return_value=(
+        '[{"paper_id": "arxiv-0", "methodology": "Packed", "key_findings": ["F0"]}, '
+        '{"paper_id": "arxiv-1", "methodology": "Broken", "key_findings": [}, '
+        '{"paper_id": "arxiv-2", "methodology": "Packed", "key_findings": ["F2"]}]'
+    ))
+    analyst = AnalystAgent(mock_reasoning_client)
+
+    analyses = await analyst.analyze_packed(papers)
+
+    assert [a.paper_id for a in analyses] == ["arxiv-0", "arxiv-1", "arxiv-2"]
+    assert [a.methodology for a in analyses] == ["Packed", "Test methodology", "Packed"]
+    assert mock_reasoning_client.complete.await_count == 1
+    assert mock_reasoning_client.extract_structured.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_analyst_packed_analysis_keeps_group_when_one_retry_fails(mock_reasoning_client):
+    """Test a failing individual retry only empties that paper's analysis"""
+    papers = [
+        Paper(id=f"arxiv-{i}", title=f"Paper {i}", authors=["A"], abstract="Abstract", url="")
+        for i in range(2)
+    ]
+    mock_reasoning_client.complete = AsyncMock(return_value=(
+        '[{"paper_id": "arxiv-0", "methodology": "Packed", "key_findings": ["F0"]}]'
+    ))
+    mock_reasoning_client.extract_structured = AsyncMock(side_effect=RuntimeError("NIM down"))
+    analyst = AnalystAgent(mock_reasoning_client)
+
+    analyses = await analyst.analyze_packed(papers)
+
+    assert [a.paper_id for a in analyses] == ["arxiv-0", "arxiv-1"]
+    assert analyses[0].methodology == "Packed"
+    assert analyses[1].methodology == "" and analyses[1].key_findings == []
+
+
+def test_analyst_pack_papers_adapts_to_abstract_length():
+    """Test long abstracts get smaller groups"""
+    short = [Paper(id=f"s-{i}", title="T", authors=[], abstract="x" * 400, url="") for i in range(5)]
+    long = [Paper(id=f"l-{i}", title="T", authors=[], abstract="x" * 4000, url="") for i in range(3)]
+
+    groups = AnalystAgent.pack_papers(short + long, max_papers=4, token_budget=1200)
+
+    assert [len(group) for group in groups] == [4, 2, 1, 1]
+
+
 @pytest.mark.asyncio
 async def test_synthesizer_agent_synthesize(mock_reasoning_client, mock_embedding_client):
     """Test SynthesizerAgent synthesize functionality"""
@@ -205,6 +362,77 @@ async def test_research_ops_agent_run(mock_reasoning_client, mock_embedding_clie
         assert isinstance(result["decisions"], list)
 
 
+@pytest.mark.asyncio
+async def test_pipelined_run_analyzes_papers_while_search_streams(mock_reasoning_client, mock_embedding_client, monkeypatch):
+    """Test papers are analyzed before the search ends and displaced papers are dropped"""
+    monkeypatch.setenv("ANALYSIS_PACK_SIZE", "1")
+    agent = ResearchOpsAgent(mock_reasoning_client, mock_embedding_client)
+    agent.analysis_store = None
+    agent.coordinator.should_search_more = AsyncMock(return_value=False)
+    mock_embedding_client.embed_batch = AsyncMock(side_effect=lambda texts, input_type: [[0.1] * 4 for _ in texts])
+    papers = {i: Paper(id=f"p{i}", title=f"Paper {i}", authors=[], abstract="A", url="") for i in (1, 2, 3)}
+    first_analysis_started = asyncio.Event()
+
+    async def analyze(paper):
+        first_analysis_started.set()
+        return Analysis(paper_id=paper.id, research_question="Q", methodology="M",
+                        key_findings=[f"F{paper.id}"], limitations=[], confidence=0.8)
+
+    async def search(query, max_papers, on_progress=None, start_year=None, end_year=None):
+        await on_progress(SearchProgress(
+            source="arxiv", new_papers=[papers[1], papers[2]], top_papers=[papers[1], papers[2]],
+            candidates_seen=2, relevant_count=2, sources_done=1, sources_total=2
+        ))
+        # The slow source is still pending while the first papers are analyzed
+        await asyncio.wait_for(first_analysis_started.wait(), timeout=1)
+        return [papers[1], papers[3]]
+
+    agent.scout.search = search
+    agent.analyst.analyze = AsyncMock(side_effect=analyze)
+
+    found, analyses, quality_scores, finding_embeddings = await agent._execute_pipelined_phases("q", 2)
+
+    assert [p.id for p in found] == ["p1", "p3"]
+    assert [a.paper_id for a in analyses] == ["p1", "p3"]
+    assert {c.args[0].id for c in agent.analyst.analyze.await_args_list} == {"p1", "p2", "p3"}
+    assert len(quality_scores) == 2
+    assert finding_embeddings == [[0.1] * 4, [0.1] * 4]
+
+
+@pytest.mark.asyncio
+async def test_pipelined_quality_scores_stay_aligned_with_papers(mock_reasoning_client, mock_embedding_client, monkeypatch):
+    """Test a failed quality assessment does not shift later scores onto other papers"""
+    monkeypatch.setenv("ANALYSIS_PACK_SIZE", "1")
+    agent = ResearchOpsAgent(mock_reasoning_client, mock_embedding_client)
+    agent.analysis_store = None
+    mock_embedding_client.embed_batch = AsyncMock(side_effect=lambda texts, input_type: [[0.1] * 4 for _ in texts])
+    papers = [Paper(id=f"p{i}", title=f"Paper {i}", authors=[], abstract="A", url="") for i in (1, 2, 3)]
+
+    async def search(query, max_papers, on_progress=None, start_year=None, end_year=None):
+        return papers
+
+    def assess(paper, analysis):
+        if paper.id == "p1":
+            raise ValueError("bad metadata")
+        return Mock(overall_score=float(paper.id[1:]))
+
+    agent.scout.search = search
+    agent.analyst.analyze = AsyncMock(side_effect=lambda paper: Analysis(
+        paper_id=paper.id, research_question="Q", methodology="M",
+        key_findings=["F"], limitations=[], confidence=0.8
+    ))
+    monkeypatch.setattr(agent, "_assess_quality", assess)
+
+    found, analyses, quality_scores, _ = await agent._execute_pipelined_phases("q", 3)
+
+    assert [p.id for p in found] == [a.paper_id for a in analyses] == ["p1", "p2", "p3"]
+    assert quality_scores[0] is None
+    assert [q.overall_score for q in quality_scores[1:]] == [2.0, 3.0]
+
+    report = agent._generate_report("q", found, analyses, Mock(), quality_scores, True)
+    assert [(q["paper_id"], q["overall_score"]) for q in report["quality_scores"]] == [("p2", 2.0), ("p3", 3.0)]
+
+
 @pytest.mark.asyncio
 async def test_decision_logging(mock_embedding_client):
     """Test decision logging functionality"""
@@ -0,0 +1,106 @@
+"""
+Unit Tests for Analysis Store
+Tests warm/cold lookups, prompt version invalidation and reuse in the analysis phase
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from dataclasses import asdict
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from analysis_store import AnalysisStore, canonical_paper_key
+from agents import Analysis, AnalystAgent, ResearchOpsAgent
+
+
+def make_analysis(paper_id: str, finding: str = "finding") -> Analysis:
+    return Analysis(
+        paper_id=paper_id,
+        research_question="question",
+        methodology="method",
+        key_findings=[finding],
+        limitations=[],
+        confidence=0.8,
+        metadata={}
+    )
+
+
+def test_warm_and_cold_tiers(tmp_path, make_paper):
+    """Test hits come from the warm tier, then from disk once evicted, and are shared by DOI"""
+    path = str(tmp_path / "analyses.db")
+    store = AnalysisStore(path, warm_size=1)
+    first, second = make_paper("arxiv-1", doi="10.1/x"), make_paper("arxiv-2")
+    store.put_many([(first, asdict(make_analysis("arxiv-1"))), (second, asdict(make_analysis("arxiv-2")))], "v1")
+
+    found = store.get_many([first, second], "v1")
+    assert found["arxiv-2"][1] == "warm"
+    assert found["arxiv-1"][1] == "cold"
+    # The cold hit was promoted
+    assert store.get_many([first], "v1")["arxiv-1"][1] == "warm"
+
+    # Another source's record of the same DOI reuses the analysis; a new process reads from disk
+    same_doi = make_paper("crossref-9", doi="10.1/x")
+    same_doi.title = first.title
+    assert canonical_paper_key(same_doi) == canonical_paper_key(first)
+    reopened = AnalysisStore(path)
+    assert reopened.get_many([same_doi], "v1")["crossref-9"] == (asdict(make_analysis("arxiv-1")), "cold")
+
+
+def test_version_and_content_changes_invalidate(tmp_path, make_paper):
+    """Test a new prompt version or edited abstract misses, and old versions are purged"""
+    store = AnalysisStore(str(tmp_path / "analyses.db"))
+    paper = make_paper("arxiv-1")
+    store.put_many([(paper, asdict(make_analysis("arxiv-1")))], "v1")
+
+    assert store.get_many([paper], "v2") == {}
+    assert store.get_many([make_paper("arxiv-1", abstract="Revised")], "v1") == {}
+
+    store.put_many([(paper, asdict(make_analysis("arxiv-1", "new")))], "v2")
+    assert store.purge_versions("v2") == 1
+    assert store.count() == 1
+    assert store.get_many([paper], "v1") == {}
+
+
+def test_stale_versions_are_purged_once_per_process(tmp_path, monkeypatch):
+    """Test building agents per request does not rerun the version purge"""
+    import analysis_store
+
+    monkeypatch.setattr(analysis_store, "_analysis_store", None)
+    monkeypatch.setenv("ANALYSIS_STORE_PATH", str(tmp_path / "analyses.db"))
+    purge = Mock(return_value=0)
+    monkeypatch.setattr(AnalysisStore, "purge_versions", purge)
+
+    for _ in range(3):
+        ResearchOpsAgent(Mock(), Mock())
+
+    purge.assert_called_once_with(AnalystAgent.STORE_VERSION)
+    analysis_store._analysis_store.close()
+
+
+@pytest.mark.asyncio
+async def test_analysis_phase_only_analyzes_misses(monkeypatch, make_paper):
+    """Test stored analyses are reused and only new papers reach the Analyst"""
+    monkeypatch.setenv("ANALYSIS_PACK_SIZE", "1")
+    agent = ResearchOpsAgent(Mock(), Mock())
+    agent.analysis_store = AnalysisStore(":memory:")
+    agent.metrics = Mock()
+    agent.analyst.analyze = AsyncMock(side_effect=lambda paper: make_analysis(paper.id, f"fresh {paper.id}"))
+    papers = [make_paper("arxiv-1"), make_paper("arxiv-2"), make_paper("arxiv-3")]
+    agent.analysis_store.put_many([(papers[1], asdict(make_analysis("ignored", "stored")))], AnalystAgent.STORE_VERSION)
+
+    analyses, _ = await agent._execute_analysis_phase(papers, "q")
+
+    assert [a.paper_id for a in analyses] == ["arxiv-1", "arxiv-2", "arxiv-3"]
+    assert analyses[1].key_findings == ["stored"]
+    assert [c.args[0].id for c in agent.analyst.analyze.await_args_list] == ["arxiv-1", "arxiv-3"]
+    agent.metrics.record_analysis_store_lookups.assert_called_once_with(1, 0, 2)
+
+    # The second query is served entirely from the store
+    agent.analyst.analyze.reset_mock()
+    analyses, _ = await agent._execute_analysis_phase(papers, "q")
+    agent.analyst.analyze.assert_not_awaited()
+    assert analyses[0].key_findings == ["fresh arxiv-1"]
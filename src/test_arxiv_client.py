@@ -0,0 +1,97 @@
+"""
+Unit Tests for Async arXiv Client
+Tests incremental Atom parsing, date filters and max_results pushdown
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import Mock
+
+import pytest
+
+from arxiv_client import ArxivClient, AtomFeedParser, build_search_query
+
+
+def make_feed(count: int) -> bytes:
+    entries = "".join(
+        f"""<entry>
+    <id>http://arxiv.org/abs/2401.0000{i}v1</id>
+    <published>2024-01-0{i + 1}T00:00:00Z</published>
+    <title>Paper
+      {i}</title>
+    <summary>  Abstract {i}
+      continues here. </summary>
+    <author><name>Author {i}</name></author>
+    <link title="pdf" href="http://arxiv.org/pdf/2401.0000{i}v1" rel="related"/>
+  </entry>"""
+        for i in range(count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><feed xmlns="http://www.w3.org/2005/Atom"><title>q</title>{entries}</feed>'.encode()
+
+
+class FakeHTTPClient:
+    """Serves a feed in small chunks and records request params"""
+
+    def __init__(self, body: bytes, chunk_size: int = 64):
+        self.body = body
+        self.chunk_size = chunk_size
+        self.params = None
+        self.chunks_read = 0
+
+    @asynccontextmanager
+    async def get(self, url, params=None):
+        self.params = params
+        client = self
+
+        async def iter_chunked(size):
+            for i in range(0, len(client.body), client.chunk_size):
+                client.chunks_read += 1
+                yield client.body[i:i + client.chunk_size]
+
+        response = Mock(status=200)
+        response.content.iter_chunked = iter_chunked
+        yield response
+
+
+def test_parser_returns_entries_as_chunks_complete():
+    """Test entries are emitted as soon as their closing tag arrives"""
+    feed = make_feed(2)
+    parser = AtomFeedParser()
+    split = feed.index(b"</entry>") + len(b"</entry>")
+
+    first = parser.feed(feed[:split])
+    second = parser.feed(feed[split:])
+    parser.close()
+
+    assert [e.arxiv_id for e in first] == ["2401.00000v1"]
+    assert [e.arxiv_id for e in second] == ["2401.00001v1"]
+    assert first[0].title == "Paper 0"
+    assert first[0].summary == "Abstract 0 continues here."
+    assert first[0].authors == ["Author 0"]
+    assert first[0].pdf_url == "http://arxiv.org/pdf/2401.00000v1"
+
+
+def test_build_search_query_with_date_range():
+    """Test submittedDate filters are appended to the query"""
+    assert build_search_query("ti:transformers") == "ti:transformers"
+    assert build_search_query(
+        "ti:transformers",
+        start_date=datetime(2023, 1, 1),
+        end_date=datetime(2023, 12, 31, 23, 59)
+    ) == "(ti:transformers) AND submittedDate:[202301010000 TO 202312312359]"
+
+
+@pytest.mark.asyncio
+async def test_search_pushes_down_max_results_and_stops_reading():
+    """Test max_results is sent to arXiv and the body is not read past it"""
+    http = FakeHTTPClient(make_feed(5))
+    entries = await ArxivClient(http).search("q", max_results=2)
+
+    assert [e.arxiv_id for e in entries] == ["2401.00000v1", "2401.00001v1"]
+    assert http.params["max_results"] == 2
+    assert http.chunks_read < len(http.body) // http.chunk_size
@@ -0,0 +1,103 @@
+"""
+Unit Tests for Boolean Search
+Tests the boolean AST, per-source query compilation and use from Scout
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from boolean_search import (
+    And,
+    Not,
+    Or,
+    Term,
+    broad_query,
+    compile_query,
+    filter_by_boolean_terms,
+    parse_boolean_ast,
+    parse_boolean_query,
+)
+from agents import Paper, ScoutAgent
+
+
+def test_parse_precedence_phrases_and_parentheses():
+    """Test NOT binds tighter than AND, AND tighter than OR, and words group into phrases"""
+    assert parse_boolean_ast("AI AND (medical OR clinical) NOT review") == And((
+        Term("AI"), Or((Term("medical"), Term("clinical"))), Not(Term("review"))
+    ))
+    assert parse_boolean_ast("machine learning or deep learning and imaging") == Or((
+        Term("machine learning"), And((Term("deep learning"), Term("imaging")))
+    ))
+    assert parse_boolean_ast('"graph neural" networks') == And((Term("graph neural"), Term("networks")))
+    # Unbalanced parentheses and dangling operators are tolerated
+    assert parse_boolean_ast("(x OR y AND") == Or((Term("x"), Term("y")))
+
+
+def test_compile_to_native_syntax():
+    """Test arXiv and PubMed syntax, and the fallback for sources without boolean search"""
+    ast = parse_boolean_ast("AI AND (medical OR clinical) NOT review")
+
+    assert compile_query(ast, "arxiv") == "all:AI AND (all:medical OR all:clinical) ANDNOT all:review"
+    assert compile_query(ast, "pubmed") == "AI[tiab] AND (medical[tiab] OR clinical[tiab]) NOT review[tiab]"
+    assert compile_query(parse_boolean_ast("deep learning NOT GPT"), "ieee") == '"deep learning" NOT GPT'
+    assert compile_query(ast, "crossref") is None
+    # A bare negation has no native form
+    assert compile_query(parse_boolean_ast("x OR NOT y"), "arxiv") is None
+    assert broad_query(ast) == "AI medical clinical"
+
+
+def test_filter_by_boolean_terms_uses_ast():
+    """Test post-filtering respects grouping instead of evaluating left to right"""
+    papers = [
+        {"title": "AI in clinical practice", "abstract": "", "authors": []},
+        {"title": "AI review", "abstract": "medical", "authors": []},
+        {"title": "Clinical trials", "abstract": "no machine", "authors": []},
+    ]
+    parsed = parse_boolean_query("AI AND (medical OR clinical) NOT review")
+
+    assert [p["title"] for p in filter_by_boolean_terms(papers, parsed)] == ["AI in clinical practice"]
+
+
+@pytest.mark.asyncio
+async def test_scout_sends_one_query_per_source(monkeypatch):
+    """Test a boolean query is searched once per source: natively or broad plus post-filter"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.0")
+    embedding = Mock()
+    embedding.embed = AsyncMock(return_value=[0.1] * 8)
+    # Distinct embeddings so semantic dedup keeps every paper
+    embedding.embed_batch = AsyncMock(side_effect=lambda texts, input_type: [
+        [1.0 if i == ord(t[0]) % 8 else 0.0 for i in range(8)] for t in texts
+    ])
+    scout = ScoutAgent(embedding)
+    for source in ("arxiv", "pubmed", "semantic_scholar", "crossref", "ieee", "acm", "springer"):
+        setattr(scout.source_config, f"enable_{source}", source in ("arxiv", "crossref"))
+
+    calls = []
+
+    async def arxiv(query):
+        calls.append(("arxiv", query))
+        return [Paper(id="arxiv-1", title="AI for medical imaging", authors=[], abstract="A", url="")]
+
+    async def crossref(query):
+        calls.append(("crossref", query))
+        return [
+            Paper(id="crossref-1", title="Clinical AI", authors=[], abstract="B", url=""),
+            Paper(id="crossref-2", title="Clinical AI: a review", authors=[], abstract="C", url=""),
+        ]
+
+    scout._search_arxiv = arxiv
+    scout._search_crossref = crossref
+
+    results = await scout.search("AI AND (medical OR clinical) NOT review", max_papers=5)
+
+    assert sorted(calls) == [
+        ("arxiv", "all:AI AND (all:medical OR all:clinical) ANDNOT all:review"),
+        ("crossref", "AI medical clinical"),
+    ]
+    assert {p.id for p in results} == {"arxiv-1", "crossref-1"}
@@ -0,0 +1,125 @@
+"""
+Unit Tests for Adaptive Concurrency Limiter
+Tests admission, AIMD adaptation and metrics wiring
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from concurrency import AdaptiveConcurrencyLimiter, AdaptiveLimiterConfig
+
+
+def make_limiter(**overrides):
+    config = AdaptiveLimiterConfig(**{"initial_limit": 2, "decrease_cooldown": 0.0, **overrides})
+    return AdaptiveConcurrencyLimiter("test", config, metrics=Mock())
+
+
+@pytest.mark.asyncio
+async def test_limits_concurrent_calls_and_records_wait():
+    """Test calls beyond the limit queue until a slot frees up"""
+    limiter = make_limiter(max_limit=2)
+    active = [0]
+    peak = [0]
+
+    async def call():
+        async with limiter.slot():
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+
+    await asyncio.gather(*[call() for _ in range(6)])
+
+    assert peak[0] == 2
+    assert limiter.in_flight == 0
+    assert limiter.get_queue_length() == 0
+    assert limiter.metrics.record_concurrency_wait.call_count == 6
+    limiter.metrics.record_concurrency_limit.assert_called_with("test", 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_saturated_and_latency_is_stable():
+    """Test additive increase when every slot is used and latency holds"""
+    limiter = make_limiter()
+
+    for _ in range(20):
+        await limiter.acquire()
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+        limiter.release(latency=0.1)
+
+    assert limiter.current_limit > 2
+
+
+@pytest.mark.asyncio
+async def test_overload_and_latency_spikes_back_off():
+    """Test multiplicative decrease on 429/503, timeouts and latency growth"""
+    limiter = make_limiter(initial_limit=16)
+
+    async with limiter.slot() as slot:
+        slot.mark_overloaded()
+    assert limiter.current_limit == 8
+
+    with pytest.raises(asyncio.TimeoutError):
+        async with limiter.slot():
+            raise asyncio.TimeoutError()
+    assert limiter.current_limit == 4
+
+    for _ in range(3):
+        await limiter.acquire()
+        limiter.release(latency=0.1, key=256)
+    await limiter.acquire()
+    limiter.release(latency=1.0, key=256)  # 10x the baseline for this key
+    assert limiter.current_limit == 2
+
+    # A slower call class does not count as a spike against short calls
+    await limiter.acquire()
+    limiter.release(latency=1.0, key=2048)
+    assert limiter.current_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_mixed_output_lengths_do_not_shrink_the_limit():
+    """Test short and long replies in one latency class are compared per generated token"""
+    limiter = make_limiter(initial_limit=8)
+
+    # Fixed 50ms overhead plus 2ms per generated token, like the mock Reasoning NIM
+    for tokens in ([5] * 10 + [500] * 10 + [5, 500, 20, 1000] * 10):
+        await limiter.acquire()
+        limiter.release(latency=0.05 + 0.002 * tokens, key=(2048, False), tokens=tokens)
+
+    assert limiter.current_limit >= 8
+
+    # Streamed calls are compared on time-to-first-token, whatever the reply length
+    for duration in (0.1, 2.0, 0.1, 2.0, 0.1, 2.0):
+        async with limiter.slot(key=(2048, True)) as slot:
+            await asyncio.sleep(0.01)
+            slot.mark_first_token()
+            await asyncio.sleep(duration / 100)
+    assert limiter.current_limit >= 8
+    assert ("ttft", (2048, True)) in limiter.baseline_latency
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_slot():
+    """Test cancelling a queued call leaves the limiter consistent"""
+    limiter = make_limiter(initial_limit=1, max_limit=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    limiter.release()
+    assert limiter.in_flight == 0
+    await asyncio.wait_for(limiter.acquire(), timeout=1)
+    assert limiter.in_flight == 1
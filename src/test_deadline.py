@@ -0,0 +1,101 @@
+"""
+Unit Tests for Request Deadlines
+Tests deadline scoping, Retry-After parsing and deadline-aware retry decisions
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+from tenacity import retry, retry_if_exception_type
+
+from deadline import (
+    DeadlineRetryPolicy,
+    deadline_scope,
+    get_current_deadline,
+    budget_timeout,
+    get_research_timeout_seconds,
+    parse_retry_after
+)
+from exceptions import NIMOverloadedError
+
+
+def test_nested_scope_never_extends_outer_deadline():
+    """Test the earlier of two nested deadlines wins"""
+    with deadline_scope(5) as outer:
+        with deadline_scope(60) as inner:
+            assert inner is outer
+            assert budget_timeout(30) <= 5
+        with deadline_scope(1) as tighter:
+            assert tighter.remaining() <= 1
+    assert get_current_deadline() is None
+    assert budget_timeout(30) == 30
+
+
+def test_research_timeout_reads_env_override(monkeypatch):
+    """Test the API timeout and the agent deadline share one configured budget"""
+    from constants import MAX_RESEARCH_TIMEOUT_SECONDS
+
+    monkeypatch.delenv("MAX_RESEARCH_TIMEOUT_SECONDS", raising=False)
+    assert get_research_timeout_seconds() == MAX_RESEARCH_TIMEOUT_SECONDS
+    monkeypatch.setenv("MAX_RESEARCH_TIMEOUT_SECONDS", "900")
+    assert get_research_timeout_seconds() == 900.0
+
+
+def test_parse_retry_after():
+    """Test delta-seconds, HTTP dates and junk values"""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+def make_flaky(policy, retry_after=None):
+    calls = []
+
+    @retry(
+        stop=policy.stop,
+        wait=policy.wait,
+        retry=retry_if_exception_type(NIMOverloadedError),
+        reraise=True
+    )
+    async def flaky():
+        calls.append(1)
+        raise NIMOverloadedError("busy", service="test", status=429, retry_after=retry_after)
+
+    return flaky, calls
+
+
+@pytest.mark.asyncio
+async def test_retries_honor_retry_after_and_count_attempts():
+    """Test Retry-After replaces backoff and retries are counted"""
+    metrics = Mock()
+    policy = DeadlineRetryPolicy("test", expected_latency=0.01, metrics_getter=lambda: metrics)
+    flaky, calls = make_flaky(policy, retry_after=0.01)
+
+    with pytest.raises(NIMOverloadedError):
+        await flaky()
+
+    assert len(calls) == 3
+    assert metrics.record_retry_attempt.call_count == 2
+    metrics.record_retry_budget_exhausted.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_no_retry_when_budget_cannot_cover_it():
+    """Test retries stop once the deadline cannot fit wait plus latency"""
+    metrics = Mock()
+    policy = DeadlineRetryPolicy("test", expected_latency=5.0, metrics_getter=lambda: metrics)
+    flaky, calls = make_flaky(policy)
+
+    with deadline_scope(3):
+        with pytest.raises(NIMOverloadedError):
+            await asyncio.wait_for(flaky(), timeout=1)
+
+    assert len(calls) == 1
+    metrics.record_retry_budget_exhausted.assert_called_once_with("test")
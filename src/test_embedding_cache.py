@@ -0,0 +1,78 @@
+"""
+Unit Tests for Embedding Vector Cache
+Tests full-text keys, LRU eviction and metrics wiring
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+from cache import EmbeddingVectorCache
+
+MODEL = "nvidia/nv-embedqa-e5-v5"
+
+
+def test_full_text_keys_do_not_collide():
+    """Test texts sharing a long prefix get separate entries"""
+    cache = EmbeddingVectorCache()
+    prefix = "a" * 150
+    cache.set(prefix + " first", MODEL, "passage", [1.0, 0.0])
+    cache.set(prefix + " second", MODEL, "passage", [0.0, 1.0])
+
+    assert cache.get(prefix + " first", MODEL, "passage") == [1.0, 0.0]
+    assert cache.get(prefix + " second", MODEL, "passage") == [0.0, 1.0]
+    # Input type and model are part of the key
+    assert cache.get(prefix + " first", MODEL, "query") is None
+    assert cache.get(prefix + " first", "other-model", "passage") is None
+
+
+def test_vectors_stored_as_float32():
+    """Test vectors are kept as compact float32 arrays"""
+    cache = EmbeddingVectorCache()
+    cache.set("text", MODEL, "passage", [0.1] * 1024)
+
+    stored = next(iter(cache._entries.values()))
+    assert stored.dtype == np.float32
+    assert cache.get_stats()["bytes"] == 1024 * 4
+
+
+def test_lru_eviction_and_metrics():
+    """Test least-recently-used entries are evicted and counted"""
+    metrics = Mock()
+    cache = EmbeddingVectorCache(max_bytes=2 * 4 * 4, metrics=metrics)  # Two 4-dim vectors
+
+    cache.set_many(["a", "b"], MODEL, "passage", [[1.0] * 4, [2.0] * 4])
+    assert cache.get("a", MODEL, "passage") is not None  # "a" is now most recent
+    cache.set("c", MODEL, "passage", [3.0] * 4)
+
+    hits = cache.get_many(["a", "b", "c"], MODEL, "passage")
+    assert set(hits) == {0, 2}
+
+    stats = cache.get_stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+    metrics.record_cache_eviction.assert_called_once_with("embedding", 1)
+    metrics.record_cache_hit.assert_called_with("embedding")
+    metrics.record_cache_miss.assert_called_with("embedding")
+
+
+def test_embedding_client_uses_shared_tier_only_with_redis():
+    """Test the in-memory fallback is not used as an unbounded second embedding cache"""
+    import nim_clients
+    from cache import Cache
+
+    with patch.object(nim_clients, "get_cache", return_value=Cache()):
+        client = nim_clients.EmbeddingNIMClient(base_url="http://localhost:8001")
+    assert client.embedding_cache_obj is None
+
+    redis_backed = Cache()
+    redis_backed.redis_client = Mock()
+    with patch.object(nim_clients, "get_cache", return_value=redis_backed):
+        client = nim_clients.EmbeddingNIMClient(base_url="http://localhost:8001")
+    assert client.embedding_cache_obj is not None
@@ -0,0 +1,118 @@
+"""
+Unit Tests for Cross-Source Identity Resolution
+Tests identifier normalization, fuzzy title matching and metadata merging
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from identity_resolution import (
+    IdentityResolver,
+    fallback_paper_id,
+    identity_keys,
+    normalize_arxiv_id,
+    normalize_doi,
+)
+
+
+def test_identifier_normalization():
+    """Test DOIs and arXiv IDs normalize across their common spellings"""
+    assert normalize_doi("https://doi.org/10.1000/ABC") == "10.1000/abc"
+    assert normalize_doi("doi:10.1000/abc") == "10.1000/abc"
+    assert normalize_doi("not a doi") is None
+    assert normalize_arxiv_id("http://arxiv.org/abs/2401.01234v3") == "2401.01234"
+    assert normalize_arxiv_id("10.48550/arXiv.2401.01234") == "2401.01234"
+    assert normalize_arxiv_id("hep-th/9901001v1") == "hep-th/9901001"
+    assert normalize_arxiv_id("001") is None
+
+
+def test_identity_keys_from_ids_urls_and_doi_field(make_paper):
+    """Test keys are collected from source IDs, URLs and DOI fields"""
+    arxiv = make_paper("arxiv-2401.01234v1", "Scaling Laws for Everything", url="http://arxiv.org/abs/2401.01234v1")
+    scholar = make_paper("semanticscholar-abc", "Scaling laws for everything!", doi="10.48550/arXiv.2401.01234")
+    pubmed = make_paper("pubmed-123", "Short", url="https://pubmed.ncbi.nlm.nih.gov/123/")
+
+    assert "arxiv:2401.01234" in identity_keys(arxiv)
+    assert "arxiv:2401.01234" in identity_keys(scholar)
+    assert identity_keys(pubmed) == {"pmid:123"}  # Title too short to match on
+
+
+def test_fallback_ids_follow_content_not_position(make_paper):
+    """Test records without a native ID get stable, distinct IDs that are not read as PMIDs"""
+    first = fallback_paper_id("pubmed", "Graph Neural Networks", ["A. Author"], "Abstract")
+    again = fallback_paper_id("pubmed", "graph neural networks!", ["A. Author"], "Abstract")
+    other = fallback_paper_id("pubmed", "Unrelated Protein Folding Study", ["B. Author"], "Abstract")
+
+    assert first == again != other
+    assert first.startswith("pubmed-")
+    assert not any(key.startswith("pmid:") for key in identity_keys(make_paper(first, "Short")))
+
+
+def test_resolver_merges_exact_and_fuzzy_duplicates(make_paper):
+    """Test duplicates are dropped and contribute missing metadata"""
+    resolver = IdentityResolver()
+    papers = [
+        make_paper("arxiv-2401.01234v1", "Attention Is All You Need in Medical Imaging",
+                   url="http://arxiv.org/abs/2401.01234v1", abstract="Short abstract", authors=["Jane Doe"]),
+        make_paper("crossref-10.1000/xyz", "Attention is all you need in medical imaging.",
+                   url="https://doi.org/10.1000/xyz", abstract="A much longer abstract from the publisher",
+                   authors=["Doe, J."],
+                   year=2024, venue="Journal of Imaging", doi="10.1000/xyz"),
+        make_paper("semanticscholar-s1", "Attention Is All You Need in Medicl Imaging",
+                   doi="10.48550/arXiv.2401.01234"),
+        make_paper("pubmed-9", "An Entirely Different Study of Protein Folding"),
+    ]
+
+    unique = resolver.resolve(papers)
+
+    assert [p.id for p in unique] == ["arxiv-2401.01234v1", "pubmed-9"]
+    assert resolver.duplicates == 2
+    merged = unique[0]
+    assert merged.abstract == "A much longer abstract from the publisher"
+    assert merged.year == 2024 and merged.venue == "Journal of Imaging"
+
+
+def test_resolver_keeps_papers_with_conflicting_identifiers(make_paper):
+    """Test similar titles with different DOIs stay separate"""
+    resolver = IdentityResolver()
+    unique = resolver.resolve([
+        make_paper("crossref-10.1000/a", "Deep Learning for Protein Structure Prediction", doi="10.1000/a"),
+        make_paper("crossref-10.1000/b", "Deep Learning for Protein Structure Prediction", doi="10.1000/b"),
+    ])
+
+    assert len(unique) == 2
+    assert resolver.duplicates == 0
+
+
+def test_title_only_matches_need_year_or_author_agreement(make_paper):
+    """Test same-titled papers merge only when their year or an author agrees"""
+    resolver = IdentityResolver()
+    unique = resolver.resolve([
+        make_paper("pubmed-1", "A Survey of Graph Neural Networks", year=2019, authors=["Jie Zhou"]),
+        make_paper("crossref-10.1000/a", "A survey of graph neural networks", year=2023,
+                   authors=["Wu, Z."], doi="10.1000/a"),
+        make_paper("arxiv-1812.08434", "A Survey of Graph Neural Networks.", year=2018,
+                   authors=["Zhou J"]),
+    ])
+
+    assert [p.id for p in unique] == ["pubmed-1", "crossref-10.1000/a"]
+    assert resolver.duplicates == 1
+
+
+def test_embedded_paper_keeps_its_abstract_on_merge(make_paper):
+    """Test a later duplicate cannot change the abstract an embedding was computed from"""
+    resolver = IdentityResolver()
+    first = make_paper("arxiv-2401.01234v1", "Attention Is All You Need in Medical Imaging",
+                       url="http://arxiv.org/abs/2401.01234v1", abstract="Short abstract")
+    resolver.add(first)
+    first.embedding = [1.0, 0.0]
+    first.relevance_score = 0.9
+
+    resolver.add(make_paper("semanticscholar-s1", "Attention Is All You Need in Medical Imaging",
+                            abstract="A much longer abstract from another source",
+                            doi="10.48550/arXiv.2401.01234", year=2024))
+
+    assert first.abstract == "Short abstract"
+    assert first.embedding == [1.0, 0.0] and first.year == 2024
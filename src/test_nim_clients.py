@@ -168,3 +168,354 @@ async def test_retry_logic():
             assert result == "Success"
             assert call_count[0] == 3  # Retried 3 times
 
+
+
+@pytest.mark.asyncio
+async def test_shared_session_not_closed_on_exit(mock_session):
+    """Test clients bound to a shared session leave it open on exit"""
+    mock_session.close = AsyncMock()
+    client = EmbeddingNIMClient(base_url="http://test:8001", session=mock_session)
+
+    async with client:
+        assert client.session is mock_session
+
+    mock_session.close.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_client_pool_lifecycle():
+    """Test shared client pool opens once and closes at shutdown"""
+    from nim_clients import NIMClientPool
+
+    pool = NIMClientPool()
+    assert not pool.started
+
+    await pool.start()
+    try:
+        assert pool.started
+        reasoning_session = pool.reasoning.session
+        await pool.start()  # Idempotent
+        assert pool.reasoning.session is reasoning_session
+        assert pool.embedding.session is not reasoning_session
+
+        stats = pool.get_stats()
+        assert stats["reasoning"] == {"open": 0, "idle": 0}
+    finally:
+        await pool.close()
+
+    assert not pool.started
+    assert reasoning_session.closed
+
+
+@pytest.mark.asyncio
+async def test_close_client_pool_skips_when_never_created(monkeypatch):
+    """Test shutdown does not build a pool just to close it"""
+    import nim_clients
+
+    monkeypatch.setattr(nim_clients, "_client_pool", None)
+    await nim_clients.close_client_pool()
+    assert nim_clients._client_pool is None
+
+    pool = nim_clients.get_client_pool()
+    await pool.start()
+    await nim_clients.close_client_pool()
+    assert not pool.started
+    assert nim_clients._client_pool is None
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_coalesces_by_input_type():
+    """Test concurrent embed requests are grouped into one call per input_type"""
+    import asyncio
+    from nim_clients import EmbeddingMicroBatcher
+
+    calls = []
+
+    async def send_batch(texts, input_type):
+        calls.append((sorted(texts), input_type))
+        return [[float(len(text))] for text in texts]
+
+    batcher = EmbeddingMicroBatcher(send_batch, linger_ms=5, max_batch_size=8)
+    results = await asyncio.gather(
+        batcher.submit("a", "query"),
+        batcher.submit("bb", "passage"),
+        batcher.submit("ccc", "query"),
+    )
+
+    assert results == [[1.0], [2.0], [3.0]]
+    assert sorted(calls, key=lambda c: c[1]) == [
+        (["bb"], "passage"),
+        (["a", "ccc"], "query"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_charges_each_request_its_share():
+    """Test a coalesced call is split across the ledgers of the requests that shared it"""
+    import asyncio
+    from nim_clients import EmbeddingMicroBatcher
+    from resource_ledger import record_embedding_call, track_resources
+
+    async def send_batch(texts, input_type):
+        record_embedding_call(tokens=600, request_bytes=1200, response_bytes=6000)
+        return [[1.0] for _ in texts]
+
+    batcher = EmbeddingMicroBatcher(send_batch, linger_ms=5, max_batch_size=8)
+    texts_b = [f"text {i} " + "x" * 92 for i in range(5)]
+
+    async def request(texts):
+        with track_resources() as ledger:
+            await batcher.submit_many(texts, "passage")
+        return ledger
+
+    # Request A starts the flush window, so the shared call runs in its context
+    ledger_a, ledger_b = await asyncio.gather(
+        request(["only " + "y" * 95]),
+        request(texts_b)
+    )
+
+    assert ledger_a.embedding_calls == ledger_b.embedding_calls == 1
+    assert (ledger_a.embedding_tokens, ledger_b.embedding_tokens) == (100, 500)
+    assert ledger_a.request_bytes + ledger_b.request_bytes == 1200
+    assert ledger_a.response_bytes + ledger_b.response_bytes == 6000
+
+
+@pytest.mark.asyncio
+async def test_micro_batcher_respects_max_batch_size_and_errors():
+    """Test full batches flush early and failures reach every waiter"""
+    from nim_clients import EmbeddingMicroBatcher
+
+    sizes = []
+
+    async def send_batch(texts, input_type):
+        sizes.append(len(texts))
+        return [[0.0] for _ in texts]
+
+    batcher = EmbeddingMicroBatcher(send_batch, linger_ms=1000, max_batch_size=2)
+    vectors = await batcher.submit_many(["a", "b", "c", "d"], "passage")
+    assert len(vectors) == 4
+    assert sizes == [2, 2]
+
+    async def failing_batch(texts, input_type):
+        raise aiohttp.ClientError("boom")
+
+    batcher = EmbeddingMicroBatcher(failing_batch, linger_ms=1)
+    with pytest.raises(aiohttp.ClientError):
+        await batcher.submit_many(["a", "b"], "query")
+
+
+def test_pack_by_token_budget():
+    """Test packing bounds estimated tokens and item count per batch"""
+    from nim_clients import pack_by_token_budget
+
+    long_text = "x" * 1800   # ~450 tokens
+    short_text = "y" * 40    # ~10 tokens
+    texts = [short_text] * 6 + [long_text] * 3
+
+    batches = pack_by_token_budget(texts, token_budget=1000, max_items=4)
+
+    assert sorted(i for batch in batches for i in batch) == list(range(len(texts)))
+    for batch in batches:
+        assert len(batch) <= 4
+        assert sum(len(texts[i]) // 4 for i in batch) <= 1000
+    # Long texts are grouped together, short ones fill their own batches
+    assert batches[0] == [6, 7]
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_dedupes_and_limits_in_flight(monkeypatch):
+    """Test duplicate texts are embedded once and sub-batches run concurrently"""
+    import asyncio
+
+    monkeypatch.setenv("EMBEDDING_MICRO_BATCHING", "false")
+    monkeypatch.setenv("EMBEDDING_MAX_IN_FLIGHT", "2")
+    client = EmbeddingNIMClient(base_url="http://test:8001")
+    client.vector_cache = None
+
+    sent = []
+    active = [0]
+    peak = [0]
+
+    async def fake_request(url, payload):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        await asyncio.sleep(0.01)
+        active[0] -= 1
+        sent.extend(payload["input"])
+        return [[float(len(text))] for text in payload["input"]]
+
+    client._send_embeddings_request = fake_request
+    client.session = Mock(closed=False)
+
+    texts = ["alpha", "beta", "alpha", "", "gamma", "delta", "beta"]
+    results = await client.embed_batch(texts, batch_size=1)
+
+    assert sorted(sent) == ["alpha", "beta", "delta", "gamma"]
+    assert results[0] == results[2] == [5.0]
+    assert results[3] == []
+    assert peak[0] == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_batch_only_sends_cache_misses(monkeypatch):
+    """Test embed_batch serves cached vectors and embeds only the misses"""
+    from cache import EmbeddingVectorCache
+
+    monkeypatch.setenv("EMBEDDING_MICRO_BATCHING", "false")
+    client = EmbeddingNIMClient(base_url="http://test:8001")
+    client.vector_cache = EmbeddingVectorCache()
+    client.vector_cache.set("cached text", client.MODEL, "passage", [1.0, 2.0])
+
+    sent = []
+
+    async def fake_request(url, payload):
+        sent.extend(payload["input"])
+        return [[0.5, 0.5] for _ in payload["input"]]
+
+    client._send_embeddings_request = fake_request
+    client.session = Mock(closed=False)
+
+    first = await client.embed_batch(["cached text", "new text"])
+    second = await client.embed_batch(["new text"])
+
+    assert sent == ["new text"]
+    assert first == [[1.0, 2.0], [0.5, 0.5]]
+    assert second == [[0.5, 0.5]]
+
+
+@pytest.mark.asyncio
+async def test_completion_cache_serves_repeated_deterministic_prompts():
+    """Test cached completions skip the NIM and count tokens saved"""
+    from cache import Cache, CompletionCache
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.completion_cache = CompletionCache(Cache())
+    client._complete_guarded = AsyncMock(return_value="yes")
+
+    first = await client.complete("same prompt", max_tokens=10, temperature=0.1, cache=True)
+    second = await client.complete("same prompt", max_tokens=10, temperature=0.1, cache=True)
+
+    assert first == second == "yes"
+    assert client._complete_guarded.call_count == 1
+    stats = client.completion_cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["tokens_saved"] == 1
+
+
+@pytest.mark.asyncio
+async def test_completion_cache_key_and_opt_in():
+    """Test version/sampling changes miss and uncached calls bypass the cache"""
+    from cache import Cache, CompletionCache
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.completion_cache = CompletionCache(Cache())
+    client._complete_guarded = AsyncMock(return_value="answer")
+
+    await client.complete("prompt", temperature=0.1, cache=True, template_version="v1")
+    await client.complete("prompt", temperature=0.1, cache=True, template_version="v2")
+    await client.complete("prompt", temperature=0.2, cache=True, template_version="v1")
+    await client.complete("prompt", temperature=0.1, template_version="v1")  # Not opted in
+    await client.complete("prompt", temperature=0.9, cache=True)  # Too random to cache
+    await client.complete("prompt", temperature=0.9, cache=True)
+
+    assert client._complete_guarded.call_count == 6
+    assert client.completion_cache.get_stats()["hits"] == 0
+
+
+@pytest.mark.asyncio
+async def test_completion_cache_separates_json_truncated_completions():
+    """Test stop_at_json gets its own key, with or without a template version"""
+    from cache import Cache, CompletionCache
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.completion_cache = CompletionCache(Cache())
+    client._complete_guarded = AsyncMock(return_value="answer")
+
+    await client.complete("prompt", temperature=0.1, cache=True)
+    await client.complete("prompt", temperature=0.1, cache=True, stop_at_json=True)
+    await client.complete("prompt", temperature=0.1, cache=True, stop_at_json=True)
+
+    assert client._complete_guarded.call_count == 2
+    key = client.completion_cache._key(client.MODEL, "prompt", 2048, 0.1, 0.9, "json")
+    assert client.completion_cache.cache.get(key) is not None
+
+
+@pytest.mark.asyncio
+async def test_completion_cache_skips_malformed_completions():
+    """Test a reply that does not parse is not replayed from the cache"""
+    from cache import Cache, CompletionCache
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.completion_cache = CompletionCache(Cache())
+    client._complete_guarded = AsyncMock(return_value='Sorry, {"truncated": ')
+
+    for _ in range(2):
+        assert await client.extract_structured("text", {}, cache=True) == {}
+    assert client._complete_guarded.call_count == 2
+
+    client._complete_guarded.return_value = '{"ok": true}'
+    for _ in range(2):
+        assert await client.extract_structured("text", {}, cache=True) == {"ok": True}
+    assert client._complete_guarded.call_count == 3
+
+
+def test_json_scanner_stops_at_first_balanced_object():
+    """Test the scanner ignores braces in strings and handles split chunks"""
+    from nim_clients import JSONObjectScanner
+
+    scanner = JSONObjectScanner()
+    chunks = ['Sure: {"a": "x}', '{\\"', '", "b": {"c"', ': 1}', '}  trailing {"d": 2}']
+    ends = [scanner.feed(chunk) for chunk in chunks]
+
+    assert ends[:4] == [None, None, None, None]
+    assert ends[4] == 1
+    assert scanner.complete
+    assert scanner.buffer == 'Sure: {"a": "x}{\\"", "b": {"c": 1}}'
+
+
+@pytest.mark.asyncio
+async def test_read_stream_closes_after_json_object():
+    """Test SSE streams are closed early and metrics are recorded"""
+    import json as json_module
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.metrics = Mock()
+
+    tokens = ['{"key"', ': "value"', '}', ' and more', ' text']
+
+    async def events():
+        for token in tokens:
+            yield f'data: {json_module.dumps({"choices": [{"text": token}]})}\n'.encode()
+        yield b"data: [DONE]\n"
+
+    response = Mock()
+    response.content = events()
+
+    result = await client._read_stream(response, "prompt", max_tokens=100, stop_at_json=True)
+
+    assert result == '{"key": "value"}'
+    response.close.assert_called_once()
+    client.metrics.record_time_to_first_token.assert_called_once()
+    client.metrics.record_stream_early_stop.assert_called_once_with("reasoning", 97)
+
+
+@pytest.mark.asyncio
+async def test_overload_is_retried_after_retry_after_header():
+    """Test 429/503 responses raise a retryable error carrying Retry-After"""
+    from exceptions import NIMOverloadedError
+
+    response = Mock(status=503, headers={"Retry-After": "1.5"})
+    response.text = AsyncMock(return_value="busy")
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.session = Mock(closed=False)
+    client.session.post = Mock(return_value=response)
+
+    with pytest.raises(NIMOverloadedError) as exc_info:
+        await client._complete_impl("prompt", max_tokens=5)
+
+    assert exc_info.value.retry_after == 1.5
+    assert exc_info.value.status == 503
@@ -15,6 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from agents import Paper, ScoutAgent
 from nim_clients import EmbeddingNIMClient
+from source_http import SourceHTTPClient
 
 
 @pytest.fixture
@@ -31,7 +32,9 @@ def mock_embedding_client():
 @pytest.fixture
 def scout_agent(mock_embedding_client):
     """Create Scout agent with mock embedding client"""
-    return ScoutAgent(mock_embedding_client)
+    # Route source requests through the mock session so tests can patch it
+    http_client = SourceHTTPClient(session=mock_embedding_client.session)
+    return ScoutAgent(mock_embedding_client, http_client=http_client)
 
 
 class TestArxivSource:
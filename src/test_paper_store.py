@@ -0,0 +1,86 @@
+"""
+Unit Tests for Local Paper Store
+Tests batched writes, FTS search and use as a Scout source
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from paper_store import PaperStore, fts_query
+from agents import ScoutAgent, mark_source_failure
+
+
+def test_fts_query_quotes_terms():
+    """Test user input cannot inject FTS operators"""
+    assert fts_query('deep "learning" NEAR(x)') == '"deep" OR "learning" OR "near"'
+
+
+def test_writes_are_batched_and_searchable(tmp_path, make_paper):
+    """Test buffered papers are written together and ranked by FTS"""
+    store = PaperStore(str(tmp_path / "papers.db"), batch_size=3)
+
+    assert store.add([make_paper("arxiv-1", "Graph neural networks", abstract="Message passing on graphs", year=2021)]) is False
+    assert store.count() == 0
+    assert store.add([
+        make_paper("pubmed-2", "Protein folding", abstract="Graph methods for proteins", doi="10.1/x"),
+        make_paper("crossref-3", "Unrelated topic", abstract="Nothing here"),
+    ]) is True
+    assert store.flush() == 3
+
+    results = store.search("graph networks")
+    assert [r["id"] for r in results] == ["arxiv-1", "pubmed-2"]
+    assert results[0]["year"] == 2021 and results[0]["source"] == "arxiv"
+    assert store.search("graph", sources=["pubmed"])[0]["doi"] == "10.1/x"
+
+    # Re-adding updates in place
+    store.add([make_paper("arxiv-1", "Graph neural networks", abstract="Updated abstract")])
+    store.flush()
+    assert store.count() == 3
+    assert store.get("arxiv-1")["abstract"] == "Updated abstract"
+
+
+@pytest.mark.asyncio
+async def test_scout_queries_store_first_and_persists_live_results(tmp_path, monkeypatch, make_paper):
+    """Test stored papers are served as a local source and fallbacks are not stored"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.0")
+    store = PaperStore(str(tmp_path / "papers.db"))
+    store.add([make_paper("arxiv-9", "Stored graph paper")])
+    store.flush()
+
+    embedding = Mock()
+    embedding.embed = AsyncMock(return_value=[0.1] * 8)
+    embedding.embed_batch = AsyncMock(side_effect=lambda texts, input_type: [[0.1] * 8 for _ in texts])
+    scout = ScoutAgent(embedding, paper_store=store)
+    for source in ("arxiv", "pubmed", "semantic_scholar", "crossref", "ieee", "acm", "springer"):
+        setattr(scout.source_config, f"enable_{source}", source in ("arxiv", "pubmed"))
+
+    async def arxiv(query):
+        await asyncio.sleep(0.05)  # Network latency
+        return [make_paper("arxiv-10", "Live graph paper")]
+
+    async def pubmed(query):
+        await asyncio.sleep(0.05)
+        mark_source_failure("down")
+        return [make_paper("pubmed-001", "Fallback graph paper")]
+
+    scout._search_arxiv = arxiv
+    scout._search_pubmed = pubmed
+
+    updates = [u async for u in scout.search_stream("graph", max_papers=5, use_query_expansion=False)]
+
+    assert updates[0].source == "local"
+    assert {p.id for p in updates[-1].top_papers} == {"arxiv-9", "arxiv-10", "pubmed-001"}
+    assert store.get("arxiv-10") is not None
+    assert store.get("pubmed-001") is None
+
+    monkeypatch.setenv("PAPER_STORE_OFFLINE", "true")
+    offline = [u async for u in scout.search_stream("graph", max_papers=5, use_query_expansion=False)]
+    assert {p.id for p in offline[-1].top_papers} == {"arxiv-9", "arxiv-10"}
+    assert offline[-1].sources_total == 1
@@ -0,0 +1,132 @@
+"""
+Unit Tests for PDF Analysis
+Tests page-text extraction results and the bounded PDF parse process pool
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+
+import pytest
+
+from exceptions import WorkerPoolSaturatedError
+from pdf_analysis import PDFParsePool, _compact, analyze_text
+
+
+def test_analyze_text_extracts_sections_from_compact_pages():
+    """Test whitespace is compacted per page and sections are found across pages"""
+    page = _compact("  Introduction \n\n\n  Deep   learning   works.  \n")
+    assert page == "Introduction\nDeep learning works."
+
+    methods = "We train a model with PyTorch using a learning rate: 0.001 on each benchmark. " * 3
+    pages = [page, f"Methods\n{methods}", "Results\nAccuracy improved (p < 0.05)."]
+    result = analyze_text(pages)
+
+    assert result["methodology"].startswith("We train a model")
+    assert "PyTorch" in result["experimental_setup"]["software_frameworks"]
+    assert result["full_text_length"] == len("\n\n".join(pages))
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_without_queueing():
+    """Test a full pool fails fast and frees its slot when the job finishes"""
+    pool = PDFParsePool(workers=1, max_pending=1, timeout=10.0)
+    try:
+        running = asyncio.create_task(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        assert pool.saturated
+
+        start = time.perf_counter()
+        with pytest.raises(WorkerPoolSaturatedError) as exc_info:
+            await pool.run(time.sleep, 0)
+        assert time.perf_counter() - start < 0.1
+        assert exc_info.value.details["retry_after"] == 10
+
+        await running
+        assert pool.pending == 0
+        assert await pool.run(abs, -3) == 3
+    finally:
+        await pool.close()
+
+
+def never_returns():
+    """Stands in for a parser stuck inside one page"""
+    while True:
+        time.sleep(1)
+
+
+@pytest.mark.asyncio
+async def test_hung_document_is_killed_and_frees_its_worker():
+    """Test a job past its timeout is terminated, so the slot and worker come back"""
+    pool = PDFParsePool(workers=1, max_pending=2, timeout=10.0)
+    try:
+        worker_pid = await pool.run(os.getpid)
+
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await pool.run(never_returns, timeout=0.5)
+        assert time.perf_counter() - start < 3
+        assert pool.pending == 0
+        with pytest.raises(ProcessLookupError):
+            os.kill(worker_pid, 0)
+
+        # A fresh worker replaces the killed one
+        assert await pool.run(abs, -3) == 3
+        assert await pool.run(os.getpid) != worker_pid
+
+        # A document queued behind a hung one runs once the hung one is killed
+        hung = asyncio.create_task(pool.run(never_returns, timeout=0.5))
+        queued = asyncio.create_task(pool.run(abs, -4))
+        with pytest.raises(asyncio.TimeoutError):
+            await hung
+        assert await asyncio.wait_for(queued, timeout=5) == 4
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_reserved_slots_are_used_by_runs_and_block_other_requests():
+    """Test a request's reservation covers its runs and is rejected up front when the pool is full"""
+    pool = PDFParsePool(workers=1, max_pending=2, timeout=10.0)
+    try:
+        with pool.reserve(5) as slots:
+            assert slots == 2
+            assert pool.saturated
+            # Runs inside the reservation take its slots, not new ones
+            assert await asyncio.gather(pool.run(abs, -1), pool.run(abs, -2)) == [1, 2]
+            assert pool.pending == 2
+
+            async def other_request():
+                with pool.reserve(1):
+                    pass
+
+            with pytest.raises(WorkerPoolSaturatedError):
+                await asyncio.create_task(other_request())
+        assert pool.pending == 0
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_full_text_analysis_rejects_whole_request_when_pool_is_full(monkeypatch):
+    """Test a saturated pool fails the request before any PDF is downloaded"""
+    import pdf_analysis
+
+    pool = PDFParsePool(workers=1, max_pending=1, timeout=10.0)
+    monkeypatch.setattr(pdf_analysis, "_pdf_parse_pool", pool)
+    downloads = []
+
+    async def download(self, url):
+        downloads.append(url)
+        return None
+
+    monkeypatch.setattr(pdf_analysis.PDFAnalyzer, "_download_pdf", download)
+    papers = [{"id": "p1", "pdf_url": "https://example.org/p1.pdf"}]
+    with pool.reserve(1):
+        with pytest.raises(WorkerPoolSaturatedError):
+            await asyncio.create_task(pdf_analysis.analyze_papers_full_text(papers))
+    assert downloads == []
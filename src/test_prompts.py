@@ -0,0 +1,58 @@
+"""
+Unit Tests for Prompt Registry
+Tests the static-prefix layout, versioning and use by the Reasoning NIM client and Analyst
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+import prompts
+from agents import AnalystAgent, Paper
+from nim_clients import ReasoningNIMClient
+
+
+def test_per_call_content_follows_the_static_prefix():
+    """Test versions are unique and call content is rendered after the shared prefix"""
+    assert len({t.version for t in prompts.PROMPTS.values()}) == len(prompts.PROMPTS)
+
+    first = prompts.ANALYSIS.render(text=prompts.format_paper("Paper one", ["A"], "First abstract"))
+    second = prompts.ANALYSIS.render(text=prompts.format_paper("Paper two", ["B"], "Second abstract"))
+    assert first.startswith(prompts.ANALYSIS.prefix) and second.startswith(prompts.ANALYSIS.prefix)
+    assert prompts.ANALYSIS_JSON_TEMPLATE in prompts.ANALYSIS.prefix
+    assert "Paper one" not in prompts.ANALYSIS.prefix
+    assert prompts.get_prompt("analysis") is prompts.ANALYSIS
+    with pytest.raises(KeyError):
+        prompts.get_prompt("missing")
+
+
+def test_structured_extraction_templates_are_built_once_per_schema():
+    """Test the same schema reuses one template and the registered analysis template"""
+    schema = {"title": "string"}
+    assert prompts.structured_extraction(schema) is prompts.structured_extraction(dict(schema))
+    assert prompts.structured_extraction(
+        prompts.ANALYSIS_JSON_TEMPLATE, prompts.ANALYSIS_INSTRUCTIONS
+    ) is prompts.ANALYSIS
+
+
+@pytest.mark.asyncio
+async def test_analyst_sends_the_paper_after_one_instruction_block():
+    """Test the analysis prompt is the registry template with a single schema, versioned for caching"""
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.complete = AsyncMock(return_value='{"key_findings": ["f"], "methodology": "m"}')
+    analyst = AnalystAgent(client)
+
+    analysis = await analyst.analyze(
+        Paper(id="arxiv-1", title="Title", authors=["A", "B"], abstract="Abstract", url="")
+    )
+
+    prompt = client.complete.await_args.kwargs["prompt"]
+    assert prompt == prompts.ANALYSIS.render(text="Title: Title\nAuthors: A, B\nAbstract: Abstract")
+    assert prompt.count("research_question") == 1
+    assert client.complete.await_args.kwargs["template_version"] == prompts.ANALYSIS.version
+    assert analysis.key_findings == ["f"]
@@ -0,0 +1,113 @@
+"""
+Unit Tests for Async PubMed Client
+Tests history-server paging and streaming article parsing
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import threading
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from pubmed_client import PubMedClient, parse_pubmed_articles
+
+
+def make_article(pmid: int, with_year: bool = True) -> str:
+    pub_date = "<Year>2021</Year>" if with_year else "<MedlineDate>2019 Spring</MedlineDate>"
+    return f"""<PubmedArticle>
+  <MedlineCitation>
+    <PMID>{pmid}</PMID>
+    <Article>
+      <Journal><JournalIssue><PubDate>{pub_date}</PubDate></JournalIssue><Title>Journal {pmid}</Title></Journal>
+      <ArticleTitle>Effects of <i>X</i> on Y</ArticleTitle>
+      <Abstract>
+        <AbstractText Label="BACKGROUND">Part one.</AbstractText>
+        <AbstractText Label="RESULTS">Part two.</AbstractText>
+      </Abstract>
+      <AuthorList><Author><LastName>Smith</LastName><ForeName>John</ForeName></Author></AuthorList>
+    </Article>
+  </MedlineCitation>
+  <PubmedData><ArticleIdList><ArticleId IdType="doi">10.1000/{pmid}</ArticleId></ArticleIdList></PubmedData>
+</PubmedArticle>"""
+
+
+def make_page(pmids) -> bytes:
+    return ("<PubmedArticleSet>" + "".join(make_article(p) for p in pmids) + "</PubmedArticleSet>").encode()
+
+
+def test_parse_extracts_year_journal_and_doi():
+    """Test the parser keeps publication metadata"""
+    records = parse_pubmed_articles(
+        ("<PubmedArticleSet>" + make_article(1) + make_article(2, with_year=False) + "</PubmedArticleSet>").encode()
+    )
+
+    assert [r.pmid for r in records] == ["1", "2"]
+    assert records[0].title == "Effects of X on Y"
+    assert records[0].abstract == "Part one. Part two."
+    assert records[0].authors == ["John Smith"]
+    assert records[0].year == 2021
+    assert records[1].year == 2019
+    assert records[0].journal == "Journal 1"
+    assert records[0].doi == "10.1000/1"
+    assert records[0].url == "https://pubmed.ncbi.nlm.nih.gov/1/"
+
+
+class FakeEutils:
+    """Fake E-utilities host serving a stored result set"""
+
+    def __init__(self, count: int):
+        self.count = count
+        self.requests = []
+
+    @asynccontextmanager
+    async def get(self, url, params=None):
+        self.requests.append((url.rsplit("/", 1)[-1], dict(params)))
+        response = Mock(status=200)
+        if url.endswith("esearch.fcgi"):
+            response.json = AsyncMock(return_value={
+                "esearchresult": {"count": str(self.count), "webenv": "WE1", "querykey": "1"}
+            })
+        else:
+            start, size = params["retstart"], params["retmax"]
+            response.read = AsyncMock(return_value=make_page(range(start, start + size)))
+        yield response
+
+
+@pytest.mark.asyncio
+async def test_search_pages_through_history_server_off_loop(monkeypatch):
+    """Test efetch uses WebEnv paging and parses pages in a worker thread"""
+    http = FakeEutils(count=50)
+    client = PubMedClient(http, api_key="key", page_size=4)
+
+    parser_threads = set()
+
+    def tracking_parse(body):
+        parser_threads.add(threading.current_thread().name)
+        return parse_pubmed_articles(body)
+
+    monkeypatch.setattr("pubmed_client.parse_pubmed_articles", tracking_parse)
+    records = await client.search("q", max_results=10)
+
+    assert [r.pmid for r in records] == [str(i) for i in range(10)]
+    esearch = http.requests[0][1]
+    assert esearch["usehistory"] == "y" and esearch["api_key"] == "key"
+    fetches = [params for name, params in http.requests if name == "efetch.fcgi"]
+    assert [(p["retstart"], p["retmax"]) for p in fetches] == [(0, 4), (4, 4), (8, 2)]
+    assert all(p["WebEnv"] == "WE1" and "id" not in p for p in fetches)
+    assert threading.main_thread().name not in parser_threads
+
+
+@pytest.mark.asyncio
+async def test_default_search_fetches_one_page():
+    """Test a typical search costs one esearch and one efetch call"""
+    http = FakeEutils(count=500)
+    records = await PubMedClient(http).search("q", max_results=20)
+
+    assert len(records) == 20
+    assert [name for name, _ in http.requests] == ["esearch.fcgi", "efetch.fcgi"]
+    assert http.requests[1][1]["retmax"] == 20
@@ -0,0 +1,96 @@
+"""
+Unit Tests for Per-Request Resource Ledger
+Tests contextvar scoping, task propagation and NIM client accounting
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import json
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from resource_ledger import (
+    track_resources,
+    get_current_ledger,
+    record_reasoning_call,
+    record_cache_lookup,
+    record_source_call
+)
+
+
+def test_records_are_noops_outside_a_request():
+    """Test recording without an active ledger does nothing"""
+    assert get_current_ledger() is None
+    record_reasoning_call(prompt_tokens=10)
+    record_source_call("arxiv")
+    assert get_current_ledger() is None
+
+
+@pytest.mark.asyncio
+async def test_ledger_is_shared_by_child_tasks_and_isolated_between_requests():
+    """Test gathered tasks write to their request's ledger only"""
+
+    async def request(source: str, calls: int):
+        with track_resources() as ledger:
+            async def call():
+                await asyncio.sleep(0)
+                record_source_call(source)
+                record_reasoning_call(prompt_tokens=5, completion_tokens=2)
+
+            await asyncio.gather(*[call() for _ in range(calls)])
+            return ledger
+
+    first, second = await asyncio.gather(request("arxiv", 3), request("pubmed", 2))
+
+    assert first.source_calls == {"arxiv": 3}
+    assert second.source_calls == {"pubmed": 2}
+    assert first.reasoning_calls == 3
+    assert first.prompt_tokens == 15
+    assert second.to_dict()["completion_tokens"] == 4
+    assert get_current_ledger() is None
+
+
+def test_cache_lookups_by_tier_and_totals():
+    """Test cache hits/misses are counted per tier and summed in totals"""
+    with track_resources() as ledger:
+        record_cache_lookup("embedding", hit=True)
+        record_cache_lookup("embedding", hit=True)
+        record_cache_lookup("completion", hit=False)
+
+    assert ledger.cache_hits == {"embedding": 2}
+    assert ledger.cache_misses == {"completion": 1}
+    assert ledger.totals()["cache_hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reasoning_client_records_usage_and_bytes():
+    """Test completions report NIM usage and payload sizes to the ledger"""
+    from nim_clients import ReasoningNIMClient
+
+    body = json.dumps({
+        "choices": [{"text": "done"}],
+        "usage": {"prompt_tokens": 12, "completion_tokens": 3}
+    }).encode()
+
+    response = Mock(status=200)
+    response.read = AsyncMock(return_value=body)
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+
+    client = ReasoningNIMClient(base_url="http://test:8000")
+    client.session = Mock(closed=False)
+    client.session.post = Mock(return_value=response)
+
+    with track_resources() as ledger:
+        assert await client._complete_impl("prompt", max_tokens=5) == "done"
+
+    assert ledger.reasoning_calls == 1
+    assert ledger.prompt_tokens == 12
+    assert ledger.completion_tokens == 3
+    assert ledger.response_bytes == len(body)
+    assert ledger.request_bytes == len(client.session.post.call_args.kwargs["data"])
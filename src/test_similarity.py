@@ -0,0 +1,87 @@
+"""
+Unit Tests for Similarity Engine
+Tests vectorized cosine similarity helpers against the per-pair implementation
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+import pytest
+
+from nim_clients import EmbeddingNIMClient
+from similarity import (
+    EmbeddingMatrix,
+    greedy_duplicates,
+    pairs_above,
+    query_scores,
+    to_matrix,
+    top_k,
+    top_k_above,
+)
+
+
+@pytest.fixture
+def vectors():
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(20, 16)).tolist()
+
+
+def test_query_scores_match_pairwise_cosine(vectors):
+    """Test rescaled scores equal EmbeddingNIMClient.cosine_similarity"""
+    query = vectors[0]
+    scores = query_scores(query, to_matrix(vectors), rescale=True)
+
+    expected = [EmbeddingNIMClient.cosine_similarity(query, v) for v in vectors]
+    assert np.allclose(scores, expected, atol=1e-5)
+
+
+def test_invalid_rows_score_zero():
+    """Test empty and zero vectors score 0 like the per-pair helper"""
+    matrix = to_matrix([[1.0, 0.0], [], [0.0, 0.0]], dim=2)
+    scores = query_scores([1.0, 0.0], matrix, rescale=True)
+
+    assert scores.tolist() == [1.0, 0.0, 0.0]
+
+
+def test_top_k_orders_best_first():
+    """Test top_k returns the highest scores in descending order"""
+    scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3], dtype=np.float32)
+
+    assert top_k(scores, 3).tolist() == [1, 3, 2]
+    assert top_k(scores, 10).tolist() == [1, 3, 2, 4, 0]
+    assert top_k(scores, 0).tolist() == []
+
+
+def test_top_k_above_masks_threshold():
+    """Test top_k_above only ranks scores at or above the threshold"""
+    scores = np.array([0.1, 0.9, 0.5, 0.7, 0.3], dtype=np.float32)
+
+    assert top_k_above(scores, 0.5, 10).tolist() == [1, 3, 2]
+    assert top_k_above(scores, 0.5, 2).tolist() == [1, 3]
+    assert top_k_above(scores, 0.95, 3).tolist() == []
+
+
+def test_pairs_and_greedy_duplicates():
+    """Test all-pairs thresholding and keep-first duplicate removal"""
+    matrix = to_matrix([[1.0, 0.0], [1.0, 0.01], [0.0, 1.0], [0.99, 0.0]])
+
+    pairs = {(i, j) for i, j, _ in pairs_above(matrix, 0.99)}
+    assert pairs == {(0, 1), (0, 3), (1, 3)}
+    assert greedy_duplicates(matrix, 0.99).tolist() == [False, True, False, True]
+
+
+def test_embedding_matrix_grows_and_ranks(vectors):
+    """Test incremental matrix matches a matrix built in one go"""
+    incremental = EmbeddingMatrix(capacity=4)
+    incremental.extend(vectors[:5])
+    incremental.extend(vectors[5:])
+
+    assert len(incremental) == len(vectors)
+    assert np.allclose(incremental.matrix, to_matrix(vectors))
+
+    best = incremental.top_k(vectors[7], 2)
+    assert best[0][0] == 7
+    assert best[0][1] == pytest.approx(1.0, abs=1e-5)
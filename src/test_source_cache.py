@@ -0,0 +1,155 @@
+"""
+Unit Tests for Source Search Cache
+Tests fresh/stale serving, negative caching and request coalescing
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+from datetime import datetime
+from unittest.mock import Mock, AsyncMock
+
+import pytest
+
+from cache import Cache
+from source_cache import SourceSearchCache, mark_source_failure, normalize_query, source_outcome
+from agents import Paper, ScoutAgent
+
+
+class CountingSearch:
+    """Fake source search that counts live calls"""
+
+    def __init__(self, results, fail: bool = False, delay: float = 0.0):
+        self.calls = 0
+        self.results = results
+        self.fail = fail
+        self.delay = delay
+
+    async def __call__(self, query: str):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            mark_source_failure("boom")
+        return self.results
+
+
+def test_normalize_query():
+    """Test case and whitespace differences share a key"""
+    assert normalize_query("  Deep   Learning\n") == "deep learning"
+
+
+@pytest.mark.asyncio
+async def test_fresh_hit_skips_live_search_and_stores_compact_records(make_paper):
+    """Test identical normalized queries are served from cache as Paper objects"""
+    cache = SourceSearchCache(Cache(), paper_factory=Paper)
+    search = CountingSearch([make_paper("p1", embedding=[0.1, 0.2])])
+
+    first = await cache.fetch("arxiv", "Deep Learning", search)
+    second = await cache.fetch("arxiv", "deep  learning", search)
+
+    assert search.calls == 1
+    assert second[0].id == first[0].id == "p1"
+    assert second[0].embedding is None  # Only compact fields are cached
+    stored = next(iter(cache.cache.memory_cache.values()))["value"]
+    assert set(stored["papers"][0]) == {"id", "title", "authors", "abstract", "url", "year", "venue", "doi"}
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_refreshing(make_paper):
+    """Test stale results return immediately and refresh in the background"""
+    cache = SourceSearchCache(Cache())
+    search = CountingSearch([make_paper("p1")])
+    await cache.fetch("pubmed", "q", search)
+
+    # Age the entry past its fresh TTL
+    key = cache.make_key("pubmed", "q")
+    cache.cache.memory_cache[key]["value"]["fresh_until"] = time.time() - 1
+    search.results = [make_paper("p2")]
+
+    stale = await cache.fetch("pubmed", "q", search)
+    assert stale[0]["id"] == "p1"
+    await asyncio.gather(*cache._background)
+
+    refreshed = await cache.fetch("pubmed", "q", search)
+    assert refreshed[0]["id"] == "p2"
+    assert search.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_failures_and_empty_results_are_cached_briefly(make_paper):
+    """Test failed and empty searches are not re-run within their short TTL"""
+    cache = SourceSearchCache(Cache())
+    failing = CountingSearch([make_paper("p1")], fail=True)
+    empty = CountingSearch([])
+
+    await cache.fetch("crossref", "q", failing)
+    await cache.fetch("crossref", "q", failing)
+    await cache.fetch("ieee", "q", empty)
+    await cache.fetch("ieee", "q", empty)
+
+    assert failing.calls == 1
+    assert empty.calls == 1
+    failed_entry = cache.cache.memory_cache[cache.make_key("crossref", "q")]
+    assert failed_entry["expires_at"].timestamp() - time.time() <= 60
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_live_search(make_paper):
+    """Test identical in-flight misses are coalesced"""
+    cache = SourceSearchCache(Cache())
+    search = CountingSearch([make_paper("p1")], delay=0.01)
+
+    results = await asyncio.gather(*[cache.fetch("arxiv", "q", search) for _ in range(5)])
+
+    assert search.calls == 1
+    assert all(r[0]["id"] == "p1" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_callers_sharing_a_failed_fetch_all_see_the_failure(make_paper):
+    """Test a caller joining an in-flight failed search is flagged too"""
+    cache = SourceSearchCache(Cache())
+    search = CountingSearch([make_paper("p1")], fail=True, delay=0.01)
+
+    async def fetch_with_outcome():
+        with source_outcome() as outcome:
+            papers = await cache.fetch("arxiv", "q", search)
+        return len(papers), outcome["failed"]
+
+    results = await asyncio.gather(fetch_with_outcome(), fetch_with_outcome())
+
+    assert search.calls == 1
+    assert results == [(1, True), (1, True)]
+
+
+@pytest.mark.asyncio
+async def test_scout_pushes_year_range_to_arxiv_and_keys_cache_by_it(monkeypatch, make_paper):
+    """Test a year range reaches arXiv and does not share entries with unfiltered searches"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.0")
+    embedding = Mock()
+    embedding.embed = AsyncMock(return_value=[1.0, 0.0])
+    embedding.embed_batch = AsyncMock(side_effect=lambda texts, input_type: [[1.0, 0.0] for _ in texts])
+    scout = ScoutAgent(embedding, source_cache=SourceSearchCache(Cache(), paper_factory=Paper))
+    for source in ("arxiv", "pubmed", "semantic_scholar", "crossref", "ieee", "acm", "springer"):
+        setattr(scout.source_config, f"enable_{source}", source == "arxiv")
+
+    calls = []
+
+    async def arxiv(query, start_date=None, end_date=None):
+        calls.append((start_date, end_date))
+        return [make_paper("arxiv-1")]
+
+    scout._search_arxiv = arxiv
+
+    await scout.search("q", max_papers=5, use_query_expansion=False, start_year=2020, end_year=2022)
+    await scout.search("q", max_papers=5, use_query_expansion=False, start_year=2020, end_year=2022)
+    await scout.search("q", max_papers=5, use_query_expansion=False)
+
+    assert calls == [
+        (datetime(2020, 1, 1), datetime(2022, 12, 31, 23, 59)),
+        (None, None),
+    ]
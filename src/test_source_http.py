@@ -0,0 +1,134 @@
+"""
+Unit Tests for Source HTTP Client
+Tests per-host rate limits, queueing and 429 handling
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+import time
+from unittest.mock import Mock, AsyncMock, MagicMock
+
+import pytest
+
+from config import PaperSourceConfig
+from source_http import SourceHTTPClient, TokenBucket, default_host_limit, host_limits_from_config
+
+
+def make_response(status: int = 200, headers=None):
+    response = MagicMock()
+    response.status = status
+    response.headers = headers or {}
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+
+def test_api_keys_raise_host_rates():
+    """Test keyed hosts get their higher rate"""
+    anonymous = host_limits_from_config(PaperSourceConfig())
+    keyed = host_limits_from_config(PaperSourceConfig(pubmed_api_key="k"))
+
+    assert anonymous["eutils.ncbi.nlm.nih.gov"].rate == 3.0
+    assert keyed["eutils.ncbi.nlm.nih.gov"].rate == 10.0
+
+
+def test_env_overrides_apply_to_unknown_hosts(monkeypatch):
+    """Test the default limit reads the same env overrides as known hosts"""
+    monkeypatch.setenv("SOURCE_HTTP_DEFAULT_RATE", "7.5")
+    monkeypatch.setenv("SOURCE_HTTP_MAX_CONCURRENCY_PER_HOST", "9")
+
+    limit = default_host_limit()
+
+    assert (limit.rate, limit.burst, limit.max_concurrent) == (7.5, 7, 9)
+    assert host_limits_from_config(PaperSourceConfig())["api.acm.org"].max_concurrent == 9
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_queues_instead_of_failing():
+    """Test callers beyond the burst wait for tokens"""
+    bucket = TokenBucket(rate=50.0, burst=1)
+    start = time.monotonic()
+    waits = await asyncio.gather(*[bucket.acquire() for _ in range(3)])
+
+    assert time.monotonic() - start >= 0.035
+    assert waits[0] < 0.01
+    assert max(waits) >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_requests_are_limited_per_host():
+    """Test per-host concurrency caps are independent"""
+    session = Mock()
+    in_flight = {"a.example": 0, "b.example": 0}
+    peak = {"a.example": 0, "b.example": 0}
+
+    def get(url, **kwargs):
+        host = url.split("/")[2]
+        response = make_response()
+
+        async def enter():
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            await asyncio.sleep(0.01)
+            return response
+
+        async def exit_(*args):
+            in_flight[host] -= 1
+
+        response.__aenter__ = AsyncMock(side_effect=enter)
+        response.__aexit__ = AsyncMock(side_effect=exit_)
+        return response
+
+    session.get = Mock(side_effect=get)
+    client = SourceHTTPClient(config=PaperSourceConfig(), session=session)
+
+    async def fetch(host):
+        async with client.get(f"https://{host}/search") as response:
+            return response.status
+
+    statuses = await asyncio.gather(*[fetch(h) for h in ["a.example"] * 6 + ["b.example"] * 2])
+
+    assert statuses == [200] * 8
+    assert peak["a.example"] <= client.default_limit.max_concurrent
+    assert peak["b.example"] == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_response_pauses_host_and_retries():
+    """Test a 429 honors Retry-After and is retried once"""
+    session = Mock()
+    session.get = Mock(side_effect=[
+        make_response(429, {"Retry-After": "0.05"}),
+        make_response(200)
+    ])
+    metrics = Mock()
+    client = SourceHTTPClient(config=PaperSourceConfig(), session=session, metrics=metrics)
+
+    start = time.monotonic()
+    async with client.get("https://api.crossref.org/works") as response:
+        assert response.status == 200
+
+    assert time.monotonic() - start >= 0.05
+    assert session.get.call_count == 2
+    metrics.record_source_throttled.assert_any_call("api.crossref.org", "rate_limited")
+
+
+def test_session_from_a_finished_loop_is_closed_on_rebind():
+    """Test a new event loop replaces the owned session without leaking the old one"""
+    client = SourceHTTPClient(config=PaperSourceConfig())
+
+    async def open_session():
+        await client._bind_loop()
+        return client._get_session()
+
+    first = asyncio.run(open_session())
+    assert not first.closed
+
+    second = asyncio.run(open_session())
+    assert first.closed
+    assert second is not first and not second.closed
+    asyncio.run(client.close())
@@ -0,0 +1,164 @@
+"""
+Unit Tests for Paper Vector Index
+Tests the in-process index (exact and IVF), the Qdrant client and use from Scout
+"""
+
+import sys
+import os
+# Add src directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import asyncio
+from unittest.mock import Mock, AsyncMock
+
+import numpy as np
+import pytest
+
+from vector_index import LocalVectorIndex, QdrantVectorIndex
+from agents import Paper, ScoutAgent
+
+
+@pytest.mark.asyncio
+async def test_local_index_top_k_and_upsert_overwrites(make_paper):
+    """Test exact search ranks by cosine and re-upserting a paper replaces its vector"""
+    index = LocalVectorIndex()
+    await index.upsert([
+        make_paper("arxiv-1", embedding=[1.0, 0.0, 0.0]),
+        make_paper("arxiv-2", embedding=[0.8, 0.6, 0.0]),
+        make_paper("arxiv-3", embedding=[0.0, 0.0, 1.0]),
+        Paper(id="arxiv-4", title="No embedding", authors=[], abstract="", url=""),
+    ])
+    assert len(index) == 3
+
+    hits = await index.search([1.0, 0.0, 0.0], k=2)
+    assert [record["id"] for record, _, _ in hits] == ["arxiv-1", "arxiv-2"]
+    assert hits[0][1] == pytest.approx(1.0)
+    assert hits[0][2] == pytest.approx([1.0, 0.0, 0.0])
+
+    await index.upsert([make_paper("arxiv-3", embedding=[1.0, 0.0, 0.0], title="Moved")])
+    assert len(index) == 3
+    hits = await index.search([1.0, 0.0, 0.0], k=3, min_score=0.9)
+    assert {record["id"] for record, _, _ in hits} == {"arxiv-1", "arxiv-3"}
+    assert next(r for r, _, _ in hits if r["id"] == "arxiv-3")["title"] == "Moved"
+
+
+def test_local_index_ivf_finds_clustered_neighbours(make_paper):
+    """Test the IVF layout is trained past the threshold and still returns the nearest rows"""
+    rng = np.random.default_rng(7)
+    centers = rng.normal(size=(8, 16))
+    papers = [
+        make_paper(f"p-{c}-{i}", embedding=centers[c] + 0.05 * rng.normal(size=16))
+        for c in range(8)
+        for i in range(40)
+    ]
+    index = LocalVectorIndex(ivf_min_size=256, nprobe=4)
+    index.upsert_sync(papers)
+    assert index._centroids is not None
+
+    hits = index.search_sync(list(centers[3]), k=10)
+    assert len(hits) == 10
+    assert all(record["id"].startswith("p-3-") for record, _, _ in hits)
+
+
+@pytest.mark.asyncio
+async def test_local_index_trains_off_loop_and_assigns_late_rows(make_paper):
+    """Test async upserts return before training and rows added meanwhile get a list"""
+    rng = np.random.default_rng(3)
+    centers = rng.normal(size=(4, 16))
+    papers = [
+        make_paper(f"p-{c}-{i}", embedding=centers[c] + 0.05 * rng.normal(size=16))
+        for c in range(4)
+        for i in range(64)
+    ]
+    index = LocalVectorIndex(ivf_min_size=256, nprobe=2)
+
+    await index.upsert(papers)
+    assert index._centroids is None and index._training
+    await index.upsert([make_paper("late", embedding=centers[1])])
+    await asyncio.gather(*index._background)
+
+    assert index._centroids is not None
+    assert len(index._assignments) == len(index) == 257
+    hits = await index.search(list(centers[1]), k=5)
+    assert "late" in {record["id"] for record, _, _ in hits}
+
+
+class FakeResponse:
+    def __init__(self, status: int, payload=None):
+        self.status = status
+        self._payload = payload or {}
+
+    async def json(self):
+        return self._payload
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+@pytest.mark.asyncio
+async def test_qdrant_index_creates_collection_upserts_and_searches(make_paper):
+    """Test the REST calls made against Qdrant"""
+    calls = []
+
+    def request(method, status, payload=None):
+        def call(url, **kwargs):
+            calls.append((method, url, kwargs))
+            return FakeResponse(status, payload)
+        return call
+
+    session = Mock(closed=False)
+    session.get = request("GET", 404)
+    session.put = request("PUT", 200)
+    session.post = request("POST", 200, {"result": [
+        {"id": "x", "score": 0.9, "payload": {"id": "arxiv-1", "title": "T"}, "vector": [1.0, 0.0]}
+    ]})
+    index = QdrantVectorIndex("http://qdrant:6333/", collection="papers")
+    index.session = session
+
+    assert await index.upsert([make_paper("arxiv-1", embedding=[1.0, 0.0])]) == 1
+    assert calls[1][1] == "http://qdrant:6333/collections/papers"
+    assert calls[1][2]["json"]["vectors"] == {"size": 2, "distance": "Cosine"}
+    point = calls[2][2]["json"]["points"][0]
+    assert point["id"] == QdrantVectorIndex.point_id("arxiv-1")
+    assert point["payload"]["id"] == "arxiv-1"
+
+    hits = await index.search([1.0, 0.0], k=5, min_score=0.4)
+    assert hits == [({"id": "arxiv-1", "title": "T"}, 0.9, [1.0, 0.0])]
+    assert calls[3][2]["json"]["score_threshold"] == 0.4
+
+
+@pytest.mark.asyncio
+async def test_scout_serves_index_hits_without_reembedding(monkeypatch, make_paper):
+    """Test indexed papers skip embedding and live papers are indexed after the search"""
+    monkeypatch.setenv("RELEVANCE_THRESHOLD", "0.5")
+    index = LocalVectorIndex()
+    await index.upsert([
+        make_paper("arxiv-1", embedding=[1.0, 0.0], title="Indexed relevant paper"),
+        make_paper("arxiv-2", embedding=[-1.0, 0.0], title="Indexed unrelated paper"),
+    ])
+
+    embedding = Mock()
+    embedding.embed = AsyncMock(return_value=[1.0, 0.0])
+    embedding.embed_batch = AsyncMock(side_effect=lambda texts, input_type: [[0.6, 0.8] for _ in texts])
+    scout = ScoutAgent(embedding, vector_index=index)
+    for source in ("arxiv", "pubmed", "semantic_scholar", "crossref", "ieee", "acm", "springer"):
+        setattr(scout.source_config, f"enable_{source}", source == "arxiv")
+
+    async def arxiv(query):
+        await asyncio.sleep(0.05)
+        return [make_paper("arxiv-3", title="Live paper")]
+
+    scout._search_arxiv = arxiv
+
+    updates = [u async for u in scout.search_stream("q", max_papers=5, use_query_expansion=False)]
+
+    assert updates[0].source == "index"
+    assert [p.id for p in updates[0].new_papers] == ["arxiv-1"]
+    assert {p.id for p in updates[-1].top_papers} == {"arxiv-1", "arxiv-3"}
+    assert updates[-1].sources_total == 2
+    embedding.embed_batch.assert_awaited_once()
+    assert embedding.embed_batch.await_args.args[0] == ["Abstract"]
+    assert len(index) == 3
@@ -0,0 +1,369 @@
+"""
+Paper Vector Index
+Nearest-neighbour search over stored abstract embeddings (Qdrant or in-process IVF)
+"""
+
+import os
+import uuid
+import asyncio
+import logging
+from typing import Optional, Dict, Any, List, Set, Tuple
+
+import aiohttp
+import numpy as np
+
+from similarity import EmbeddingMatrix, normalize, top_k
+from source_cache import paper_to_record
+from constants import (
+    VECTOR_INDEX_IVF_MIN_SIZE,
+    VECTOR_INDEX_IVF_NPROBE,
+    VECTOR_INDEX_MAX_LOCAL_SIZE,
+    VECTOR_DB_DEFAULT_COLLECTION
+)
+
+logger = logging.getLogger(__name__)
+
+# Namespace for deterministic Qdrant point IDs derived from paper IDs
+_POINT_NAMESPACE = uuid.UUID("8f6c2b1e-4d7a-4c1e-9b3a-2f5e6d7c8a90")
+
+SearchHit = Tuple[Dict[str, Any], float, List[float]]  # (paper record, raw cosine, embedding)
+
+
+class LocalVectorIndex:
+    """
+    In-process vector index over NumPy
+
+    Small indexes are scanned exactly. From VECTOR_INDEX_IVF_MIN_SIZE rows an
+    IVF layout is trained (k-means centroids, ~sqrt(n) lists) and queries
+    only score the rows in the nprobe closest lists; it is retrained off the
+    event loop each time the index doubles. Past max_size the oldest half is
+    dropped.
+    """
+
+    def __init__(
+        self,
+        ivf_min_size: int = VECTOR_INDEX_IVF_MIN_SIZE,
+        nprobe: int = VECTOR_INDEX_IVF_NPROBE,
+        max_size: int = VECTOR_INDEX_MAX_LOCAL_SIZE
+    ):
+        self.ivf_min_size = ivf_min_size
+        self.nprobe = nprobe
+        self.max_size = max_size
+        self._background: Set[asyncio.Task] = set()
+        self._reset()
+
+    def _reset(self):
+        self._vectors = EmbeddingMatrix()
+        self._ids: List[str] = []
+        self._payloads: List[Dict[str, Any]] = []
+        self._positions: Dict[str, int] = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._trained_size = 0
+        # Bumped by compaction so a background training run can tell its rows moved
+        self._generation = getattr(self, "_generation", 0) + 1
+        self._training = False
+        self._dirty: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _needs_training(self) -> bool:
+        return len(self) >= self.ivf_min_size and len(self) >= 2 * self._trained_size
+
+    async def upsert(self, papers: List[Any]) -> int:
+        """
+        Insert or update papers that carry an embedding; returns the number indexed
+
+        Rows are added on the loop (cheap); k-means training runs as a
+        background task in a worker thread on a snapshot, and its centroids are
+        swapped in when it finishes (searches stay exact or use the previous
+        lists until then).
+        """
+        indexed = self._insert(papers)
+        if self._needs_training() and not self._training:
+            self._training = True
+            task = asyncio.create_task(self._train_in_background())
+            self._background.add(task)
+            task.add_done_callback(self._background.discard)
+        return indexed
+
+    def upsert_sync(self, papers: List[Any]) -> int:
+        indexed = self._insert(papers)
+        if self._needs_training():
+            self._install(*self._kmeans(self._vectors.matrix), 0)
+        return indexed
+
+    def _insert(self, papers: List[Any]) -> int:
+        indexed = 0
+        new_embeddings: List[Any] = []
+        for paper in papers:
+            embedding = getattr(paper, "embedding", None)
+            if embedding is None or len(embedding) == 0:
+                continue
+            dim = self._vectors.dim or (len(new_embeddings[0]) if new_embeddings else None)
+            if dim is not None and len(embedding) != dim:
+                continue
+            payload = paper_to_record(paper)
+            position = self._positions.get(paper.id)
+            if position is not None and position < len(self._vectors):
+                self._vectors.set_row(position, embedding)
+                self._payloads[position] = payload
+                if self._centroids is not None:
+                    self._assignments[position] = self._nearest_list(self._vectors.matrix[position])
+                if self._training:
+                    self._dirty.add(position)
+            elif position is not None:
+                # Repeated within this batch; the later copy wins
+                new_embeddings[position - len(self._vectors)] = embedding
+                self._payloads[position] = payload
+            else:
+                self._positions[paper.id] = len(self._ids)
+                self._ids.append(paper.id)
+                self._payloads.append(payload)
+                new_embeddings.append(embedding)
+            indexed += 1
+
+        if new_embeddings:
+            start = len(self._vectors)
+            self._vectors.extend(new_embeddings)
+            if self._centroids is not None:
+                added = np.argmax(self._vectors.matrix[start:] @ self._centroids.T, axis=1)
+                self._assignments = np.concatenate([self._assignments, added.astype(np.int32)])
+
+        if len(self) > self.max_size:
+            self._compact()
+        return indexed
+
+    async def _train_in_background(self):
+        snapshot = self._vectors.matrix.copy()
+        generation = self._generation
+        self._dirty = set()
+        try:
+            centroids, assignments = await asyncio.to_thread(self._kmeans, snapshot)
+        except Exception as e:
+            logger.warning(f"Vector index: IVF training failed: {e}")
+            return
+        finally:
+            if generation == self._generation:
+                self._training = False
+        if generation != self._generation:
+            # Compacted while training; the next upsert retrains on the new rows
+            return
+        self._install(centroids, assignments, len(snapshot))
+
+    def _install(self, centroids: np.ndarray, assignments: np.ndarray, trained_rows: int = 0):
+        """Swap in trained centroids, assigning rows added or changed since the snapshot"""
+        self._centroids = centroids
+        if trained_rows:
+            matrix = self._vectors.matrix
+            stale = sorted(self._dirty) + list(range(trained_rows, matrix.shape[0]))
+            assignments = np.concatenate([
+                assignments, np.zeros(matrix.shape[0] - trained_rows, dtype=np.int32)
+            ])
+            if stale:
+                assignments[stale] = np.argmax(matrix[stale] @ centroids.T, axis=1)
+            self._dirty = set()
+        self._assignments = assignments
+        self._trained_size = len(assignments)
+        logger.info(f"Vector index: trained {len(centroids)} IVF lists over {len(assignments)} vectors")
+
+    def _nearest_list(self, vector: np.ndarray) -> int:
+        return int(np.argmax(self._centroids @ vector))
+
+    @staticmethod
+    def _kmeans(matrix: np.ndarray, iterations: int = 8) -> Tuple[np.ndarray, np.ndarray]:
+        """k-means (cosine) over the given rows; returns (centroids, assignments)"""
+        n = matrix.shape[0]
+        nlist = max(1, int(np.sqrt(n)))
+        rng = np.random.default_rng(0)
+        centroids = matrix[rng.choice(n, size=nlist, replace=False)].copy()
+        for _ in range(iterations):
+            assignments = np.argmax(matrix @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = matrix[assignments == c]
+                if len(members):
+                    centroids[c] = normalize(members.mean(axis=0))
+        return centroids, np.argmax(matrix @ centroids.T, axis=1).astype(np.int32)
+
+    def _compact(self):
+        keep = slice(len(self) - self.max_size // 2, len(self))
+        ids = self._ids[keep]
+        payloads = self._payloads[keep]
+        vectors = self._vectors.matrix[keep].copy()
+        self._reset()
+        self._ids = ids
+        self._payloads = payloads
+        self._positions = {paper_id: i for i, paper_id in enumerate(ids)}
+        self._vectors.extend(list(vectors))
+
+    async def search(
+        self,
+        vector: List[float],
+        k: int = 20,
+        min_score: Optional[float] = None
+    ) -> List[SearchHit]:
+        """
+        k nearest stored papers
+
+        Args:
+            vector: Query embedding
+            k: Number of results
+            min_score: Minimum raw cosine similarity
+
+        Returns:
+            (paper record, raw cosine, embedding) tuples, best first
+        """
+        return self.search_sync(vector, k, min_score)
+
+    def search_sync(self, vector: List[float], k: int = 20, min_score: Optional[float] = None) -> List[SearchHit]:
+        if not len(self) or len(vector) != self._vectors.dim:
+            return []
+        query = normalize(vector)
+        matrix = self._vectors.matrix
+
+        if self._centroids is not None:
+            probe = top_k(self._centroids @ query, self.nprobe)
+            rows = np.nonzero(np.isin(self._assignments, probe))[0]
+        else:
+            rows = np.arange(matrix.shape[0])
+
+        scores = matrix[rows] @ query
+        hits = []
+        for i in top_k(scores, k):
+            score = float(scores[i])
+            if min_score is not None and score < min_score:
+                break
+            row = int(rows[i])
+            hits.append((dict(self._payloads[row]), score, matrix[row].tolist()))
+        return hits
+
+    async def close(self):
+        """Stop any IVF training still running"""
+        for task in list(self._background):
+            task.cancel()
+
+
+class QdrantVectorIndex:
+    """
+    Qdrant-backed vector index (REST API)
+
+    The collection is created on first upsert with cosine distance; point IDs
+    are UUIDv5 of the paper ID so re-upserting a paper replaces it.
+    """
+
+    def __init__(self, url: str, collection: str = VECTOR_DB_DEFAULT_COLLECTION, timeout: float = 5.0):
+        self.url = url.rstrip("/")
+        self.collection = collection
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._ready_dim: Optional[int] = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(timeout=self.timeout)
+        return self.session
+
+    @staticmethod
+    def point_id(paper_id: str) -> str:
+        return str(uuid.uuid5(_POINT_NAMESPACE, paper_id))
+
+    async def _ensure_collection(self, dim: int):
+        if self._ready_dim == dim:
+            return
+        collection_url = f"{self.url}/collections/{self.collection}"
+        async with self._session().get(collection_url) as response:
+            exists = response.status == 200
+        if not exists:
+            body = {"vectors": {"size": dim, "distance": "Cosine"}}
+            async with self._session().put(collection_url, json=body) as response:
+                if response.status not in (200, 409):
+                    raise RuntimeError(f"Qdrant collection create returned {response.status}")
+        self._ready_dim = dim
+
+    async def upsert(self, papers: List[Any]) -> int:
+        """Insert or update papers that carry an embedding; returns the number sent"""
+        points = [
+            {
+                "id": self.point_id(paper.id),
+                "vector": list(paper.embedding),
+                "payload": paper_to_record(paper)
+            }
+            for paper in papers
+            if getattr(paper, "embedding", None) is not None and len(paper.embedding) > 0
+        ]
+        if not points:
+            return 0
+        await self._ensure_collection(len(points[0]["vector"]))
+        async with self._session().put(
+            f"{self.url}/collections/{self.collection}/points",
+            params={"wait": "false"},
+            json={"points": points}
+        ) as response:
+            if response.status != 200:
+                raise RuntimeError(f"Qdrant upsert returned {response.status}")
+        return len(points)
+
+    async def search(
+        self,
+        vector: List[float],
+        k: int = 20,
+        min_score: Optional[float] = None
+    ) -> List[SearchHit]:
+        """k nearest stored papers (see LocalVectorIndex.search)"""
+        body: Dict[str, Any] = {
+            "vector": list(vector),
+            "limit": k,
+            "with_payload": True,
+            "with_vector": True
+        }
+        if min_score is not None:
+            body["score_threshold"] = min_score
+        async with self._session().post(
+            f"{self.url}/collections/{self.collection}/points/search",
+            json=body
+        ) as response:
+            if response.status == 404:
+                return []  # Nothing indexed yet
+            if response.status != 200:
+                raise RuntimeError(f"Qdrant search returned {response.status}")
+            result = await response.json()
+        return [
+            (hit.get("payload") or {}, float(hit["score"]), hit.get("vector") or [])
+            for hit in result.get("result", [])
+        ]
+
+    async def close(self):
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+
+# Global vector index instance
+_vector_index = None
+
+
+def get_vector_index():
+    """
+    Get global vector index
+
+    Uses Qdrant when VECTOR_DB_URL is set, otherwise the in-process index.
+    """
+    global _vector_index
+    if _vector_index is None:
+        url = os.getenv("VECTOR_DB_URL")
+        if url:
+            collection = os.getenv("VECTOR_DB_COLLECTION", VECTOR_DB_DEFAULT_COLLECTION)
+            _vector_index = QdrantVectorIndex(url, collection=collection)
+            logger.info(f"Vector index: Qdrant at {url} (collection '{collection}')")
+        else:
+            _vector_index = LocalVectorIndex()
+            logger.info("Vector index: in-process (VECTOR_DB_URL not set)")
+    return _vector_index
+
+
+async def close_vector_index():
+    """Close the global vector index if one was created"""
+    global _vector_index
+    if _vector_index is not None:
+        await _vector_index.close()
+        _vector_index = None